@@ -13,8 +13,7 @@ from django.contrib.auth.models import Group, User
 from django.contrib.auth.views import LoginView as DjangoLoginView
 from django.core.mail import send_mail
 from django.core.cache import cache
-from django.db.models import Avg, Case, Count, FloatField, Min, Q, Value, CharField, When
-from django.db.models.functions import Cast, Concat, TruncDate, ExtractWeekDay
+from django.db.models import Count, Q
 from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -66,7 +65,6 @@ from core.models import (
     SocialPlatform,
     AnalyticsEvent,
     AnalyticsEventType,
-    Page,
     OfficeLocation,
     HeroSettings,
     HeroContentBlock,
@@ -74,8 +72,28 @@ from core.models import (
 from profiles.forms import AdminTherapistProfileForm, ClientFocusForm, LicenseTypeForm
 from profiles.models import ClientFocus, LicenseType, TherapistProfile
 from blog.models import Post
-from core.utils.bot_detection import bot_ua_exclude_q, is_bot_session
+from core.analytics_rollups import (
+    CALL_CTA_LABELS,
+    EMAIL_CTA_LABELS,
+    METRIC_CLICK,
+    METRIC_CTA,
+    METRIC_DEAD_CLICK,
+    METRIC_HOVER,
+    METRIC_LANDING_REFERRER,
+    METRIC_PAGE_VIEW,
+    METRIC_RAGE_CLICK,
+    METRIC_SCHEDULE,
+    METRIC_SCHEDULE_SOURCE,
+    METRIC_SCROLL,
+    METRIC_SESSION_EXIT,
+    SCHEDULE_CTA_LABELS,
+    RollupReader,
+    person_key_expr,
+)
+from core.live_sessions import active_sessions
+from core.utils.bot_detection import is_bot_session
 from core.utils.gsc_utils import fetch_top_queries
+from core.utils.page_titles import get_page_title_map
 
 
 
@@ -91,41 +109,8 @@ def is_office_manager(user: Any) -> bool:
     return bool(getattr(user, "groups", None) and user.groups.filter(name="office_manager").exists())
 
 
-def _build_page_title_map() -> dict[str, str]:
-    """Return a path->title mapping for known pages/posts/profiles."""
-    page_title_map: dict[str, str] = {}
-
-    def _add_title(path_val: str, title_val: str) -> None:
-        norm = (path_val or "").strip("/")
-        if not norm or norm in page_title_map:
-            return
-        page_title_map[norm] = title_val
-
-    for p in Page.objects.all().values("path", "title"):
-        _add_title(p.get("path") or "", p.get("title") or "")
-
-    for entry in StaticPageSEO.objects.all().values("slug", "page_name"):
-        _add_title(entry.get("slug") or "", entry.get("page_name") or "")
-
-    for t in TherapistProfile.objects.filter(is_published=True).values("slug", "salutation", "first_name", "last_name"):
-        slug = t.get("slug") or ""
-        salutation = (t.get("salutation") or "").strip()
-        first = (t.get("first_name") or "").strip()
-        last = (t.get("last_name") or "").strip()
-        name_parts = [p for p in [first, last] if p]
-        name = " ".join(name_parts) or slug or "Therapist"
-        if salutation:
-            name = f"{salutation} {name}".strip()
-        _add_title(f"therapists/{slug}", name)
-
-    for post in Post.objects.filter(status=Post.STATUS_PUBLISHED).values("slug", "title"):
-        _add_title(f"blog/{post.get('slug') or ''}", post.get("title") or "")
-
-    return page_title_map
-
-
 def _path_to_title(path_val: str, title_map: dict[str, str] | None = None) -> str:
-    title_map = title_map or _build_page_title_map()
+    title_map = title_map or get_page_title_map()
     norm = (path_val or "").strip("/")
     if not norm:
         return "Home"
@@ -1286,134 +1271,36 @@ class ActiveSessionsApiView(LoginRequiredMixin, UserPassesTestMixin, View):
         return is_admin(self.request.user)
 
     def get(self, request: HttpRequest) -> JsonResponse:
+        # Reads the live session store kept by the ingest worker (core/live_sessions.py),
+        # not the event table.
         now = timezone.now()
-        cutoff = now - timedelta(minutes=self.active_window_minutes)
-
-        person_expr = Case(
-            When(~Q(ip_hash="") & ~Q(user_agent=""), then=Concat("ip_hash", Value("|"), "user_agent")),
-            When(~Q(ip_hash=""), then="ip_hash"),
-            default="session_id",
-            output_field=CharField(),
-        )
-
-        device_os_expr = Case(
-            When(user_agent__icontains="android", then=Value("Android")),
-            When(user_agent__icontains="iphone", then=Value("iOS")),
-            When(user_agent__icontains="ipad", then=Value("iPadOS")),
-            When(user_agent__icontains="mac os", then=Value("macOS")),
-            When(user_agent__icontains="macintosh", then=Value("macOS")),
-            When(user_agent__icontains="windows", then=Value("Windows")),
-            When(user_agent__icontains="linux", then=Value("Linux")),
-            When(user_agent__icontains="cros", then=Value("ChromeOS")),
-            default=Value("Other"),
-            output_field=CharField(),
-        )
-
-        device_type_expr = Case(
-            When(Q(user_agent__icontains="ipad") | Q(user_agent__icontains="tablet"), then=Value("Tablet")),
-            When(
-                Q(user_agent__icontains="mobile")
-                | Q(user_agent__icontains="iphone")
-                | Q(user_agent__icontains="android"),
-                then=Value("Mobile"),
-            ),
-            default=Value("Desktop"),
-            output_field=CharField(),
-        )
-
-        events = (
-            AnalyticsEvent.objects.filter(is_authenticated=False, created__gte=cutoff)
-            .filter(Q(country_code="US") | Q(country_code=""))
-            .exclude(bot_ua_exclude_q())
-            .annotate(person_key=person_expr, device_os=device_os_expr, device_type=device_type_expr)
-            .order_by("session_id", "-created")
-            .values(
-                "session_id",
-                "person_key",
-                "event_type",
-                "path",
-                "label",
-                "created",
-                "country_code",
-                "region",
-                "city",
-                "device_os",
-                "device_type",
-                "duration_ms",
-                "scroll_percent",
-            )
-        )
-
-        title_map = _build_page_title_map()
-        session_map: dict[str, dict] = {}
-
-        for row in events:
-            session_key = row.get("session_id") or row.get("person_key") or ""
-            if not session_key:
-                continue
-
-            created = row.get("created")
-            event_type = row.get("event_type") or ""
-
-            session = session_map.get(session_key)
-            if not session:
-                session = {
-                    "session_key": session_key,
-                    "session_id": row.get("session_id") or "",
-                    "first_seen": created,
-                    "last_seen": created,
-                    "last_event_type": event_type,
-                    "current_path": row.get("path") or "",
-                    "current_page_title": _path_to_title(row.get("path") or "", title_map),
-                    "current_label": row.get("label") or "",
-                    "country_code": row.get("country_code") or "",
-                    "region": row.get("region") or "",
-                    "city": row.get("city") or "",
-                    "device_os": row.get("device_os") or "Other",
-                    "device_type": row.get("device_type") or "Desktop",
-                    "page_views": 0,
-                    "clicks": 0,
-                    "time_on_page_ms": row.get("duration_ms") or 0,
-                    "_event_types": [],
-                    "_paths": [],
-                }
-                session_map[session_key] = session
-
-            session["_event_types"].append(event_type)
-            session["_paths"].append(row.get("path") or "")
-
-            if created and session.get("last_seen") and created > session["last_seen"]:
-                session["last_seen"] = created
-                session["last_event_type"] = event_type
-                session["current_path"] = row.get("path") or ""
-                session["current_page_title"] = _path_to_title(row.get("path") or "", title_map)
-                session["current_label"] = row.get("label") or ""
-                session["country_code"] = row.get("country_code") or session.get("country_code") or ""
-                session["region"] = row.get("region") or session.get("region") or ""
-                session["city"] = row.get("city") or session.get("city") or ""
-                session["device_os"] = row.get("device_os") or session.get("device_os") or "Other"
-                session["device_type"] = row.get("device_type") or session.get("device_type") or "Desktop"
-
-            if event_type == AnalyticsEventType.PAGE_VIEW:
-                session["page_views"] = int(session.get("page_views", 0)) + 1
-            if event_type == AnalyticsEventType.CLICK:
-                session["clicks"] = int(session.get("clicks", 0)) + 1
-            if event_type in {AnalyticsEventType.PAGE_VIEW, AnalyticsEventType.HEARTBEAT}:
-                session["time_on_page_ms"] = row.get("duration_ms") or session.get("time_on_page_ms") or 0
-
-            if created and (not session.get("first_seen") or created < session["first_seen"]):
-                session["first_seen"] = created
+        title_map = get_page_title_map()
 
         sessions = []
-        for session in session_map.values():
-            if is_bot_session(session.pop("_event_types", []), session.pop("_paths", [])):
-                continue
-            last_seen_dt = session.get("last_seen") or now
-            first_seen_dt = session.get("first_seen") or now
-            session["last_seen"] = timezone.localtime(last_seen_dt).isoformat()
-            session["first_seen"] = timezone.localtime(first_seen_dt).isoformat()
-            session["active_seconds_ago"] = max(0, int((now - last_seen_dt).total_seconds()))
-            sessions.append(session)
+        for record in active_sessions(self.active_window_minutes):
+            last_seen_dt = record["last_seen"]
+            first_seen_dt = record["first_seen"]
+            sessions.append(
+                {
+                    "session_key": record["session_id"],
+                    "session_id": record["session_id"],
+                    "first_seen": timezone.localtime(first_seen_dt).isoformat(),
+                    "last_seen": timezone.localtime(last_seen_dt).isoformat(),
+                    "last_event_type": record["last_event_type"],
+                    "current_path": record["current_path"],
+                    "current_page_title": _path_to_title(record["current_path"], title_map),
+                    "current_label": record["current_label"],
+                    "country_code": record["country_code"],
+                    "region": record["region"],
+                    "city": record["city"],
+                    "device_os": record["device_os"],
+                    "device_type": record["device_type"],
+                    "page_views": record["page_views"],
+                    "clicks": record["clicks"],
+                    "time_on_page_ms": record["time_on_page_ms"],
+                    "active_seconds_ago": max(0, int((now - last_seen_dt).total_seconds())),
+                }
+            )
 
         sessions.sort(key=lambda s: s.get("last_seen", ""), reverse=True)
 
@@ -1439,50 +1326,19 @@ class ActiveSessionDetailApiView(LoginRequiredMixin, UserPassesTestMixin, View):
         now = timezone.now()
         cutoff = now - timedelta(days=self.detail_window_days)
 
-        person_expr = Case(
-            When(~Q(ip_hash="") & ~Q(user_agent=""), then=Concat("ip_hash", Value("|"), "user_agent")),
-            When(~Q(ip_hash=""), then="ip_hash"),
-            default="session_id",
-            output_field=CharField(),
-        )
-
-        device_os_expr = Case(
-            When(user_agent__icontains="android", then=Value("Android")),
-            When(user_agent__icontains="iphone", then=Value("iOS")),
-            When(user_agent__icontains="ipad", then=Value("iPadOS")),
-            When(user_agent__icontains="mac os", then=Value("macOS")),
-            When(user_agent__icontains="macintosh", then=Value("macOS")),
-            When(user_agent__icontains="windows", then=Value("Windows")),
-            When(user_agent__icontains="linux", then=Value("Linux")),
-            When(user_agent__icontains="cros", then=Value("ChromeOS")),
-            default=Value("Other"),
-            output_field=CharField(),
-        )
-
-        device_type_expr = Case(
-            When(Q(user_agent__icontains="ipad") | Q(user_agent__icontains="tablet"), then=Value("Tablet")),
-            When(
-                Q(user_agent__icontains="mobile")
-                | Q(user_agent__icontains="iphone")
-                | Q(user_agent__icontains="android"),
-                then=Value("Mobile"),
-            ),
-            default=Value("Desktop"),
-            output_field=CharField(),
-        )
-
         events_qs = (
             AnalyticsEvent.objects.filter(is_authenticated=False, created__gte=cutoff)
-            .exclude(bot_ua_exclude_q())
-            .annotate(person_key=person_expr, device_os=device_os_expr, device_type=device_type_expr)
+            .filter(is_bot=False)
+            .annotate(person_key=person_key_expr())
             .filter(Q(session_id=session_key) | Q(person_key=session_key))
+            .select_related("ua")
             .order_by("created", "id")
         )
 
         if not events_qs.exists():
             return JsonResponse({"error": "session not found"}, status=404)
 
-        title_map = _build_page_title_map()
+        title_map = get_page_title_map()
         first_seen = None
         last_seen = None
         last_path = ""
@@ -1516,8 +1372,9 @@ class ActiveSessionDetailApiView(LoginRequiredMixin, UserPassesTestMixin, View):
             last_seen = evt.created
             last_path = evt.path or last_path
             current_title = _path_to_title(evt.path or "", title_map)
-            device_os = evt.device_os or device_os or "Other"
-            device_type = evt.device_type or device_type or "Desktop"
+            if evt.ua:
+                device_os = evt.ua.device_os or device_os or "Other"
+                device_type = evt.ua.device_type or device_type or "Desktop"
             country_code = evt.country_code or country_code or ""
             region = evt.region or region or ""
             city = evt.city or city or ""
@@ -1624,7 +1481,7 @@ class LocationSessionsApiView(LoginRequiredMixin, UserPassesTestMixin, View):
         city = request.GET.get("city") or ""
         tz_filter = request.GET.get("timezone") or ""
 
-        events = AnalyticsEvent.objects.filter(is_authenticated=False, created__gte=start_dt, created__lt=end_dt)
+        events = AnalyticsEvent.objects.filter(is_authenticated=False, is_bot=False, created__gte=start_dt, created__lt=end_dt)
         if country_code:
             events = events.filter(country_code=country_code)
         else:
@@ -1636,43 +1493,11 @@ class LocationSessionsApiView(LoginRequiredMixin, UserPassesTestMixin, View):
         if tz_filter:
             events = events.filter(timezone=tz_filter)
 
-        person_expr = Case(
-            When(~Q(ip_hash="") & ~Q(user_agent=""), then=Concat("ip_hash", Value("|"), "user_agent")),
-            When(~Q(ip_hash=""), then="ip_hash"),
-            default="session_id",
-            output_field=CharField(),
-        )
-
-        device_os_expr = Case(
-            When(user_agent__icontains="android", then=Value("Android")),
-            When(user_agent__icontains="iphone", then=Value("iOS")),
-            When(user_agent__icontains="ipad", then=Value("iPadOS")),
-            When(user_agent__icontains="mac os", then=Value("macOS")),
-            When(user_agent__icontains="macintosh", then=Value("macOS")),
-            When(user_agent__icontains="windows", then=Value("Windows")),
-            When(user_agent__icontains="linux", then=Value("Linux")),
-            When(user_agent__icontains="cros", then=Value("ChromeOS")),
-            default=Value("Other"),
-            output_field=CharField(),
-        )
-
-        device_type_expr = Case(
-            When(Q(user_agent__icontains="ipad") | Q(user_agent__icontains="tablet"), then=Value("Tablet")),
-            When(
-                Q(user_agent__icontains="mobile")
-                | Q(user_agent__icontains="iphone")
-                | Q(user_agent__icontains="android"),
-                then=Value("Mobile"),
-            ),
-            default=Value("Desktop"),
-            output_field=CharField(),
-        )
-
-        title_map = _build_page_title_map()
+        title_map = get_page_title_map()
         session_map: dict[str, dict[str, Any]] = {}
 
         for row in (
-            events.annotate(person_key=person_expr, device_os=device_os_expr, device_type=device_type_expr)
+            events.annotate(person_key=person_key_expr())
             .order_by("session_id", "-created")
             .values(
                 "session_id",
@@ -1684,8 +1509,8 @@ class LocationSessionsApiView(LoginRequiredMixin, UserPassesTestMixin, View):
                 "country_code",
                 "region",
                 "city",
-                "device_os",
-                "device_type",
+                "ua__device_os",
+                "ua__device_type",
             )
         ):
             session_key = row.get("session_id") or row.get("person_key") or ""
@@ -1706,8 +1531,8 @@ class LocationSessionsApiView(LoginRequiredMixin, UserPassesTestMixin, View):
                     "country_code": row.get("country_code") or "",
                     "region": row.get("region") or "",
                     "city": row.get("city") or "",
-                    "device_os": row.get("device_os") or "Other",
-                    "device_type": row.get("device_type") or "Desktop",
+                    "device_os": row.get("ua__device_os") or "Other",
+                    "device_type": row.get("ua__device_type") or "Desktop",
                     "event_count": 0,
                     "_event_types": [],
                     "_paths": [],
@@ -1725,8 +1550,8 @@ class LocationSessionsApiView(LoginRequiredMixin, UserPassesTestMixin, View):
                 session["country_code"] = row.get("country_code") or session.get("country_code") or ""
                 session["region"] = row.get("region") or session.get("region") or ""
                 session["city"] = row.get("city") or session.get("city") or ""
-                session["device_os"] = row.get("device_os") or session.get("device_os") or "Other"
-                session["device_type"] = row.get("device_type") or session.get("device_type") or "Desktop"
+                session["device_os"] = row.get("ua__device_os") or session.get("device_os") or "Other"
+                session["device_type"] = row.get("ua__device_type") or session.get("device_type") or "Desktop"
 
             if created and (not session.get("first_seen") or created < session.get("first_seen")):
                 session["first_seen"] = created
@@ -1810,77 +1635,59 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
         start_dt = timezone.make_aware(datetime.combine(start_date, time.min), timezone=tzinfo)
         end_dt = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), timezone=tzinfo)
 
-        all_events = AnalyticsEvent.objects.filter(created__gte=start_dt, created__lt=end_dt)
-        events = all_events.filter(is_authenticated=False).filter(Q(country_code="US") | Q(country_code="")).exclude(bot_ua_exclude_q())
-
-        person_expr = Case(
-            When(~Q(ip_hash="") & ~Q(user_agent=""), then=Concat("ip_hash", Value("|"), "user_agent")),
-            When(~Q(ip_hash=""), then="ip_hash"),
-            default="session_id",
-            output_field=CharField(),
-        )
-
-        device_os_expr = Case(
-            When(user_agent__icontains="android", then=Value("Android")),
-            When(user_agent__icontains="iphone", then=Value("iOS")),
-            When(user_agent__icontains="ipad", then=Value("iPadOS")),
-            When(user_agent__icontains="mac os", then=Value("macOS")),
-            When(user_agent__icontains="macintosh", then=Value("macOS")),
-            When(user_agent__icontains="windows", then=Value("Windows")),
-            When(user_agent__icontains="linux", then=Value("Linux")),
-            When(user_agent__icontains="cros", then=Value("ChromeOS")),
-            default=Value("Other"),
-            output_field=CharField(),
-        )
+        # Closed hours and days are read from the rollup tables; only the part
+        # of the range that has not been rolled up yet (normally the current
+        # hour) is aggregated from raw events. See core/analytics_rollups.py.
+        stats = RollupReader(start_dt, end_dt)
+
+        def _total(groups: dict) -> list:
+            total = [0, 0.0, 0]
+            for count, value_sum, value_count in groups.values():
+                total[0] += count
+                total[1] += value_sum
+                total[2] += value_count
+            return total
+
+        def _avg(acc) -> float:
+            return acc[1] / acc[2] if acc[2] else 0
+
+        def _local(dt: datetime) -> datetime:
+            return timezone.localtime(dt, timezone=tzinfo)
+
+        def _weekday(dt: datetime) -> int:
+            # Same numbering as ExtractWeekDay: 1 = Sunday ... 7 = Saturday.
+            return _local(dt).isoweekday() % 7 + 1
+
+        page_view_stats = stats.metrics(METRIC_PAGE_VIEW, by=("dim1",))
+        page_view_total = _total(page_view_stats)
+        total_page_views = page_view_total[0]
+        avg_time_ms = _avg(page_view_total)
+        avg_time_label = self._format_ms(avg_time_ms)
 
-        device_type_expr = Case(
-            When(Q(user_agent__icontains="ipad") | Q(user_agent__icontains="tablet"), then=Value("Tablet")),
-            When(
-                Q(user_agent__icontains="mobile")
-                | Q(user_agent__icontains="iphone")
-                | Q(user_agent__icontains="android"),
-                then=Value("Mobile"),
-            ),
-            default=Value("Desktop"),
-            output_field=CharField(),
-        )
+        visitor_rows = sorted(stats.visitors(), key=lambda row: row["bucket"])
+        unique_sessions = len({row["person"] for row in visitor_rows})
 
-        events = events.annotate(person_key=person_expr, device_os=device_os_expr, device_type=device_type_expr)
+        schedule_counts = {
+            label: count
+            for (label,), (count, _, _) in stats.metrics(METRIC_SCHEDULE, by=("dim1",)).items()
+        }
 
-        click_events = events.filter(event_type=AnalyticsEventType.CLICK)
-        page_views = events.filter(event_type=AnalyticsEventType.PAGE_VIEW)
-        total_page_views = page_views.count()
-        avg_time_ms = page_views.aggregate(avg=Avg("duration_ms"))['avg'] or 0
-        avg_time_label = self._format_ms(avg_time_ms)
-        unique_sessions = events.values("person_key").distinct().count()
-
-        rage_clicks_qs = events.filter(event_type=AnalyticsEventType.RAGE_CLICK)
-        dead_clicks_qs = events.filter(event_type=AnalyticsEventType.DEAD_CLICK)
-        hover_qs = events.filter(event_type=AnalyticsEventType.HOVER_INTENT)
-        exit_qs = events.filter(event_type=AnalyticsEventType.SESSION_EXIT)
-
-        schedule_open_qs = click_events.filter(label="schedule_modal_open")
-        schedule_existing_qs = click_events.filter(label="schedule_existing_select")
-        schedule_new_qs = click_events.filter(label="schedule_new_select")
-        schedule_no_selection_qs = click_events.filter(label="schedule_no_selection")
-
-        schedule_clicks_by_day = (
-            click_events.filter(
-                label__in=[
-                    "schedule_modal_open",
-                    "schedule_new_select",
-                    "schedule_existing_select",
-                ]
-            )
-            .annotate(day=TruncDate("created"))
-            .values("day", "label")
-            .annotate(count=Count("id"))
-            .order_by("day")
-        )
+        with timezone.override(tzinfo):
+            schedule_by_day = stats.metrics(METRIC_SCHEDULE, by=("day", "dim1"))
+            page_views_by_day = stats.metrics(METRIC_PAGE_VIEW, by=("day",))
+            cta_clicks_by_day = stats.metrics(METRIC_CTA, by=("day",))
+            page_views_by_weekday = stats.metrics(METRIC_PAGE_VIEW, by=("weekday",))
+            cta_clicks_by_weekday = stats.metrics(METRIC_CTA, by=("weekday",))
 
         schedule_daily_map: dict[date, dict[str, int | str]] = {}
-        for row in schedule_clicks_by_day:
-            day_key = row["day"]
+        schedule_daily_keys = {
+            "schedule_modal_open": "opens",
+            "schedule_new_select": "new",
+            "schedule_existing_select": "existing",
+        }
+        for (day_key, label), (count, _, _) in schedule_by_day.items():
+            if label not in schedule_daily_keys:
+                continue
             entry = schedule_daily_map.setdefault(
                 day_key,
                 {
@@ -1890,13 +1697,7 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
                     "existing": 0,
                 },
             )
-            label = row["label"]
-            if label == "schedule_modal_open":
-                entry["opens"] = row["count"]
-            elif label == "schedule_new_select":
-                entry["new"] = row["count"]
-            elif label == "schedule_existing_select":
-                entry["existing"] = row["count"]
+            entry[schedule_daily_keys[label]] = count
 
         def _fmt_day(day_val: date) -> str:
             try:
@@ -1917,49 +1718,16 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
                 }
             )
 
-        schedule_sources = list(
-            schedule_open_qs.values("metadata__source")
-            .annotate(count=Count("id"))
-            .order_by("-count")
+        schedule_sources = sorted(
+            (
+                {"metadata__source": source or None, "count": count}
+                for (source,), (count, _, _) in stats.metrics(METRIC_SCHEDULE_SOURCE, by=("dim1",)).items()
+            ),
+            key=lambda r: r["count"],
+            reverse=True,
         )
 
-        def _label_counts(qs):
-            return list(
-                qs.values("path", "label")
-                .annotate(count=Count("person_key", distinct=True))
-                .order_by("-count")
-            )
-
-        cta_excluded_labels = ["schedule_new_select", "schedule_existing_select"]
-        cta_events = click_events.exclude(label__in=cta_excluded_labels)
-
-        page_title_map: dict[str, str] = {}
-
-        def _add_title(path_val: str, title_val: str) -> None:
-            norm = (path_val or "").strip("/")
-            if norm in page_title_map:
-                return
-            page_title_map[norm] = title_val
-
-        for p in Page.objects.all().values("path", "title"):
-            _add_title(p.get("path") or "", p.get("title") or "")
-
-        for entry in StaticPageSEO.objects.all().values("slug", "page_name"):
-            _add_title(entry.get("slug") or "", entry.get("page_name") or "")
-
-        for t in TherapistProfile.objects.filter(is_published=True).values("slug", "salutation", "first_name", "last_name"):
-            slug = t.get("slug") or ""
-            salutation = (t.get("salutation") or "").strip()
-            first = (t.get("first_name") or "").strip()
-            last = (t.get("last_name") or "").strip()
-            name_parts = [p for p in [first, last] if p]
-            name = " ".join(name_parts) or slug or "Therapist"
-            if salutation:
-                name = f"{salutation} {name}".strip()
-            _add_title(f"therapists/{slug}", name)
-
-        for post in Post.objects.filter(status=Post.STATUS_PUBLISHED).values("slug", "title"):
-            _add_title(f"blog/{post.get('slug') or ''}", post.get("title") or "")
+        page_title_map = get_page_title_map()
 
         def _path_to_title(path_val: str) -> str:
             norm = (path_val or "").strip("/")
@@ -1967,28 +1735,29 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
                 return "Home"
             return page_title_map.get(norm, path_val or "(unknown)")
 
-        # Use modal opens as the single schedule CTA event to avoid double-counting alongside the per-button click labels.
-        schedule_cta_labels = [
-            "schedule_modal_open",
-        ]
-        call_cta_labels = [
-            "cta_call_header",
-            "cta_call_hero",
-            "cta_call_contact_home",
-            "cta_call_contact_section_primary",
-            "cta_call_contact_section_office",
-        ]
-        email_cta_labels = [
-            "cta_email_contact_home",
-            "cta_email_contact_section_primary",
-            "cta_email_contact_section_office",
-        ]
+        # Distinct visitors per (label, path), plus the CTA categories each visitor clicked.
+        cta_label_map = {lbl: "Schedule" for lbl in SCHEDULE_CTA_LABELS}
+        cta_label_map.update({lbl: "Call" for lbl in CALL_CTA_LABELS})
+        cta_label_map.update({lbl: "Email" for lbl in EMAIL_CTA_LABELS})
 
-        all_cta_labels = schedule_cta_labels + call_cta_labels + email_cta_labels
+        cta_visitors: dict[tuple[str, str], set[str]] = {}
+        session_cta_types: dict[str, set[str]] = {}
+        for (label, path, person) in stats.metrics(METRIC_CTA, by=("dim1", "dim2", "person")):
+            cta_visitors.setdefault((label, path), set()).add(person)
+            session_cta_types.setdefault(person, set()).add(cta_label_map[label])
+
+        def _label_counts(labels) -> list[dict]:
+            rows = [
+                {"path": path, "label": label, "count": len(persons)}
+                for (label, path), persons in cta_visitors.items()
+                if label in labels
+            ]
+            rows.sort(key=lambda r: r["count"], reverse=True)
+            return rows
 
-        schedule_cta_clicks = _label_counts(cta_events.filter(label__in=schedule_cta_labels))
-        call_cta_clicks = _label_counts(cta_events.filter(label__in=call_cta_labels))
-        email_cta_clicks = _label_counts(cta_events.filter(label__in=email_cta_labels))
+        schedule_cta_clicks = _label_counts(SCHEDULE_CTA_LABELS)
+        call_cta_clicks = _label_counts(CALL_CTA_LABELS)
+        email_cta_clicks = _label_counts(EMAIL_CTA_LABELS)
 
         cta_clicks_combined = [
             {"category": "Schedule", **row} for row in schedule_cta_clicks
@@ -2001,112 +1770,86 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
             row["page_title"] = _path_to_title(row.get("path") or "")
         cta_clicks_combined.sort(key=lambda r: r.get("count", 0), reverse=True)
 
-        weekday_map: dict[int, dict[str, int | str]] = {}
-
-        weekday_events = (
-            events.annotate(weekday=ExtractWeekDay("created"))
-            .values("weekday")
-            .annotate(sessions=Count("person_key", distinct=True))
-        )
-        for row in weekday_events:
-            weekday = int(row.get("weekday") or 0)
-            entry = weekday_map.setdefault(
-                weekday,
-                {"weekday": weekday, "weekday_label": "", "sessions": 0, "page_views": 0, "cta_clicks": 0},
-            )
-            entry["sessions"] = row.get("sessions", 0) or 0
-
-        weekday_page_views = (
-            page_views.annotate(weekday=ExtractWeekDay("created"))
-            .values("weekday")
-            .annotate(page_views=Count("id"))
-        )
-        for row in weekday_page_views:
-            weekday = int(row.get("weekday") or 0)
-            entry = weekday_map.setdefault(
-                weekday,
-                {"weekday": weekday, "weekday_label": "", "sessions": 0, "page_views": 0, "cta_clicks": 0},
-            )
-            entry["page_views"] = row.get("page_views", 0) or 0
-
-        weekday_cta = (
-            cta_events.filter(label__in=all_cta_labels)
-            .annotate(weekday=ExtractWeekDay("created"))
-            .values("weekday")
-            .annotate(cta_clicks=Count("id"))
-        )
-        for row in weekday_cta:
-            weekday = int(row.get("weekday") or 0)
-            entry = weekday_map.setdefault(
-                weekday,
-                {"weekday": weekday, "weekday_label": "", "sessions": 0, "page_views": 0, "cta_clicks": 0},
-            )
-            entry["cta_clicks"] = row.get("cta_clicks", 0) or 0
+        # Per-visitor rollup rows: sessions by day/weekday, exits, page sequences,
+        # locations and devices.
+        persons_by_day: dict[date, set[str]] = {}
+        persons_by_weekday: dict[int, set[str]] = {}
+        session_pages: dict[str, list[str]] = {}
+        latest_exit_by_session: dict[str, dict] = {}
+        location_map: dict[tuple[str, str, str, str], dict] = {}
+        device_map: dict[tuple[str, str], dict] = {}
+        for row in visitor_rows:
+            person = row["person"]
+            persons_by_day.setdefault(_local(row["bucket"]).date(), set()).add(person)
+            persons_by_weekday.setdefault(_weekday(row["bucket"]), set()).add(person)
+            session_pages.setdefault(person, []).extend(row["page_paths"] or [])
+
+            # Keep only the last exit event per session so exits represent the final page seen.
+            exit_at = row["last_exit_at"]
+            if exit_at:
+                existing = latest_exit_by_session.get(person)
+                if not existing or exit_at > existing["created"]:
+                    latest_exit_by_session[person] = {"path": row["last_exit_path"], "created": exit_at}
+
+            if row["geo_events"]:
+                key = (row["country_code"], row["region"], row["city"], row["timezone"])
+                entry = location_map.setdefault(key, {"count": 0, "sessions": set()})
+                entry["count"] += row["geo_events"]
+                entry["sessions"].add(person)
+
+            entry = device_map.setdefault((row["device_os"], row["device_type"]), {"events": 0, "sessions": set()})
+            entry["events"] += row["events"]
+            entry["sessions"].add(person)
 
         weekday_labels = {1: "Sun", 2: "Mon", 3: "Tue", 4: "Wed", 5: "Thu", 6: "Fri", 7: "Sat"}
         by_weekday = []
         for weekday in range(1, 8):
-            entry = weekday_map.get(
-                weekday,
-                {"weekday": weekday, "weekday_label": "", "sessions": 0, "page_views": 0, "cta_clicks": 0},
+            by_weekday.append(
+                {
+                    "weekday": weekday,
+                    "weekday_label": weekday_labels.get(weekday, str(weekday)),
+                    "sessions": len(persons_by_weekday.get(weekday, ())),
+                    "page_views": page_views_by_weekday.get((weekday,), [0])[0],
+                    "cta_clicks": cta_clicks_by_weekday.get((weekday,), [0])[0],
+                }
             )
-            entry["weekday_label"] = weekday_labels.get(weekday, str(weekday))
-            by_weekday.append(entry)
 
-        rage_click_count = rage_clicks_qs.count()
-        dead_click_count = dead_clicks_qs.count()
+        rage_stats = stats.metrics(METRIC_RAGE_CLICK, by=("dim1",))
+        dead_stats = stats.metrics(METRIC_DEAD_CLICK, by=("dim1",))
+        hover_stats = stats.metrics(METRIC_HOVER, by=("dim1",))
+        hover_total = _total(hover_stats)
+        exit_total = _total(stats.metrics(METRIC_SESSION_EXIT))
 
-        exit_events_raw = list(
-            exit_qs.order_by("person_key", "-created", "-id")
-            .values(
-                "person_key",
-                "path",
-                "metadata__exit_scroll",
-                "metadata__click_path",
-                "created",
-            )
-        )
-
-        # Keep only the last exit event per session so exits represent the final page seen.
-        latest_exit_by_session: dict[str, dict] = {}
-        for row in exit_events_raw:
-            session_key = row.get("person_key") or ""
-            created = row.get("created")
-            existing = latest_exit_by_session.get(session_key)
-            if not existing:
-                latest_exit_by_session[session_key] = row
-                continue
-
-            existing_created = existing.get("created")
-            if created and not existing_created:
-                latest_exit_by_session[session_key] = row
-            elif created and existing_created and created > existing_created:
-                latest_exit_by_session[session_key] = row
+        rage_click_count = _total(rage_stats)[0]
+        dead_click_count = _total(dead_stats)[0]
 
         exit_events_dedup: list[dict] = list(latest_exit_by_session.values())
         exit_event_count = len(exit_events_dedup)
 
-        rage_hotspots = list(
-            rage_clicks_qs.values("label")
-            .annotate(count=Count("id"))
-            .order_by("-count")
+        rage_hotspots = sorted(
+            ({"label": label, "count": count} for (label,), (count, _, _) in rage_stats.items()),
+            key=lambda r: r["count"],
+            reverse=True,
         )
 
-        dead_hotspots = list(
-            dead_clicks_qs.values("label")
-            .annotate(count=Count("id"))
-            .order_by("-count")
+        dead_hotspots = sorted(
+            ({"label": label, "count": count} for (label,), (count, _, _) in dead_stats.items()),
+            key=lambda r: r["count"],
+            reverse=True,
         )
 
-        hover_targets = list(
-            hover_qs.values("label")
-            .annotate(count=Count("id"), avg_duration=Avg("duration_ms"))
-            .order_by("-count")
+        hover_targets = sorted(
+            (
+                {"label": label, "count": acc[0], "avg_duration": _avg(acc) if acc[2] else None}
+                for (label,), acc in hover_stats.items()
+            ),
+            key=lambda r: r["count"],
+            reverse=True,
         )
         for row in hover_targets:
             row["avg_duration_label"] = self._format_ms(row.get("avg_duration") or 0)
 
-        avg_hover_ms = hover_qs.aggregate(avg=Avg("duration_ms"))["avg"] or 0
+        avg_hover_ms = _avg(hover_total)
         avg_hover_label = self._format_ms(avg_hover_ms)
 
         exit_sessions = len(latest_exit_by_session)
@@ -2129,33 +1872,14 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
             )
         exit_by_path.sort(key=lambda r: r.get("count", 0), reverse=True)
 
-        click_path_map: dict[str, dict[str, int | set[str]]] = {}
-
-        # Track CTA categories clicked per session (Schedule/Call/Email).
-        cta_label_map = {lbl: "Schedule" for lbl in schedule_cta_labels}
-        cta_label_map.update({lbl: "Call" for lbl in call_cta_labels})
-        cta_label_map.update({lbl: "Email" for lbl in email_cta_labels})
-
-        session_cta_types: dict[str, set[str]] = {}
-        for row in cta_events.filter(label__in=all_cta_labels).values("person_key", "label"):
-            session_key = row.get("person_key") or ""
-            category = cta_label_map.get(row.get("label") or "")
-            if not category:
-                continue
-            entry = session_cta_types.setdefault(session_key, set())
-            entry.add(category)
-
         for row in exit_by_path:
             row["page_title"] = _path_to_title(row.get("path") or "")
 
-        session_pages: dict[str, list[str]] = {}
-        for row in page_views.order_by("person_key", "created", "id").values("person_key", "path"):
-            session_key = row.get("person_key") or ""
-            path = row.get("path") or ""
-            session_pages.setdefault(session_key, []).append(path)
+        click_path_map: dict[str, dict[str, int | set[str]]] = {}
 
         for session_key, paths in session_pages.items():
             # Build a simple navigation sequence of page titles, ignoring clicks/buttons.
+            # Rollup rows are already de-duplicated within a bucket; repeat across buckets.
             deduped_paths: list[str] = []
             for p in paths:
                 if not p:
@@ -2183,61 +1907,24 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
             )
         click_paths.sort(key=lambda r: r.get("count", 0), reverse=True)
 
-        page_views_by_day = list(
-            page_views.annotate(day=TruncDate("created"))
-            .values("day")
-            .annotate(count=Count("id"))
-            .order_by("day")
-        )
-
-        cta_clicks_by_day = list(
-            cta_events.filter(label__in=all_cta_labels)
-            .annotate(day=TruncDate("created"))
-            .values("day")
-            .annotate(cta_clicks=Count("id"))
-            .order_by("day")
-        )
-
-        sessions_by_day = list(
-            events.annotate(day=TruncDate("created"))
-            .values("day")
-            .annotate(sessions=Count("person_key", distinct=True))
-            .order_by("day")
-        )
-
-        # New sessions: persons whose very first event (across all time) falls within the
-        # selected date range. Single aggregating query — no intermediate Python list.
+        # New sessions: persons whose first referred visit (across all time) falls
+        # within the selected date range. Direct traffic (no referrer) is excluded
+        # as it most likely represents returning users.
         new_sessions_by_day: dict[date, int] = {}
-        # Only count new sessions where a referrer is present — direct traffic
-        # (no referrer) is excluded as it most likely represents returning users.
-        first_seen_qs = (
-            AnalyticsEvent.objects
-            .filter(is_authenticated=False)
-            .filter(Q(country_code="US") | Q(country_code=""))
-            .exclude(bot_ua_exclude_q())
-            .exclude(referrer="")
-            .exclude(referrer__isnull=True)
-            .annotate(person_key=person_expr)
-            .values("person_key")
-            .annotate(first_seen=Min("created"))
-            .filter(first_seen__gte=start_dt, first_seen__lt=end_dt)
-        )
-        for row in first_seen_qs:
-            fs = row["first_seen"]
-            if fs:
-                day_key = timezone.localtime(fs, timezone=tzinfo).date()
-                new_sessions_by_day[day_key] = new_sessions_by_day.get(day_key, 0) + 1
+        for fs in stats.first_referred().values():
+            day_key = _local(fs).date()
+            new_sessions_by_day[day_key] = new_sessions_by_day.get(day_key, 0) + 1
         total_new_sessions = sum(new_sessions_by_day.values())
 
         daily_map: dict[date, dict[str, int]] = {}
-        for row in page_views_by_day:
-            daily_map[row["day"]] = {"page_views": row["count"], "sessions": 0, "cta_clicks": 0, "new_sessions": 0}
-        for row in sessions_by_day:
-            existing = daily_map.setdefault(row["day"], {"page_views": 0, "sessions": 0, "cta_clicks": 0, "new_sessions": 0})
-            existing["sessions"] = row["sessions"]
-        for row in cta_clicks_by_day:
-            existing = daily_map.setdefault(row["day"], {"page_views": 0, "sessions": 0, "cta_clicks": 0, "new_sessions": 0})
-            existing["cta_clicks"] = row["cta_clicks"]
+        for (day_key,), (count, _, _) in page_views_by_day.items():
+            daily_map[day_key] = {"page_views": count, "sessions": 0, "cta_clicks": 0, "new_sessions": 0}
+        for day_key, persons in persons_by_day.items():
+            existing = daily_map.setdefault(day_key, {"page_views": 0, "sessions": 0, "cta_clicks": 0, "new_sessions": 0})
+            existing["sessions"] = len(persons)
+        for (day_key,), (count, _, _) in cta_clicks_by_day.items():
+            existing = daily_map.setdefault(day_key, {"page_views": 0, "sessions": 0, "cta_clicks": 0, "new_sessions": 0})
+            existing["cta_clicks"] = count
         for day_key, count in new_sessions_by_day.items():
             existing = daily_map.setdefault(day_key, {"page_views": 0, "sessions": 0, "cta_clicks": 0, "new_sessions": 0})
             existing["new_sessions"] = count
@@ -2272,33 +1959,25 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
             for entry in chart_by_day
         ]
 
-        top_pages = list(
-            page_views.values("path")
-            .annotate(count=Count("id"), avg_duration=Avg("duration_ms"))
-            .order_by("-count")
+        top_pages = sorted(
+            (
+                {"path": path, "count": acc[0], "avg_duration": _avg(acc) if acc[2] else None}
+                for (path,), acc in page_view_stats.items()
+            ),
+            key=lambda r: r["count"],
+            reverse=True,
         )
         for row in top_pages:
             row["avg_duration_label"] = self._format_ms(row.get("avg_duration") or 0)
             row["page_title"] = _path_to_title(row.get("path") or "")
 
-        top_clicks_exclude = [
-            "menu_toggle",
-            "mobile_nav_toggle",
-            "nav_toggle",
-            "menu-toggle",
-            "mobile-menu-toggle",
-            "continue with microsoft",
-            "",
-        ]
-        top_clicks = list(
-            events.filter(event_type=AnalyticsEventType.CLICK)
-            .exclude(label__in=top_clicks_exclude)
-            .exclude(path__startswith="/admin")
-            .exclude(metadata__href__icontains="/admin")
-            .exclude(metadata__target__icontains="modal")
-            .values("label", "path")
-            .annotate(count=Count("id"))
-            .order_by("-count")
+        top_clicks = sorted(
+            (
+                {"label": label, "path": path, "count": count}
+                for (label, path), (count, _, _) in stats.metrics(METRIC_CLICK, by=("dim1", "dim2")).items()
+            ),
+            key=lambda r: r["count"],
+            reverse=True,
         )
         for row in top_clicks:
             row["page_title"] = _path_to_title(row.get("path") or "")
@@ -2306,38 +1985,57 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
         gsc_top_queries = fetch_top_queries(start_date, end_date)
 
         current_host = request.get_host()
-        landing_referrers = list(
-            events.exclude(
-                Q(metadata__landing_referrer__icontains="localhost")
-                | Q(metadata__landing_referrer__icontains="127.0.0.1")
-                | Q(metadata__landing_referrer__icontains=current_host)
-            )
-            .values("metadata__landing_referrer")
-            .annotate(
-                sessions=Count("person_key", distinct=True),
-                events=Count("id"),
-            )
-            .order_by("-sessions")
+        internal_referrers = ("localhost", "127.0.0.1", current_host.lower())
+        referrer_map: dict[str, dict] = {}
+        for (referrer, person), (count, _, _) in stats.metrics(
+            METRIC_LANDING_REFERRER, by=("dim1", "person")
+        ).items():
+            if any(host in referrer.lower() for host in internal_referrers):
+                continue
+            entry = referrer_map.setdefault(referrer, {"sessions": set(), "events": 0})
+            entry["sessions"].add(person)
+            entry["events"] += count
+        landing_referrers = sorted(
+            (
+                {
+                    "metadata__landing_referrer": referrer or None,
+                    "sessions": len(entry["sessions"]),
+                    "events": entry["events"],
+                }
+                for referrer, entry in referrer_map.items()
+            ),
+            key=lambda r: r["sessions"],
+            reverse=True,
         )
 
-        avg_scroll = (
-            events.filter(event_type=AnalyticsEventType.SCROLL)
-            .aggregate(avg=Avg("scroll_percent"))
-            .get("avg")
-            or 0
-        )
+        avg_scroll = _avg(_total(stats.metrics(METRIC_SCROLL)))
 
-        locations = list(
-            events.exclude(country_code="")
-            .values("country_code", "region", "city", "timezone")
-            .annotate(count=Count("id"), sessions=Count("person_key", distinct=True))
-            .order_by("-sessions", "-count")
+        locations = sorted(
+            (
+                {
+                    "country_code": country_code,
+                    "region": region,
+                    "city": city,
+                    "timezone": tz,
+                    "count": entry["count"],
+                    "sessions": len(entry["sessions"]),
+                }
+                for (country_code, region, city, tz), entry in location_map.items()
+            ),
+            key=lambda r: (-r["sessions"], -r["count"]),
         )
 
-        device_os_stats = list(
-            events.values("device_os", "device_type")
-            .annotate(sessions=Count("person_key", distinct=True), events=Count("id"))
-            .order_by("-sessions", "device_os", "device_type")
+        device_os_stats = sorted(
+            (
+                {
+                    "device_os": os_name,
+                    "device_type": form_factor,
+                    "sessions": len(entry["sessions"]),
+                    "events": entry["events"],
+                }
+                for (os_name, form_factor), entry in device_map.items()
+            ),
+            key=lambda r: (-r["sessions"], r["device_os"], r["device_type"]),
         )
 
         ctx = {
@@ -2365,20 +2063,20 @@ class VisitorStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
             "dead_hotspots": dead_hotspots,
             "hover_targets": hover_targets,
             "avg_hover_label": avg_hover_label,
-            "hover_event_count": hover_qs.count(),
+            "hover_event_count": hover_total[0],
             "exit_rate": exit_rate,
             "exit_by_path": exit_by_path,
-            "avg_exit_scroll": round(exit_qs.aggregate(avg=Avg(Cast("metadata__exit_scroll", FloatField())))["avg"] or 0),
+            "avg_exit_scroll": round(_avg(exit_total)),
             "click_paths": click_paths,
             "exit_sessions": exit_sessions,
             "rage_click_count": rage_click_count,
             "dead_click_count": dead_click_count,
             "exit_event_count": exit_event_count,
             "active_timezone": tz_name,
-            "schedule_modal_open_count": schedule_open_qs.count(),
-            "schedule_existing_select_count": schedule_existing_qs.count(),
-            "schedule_new_select_count": schedule_new_qs.count(),
-            "schedule_no_selection_count": schedule_no_selection_qs.count(),
+            "schedule_modal_open_count": schedule_counts.get("schedule_modal_open", 0),
+            "schedule_existing_select_count": schedule_counts.get("schedule_existing_select", 0),
+            "schedule_new_select_count": schedule_counts.get("schedule_new_select", 0),
+            "schedule_no_selection_count": schedule_counts.get("schedule_no_selection", 0),
             "schedule_sources": schedule_sources,
             "cta_clicks": cta_clicks_combined,
             "schedule_cta_total": sum(row.get("count", 0) for row in schedule_cta_clicks),
@@ -3729,7 +3427,8 @@ class UrlRemovalView(LoginRequiredMixin, UserPassesTestMixin, View):
 
     def post(self, request: HttpRequest) -> HttpResponse:
         from urllib.parse import urlparse
-        from django.core.cache import cache
+        from core.cache import GONE_410
+        from core.middleware import Custom410Middleware
         from core.models import Gone410URL
 
         action = request.POST.get("action", "check")
@@ -3741,7 +3440,7 @@ class UrlRemovalView(LoginRequiredMixin, UserPassesTestMixin, View):
                 if p:
                     Gone410URL.objects.get_or_create(path=p)
             if paths:
-                cache.delete("gone_410_paths")
+                GONE_410.delete(Custom410Middleware._CACHE_KEY)
             from django.shortcuts import redirect
             from django.urls import reverse
             return redirect(reverse("accounts:settings_url_removal"))
@@ -3750,7 +3449,7 @@ class UrlRemovalView(LoginRequiredMixin, UserPassesTestMixin, View):
             path = request.POST.get("path", "").strip()
             if path:
                 Gone410URL.objects.filter(path=path).delete()
-                cache.delete("gone_410_paths")
+                GONE_410.delete(Custom410Middleware._CACHE_KEY)
             from django.shortcuts import redirect
             from django.urls import reverse
             return redirect(reverse("accounts:settings_url_removal"))
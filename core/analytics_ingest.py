@@ -0,0 +1,299 @@
+"""
+Asynchronous ingestion pipeline for front-end analytics events.
+
+The ``/api/analytics/`` view only validates the payload and pushes it onto a
+Redis list; it never touches the database or the network.  The Celery task
+``core.tasks.drain_analytics_events`` pops events off the list in batches,
+enriches them (IP hashing and geolocation via core.utils.geolocation, once
+per distinct IP per batch; user agents are resolved to UserAgent rows once per
+distinct string) and writes each batch with a single ``bulk_create``.  Each
+written batch also updates the live session store (core/live_sessions.py) and
+flags any rollup bucket it lands in that was already built (late events).
+A batch that fails to write goes back to the head of the queue; after
+MAX_ATTEMPTS failures it is moved to DEAD_LETTER_KEY so it no longer blocks
+the batches behind it.
+
+When ``REDIS_URL`` is not configured (local development) events are
+persisted inline so the tracker still works without a broker.
+
+Public API
+----------
+  InvalidEvent                          raised by validate_event()
+  validate_event(payload, ...)          -> dict | None
+  validate_batch(payload, ...)          -> list[dict]
+  enqueue_events(events)                -> None
+  drain_events(batch_size=BATCH_SIZE)   -> int   (events popped)
+  persist_events(events)                -> int   (rows written)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from datetime import datetime, timezone as dt_timezone
+from urllib.parse import urlparse
+
+from django.db import transaction
+
+from core.analytics_rollups import mark_dirty
+from core.live_sessions import record_events
+from core.models import AnalyticsEvent, AnalyticsEventType, UserAgent
+from core.utils.geolocation import flush_stats, geolocate
+from core.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "analytics:events"
+BATCH_SIZE = 500
+# Batches that failed MAX_ATTEMPTS writes, kept (newest DEAD_LETTER_MAX events)
+# for inspection instead of being retried forever
+DEAD_LETTER_KEY = "analytics:events:dead"
+MAX_ATTEMPTS = 3
+DEAD_LETTER_MAX = 10_000
+# Once the queue holds a full batch the producer nudges the consumer
+# instead of waiting for the next beat tick.
+KICK_THRESHOLD = BATCH_SIZE
+# Largest envelope accepted by /api/analytics/batch/ (the tracker flushes well below this)
+MAX_BATCH_EVENTS = 50
+# Client-reported event ages beyond this are clamped (stale tabs, bad clocks)
+MAX_EVENT_AGE_MS = 10 * 60 * 1000
+
+_BLOCKED_PATHS = ("/admin", "/accounts/login", "/accounts/logout")
+_AUTH_EVENTS = {AnalyticsEventType.AUTH_SUCCESS, AnalyticsEventType.AUTH_FAILED}
+
+
+class InvalidEvent(ValueError):
+    """The payload cannot be accepted; the message is returned to the client."""
+
+
+def _text(payload: dict, key: str) -> str:
+    """Return a string field of ``payload`` (``""`` when absent); reject other types."""
+    value = payload.get(key) or ""
+    if not isinstance(value, str):
+        raise InvalidEvent(f"invalid {key}")
+    return value
+
+
+def validate_event(
+    payload: dict,
+    *,
+    ip: str,
+    user_agent: str,
+    request_path: str = "",
+    session_id: str | None = None,
+    received_at: float | None = None,
+) -> dict | None:
+    """
+    Normalise one tracker payload into a queue record.
+
+    ``session_id`` and ``received_at`` override the payload's own values
+    (used by validate_batch, where they come from the envelope).
+
+    Returns ``None`` for events that are valid but deliberately not recorded
+    (admin/login paths).  Raises :class:`InvalidEvent` for malformed input.
+    """
+    if not isinstance(payload, dict):
+        raise InvalidEvent("invalid payload")
+
+    event_type = payload.get("event_type") or ""
+    if event_type not in AnalyticsEventType.values:
+        raise InvalidEvent("unknown event type")
+
+    if session_id is None:
+        session_id = payload.get("session_id") or ""
+    session_id = str(session_id).strip()[:64]
+    if not session_id:
+        raise InvalidEvent("session_id required")
+
+    raw_path = (_text(payload, "path") or request_path or "").split("?")[0]
+    if "://" in raw_path:
+        raw_path = urlparse(raw_path).path or raw_path
+    path = raw_path[:500]
+
+    if event_type not in _AUTH_EVENTS and any(path.startswith(p) for p in _BLOCKED_PATHS):
+        return None
+
+    try:
+        duration_ms = max(int(payload.get("duration_ms") or 0), 0)
+        scroll_percent = max(0, min(int(payload.get("scroll_percent") or 0), 100))
+    except (TypeError, ValueError):
+        raise InvalidEvent("invalid number")
+
+    metadata = payload.get("metadata")
+    if not isinstance(metadata, dict):
+        metadata = {}
+
+    return {
+        "event_type": event_type,
+        "session_id": session_id,
+        "path": path,
+        "referrer": _text(payload, "referrer")[:500],
+        "label": _text(payload, "label")[:255],
+        "duration_ms": duration_ms,
+        "scroll_percent": scroll_percent,
+        "metadata": metadata,
+        "ip": ip or "",
+        "user_agent": (user_agent or "")[:1000],
+        "ts": received_at if received_at is not None else time.time(),
+    }
+
+
+def validate_batch(payload: dict, *, ip: str, user_agent: str, request_path: str = "") -> list[dict]:
+    """
+    Normalise a batch envelope ``{"session_id", "sent_at", "events": [...]}``.
+
+    Each event may carry ``t`` (client ms timestamp); its age relative to the
+    envelope's ``sent_at`` is subtracted from the server receive time, so the
+    stored timestamp does not depend on the client clock being right.
+
+    Invalid or blocked events are skipped; an invalid envelope raises
+    :class:`InvalidEvent`.
+    """
+    if not isinstance(payload, dict):
+        raise InvalidEvent("invalid payload")
+    session_id = payload.get("session_id") or ""
+    if not isinstance(session_id, str):
+        raise InvalidEvent("invalid session_id")
+    session_id = session_id.strip()[:64]
+    if not session_id:
+        raise InvalidEvent("session_id required")
+    events = payload.get("events")
+    if not isinstance(events, list) or not events:
+        raise InvalidEvent("events required")
+    if len(events) > MAX_BATCH_EVENTS:
+        raise InvalidEvent("too many events")
+
+    now = time.time()
+    sent_at = payload.get("sent_at")
+    records = []
+    for item in events:
+        received_at = now
+        if isinstance(item, dict) and isinstance(item.get("t"), (int, float)) and isinstance(sent_at, (int, float)):
+            age_ms = max(0, min(sent_at - item["t"], MAX_EVENT_AGE_MS))
+            received_at = now - age_ms / 1000
+        try:
+            record = validate_event(
+                item,
+                ip=ip,
+                user_agent=user_agent,
+                request_path=request_path,
+                session_id=session_id,
+                received_at=received_at,
+            )
+        except InvalidEvent:
+            continue
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def enqueue_events(events: list[dict]) -> None:
+    """Push validated events onto the ingest queue (or persist inline without Redis)."""
+    if not events:
+        return
+    client = get_redis()
+    if client is None:
+        persist_events(events)
+        return
+    try:
+        length = client.rpush(QUEUE_KEY, *(json.dumps(e, separators=(",", ":")) for e in events))
+    except Exception as exc:
+        # Redis outage: fall back to a direct write rather than dropping data
+        logger.warning("analytics queue unavailable, writing inline: %s", exc)
+        persist_events(events)
+        return
+    if length >= KICK_THRESHOLD and length - len(events) < KICK_THRESHOLD:
+        from core.tasks import drain_analytics_events
+
+        drain_analytics_events.delay()
+
+
+def drain_events(batch_size: int = BATCH_SIZE) -> int:
+    """Pop up to *batch_size* events from the queue and persist them. Returns the number popped."""
+    client = get_redis()
+    if client is None:
+        return 0
+
+    pipe = client.pipeline(transaction=True)
+    pipe.lrange(QUEUE_KEY, 0, batch_size - 1)
+    pipe.ltrim(QUEUE_KEY, batch_size, -1)
+    raw, _ = pipe.execute()
+    if not raw:
+        return 0
+
+    events = []
+    for item in raw:
+        try:
+            event = json.loads(item)
+        except (TypeError, ValueError):
+            event = None
+        if isinstance(event, dict):
+            events.append(event)
+        else:
+            logger.warning("dropping malformed analytics queue item")
+
+    try:
+        persist_events(events)
+    except Exception:
+        attempts = 1 + max((event.get("_attempts", 0) for event in events), default=0)
+        retry = [json.dumps({**event, "_attempts": attempts}, separators=(",", ":")) for event in events]
+        if attempts < MAX_ATTEMPTS:
+            # Put the batch back at the head of the queue so it is retried
+            if retry:
+                client.lpush(QUEUE_KEY, *reversed(retry))
+            raise
+        logger.exception(
+            "analytics batch of %d event(s) failed %d times; moved to %s", len(retry), attempts, DEAD_LETTER_KEY,
+        )
+        if retry:
+            pipe = client.pipeline(transaction=False)
+            pipe.rpush(DEAD_LETTER_KEY, *retry)
+            pipe.ltrim(DEAD_LETTER_KEY, -DEAD_LETTER_MAX, -1)
+            pipe.execute()
+    return len(raw)
+
+
+def persist_events(events: list[dict]) -> int:
+    """Enrich queue records and write them with one ``bulk_create``. Returns rows written."""
+    geo_by_ip: dict[str, dict[str, str]] = {}
+    hash_by_ip: dict[str, str] = {}
+    agents = UserAgent.resolve({event.get("user_agent", "") for event in events})
+    rows = []
+    for event in events:
+        ip = event.get("ip", "")
+        if ip not in geo_by_ip:
+            hash_by_ip[ip] = AnalyticsEvent.hash_ip(ip)
+            geo_by_ip[ip] = geolocate(ip, ip_hash=hash_by_ip[ip], remote=True)
+        geo = geo_by_ip[ip]
+        agent = agents.get(event.get("user_agent", ""))
+        rows.append(AnalyticsEvent(
+            created=datetime.fromtimestamp(event.get("ts") or time.time(), tz=dt_timezone.utc),
+            event_type=event["event_type"],
+            session_id=event["session_id"],
+            path=event["path"],
+            referrer=event.get("referrer", ""),
+            ua=agent,
+            ip_hash=hash_by_ip[ip],
+            label=event.get("label", ""),
+            duration_ms=event.get("duration_ms", 0),
+            scroll_percent=event.get("scroll_percent", 0),
+            metadata=event.get("metadata") or {},
+            is_authenticated=bool(event.get("is_authenticated")),
+            country_code=geo.get("country_code", ""),
+            region=geo.get("region", ""),
+            city=geo.get("city", ""),
+            timezone=geo.get("timezone", ""),
+            is_bot=agent.is_bot if agent else False,
+        ))
+    with transaction.atomic():
+        AnalyticsEvent.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+        # Late events (queue backlog, dead-letter replay) can land in rolled-up buckets
+        mark_dirty(row.created for row in rows)
+    flush_stats()
+    try:
+        record_events(rows)
+    except Exception as exc:
+        # The rows are written; a stale live view is better than re-queueing them
+        logger.warning("live session update failed: %s", exc)
+    return len(rows)
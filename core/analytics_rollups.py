@@ -0,0 +1,562 @@
+"""
+Hourly and daily rollups of AnalyticsEvent for the visitor-stats dashboard.
+
+Raw events are folded into two tables per bucket (one UTC hour, or one day
+in settings.TIME_ZONE):
+
+  AnalyticsMetricRollup   counts / value sums per metric and dimension
+                          (page views by path, clicks by label+path, hover
+                          durations, schedule funnel labels, …)
+  AnalyticsVisitorRollup  one row per visitor: event counts, device, geo,
+                          first referred visit, last exit, page sequence
+
+AnalyticsRollupBucket marks which buckets are complete.  The Celery task
+``core.tasks.build_analytics_rollups`` builds closed buckets every 15
+minutes; ``manage.py build_analytics_rollups`` backfills history.  Events
+persisted after their bucket was built (ingest backlog, dead-letter replay)
+mark it dirty via mark_dirty(); dirty buckets are read raw until the task
+rebuilds them.
+
+The dashboard reads through RollupReader, which covers the requested range
+with complete day buckets, then complete hour buckets, and computes whatever
+is left (normally just the current hour) from raw events with the same code
+the builder uses.  "First referred visit" looks at all history before the
+range; history no bucket covers is read from raw events too.
+
+Only the dashboard population is rolled up: anonymous, US/unknown-country,
+non-bot events (see dashboard_events()).
+
+Public API
+----------
+  dashboard_events()                       -> QuerySet[AnalyticsEvent]
+  person_key_expr()                        -> Case   (visitor identity annotation)
+  compute_rollups(start, end, bucket=None) -> RollupData
+  build_bucket(period, start)              -> int   (events rolled up)
+  mark_dirty(created)                      -> int   (built buckets invalidated)
+  build_pending_rollups(since=None, ...)   -> dict  (buckets built per period)
+  RollupReader(start, end)                 dashboard read API
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Case, CharField, Min, Q, Sum, Value, When
+from django.db.models.functions import Cast, Concat, ExtractWeekDay, TruncDate
+from django.utils import timezone
+
+from core.models import (
+    AnalyticsEvent,
+    AnalyticsEventType,
+    AnalyticsMetricRollup,
+    AnalyticsRollupBucket,
+    AnalyticsVisitorRollup,
+    RollupPeriod,
+)
+from core.utils.device_detection import classify_device
+
+HOUR = timedelta(hours=1)
+PERIOD_HOUR = RollupPeriod.HOUR.value
+PERIOD_DAY = RollupPeriod.DAY.value
+# Closed buckets are only rolled up once late events (tracker buffering,
+# ingest queue) have had time to land.
+GRACE = timedelta(minutes=15)
+LOOKBACK_DAYS = 3
+BATCH_SIZE = 1000
+
+METRIC_PAGE_VIEW = "page_view"
+METRIC_SCROLL = "scroll"
+METRIC_HOVER = "hover"
+METRIC_RAGE_CLICK = "rage_click"
+METRIC_DEAD_CLICK = "dead_click"
+METRIC_SESSION_EXIT = "session_exit"
+METRIC_CLICK = "click"                    # top clicks, dashboard exclusions applied
+METRIC_SCHEDULE = "schedule"              # schedule funnel labels
+METRIC_SCHEDULE_SOURCE = "schedule_source"
+METRIC_CTA = "cta"                        # per person, for distinct-visitor counts
+METRIC_LANDING_REFERRER = "landing_referrer"  # per person
+
+SCHEDULE_FUNNEL_LABELS = (
+    "schedule_modal_open",
+    "schedule_existing_select",
+    "schedule_new_select",
+    "schedule_no_selection",
+)
+# Modal opens are the single schedule CTA event; the per-button select labels
+# would double-count them.
+SCHEDULE_CTA_LABELS = ("schedule_modal_open",)
+CALL_CTA_LABELS = (
+    "cta_call_header",
+    "cta_call_hero",
+    "cta_call_contact_home",
+    "cta_call_contact_section_primary",
+    "cta_call_contact_section_office",
+)
+EMAIL_CTA_LABELS = (
+    "cta_email_contact_home",
+    "cta_email_contact_section_primary",
+    "cta_email_contact_section_office",
+)
+ALL_CTA_LABELS = SCHEDULE_CTA_LABELS + CALL_CTA_LABELS + EMAIL_CTA_LABELS
+TOP_CLICKS_EXCLUDE = frozenset((
+    "menu_toggle",
+    "mobile_nav_toggle",
+    "nav_toggle",
+    "menu-toggle",
+    "mobile-menu-toggle",
+    "continue with microsoft",
+    "",
+))
+
+
+def dashboard_events():
+    """Events the visitor-stats dashboard reports on."""
+    return (
+        AnalyticsEvent.objects.filter(is_authenticated=False)
+        .filter(Q(country_code="US") | Q(country_code=""))
+        .filter(is_bot=False)
+    )
+
+
+def person_key(ip_hash: str, ua_id: int | None, user_agent: str, session_id: str) -> str:
+    """
+    Visitor identity used by the dashboards: IP hash + UserAgent id, else IP
+    hash, else session.  Legacy rows without ``ua`` fall back to the UA text.
+    """
+    if ip_hash and ua_id is not None:
+        return f"{ip_hash}|{ua_id}"
+    if ip_hash and user_agent:
+        return f"{ip_hash}|{user_agent}"
+    return ip_hash or session_id
+
+
+def person_key_expr() -> Case:
+    """person_key() as an ``AnalyticsEvent`` annotation."""
+    return Case(
+        When(~Q(ip_hash="") & Q(ua__isnull=False), then=Concat("ip_hash", Value("|"), Cast("ua_id", CharField()))),
+        When(~Q(ip_hash="") & ~Q(user_agent=""), then=Concat("ip_hash", Value("|"), "user_agent")),
+        When(~Q(ip_hash=""), then="ip_hash"),
+        default="session_id",
+        output_field=CharField(),
+    )
+
+
+def person_digest(ip_hash: str, ua_id: int | None, user_agent: str, session_id: str) -> str:
+    return hashlib.sha1(person_key(ip_hash, ua_id, user_agent, session_id).encode("utf-8")).hexdigest()
+
+
+def floor_hour(dt: datetime) -> datetime:
+    return dt.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def day_start(day: date) -> datetime:
+    """Midnight of *day* in settings.TIME_ZONE."""
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_default_timezone())
+
+
+def bucket_end(period: str, start: datetime) -> datetime:
+    if period == PERIOD_HOUR:
+        return start + HOUR
+    local_day = timezone.localtime(start, timezone.get_default_timezone()).date()
+    return day_start(local_day + timedelta(days=1))
+
+
+def _weekday(dt: datetime) -> int:
+    """Same numbering as ExtractWeekDay: 1 = Sunday … 7 = Saturday."""
+    return timezone.localtime(dt).isoweekday() % 7 + 1
+
+
+def _as_float(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RollupData:
+    """In-memory rollup rows, keyed like the tables they are saved to."""
+
+    # (bucket, metric, dim1, dim2, person) -> [count, value_sum, value_count]
+    metrics: dict = field(default_factory=lambda: defaultdict(lambda: [0, 0.0, 0]))
+    # (bucket, person) -> visitor fields
+    visitors: dict = field(default_factory=dict)
+    event_count: int = 0
+
+    def add(self, bucket, metric: str, dim1: str = "", dim2: str = "", person: str = "", value=None) -> None:
+        acc = self.metrics[(bucket, metric, dim1[:500], dim2[:500], person)]
+        acc[0] += 1
+        if value is not None:
+            acc[1] += value
+            acc[2] += 1
+
+
+def compute_rollups(start: datetime, end: datetime, bucket: datetime | None = None, into: RollupData | None = None) -> RollupData:
+    """
+    Aggregate dashboard events in [start, end).
+
+    Rows are bucketed by UTC hour, or all under *bucket* when given (used
+    for day buckets).
+    """
+    data = into if into is not None else RollupData()
+    rows = (
+        dashboard_events()
+        .filter(created__gte=start, created__lt=end)
+        .order_by("created", "id")
+        .values_list(
+            "created", "event_type", "session_id", "ip_hash", "ua_id", "user_agent", "path", "referrer",
+            "label", "duration_ms", "scroll_percent", "metadata",
+            "country_code", "region", "city", "timezone", "ua__device_os", "ua__device_type",
+        )
+    )
+    for (created, event_type, session_id, ip_hash, ua_id, user_agent, path, referrer,
+         label, duration_ms, scroll_percent, metadata,
+         country_code, region, city, tz_name, os_name, form_factor) in rows.iterator(chunk_size=2000):
+        data.event_count += 1
+        b = bucket or floor_hour(created)
+        person = person_digest(ip_hash, ua_id, user_agent, session_id)
+        metadata = metadata if isinstance(metadata, dict) else {}
+
+        visitor = data.visitors.get((b, person))
+        if visitor is None:
+            if ua_id is None:
+                # Legacy row not yet linked to a UserAgent (see manage.py classify_analytics_events)
+                os_name, form_factor = classify_device(user_agent or "")
+            visitor = data.visitors[(b, person)] = {
+                "events": 0,
+                "page_views": 0,
+                "device_os": os_name,
+                "device_type": form_factor,
+                "geo_events": 0,
+                "country_code": "",
+                "region": "",
+                "city": "",
+                "timezone": "",
+                "first_referred_at": None,
+                "last_exit_at": None,
+                "last_exit_path": "",
+                "page_paths": [],
+            }
+        visitor["events"] += 1
+        if country_code:
+            if not visitor["geo_events"]:
+                visitor.update(country_code=country_code, region=region, city=city, timezone=tz_name)
+            visitor["geo_events"] += 1
+        if referrer and visitor["first_referred_at"] is None:
+            visitor["first_referred_at"] = created
+
+        # Events without the key are left out, matching the SQL exclude() the
+        # dashboard used (NULL never passes NOT ... LIKE).
+        if "landing_referrer" in metadata:
+            data.add(b, METRIC_LANDING_REFERRER, str(metadata.get("landing_referrer") or ""), person=person)
+
+        if event_type == AnalyticsEventType.PAGE_VIEW:
+            visitor["page_views"] += 1
+            if path and (not visitor["page_paths"] or visitor["page_paths"][-1] != path):
+                visitor["page_paths"].append(path)
+            data.add(b, METRIC_PAGE_VIEW, path, value=duration_ms)
+        elif event_type == AnalyticsEventType.SCROLL:
+            data.add(b, METRIC_SCROLL, value=scroll_percent)
+        elif event_type == AnalyticsEventType.HOVER_INTENT:
+            data.add(b, METRIC_HOVER, label, value=duration_ms)
+        elif event_type == AnalyticsEventType.RAGE_CLICK:
+            data.add(b, METRIC_RAGE_CLICK, label)
+        elif event_type == AnalyticsEventType.DEAD_CLICK:
+            data.add(b, METRIC_DEAD_CLICK, label)
+        elif event_type == AnalyticsEventType.SESSION_EXIT:
+            data.add(b, METRIC_SESSION_EXIT, value=_as_float(metadata.get("exit_scroll")))
+            visitor["last_exit_at"] = created
+            visitor["last_exit_path"] = path
+        elif event_type == AnalyticsEventType.CLICK:
+            if label in SCHEDULE_FUNNEL_LABELS:
+                data.add(b, METRIC_SCHEDULE, label)
+            if label == "schedule_modal_open":
+                data.add(b, METRIC_SCHEDULE_SOURCE, str(metadata.get("source") or ""))
+            if label in ALL_CTA_LABELS:
+                data.add(b, METRIC_CTA, label, path, person=person)
+            # As with landing_referrer, clicks without href/target metadata
+            # never passed the dashboard's exclude() filters.
+            if (
+                label not in TOP_CLICKS_EXCLUDE
+                and not path.startswith("/admin")
+                and "href" in metadata
+                and "target" in metadata
+                and "/admin" not in str(metadata.get("href")).lower()
+                and "modal" not in str(metadata.get("target")).lower()
+            ):
+                data.add(b, METRIC_CLICK, label, path)
+    return data
+
+
+def build_bucket(period: str, start: datetime) -> int:
+    """(Re)build the rollup rows for one bucket and mark it complete."""
+    end = bucket_end(period, start)
+    # The marker stays dirty while we read, so events persisted meanwhile
+    # (which dirty it again, later than *started*) get another rebuild.
+    started = timezone.now()
+    AnalyticsRollupBucket.objects.update_or_create(
+        period=period, bucket=start, defaults={"dirtied_at": started},
+    )
+    data = compute_rollups(start, end, bucket=start)
+    metric_rows = [
+        AnalyticsMetricRollup(
+            period=period,
+            bucket=start,
+            metric=metric,
+            dim1=dim1,
+            dim2=dim2,
+            person=person,
+            count=count,
+            value_sum=value_sum,
+            value_count=value_count,
+        )
+        for (_, metric, dim1, dim2, person), (count, value_sum, value_count) in data.metrics.items()
+    ]
+    visitor_rows = [
+        AnalyticsVisitorRollup(period=period, bucket=start, person=person, **fields)
+        for (_, person), fields in data.visitors.items()
+    ]
+    with transaction.atomic():
+        AnalyticsMetricRollup.objects.filter(period=period, bucket=start).delete()
+        AnalyticsVisitorRollup.objects.filter(period=period, bucket=start).delete()
+        AnalyticsMetricRollup.objects.bulk_create(metric_rows, batch_size=BATCH_SIZE)
+        AnalyticsVisitorRollup.objects.bulk_create(visitor_rows, batch_size=BATCH_SIZE)
+        markers = AnalyticsRollupBucket.objects.filter(period=period, bucket=start)
+        markers.update(event_count=data.event_count, built_at=timezone.now())
+        markers.filter(dirtied_at__lte=started).update(dirtied_at=None)
+    return data.event_count
+
+
+def mark_dirty(created) -> int:
+    """Flag already-built buckets containing any of the *created* times for a rebuild."""
+    created = list(created)
+    site_tz = timezone.get_default_timezone()
+    hours = {floor_hour(dt) for dt in created}
+    days = {day_start(timezone.localtime(dt, site_tz).date()) for dt in created}
+    if not hours:
+        return 0
+    return AnalyticsRollupBucket.objects.filter(
+        Q(period=PERIOD_HOUR, bucket__in=hours) | Q(period=PERIOD_DAY, bucket__in=days)
+    ).update(dirtied_at=timezone.now())
+
+
+def build_pending_rollups(since: datetime | None = None, now: datetime | None = None, rebuild: bool = False) -> dict:
+    """
+    Build every closed hour and day bucket from *since* (default: LOOKBACK_DAYS ago),
+    plus any dirty bucket, however old.
+
+    Buckets that are already marked complete are skipped unless *rebuild*.
+    Returns ``{"hour": n, "day": n}`` buckets built.
+    """
+    now = now or timezone.now()
+    horizon = now - GRACE
+    since = since or now - timedelta(days=LOOKBACK_DAYS)
+    done = set() if rebuild else set(
+        AnalyticsRollupBucket.objects.filter(
+            bucket__gte=since - timedelta(days=1), dirtied_at__isnull=True,
+        ).values_list("period", "bucket")
+    )
+    built = {PERIOD_HOUR: 0, PERIOD_DAY: 0}
+
+    start = floor_hour(since)
+    while start + HOUR <= horizon:
+        if (PERIOD_HOUR, start) not in done:
+            build_bucket(PERIOD_HOUR, start)
+            built[PERIOD_HOUR] += 1
+        start += HOUR
+
+    day = timezone.localtime(since, timezone.get_default_timezone()).date()
+    while day_start(day + timedelta(days=1)) <= horizon:
+        start = day_start(day)
+        if (PERIOD_DAY, start) not in done:
+            build_bucket(PERIOD_DAY, start)
+            built[PERIOD_DAY] += 1
+        day += timedelta(days=1)
+
+    # Older buckets that late events have landed in since they were built
+    dirty = AnalyticsRollupBucket.objects.filter(dirtied_at__isnull=False)
+    for period, start in dirty.values_list("period", "bucket"):
+        build_bucket(period, start)
+        built[period] += 1
+    return built
+
+
+def plan_segments(start: datetime, end: datetime) -> tuple[Q | None, list[tuple[datetime, datetime]]]:
+    """
+    Cover [start, end) with complete day buckets, then complete hour buckets.
+
+    Returns a ``Q`` over the rollup tables for the covered part (None if
+    nothing is covered) and the remaining ranges that must be read raw.
+    """
+    done = set(
+        AnalyticsRollupBucket.objects.filter(
+            bucket__gte=start - timedelta(days=1), bucket__lt=end, dirtied_at__isnull=True,
+        ).values_list("period", "bucket")
+    )
+    site_tz = timezone.get_default_timezone()
+    segments: list[list] = []  # [kind, start, end], consecutive kinds merged
+
+    def _take(kind: str, a: datetime, b: datetime) -> None:
+        if segments and segments[-1][0] == kind and segments[-1][2] == a:
+            segments[-1][2] = b
+        else:
+            segments.append([kind, a, b])
+
+    cursor = start
+    while cursor < end:
+        local = timezone.localtime(cursor, site_tz)
+        if local.time() == time.min:
+            nxt = day_start(local.date() + timedelta(days=1))
+            if nxt <= end and (PERIOD_DAY, cursor) in done:
+                _take(PERIOD_DAY, cursor, nxt)
+                cursor = nxt
+                continue
+        hour = floor_hour(cursor)
+        if hour == cursor and cursor + HOUR <= end and (PERIOD_HOUR, cursor) in done:
+            _take(PERIOD_HOUR, cursor, cursor + HOUR)
+            cursor += HOUR
+            continue
+        nxt = min(end, hour + HOUR)
+        _take("raw", cursor, nxt)
+        cursor = nxt
+
+    db_q = None
+    raw_ranges = []
+    for kind, a, b in segments:
+        if kind == "raw":
+            raw_ranges.append((a, b))
+            continue
+        q = Q(period=kind, bucket__gte=a, bucket__lt=b)
+        db_q = q if db_q is None else db_q | q
+    return db_q, raw_ranges
+
+
+class RollupReader:
+    """
+    Dashboard read API over rollups plus raw events for uncovered ranges.
+
+    ``metrics()`` group keys may be any of ``dim1``, ``dim2``, ``person``,
+    ``day`` (date in the active time zone) and ``weekday`` (1 = Sunday).
+    """
+
+    _VISITOR_FIELDS = (
+        "bucket", "person", "events", "page_views", "device_os", "device_type",
+        "geo_events", "country_code", "region", "city", "timezone",
+        "first_referred_at", "last_exit_at", "last_exit_path", "page_paths",
+    )
+
+    def __init__(self, start: datetime, end: datetime):
+        self.start = start
+        self.end = end
+        self.db_q, self.raw_ranges = plan_segments(start, end)
+        self.live = RollupData()
+        for a, b in self.raw_ranges:
+            compute_rollups(a, b, into=self.live)
+
+    def metrics(self, metrics, by: tuple[str, ...] = ()) -> dict[tuple, list]:
+        """Return ``{group key tuple: [count, value_sum, value_count]}``."""
+        if isinstance(metrics, str):
+            metrics = (metrics,)
+        result: dict[tuple, list] = defaultdict(lambda: [0, 0.0, 0])
+
+        if self.db_q is not None:
+            qs = AnalyticsMetricRollup.objects.filter(self.db_q, metric__in=metrics)
+            if "day" in by:
+                qs = qs.annotate(day=TruncDate("bucket"))
+            if "weekday" in by:
+                qs = qs.annotate(weekday=ExtractWeekDay("bucket"))
+            grouped = qs.values(*by).annotate(
+                c=Sum("count"), s=Sum("value_sum"), n=Sum("value_count"),
+            ).order_by()
+            for row in grouped:
+                acc = result[tuple(row[k] for k in by)]
+                acc[0] += row["c"] or 0
+                acc[1] += row["s"] or 0
+                acc[2] += row["n"] or 0
+
+        for (bucket, metric, dim1, dim2, person), (count, value_sum, value_count) in self.live.metrics.items():
+            if metric not in metrics:
+                continue
+            values = {"dim1": dim1, "dim2": dim2, "person": person}
+            if "day" in by:
+                values["day"] = timezone.localtime(bucket).date()
+            if "weekday" in by:
+                values["weekday"] = _weekday(bucket)
+            acc = result[tuple(values[k] for k in by)]
+            acc[0] += count
+            acc[1] += value_sum
+            acc[2] += value_count
+        return dict(result)
+
+    def visitors(self) -> list[dict]:
+        """Visitor rows (one per person per bucket) covering the range."""
+        rows = []
+        if self.db_q is not None:
+            rows = list(AnalyticsVisitorRollup.objects.filter(self.db_q).values(*self._VISITOR_FIELDS))
+        for (bucket, person), fields in self.live.visitors.items():
+            rows.append({"bucket": bucket, "person": person, **fields})
+        return rows
+
+    def first_referred(self) -> dict[str, datetime]:
+        """Persons whose first-ever referred visit falls in the range → that time."""
+        first = dict(
+            AnalyticsVisitorRollup.objects.filter(first_referred_at__isnull=False)
+            .values("person")
+            .annotate(first=Min("first_referred_at"))
+            .filter(first__gte=self.start, first__lt=self.end)
+            .values_list("person", "first")
+        )
+        live: dict[str, datetime] = {}
+        for (_, person), fields in self.live.visitors.items():
+            seen = fields["first_referred_at"]
+            if seen and (person not in live or seen < live[person]):
+                live[person] = seen
+        if live:
+            earlier = dict(
+                AnalyticsVisitorRollup.objects.filter(person__in=list(live), first_referred_at__isnull=False)
+                .values("person")
+                .annotate(first=Min("first_referred_at"))
+                .values_list("person", "first")
+            )
+            for person, seen in live.items():
+                if person in earlier:
+                    seen = min(seen, earlier[person])
+                if self.start <= seen < self.end:
+                    first[person] = seen
+                else:
+                    first.pop(person, None)
+        for person in self._referred_before(set(first)):
+            del first[person]
+        return first
+
+    def _referred_before(self, persons: set[str]) -> set[str]:
+        """
+        Those of *persons* with a referred event before the range, in history
+        no rollup bucket covers (older than the backfill, or gaps while the
+        builder was not running).  Those events are read raw.
+        """
+        if not persons:
+            return set()
+        earliest = (
+            dashboard_events().filter(created__lt=self.start).exclude(referrer="")
+            .aggregate(first=Min("created"))["first"]
+        )
+        if earliest is None:
+            return set()
+        site_tz = timezone.get_default_timezone()
+        _, gaps = plan_segments(day_start(timezone.localtime(earliest, site_tz).date()), self.start)
+        if not gaps:
+            return set()
+        in_gaps = Q()
+        for a, b in gaps:
+            in_gaps |= Q(created__gte=a, created__lt=b)
+        rows = (
+            dashboard_events().filter(in_gaps).exclude(referrer="")
+            .values_list("ip_hash", "ua_id", "user_agent", "session_id")
+            .distinct()
+        )
+        return {digest for digest in (person_digest(*row) for row in rows.iterator()) if digest in persons}
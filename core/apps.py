@@ -5,3 +5,6 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
 
+    def ready(self):
+        # Mark sitemap sections dirty and drop cached page titles when their source models change
+        from . import signals  # noqa: F401
@@ -0,0 +1,209 @@
+"""
+core/cache.py
+--------------
+Shared cache helpers: the Redis serializer and per-feature key namespaces.
+
+When REDIS_URL is set the default cache is Django's RedisCache on the Redis
+instance Celery already uses (see CACHES in settings), so every gunicorn and
+Celery worker on every dyno shares one cache that survives restarts.
+Without REDIS_URL it falls back to per-process LocMemCache.
+
+Values are pickled; pickles larger than COMPRESS_MIN_BYTES (crawl payloads,
+directory / social scan results, keyword reports) are zlib-compressed.
+
+Each feature caches under its own namespace.  A namespace's keys embed its
+current version (``<namespace>:v<version>:<key>``), so bump() invalidates
+every key in it at once; the old keys are never read again and expire on
+their own.  Versions are seeded from the clock, so a version key lost to
+eviction comes back higher than before, never lower, and each process holds
+a version for VERSION_TTL seconds rather than reading it on every get/set
+(a bump reaches other processes within that time).  namespace_stats() reports key counts and memory per namespace
+for the SEO portal's cache page.
+
+Public API
+----------
+    CompressedPickleSerializer
+    CacheNamespace(name, label, *, bumpable=True)
+        .get / .set / .add / .delete / .bump() / .version()
+    CRAWL, DIRECTORY, SOCIAL, KEYWORD_TRENDS, GONE_410, PAGE_TITLES, LOCKS
+    NAMESPACES                                     name -> CacheNamespace
+    namespace_stats() -> list[dict]
+"""
+from __future__ import annotations
+
+import logging
+import pickle
+import time
+import zlib
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.redis import RedisSerializer
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_MIN_BYTES = 1024
+_COMPRESSED = b"z"  # pickles start with b"\x80", raw ints with a digit or "-"
+
+# Keys per SCAN page / MEMORY USAGE pipeline
+_SCAN_BATCH = 500
+
+# Seconds a process reuses a namespace version before reading it again
+VERSION_TTL = 5
+
+
+class CompressedPickleSerializer(RedisSerializer):
+    """RedisSerializer that zlib-compresses large pickles."""
+
+    def dumps(self, obj):
+        data = super().dumps(obj)
+        if isinstance(data, bytes) and len(data) >= COMPRESS_MIN_BYTES:
+            return _COMPRESSED + zlib.compress(data)
+        return data
+
+    def loads(self, data):
+        if isinstance(data, bytes) and data[:1] == _COMPRESSED:
+            return pickle.loads(zlib.decompress(data[1:]))
+        return super().loads(data)
+
+
+def _clock_version() -> int:
+    """Starting version for a namespace: milliseconds since the epoch."""
+    return time.time_ns() // 1_000_000
+
+
+NAMESPACES: dict[str, "CacheNamespace"] = {}
+
+
+class CacheNamespace:
+    """
+    A versioned key namespace on the default cache.
+
+    Mirrors the parts of the cache API the app uses (get, set, add, delete);
+    *key* is the feature's own key, without any prefix.
+    """
+
+    def __init__(self, name: str, label: str, *, bumpable: bool = True):
+        self.name = name
+        self.label = label
+        self.bumpable = bumpable
+        self._cached_version = (0.0, 0)  # (monotonic expiry, version)
+        NAMESPACES[name] = self
+
+    @property
+    def _version_key(self) -> str:
+        return f"{self.name}:version"
+
+    def version(self) -> int:
+        if not self.bumpable:
+            return 1
+        expires, version = self._cached_version
+        now = time.monotonic()
+        if now < expires:
+            return version
+        version = cache.get(self._version_key)
+        if version is None:
+            cache.add(self._version_key, _clock_version(), None)
+            version = cache.get(self._version_key) or _clock_version()
+        self._cached_version = (now + VERSION_TTL, version)
+        return version
+
+    def key(self, key: str) -> str:
+        return f"{self.name}:v{self.version()}:{key}"
+
+    def get(self, key: str, default=None):
+        return cache.get(self.key(key), default)
+
+    def set(self, key: str, value, timeout=DEFAULT_TIMEOUT) -> None:
+        cache.set(self.key(key), value, timeout)
+
+    def add(self, key: str, value, timeout=DEFAULT_TIMEOUT) -> bool:
+        return cache.add(self.key(key), value, timeout)
+
+    def delete(self, key: str) -> None:
+        cache.delete(self.key(key))
+
+    def bump(self) -> int:
+        """Invalidate every key in the namespace; return the new version."""
+        if not self.bumpable:
+            raise ValueError(f"cache namespace {self.name!r} is not versioned")
+        try:
+            version = cache.incr(self._version_key)
+        except ValueError:
+            # Never set, or evicted: seed from the clock, then bump
+            cache.add(self._version_key, _clock_version(), None)
+            version = cache.incr(self._version_key)
+        self._cached_version = (time.monotonic() + VERSION_TTL, version)
+        logger.info("cache: namespace %s bumped to v%d", self.name, version)
+        return version
+
+
+# ── Namespaces ─────────────────────────────────────────────────────────────
+CRAWL = CacheNamespace("crawl", "Competitor crawls")
+DIRECTORY = CacheNamespace("directory", "Directory profiles")
+SOCIAL = CacheNamespace("social", "Social profiles")
+KEYWORD_TRENDS = CacheNamespace("keyword_trends", "Keyword seeds intelligence")
+GONE_410 = CacheNamespace("gone410", "410 Gone paths")
+PAGE_TITLES = CacheNamespace("page_titles", "Dashboard page titles")
+# Locks must outlive a bump, or a second run could start beside the first
+LOCKS = CacheNamespace("locks", "Job locks", bumpable=False)
+
+
+def _redis_client():
+    client = getattr(cache, "_cache", None)
+    if client is None or not hasattr(client, "get_client"):
+        return None
+    return client.get_client(write=False)
+
+
+def _memory_usage(client, keys: list[bytes]) -> int:
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.memory_usage(key)
+    return sum(n or 0 for n in pipe.execute())
+
+
+def namespace_stats() -> list[dict]:
+    """
+    Key count and memory per namespace.
+
+    ::
+
+        [{"name", "label", "bumpable", "version", "keys", "current_keys",
+          "bytes"}, ...]
+
+    ``keys`` counts every version still held; ``current_keys`` only those
+    of the current version.  Counts and bytes are None when the cache is
+    not Redis (LocMemCache can't be inspected).
+    """
+    client = _redis_client()
+    stats = []
+    for ns in NAMESPACES.values():
+        row = {
+            "name": ns.name,
+            "label": ns.label,
+            "bumpable": ns.bumpable,
+            "version": ns.version(),
+            "keys": None,
+            "current_keys": None,
+            "bytes": None,
+        }
+        if client is not None:
+            version_key = cache.make_key(ns._version_key).encode()
+            current = cache.make_key(f"{ns.name}:v{row['version']}:").encode()
+            keys = current_keys = size = 0
+            batch: list[bytes] = []
+            for key in client.scan_iter(match=cache.make_key(f"{ns.name}:*"), count=_SCAN_BATCH):
+                if key == version_key:
+                    continue
+                keys += 1
+                current_keys += key.startswith(current)
+                batch.append(key)
+                if len(batch) >= _SCAN_BATCH:
+                    size += _memory_usage(client, batch)
+                    batch = []
+            if batch:
+                size += _memory_usage(client, batch)
+            row.update(keys=keys, current_keys=current_keys, bytes=size)
+        stats.append(row)
+    return stats
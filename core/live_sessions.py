@@ -0,0 +1,198 @@
+"""
+Live store of anonymous sessions for the "active now" dashboard panel.
+
+The ingest worker calls record_events() after each batch is written.  Every
+session seen in the last SESSION_TTL seconds has
+
+  analytics:live:s:<session id>   Redis hash: first/last seen, current path
+                                  and label, geo, device, counters and the
+                                  signals is_bot_session() needs
+  analytics:live:index            sorted set of session ids by last-seen time
+
+Hashes expire on their own; the index is trimmed on every write.  Updates
+read, merge and rewrite the hashes, so they run under LOCK_KEY: overlapping
+drains (beat tick plus producer kick) take turns instead of overwriting
+each other's counters.
+ActiveSessionsApiView reads only these keys, so its cost depends on the
+number of live sessions, not on event volume.
+
+Only the dashboard population is tracked: anonymous, US/unknown-country,
+non-bot events (core.analytics_rollups.dashboard_events()).  Without Redis
+(local development) active_sessions() builds the same records from the
+last few minutes of AnalyticsEvent rows.
+
+Public API
+----------
+  record_events(events)               -> int   (sessions updated)
+  active_sessions(window_minutes=5)   -> list[dict]
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from core.analytics_rollups import dashboard_events
+from core.models import AnalyticsEventType
+from core.utils.bot_detection import is_bot_session_summary, is_human_event
+from core.utils.redis_client import get_redis
+
+INDEX_KEY = "analytics:live:index"
+SESSION_PREFIX = "analytics:live:s:"
+# Longer than any window the dashboard asks for
+SESSION_TTL = 15 * 60
+LOCK_KEY = "analytics:live:lock"
+# Expiry if the holder dies, and how long a second drain waits for its turn
+LOCK_TIMEOUT = 10
+LOCK_WAIT = 5
+
+_INT_FIELDS = ("events", "page_views", "clicks", "time_on_page_ms", "human", "multi_path")
+_FLOAT_FIELDS = ("first_seen", "last_seen")
+
+
+def _is_tracked(event) -> bool:
+    """Python version of the dashboard_events() filter."""
+    return not event.is_authenticated and not event.is_bot and event.country_code in ("US", "")
+
+
+def _apply(record: dict, event) -> None:
+    """Fold one AnalyticsEvent into a session record (events arrive oldest first)."""
+    created = event.created.timestamp()
+    path = event.path or ""
+    agent = event.ua
+    if not record:
+        record.update(
+            session_id=event.session_id,
+            first_seen=created,
+            last_seen=created,
+            first_path=path,
+            current_path=path,
+            current_label=event.label or "",
+            last_event_type=event.event_type,
+            country_code=event.country_code or "",
+            region=event.region or "",
+            city=event.city or "",
+            device_os=(agent.device_os if agent else "") or "Other",
+            device_type=(agent.device_type if agent else "") or "Desktop",
+            events=0,
+            page_views=0,
+            clicks=0,
+            time_on_page_ms=event.duration_ms or 0,
+            human=0,
+            multi_path=0,
+        )
+
+    record["events"] += 1
+    if is_human_event(event.event_type):
+        record["human"] = 1
+    if path != record["first_path"]:
+        record["multi_path"] = 1
+
+    if created >= record["last_seen"]:
+        record["last_seen"] = created
+        record["last_event_type"] = event.event_type
+        record["current_path"] = path
+        record["current_label"] = event.label or ""
+        record["country_code"] = event.country_code or record["country_code"]
+        record["region"] = event.region or record["region"]
+        record["city"] = event.city or record["city"]
+        if agent:
+            record["device_os"] = agent.device_os or record["device_os"]
+            record["device_type"] = agent.device_type or record["device_type"]
+    if created < record["first_seen"]:
+        record["first_seen"] = created
+
+    if event.event_type == AnalyticsEventType.PAGE_VIEW:
+        record["page_views"] += 1
+    elif event.event_type == AnalyticsEventType.CLICK:
+        record["clicks"] += 1
+    if event.event_type in (AnalyticsEventType.PAGE_VIEW, AnalyticsEventType.HEARTBEAT):
+        record["time_on_page_ms"] = event.duration_ms or record["time_on_page_ms"]
+
+
+def _decode(raw: dict) -> dict:
+    record = {
+        (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+        for k, v in raw.items()
+    }
+    if not record:
+        return record
+    for name in _INT_FIELDS:
+        record[name] = int(record.get(name) or 0)
+    for name in _FLOAT_FIELDS:
+        record[name] = float(record.get(name) or 0)
+    return record
+
+
+def record_events(events) -> int:
+    """Update the live store from freshly written AnalyticsEvent instances."""
+    client = get_redis()
+    if client is None:
+        return 0
+    tracked = sorted((e for e in events if _is_tracked(e)), key=lambda e: e.created)
+    if not tracked:
+        return 0
+
+    session_ids = list(dict.fromkeys(e.session_id for e in tracked))
+    with client.lock(LOCK_KEY, timeout=LOCK_TIMEOUT, blocking_timeout=LOCK_WAIT):
+        pipe = client.pipeline(transaction=False)
+        for session_id in session_ids:
+            pipe.hgetall(SESSION_PREFIX + session_id)
+        records = {session_id: _decode(raw) for session_id, raw in zip(session_ids, pipe.execute())}
+
+        for event in tracked:
+            _apply(records[event.session_id], event)
+
+        pipe = client.pipeline(transaction=False)
+        for session_id, record in records.items():
+            key = SESSION_PREFIX + session_id
+            pipe.hset(key, mapping=record)
+            pipe.expire(key, SESSION_TTL)
+            pipe.zadd(INDEX_KEY, {session_id: record["last_seen"]})
+        pipe.zremrangebyscore(INDEX_KEY, "-inf", time.time() - SESSION_TTL)
+        pipe.execute()
+    return len(records)
+
+
+def _records_from_db(cutoff: float) -> list[dict]:
+    records: dict[str, dict] = {}
+    events = (
+        dashboard_events()
+        .filter(created__gte=datetime.fromtimestamp(cutoff, tz=dt_timezone.utc))
+        .select_related("ua")
+        .order_by("created", "id")
+    )
+    for event in events:
+        _apply(records.setdefault(event.session_id, {}), event)
+    return list(records.values())
+
+
+def active_sessions(window_minutes: int = 5) -> list[dict]:
+    """
+    Sessions with an event in the last *window_minutes*, most recent first.
+
+    Bot-like sessions (see is_bot_session()) are left out.  ``first_seen``
+    and ``last_seen`` are aware datetimes.
+    """
+    cutoff = time.time() - timedelta(minutes=window_minutes).total_seconds()
+    client = get_redis()
+    if client is None:
+        records = _records_from_db(cutoff)
+    else:
+        session_ids = client.zrangebyscore(INDEX_KEY, cutoff, "+inf")
+        pipe = client.pipeline(transaction=False)
+        for session_id in session_ids:
+            pipe.hgetall(SESSION_PREFIX + (session_id.decode() if isinstance(session_id, bytes) else session_id))
+        records = [record for record in map(_decode, pipe.execute()) if record]
+
+    sessions = []
+    for record in records:
+        if record["last_seen"] < cutoff:
+            continue
+        if is_bot_session_summary(record["events"], 2 if record["multi_path"] else 1, bool(record["human"])):
+            continue
+        record["first_seen"] = datetime.fromtimestamp(record["first_seen"], tz=dt_timezone.utc)
+        record["last_seen"] = datetime.fromtimestamp(record["last_seen"], tz=dt_timezone.utc)
+        sessions.append(record)
+    sessions.sort(key=lambda r: r["last_seen"], reverse=True)
+    return sessions
@@ -0,0 +1,47 @@
+"""
+Build hourly/daily analytics rollups for the visitor-stats dashboard.
+
+The Celery beat task keeps the last few days current.  The release phase
+(Procfile) runs this with --days 365 so the dashboard's long ranges are
+served from rollups; buckets already built are skipped, so it is cheap once
+history is filled in.  Run with --rebuild after changing the rollup rules.
+
+Usage
+-----
+  python manage.py build_analytics_rollups               # last 30 days, missing buckets
+  python manage.py build_analytics_rollups --days 400    # backfill a year+
+  python manage.py build_analytics_rollups --rebuild     # rebuild even completed buckets
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.analytics_rollups import build_pending_rollups
+
+
+class Command(BaseCommand):
+    help = "Roll AnalyticsEvent rows up into hourly and daily dashboard tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="How many days back to build (default: 30).",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Rebuild buckets that are already marked complete.",
+        )
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options["days"])
+        result = build_pending_rollups(since=since, rebuild=options["rebuild"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rollups built: {result['day']} day bucket(s), {result['hour']} hour bucket(s)."
+            )
+        )
@@ -0,0 +1,61 @@
+"""
+Render sitemap sections to gzip-compressed files in storage.
+
+Usage
+-----
+  python manage.py build_sitemaps                     # dirty / never-built sections
+  python manage.py build_sitemaps --all               # every section
+  python manage.py build_sitemaps geo_states therapists
+  python manage.py build_sitemaps --async             # queue the Celery task instead
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.sitemap_files import SITEMAP_SECTIONS, build_sitemaps
+
+
+class Command(BaseCommand):
+    help = "Pre-render sitemap sections and the sitemap index to storage"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "sections",
+            nargs="*",
+            help=f"Sections to rebuild (default: dirty ones). Choices: {', '.join(SITEMAP_SECTIONS)}",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild every section even if nothing changed.",
+        )
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="run_async",
+            help="Queue the rebuild_sitemaps Celery task and return immediately.",
+        )
+
+    def handle(self, *args, **options):
+        sections = options["sections"] or None
+        force = options["all"] or bool(sections)
+
+        if options["run_async"]:
+            from core.tasks import rebuild_sitemaps
+
+            rebuild_sitemaps.delay(sections=sections, force=force)
+            self.stdout.write(self.style.SUCCESS("Queued rebuild_sitemaps task."))
+            return
+
+        try:
+            result = build_sitemaps(sections=sections, force=force)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sitemaps: {len(result['built'])} section(s) written, "
+                f"{len(result['unchanged'])} unchanged, {result['urls']} URLs."
+            )
+        )
+        for name in result["built"]:
+            self.stdout.write(f"  wrote {name}")
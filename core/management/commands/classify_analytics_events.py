@@ -0,0 +1,91 @@
+"""
+Link historical AnalyticsEvent rows to the UserAgent dimension.
+
+Older rows carry the full user-agent text.  This resolves each distinct
+string to a UserAgent row, sets ``ua`` and ``is_bot`` from it, and clears
+the text column.  The dashboards filter on ``is_bot``, so it runs in the
+release phase (Procfile); once every row is linked it finds nothing to do.
+
+Linking changes a row's visitor key (IP hash + UserAgent id instead of the
+UA text) and bot flag, so every completed rollup bucket holding a linked
+row is rebuilt afterwards; new and old rollups then agree.
+
+Usage
+-----
+  python manage.py classify_analytics_events
+  python manage.py classify_analytics_events --batch-size 20000
+"""
+
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.analytics_rollups import PERIOD_DAY, PERIOD_HOUR, build_bucket, day_start, floor_hour
+from core.models import AnalyticsEvent, AnalyticsRollupBucket, UserAgent
+
+
+class Command(BaseCommand):
+    help = "Link historical analytics events to UserAgent rows (bot flag, device, browser)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows read per batch (default: 5000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options["batch_size"], 1)
+        last_id = 0
+        total = 0
+        bots = 0
+        site_tz = timezone.get_default_timezone()
+        buckets: set = set()
+        while True:
+            batch = list(
+                AnalyticsEvent.objects.filter(ua__isnull=True, id__gt=last_id)
+                .exclude(user_agent="")
+                .order_by("id")
+                .values_list("id", "user_agent", "created")[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            agents = UserAgent.resolve({user_agent for _, user_agent, _ in batch})
+            # Few distinct user agents per batch: one UPDATE for each.
+            ids_by_agent: dict[UserAgent, list[int]] = defaultdict(list)
+            for pk, user_agent, created in batch:
+                ids_by_agent[agents[user_agent]].append(pk)
+                buckets.add((PERIOD_HOUR, floor_hour(created)))
+                buckets.add((PERIOD_DAY, day_start(timezone.localtime(created, site_tz).date())))
+            for agent, ids in ids_by_agent.items():
+                AnalyticsEvent.objects.filter(id__in=ids).update(ua=agent, is_bot=agent.is_bot, user_agent="")
+                if agent.is_bot:
+                    bots += len(ids)
+            total += len(batch)
+            self.stdout.write(f"  linked {total} event(s)…")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Linked {total} event(s) to {UserAgent.objects.count()} user agent(s); {bots} flagged as bots."
+            )
+        )
+        if buckets:
+            rebuilt = self._rebuild_rollups(buckets)
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} rollup bucket(s) holding linked events."))
+
+    def _rebuild_rollups(self, buckets: set) -> int:
+        """Rebuild the completed rollup buckets among *buckets*; unbuilt ones are left to the builder."""
+        starts = [start for _, start in buckets]
+        complete = set(
+            AnalyticsRollupBucket.objects.filter(bucket__gte=min(starts), bucket__lte=max(starts))
+            .values_list("period", "bucket")
+        )
+        rebuilt = 0
+        for period, start in sorted(buckets & complete, key=lambda b: (b[1], b[0])):
+            build_bucket(period, start)
+            rebuilt += 1
+        return rebuilt
@@ -0,0 +1,40 @@
+"""
+Show geolocation cache hit/miss counters shared across dynos and workers.
+
+Usage
+-----
+  python manage.py geoip_stats            # print totals and hit rates
+  python manage.py geoip_stats --reset    # clear the counters
+"""
+
+from django.core.management.base import BaseCommand
+
+from core.utils.geolocation import STAT_FIELDS, get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = "Print GeoIP lookup cache hit/miss counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the shared counters after printing them.",
+        )
+
+    def handle(self, *args, **options):
+        stats = get_stats()["shared"]
+        total = sum(stats.values())
+        self.stdout.write(f"GeoIP lookups: {total}")
+        for field in STAT_FIELDS:
+            share = (stats[field] / total * 100) if total else 0.0
+            self.stdout.write(f"  {field:<12} {stats[field]:>10}  ({share:.1f}%)")
+        if total:
+            cached = stats["local_hit"] + stats["redis_hit"]
+            self.stdout.write(
+                self.style.SUCCESS(f"Served from cache: {cached / total * 100:.1f}%; remote API calls: {stats['remote_hit']}")
+            )
+
+        if options["reset"]:
+            reset_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
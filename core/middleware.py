@@ -1,7 +1,10 @@
+import logging
 from urllib.parse import urlparse
 from django.conf import settings
 from django.http import HttpResponse, HttpResponsePermanentRedirect
 
+logger = logging.getLogger(__name__)
+
 
 class CanonicalDomainMiddleware:
     """
@@ -89,25 +92,34 @@ class GeoSlug410Middleware:
 class Custom410Middleware:
     """
     Returns 410 Gone for any path stored in the Gone410URL table.
-    Paths are cached in memory for 60 seconds to avoid a DB hit on every request.
+    Paths are cached for 60 seconds (in the shared GONE_410 cache namespace)
+    to avoid a DB hit on every request; if the cache is unreachable the
+    table is read directly.
     """
 
-    _CACHE_KEY = "gone_410_paths"
+    _CACHE_KEY = "paths"
     _CACHE_TTL = 60
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def _get_paths(self):
-        from django.core.cache import cache
-        paths = cache.get(self._CACHE_KEY)
+        from core.cache import GONE_410
+        try:
+            paths = GONE_410.get(self._CACHE_KEY)
+        except Exception as exc:
+            logger.warning("Custom410Middleware: cache unavailable: %s", exc)
+            paths = None
         if paths is None:
             try:
                 from core.models import Gone410URL
                 paths = set(Gone410URL.objects.values_list("path", flat=True))
             except Exception:
                 paths = set()
-            cache.set(self._CACHE_KEY, paths, self._CACHE_TTL)
+            try:
+                GONE_410.set(self._CACHE_KEY, paths, self._CACHE_TTL)
+            except Exception:
+                pass
         return paths
 
     def __call__(self, request):
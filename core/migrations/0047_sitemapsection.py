@@ -0,0 +1,29 @@
+# Generated by Django 5.0.7 on 2026-10-16 21:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0046_add_latlng_to_officelocation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SitemapSection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('is_dirty', models.BooleanField(default=True, help_text='Source data changed since the last build.')),
+                ('checksum', models.CharField(blank=True, max_length=64)),
+                ('page_count', models.PositiveIntegerField(default=0)),
+                ('url_count', models.PositiveIntegerField(default=0)),
+                ('lastmod', models.DateTimeField(blank=True, null=True)),
+                ('built_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+    ]
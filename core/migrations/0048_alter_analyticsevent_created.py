@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-16 21:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0047_sitemapsection'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='analyticsevent',
+            name='created',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
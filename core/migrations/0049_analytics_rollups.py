@@ -0,0 +1,83 @@
+# Generated by Django 5.0.7 on 2026-10-16 21:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0048_alter_analyticsevent_created'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsMetricRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=8)),
+                ('bucket', models.DateTimeField()),
+                ('metric', models.CharField(max_length=32)),
+                ('dim1', models.CharField(blank=True, max_length=500)),
+                ('dim2', models.CharField(blank=True, max_length=500)),
+                ('person', models.CharField(blank=True, max_length=40)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('value_sum', models.FloatField(default=0)),
+                ('value_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AnalyticsRollupBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=8)),
+                ('bucket', models.DateTimeField(help_text='Start of the hour (UTC) or of the day in TIME_ZONE.')),
+                ('event_count', models.PositiveIntegerField(default=0)),
+                ('built_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['period', '-bucket'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AnalyticsVisitorRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=8)),
+                ('bucket', models.DateTimeField()),
+                ('person', models.CharField(max_length=40)),
+                ('events', models.PositiveIntegerField(default=0)),
+                ('page_views', models.PositiveIntegerField(default=0)),
+                ('device_os', models.CharField(blank=True, max_length=16)),
+                ('device_type', models.CharField(blank=True, max_length=16)),
+                ('geo_events', models.PositiveIntegerField(default=0, help_text='Events that carried a country code.')),
+                ('country_code', models.CharField(blank=True, max_length=2)),
+                ('region', models.CharField(blank=True, max_length=100)),
+                ('city', models.CharField(blank=True, max_length=100)),
+                ('timezone', models.CharField(blank=True, max_length=64)),
+                ('first_referred_at', models.DateTimeField(blank=True, help_text='Earliest event in the bucket with a referrer.', null=True)),
+                ('last_exit_at', models.DateTimeField(blank=True, null=True)),
+                ('last_exit_path', models.CharField(blank=True, max_length=500)),
+                ('page_paths', models.JSONField(blank=True, default=list, help_text='Page-view paths in order, consecutive repeats removed.')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='analyticsevent',
+            index=models.Index(fields=['created'], name='analytics_event_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='analyticsmetricrollup',
+            index=models.Index(fields=['period', 'metric', 'bucket'], name='analytics_metric_rollup_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='analyticsrollupbucket',
+            constraint=models.UniqueConstraint(fields=('period', 'bucket'), name='analytics_rollup_bucket_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='analyticsvisitorrollup',
+            index=models.Index(fields=['person', 'first_referred_at'], name='analytics_visitor_first_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='analyticsvisitorrollup',
+            constraint=models.UniqueConstraint(fields=('period', 'bucket', 'person'), name='analytics_visitor_rollup_unique'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.7 on 2026-10-16 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0049_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyticsevent',
+            name='device_os',
+            field=models.CharField(blank=True, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='analyticsevent',
+            name='device_type',
+            field=models.CharField(blank=True, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='analyticsevent',
+            name='is_bot',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='analyticsevent',
+            index=models.Index(fields=['is_bot', 'created'], name='analytics_event_bot_idx'),
+        ),
+    ]
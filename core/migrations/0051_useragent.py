@@ -0,0 +1,40 @@
+# Generated by Django 5.0.7 on 2026-10-16 22:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0050_analyticsevent_classification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserAgent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ua_hash', models.CharField(help_text='SHA-1 of user_agent.', max_length=40, unique=True)),
+                ('user_agent', models.TextField()),
+                ('is_bot', models.BooleanField(default=False)),
+                ('device_os', models.CharField(max_length=16)),
+                ('device_type', models.CharField(max_length=16)),
+                ('browser_family', models.CharField(max_length=32)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='analyticsevent',
+            name='device_os',
+        ),
+        migrations.RemoveField(
+            model_name='analyticsevent',
+            name='device_type',
+        ),
+        migrations.AddField(
+            model_name='analyticsevent',
+            name='ua',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='events', to='core.useragent'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-17 01:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0051_useragent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyticsrollupbucket',
+            name='dirtied_at',
+            field=models.DateTimeField(blank=True, help_text='When late events last landed in this bucket; cleared by a rebuild.', null=True),
+        ),
+    ]
@@ -6,6 +6,9 @@ from django.utils import timezone
 import hashlib
 
 from ckeditor.fields import RichTextField
+
+from core.utils.bot_detection import is_bot_ua
+from core.utils import device_detection
 class PublishStatus(models.TextChoices):
 	DRAFT = 'draft', 'Draft'
 	PUBLISH = 'publish', 'Published'
@@ -651,14 +654,67 @@ class AnalyticsEventType(models.TextChoices):
 	SESSION_EXIT = "session_exit", "Session exit"
 
 
+class UserAgent(models.Model):
+	"""A distinct user-agent string, classified once and shared by AnalyticsEvent rows."""
+
+	ua_hash = models.CharField(max_length=40, unique=True, help_text="SHA-1 of user_agent.")
+	user_agent = models.TextField()
+	is_bot = models.BooleanField(default=False)
+	device_os = models.CharField(max_length=16)
+	device_type = models.CharField(max_length=16)
+	browser_family = models.CharField(max_length=32)
+	created = models.DateTimeField(auto_now_add=True)
+
+	def __str__(self) -> str:
+		return self.user_agent[:80]
+
+	@staticmethod
+	def hash_ua(user_agent: str) -> str:
+		return hashlib.sha1(user_agent.encode("utf-8")).hexdigest()
+
+	@classmethod
+	def resolve(cls, user_agents) -> dict[str, "UserAgent"]:
+		"""Return ``{user agent string: UserAgent}`` for non-empty *user_agents*, creating missing rows."""
+		wanted = {cls.hash_ua(ua): ua for ua in user_agents if ua}
+		if not wanted:
+			return {}
+		found = {obj.ua_hash: obj for obj in cls.objects.filter(ua_hash__in=list(wanted))}
+		missing = [
+			cls(
+				ua_hash=ua_hash,
+				user_agent=ua,
+				is_bot=is_bot_ua(ua),
+				device_os=device_detection.device_os(ua),
+				device_type=device_detection.device_type(ua),
+				browser_family=device_detection.browser_family(ua),
+			)
+			for ua_hash, ua in wanted.items()
+			if ua_hash not in found
+		]
+		if missing:
+			# Another worker may insert the same strings concurrently; re-read after.
+			cls.objects.bulk_create(missing, ignore_conflicts=True)
+			found.update(
+				(obj.ua_hash, obj)
+				for obj in cls.objects.filter(ua_hash__in=[obj.ua_hash for obj in missing])
+			)
+		return {ua: found[ua_hash] for ua_hash, ua in wanted.items()}
+
+
 class AnalyticsEvent(Timestamped):
 	"""Lightweight event log for anonymous sessions."""
 
+	# Set explicitly by the ingest worker to the time the event was received,
+	# not the time the batch was written (see core/analytics_ingest.py).
+	created = models.DateTimeField(default=timezone.now, editable=False)
 	event_type = models.CharField(max_length=32, choices=AnalyticsEventType.choices)
 	session_id = models.CharField(max_length=64, db_index=True)
 	path = models.CharField(max_length=500, db_index=True)
 	referrer = models.CharField(max_length=500, blank=True)
+	# Legacy rows only: new events reference the UserAgent dimension through ``ua``
+	# and leave this empty (manage.py classify_analytics_events migrates old rows).
 	user_agent = models.TextField(blank=True)
+	ua = models.ForeignKey(UserAgent, null=True, blank=True, on_delete=models.PROTECT, related_name="events")
 	ip_hash = models.CharField(max_length=64, blank=True)
 	label = models.CharField(max_length=255, blank=True)
 	duration_ms = models.PositiveIntegerField(default=0, help_text="Client-reported duration for the event, if applicable.")
@@ -669,12 +725,16 @@ class AnalyticsEvent(Timestamped):
 	region = models.CharField(max_length=100, blank=True)
 	city = models.CharField(max_length=100, blank=True)
 	timezone = models.CharField(max_length=64, blank=True)
+	# Copied from ua.is_bot at ingest so dashboards can filter without a join.
+	is_bot = models.BooleanField(default=False)
 
 	class Meta:
 		ordering = ["-created"]
 		indexes = [
 			models.Index(fields=["event_type", "created"]),
 			models.Index(fields=["path", "created"]),
+			models.Index(fields=["created"], name="analytics_event_created_idx"),
+			models.Index(fields=["is_bot", "created"], name="analytics_event_bot_idx"),
 		]
 
 	def __str__(self) -> str:
@@ -688,6 +748,94 @@ class AnalyticsEvent(Timestamped):
 		return hashlib.sha256(f"{ip}|{secret}".encode()).hexdigest()
 
 
+class RollupPeriod(models.TextChoices):
+	HOUR = 'hour', 'Hour'
+	DAY = 'day', 'Day'
+
+
+class AnalyticsRollupBucket(models.Model):
+	"""Marks one hour or day as fully rolled up (see core/analytics_rollups.py).
+
+	Buckets with no events still get a marker, so the dashboard knows it can
+	skip the raw table for that interval.  A marker with ``dirtied_at`` set
+	has had events land after it was built: the dashboard reads that bucket
+	raw until the beat task rebuilds it.
+	"""
+
+	period = models.CharField(max_length=8, choices=RollupPeriod.choices)
+	bucket = models.DateTimeField(help_text="Start of the hour (UTC) or of the day in TIME_ZONE.")
+	event_count = models.PositiveIntegerField(default=0)
+	dirtied_at = models.DateTimeField(null=True, blank=True, help_text="When late events last landed in this bucket; cleared by a rebuild.")
+	built_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		ordering = ["period", "-bucket"]
+		constraints = [
+			models.UniqueConstraint(fields=["period", "bucket"], name="analytics_rollup_bucket_unique"),
+		]
+
+	def __str__(self) -> str:
+		return f"{self.period} {self.bucket:%Y-%m-%d %H:%M}"
+
+
+class AnalyticsMetricRollup(models.Model):
+	"""Event counts per bucket, metric and up to two dimensions (label, path, …).
+
+	``person`` is only set for metrics the dashboard counts distinct visitors
+	on (CTA clicks, landing referrers).
+	"""
+
+	period = models.CharField(max_length=8, choices=RollupPeriod.choices)
+	bucket = models.DateTimeField()
+	metric = models.CharField(max_length=32)
+	dim1 = models.CharField(max_length=500, blank=True)
+	dim2 = models.CharField(max_length=500, blank=True)
+	person = models.CharField(max_length=40, blank=True)
+	count = models.PositiveIntegerField(default=0)
+	value_sum = models.FloatField(default=0)
+	value_count = models.PositiveIntegerField(default=0)
+
+	class Meta:
+		indexes = [
+			models.Index(fields=["period", "metric", "bucket"], name="analytics_metric_rollup_idx"),
+		]
+
+	def __str__(self) -> str:
+		return f"{self.metric} {self.dim1} @ {self.bucket:%Y-%m-%d %H:%M}"
+
+
+class AnalyticsVisitorRollup(models.Model):
+	"""One row per visitor (hashed person key) per bucket."""
+
+	period = models.CharField(max_length=8, choices=RollupPeriod.choices)
+	bucket = models.DateTimeField()
+	person = models.CharField(max_length=40)
+	events = models.PositiveIntegerField(default=0)
+	page_views = models.PositiveIntegerField(default=0)
+	device_os = models.CharField(max_length=16, blank=True)
+	device_type = models.CharField(max_length=16, blank=True)
+	geo_events = models.PositiveIntegerField(default=0, help_text="Events that carried a country code.")
+	country_code = models.CharField(max_length=2, blank=True)
+	region = models.CharField(max_length=100, blank=True)
+	city = models.CharField(max_length=100, blank=True)
+	timezone = models.CharField(max_length=64, blank=True)
+	first_referred_at = models.DateTimeField(null=True, blank=True, help_text="Earliest event in the bucket with a referrer.")
+	last_exit_at = models.DateTimeField(null=True, blank=True)
+	last_exit_path = models.CharField(max_length=500, blank=True)
+	page_paths = models.JSONField(default=list, blank=True, help_text="Page-view paths in order, consecutive repeats removed.")
+
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(fields=["period", "bucket", "person"], name="analytics_visitor_rollup_unique"),
+		]
+		indexes = [
+			models.Index(fields=["person", "first_referred_at"], name="analytics_visitor_first_idx"),
+		]
+
+	def __str__(self) -> str:
+		return f"{self.person[:8]} @ {self.bucket:%Y-%m-%d %H:%M}"
+
+
 class OfficeLocation(Timestamped):
 	"""Physical office location with contact info, hours, and geo/therapist associations."""
 
@@ -955,4 +1103,22 @@ class Gone410URL(models.Model):
         ordering = ["path"]
 
     def __str__(self):
-        return self.path
\ No newline at end of file
+        return self.path
+
+
+class SitemapSection(models.Model):
+	"""Build state for one pre-rendered sitemap section (see core/sitemap_files.py)."""
+
+	name = models.CharField(max_length=64, unique=True)
+	is_dirty = models.BooleanField(default=True, help_text="Source data changed since the last build.")
+	checksum = models.CharField(max_length=64, blank=True)
+	page_count = models.PositiveIntegerField(default=0)
+	url_count = models.PositiveIntegerField(default=0)
+	lastmod = models.DateTimeField(null=True, blank=True)
+	built_at = models.DateTimeField(null=True, blank=True)
+
+	class Meta:
+		ordering = ["name"]
+
+	def __str__(self) -> str:
+		return self.name
@@ -1,51 +1,59 @@
 """
-Post-save signals that ping Google whenever sitemap-relevant content changes.
-Fires for: Service, GeoLocation, GeoState, GeoRegion, and TherapistProfile.
+Signals that keep pre-rendered and cached data current.
+
+Saving or deleting a model that feeds a sitemap section marks that section
+dirty and schedules one debounced Celery rebuild (core/sitemap_files.py),
+instead of rebuilding or pinging search engines inside the save request.
+
+Saving or deleting a page, therapist profile or post drops the cached
+dashboard page-title map (core/utils/page_titles.py) by bumping its cache
+namespace.
 """
 import logging
 
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
 
-logger = logging.getLogger(__name__)
+from core.sitemap_files import AVAILABILITY, SOURCE_LABELS, schedule_sitemap_rebuild
+from core.utils import page_titles
+from geo.utils.availability_sync import availability_changed
 
-SITEMAP_URL = "https://www.lcpsych.com/sitemap.xml"
+logger = logging.getLogger(__name__)
 
 
-def _ping():
+def _schedule(label):
     try:
-        from django.contrib.sitemaps import ping_google
-        ping_google(SITEMAP_URL)
+        schedule_sitemap_rebuild(label)
     except Exception as exc:
-        # Never let a ping failure break a save
-        logger.warning("ping_google failed: %s", exc)
+        # Never let sitemap bookkeeping break a save
+        logger.warning("sitemap rebuild scheduling failed for %s: %s", label, exc)
+
 
+def _on_source_changed(sender, **kwargs):
+    if kwargs.get("raw"):
+        return
+    _schedule(sender._meta.label_lower)
 
-@receiver(post_save, sender="core.Service")
-def ping_on_service_save(sender, instance, created, **kwargs):
-    if created:
-        _ping()
 
+def _on_availability_changed(sender, **kwargs):
+    _schedule(AVAILABILITY)
 
-@receiver(post_save, sender="geo.GeoLocation")
-def ping_on_location_save(sender, instance, created, **kwargs):
-    if created:
-        _ping()
 
+for _label in SOURCE_LABELS - {AVAILABILITY}:
+    _model = apps.get_model(_label)
+    post_save.connect(_on_source_changed, sender=_model, dispatch_uid=f"sitemap_save_{_label}")
+    post_delete.connect(_on_source_changed, sender=_model, dispatch_uid=f"sitemap_delete_{_label}")
 
-@receiver(post_save, sender="geo.GeoState")
-def ping_on_state_save(sender, instance, created, **kwargs):
-    if created:
-        _ping()
+availability_changed.connect(_on_availability_changed, dispatch_uid="sitemap_availability")
 
 
-@receiver(post_save, sender="geo.GeoRegion")
-def ping_on_region_save(sender, instance, created, **kwargs):
-    if created:
-        _ping()
+def _on_title_source_changed(sender, **kwargs):
+    if kwargs.get("raw"):
+        return
+    page_titles.invalidate_page_title_map()
 
 
-@receiver(post_save, sender="profiles.TherapistProfile")
-def ping_on_therapist_save(sender, instance, created, **kwargs):
-    if created:
-        _ping()
+for _label in page_titles.SOURCE_LABELS:
+    _model = apps.get_model(_label)
+    post_save.connect(_on_title_source_changed, sender=_model, dispatch_uid=f"page_titles_save_{_label}")
+    post_delete.connect(_on_title_source_changed, sender=_model, dispatch_uid=f"page_titles_delete_{_label}")
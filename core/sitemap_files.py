@@ -0,0 +1,306 @@
+"""
+Pre-rendered, gzip-compressed sitemap files.
+
+Every section of the site sitemap is rendered to its own file in the default
+storage (local media or S3) and a sitemap index pointing at them is written
+alongside.  /sitemap.xml serves the stored index and /sitemaps/<file> serves
+the section files, so crawler requests never touch the sitemap classes.
+
+Sections are rebuilt incrementally: saving a model marks the sections that
+read from it dirty (SitemapSection.is_dirty) and schedules a debounced
+Celery rebuild; only dirty sections are re-rendered, and unchanged output is
+not re-uploaded.
+
+Public API
+----------
+  SITEMAP_SECTIONS                      section name → Sitemap class
+  build_sitemaps(sections=None, force=False) -> dict
+  mark_sections_dirty(model_label)      -> list[str]
+  schedule_sitemap_rebuild(model_label) -> None
+  read_sitemap_file(filename)           -> bytes | None
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import re
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from core.sitemaps import ConditionSitemap, ModalitySitemap, PageSitemap, PostSitemap, StaticViewSitemap
+from geo.sitemaps import (
+    GeoCitySitemap,
+    GeoCountySitemap,
+    GeoLocationConditionSitemap,
+    GeoLocationModalitySitemap,
+    GeoLocationServiceSitemap,
+    GeoRegionConditionSitemap,
+    GeoRegionModalitySitemap,
+    GeoRegionServiceSitemap,
+    GeoRegionSitemap,
+    GeoRegionTherapistSitemap,
+    GeoStateConditionSitemap,
+    GeoStateModalitySitemap,
+    GeoStateServiceSitemap,
+    GeoStateSitemap,
+)
+from profiles.sitemaps import TherapistAreaSitemap, TherapistSitemap, TherapistStateSitemap
+
+logger = logging.getLogger(__name__)
+
+STORAGE_DIR = "sitemaps"
+INDEX_FILENAME = "sitemap.xml"
+DEBOUNCE_SECONDS = 5 * 60
+_DEBOUNCE_KEY = "sitemaps:rebuild_scheduled"
+_FILENAME_RE = re.compile(r"^[a-z_]+(?:-\d+)?\.xml\.gz$")
+
+SITEMAP_SECTIONS = {
+    'static': StaticViewSitemap,
+    'pages': PageSitemap,
+    'posts': PostSitemap,
+    'conditions': ConditionSitemap,
+    'modalities': ModalitySitemap,
+    'geo_states': GeoStateSitemap,
+    'geo_cities': GeoCitySitemap,
+    'geo_counties': GeoCountySitemap,
+    'geo_state_services': GeoStateServiceSitemap,
+    'geo_location_services': GeoLocationServiceSitemap,
+    'geo_regions': GeoRegionSitemap,
+    'geo_region_services': GeoRegionServiceSitemap,
+    'geo_region_therapists': GeoRegionTherapistSitemap,
+    'geo_region_modalities': GeoRegionModalitySitemap,
+    'geo_region_conditions': GeoRegionConditionSitemap,
+    'geo_state_modalities': GeoStateModalitySitemap,
+    'geo_state_conditions': GeoStateConditionSitemap,
+    'geo_location_modalities': GeoLocationModalitySitemap,
+    'geo_location_conditions': GeoLocationConditionSitemap,
+    'therapists': TherapistSitemap,
+    'therapist_states': TherapistStateSitemap,
+    'therapist_areas': TherapistAreaSitemap,
+}
+
+# Pseudo-label sent when the GeoAvailability table changes (see core/signals.py)
+AVAILABILITY = "geo.geoavailability"
+# Geo sections use the latest therapist update as their lastmod
+THERAPIST = "profiles.therapistprofile"
+
+# section name → model labels whose changes affect the section's output
+SECTION_SOURCES: dict[str, set[str]] = {
+    'static': set(),
+    'pages': {"core.page"},
+    'posts': {"blog.post"},
+    'conditions': {"core.condition"},
+    'modalities': {"core.modality"},
+    'geo_states': {"geo.geostate", THERAPIST},
+    'geo_cities': {"geo.geostate", "geo.geolocation", THERAPIST},
+    'geo_counties': {"geo.geostate", "geo.geolocation", THERAPIST},
+    'geo_state_services': {"geo.geostate", "core.service", AVAILABILITY, THERAPIST},
+    'geo_location_services': {"geo.geostate", "geo.geolocation", "core.service", AVAILABILITY, THERAPIST},
+    'geo_regions': {"geo.georegion", THERAPIST},
+    'geo_region_services': {"geo.georegion", "core.service", THERAPIST},
+    'geo_region_therapists': {"geo.georegion", THERAPIST},
+    'geo_region_modalities': {"geo.georegion", "core.modality", AVAILABILITY, THERAPIST},
+    'geo_region_conditions': {"geo.georegion", "core.condition", AVAILABILITY, THERAPIST},
+    'geo_state_modalities': {"geo.geostate", "core.modality", AVAILABILITY, THERAPIST},
+    'geo_state_conditions': {"geo.geostate", "core.condition", AVAILABILITY, THERAPIST},
+    'geo_location_modalities': {"geo.geostate", "geo.geolocation", "core.modality", AVAILABILITY, THERAPIST},
+    'geo_location_conditions': {"geo.geostate", "geo.geolocation", "core.condition", AVAILABILITY, THERAPIST},
+    'therapists': {THERAPIST},
+    'therapist_states': {"geo.geostate", "geo.geolocation", AVAILABILITY, THERAPIST},
+    'therapist_areas': {"geo.geostate", "geo.geolocation", AVAILABILITY, THERAPIST},
+}
+
+SOURCE_LABELS = set().union(*SECTION_SOURCES.values())
+
+
+def _site_base() -> str:
+    return (getattr(settings, "BASE_URL", "") or "https://www.lcpsych.com").rstrip("/")
+
+
+def _storage_name(filename: str) -> str:
+    return f"{STORAGE_DIR}/{filename}"
+
+
+def _section_filename(section: str, page: int) -> str:
+    return f"{section}.xml.gz" if page == 1 else f"{section}-{page}.xml.gz"
+
+
+def _write(filename: str, content: bytes) -> None:
+    name = _storage_name(filename)
+    # S3 is configured with AWS_S3_FILE_OVERWRITE=False, so delete first to keep the name stable
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    default_storage.save(name, ContentFile(content))
+
+
+def read_sitemap_file(filename: str) -> bytes | None:
+    """Return the stored bytes for *filename* (index or section file), or None."""
+    if filename != INDEX_FILENAME and not _FILENAME_RE.match(filename):
+        return None
+    name = _storage_name(filename)
+    try:
+        with default_storage.open(name, "rb") as fh:
+            return fh.read()
+    except (FileNotFoundError, OSError):
+        return None
+
+
+def _render_section(section: str) -> tuple[list[bytes], int, object]:
+    """Render every page of *section*; return (gzipped pages, url count, latest lastmod)."""
+    sitemap = SITEMAP_SECTIONS[section]()
+    base = urlparse(_site_base())
+    site = SimpleNamespace(domain=base.netloc, name=settings.SITE_NAME)
+    pages: list[bytes] = []
+    url_count = 0
+    for page in sitemap.paginator.page_range:
+        urls = sitemap.get_urls(page=page, site=site, protocol=sitemap.protocol or base.scheme)
+        url_count += len(urls)
+        xml = render_to_string("sitemap.xml", {"urlset": urls})
+        pages.append(gzip.compress(xml.encode("utf-8"), mtime=0))
+    return pages, url_count, getattr(sitemap, "latest_lastmod", None)
+
+
+def _write_index() -> None:
+    from core.models import SitemapSection
+
+    base = _site_base()
+    entries = []
+    for row in SitemapSection.objects.filter(page_count__gt=0).order_by("name"):
+        if row.name not in SITEMAP_SECTIONS:
+            continue
+        for page in range(1, row.page_count + 1):
+            entries.append(SimpleNamespace(
+                location=f"{base}/{STORAGE_DIR}/{_section_filename(row.name, page)}",
+                last_mod=row.lastmod,
+            ))
+    xml = render_to_string("sitemap_index.xml", {"sitemaps": entries})
+    _write(INDEX_FILENAME, xml.encode("utf-8"))
+
+
+def build_sitemaps(sections=None, force: bool = False) -> dict:
+    """
+    Render sitemap sections to storage and rewrite the index.
+
+    Parameters
+    ----------
+    sections : iterable of section names, or None for every dirty (or
+               never-built) section
+    force    : rebuild the selected sections even if they are not dirty
+
+    Returns a dict with ``built`` (re-uploaded), ``unchanged`` and ``urls``.
+    """
+    from core.models import SitemapSection
+    from geo.sitemaps import _latest_therapist_date
+
+    # Process-lifetime cache; a long-running worker would otherwise never refresh it
+    _latest_therapist_date.cache_clear()
+
+    rows = {row.name: row for row in SitemapSection.objects.all()}
+    if sections is None:
+        selected = [
+            name for name in SITEMAP_SECTIONS
+            if force or name not in rows or rows[name].is_dirty
+        ]
+    else:
+        unknown = set(sections) - set(SITEMAP_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown sitemap section(s): {', '.join(sorted(unknown))}")
+        selected = [name for name in SITEMAP_SECTIONS if name in set(sections)]
+
+    built, unchanged, url_total = [], [], 0
+    for section in selected:
+        row = rows.get(section) or SitemapSection(name=section)
+        # Clear the flag before rendering so changes made meanwhile re-dirty it
+        if row.pk:
+            SitemapSection.objects.filter(pk=row.pk).update(is_dirty=False)
+        pages, url_count, lastmod = _render_section(section)
+        url_total += url_count
+        checksum = hashlib.sha256(b"".join(pages)).hexdigest()
+
+        if checksum == row.checksum and len(pages) == row.page_count and not force:
+            unchanged.append(section)
+        else:
+            for page, content in enumerate(pages, start=1):
+                _write(_section_filename(section, page), content)
+            for page in range(len(pages) + 1, row.page_count + 1):
+                default_storage.delete(_storage_name(_section_filename(section, page)))
+            built.append(section)
+
+        row.checksum = checksum
+        row.page_count = len(pages)
+        row.url_count = url_count
+        row.lastmod = lastmod
+        row.built_at = timezone.now()
+        if row.pk:
+            SitemapSection.objects.filter(pk=row.pk).update(
+                checksum=row.checksum,
+                page_count=row.page_count,
+                url_count=row.url_count,
+                lastmod=row.lastmod,
+                built_at=row.built_at,
+            )
+        else:
+            row.save()
+
+    if built or read_sitemap_file(INDEX_FILENAME) is None:
+        _write_index()
+
+    result = {"built": built, "unchanged": unchanged, "urls": url_total}
+    logger.info("sitemaps built: %d re-uploaded, %d unchanged", len(built), len(unchanged))
+    return result
+
+
+def mark_sections_dirty(model_label: str) -> list[str]:
+    """Flag every section that reads from *model_label*; return their names."""
+    from core.models import SitemapSection
+
+    sections = [name for name, sources in SECTION_SOURCES.items() if model_label in sources]
+    if not sections:
+        return []
+    updated = SitemapSection.objects.filter(name__in=sections).update(is_dirty=True)
+    if updated < len(sections):
+        SitemapSection.objects.bulk_create(
+            [SitemapSection(name=name, is_dirty=True) for name in sections],
+            ignore_conflicts=True,
+        )
+    return sections
+
+
+def _queue_rebuild() -> None:
+    try:
+        if not cache.add(_DEBOUNCE_KEY, True, DEBOUNCE_SECONDS):
+            return
+        from core.tasks import rebuild_sitemaps
+
+        rebuild_sitemaps.apply_async(countdown=DEBOUNCE_SECONDS)
+    except Exception as exc:
+        # The sections stay dirty; the next change queues the rebuild again
+        logger.exception("sitemap rebuild could not be queued: %s", exc)
+        try:
+            cache.delete(_DEBOUNCE_KEY)
+        except Exception:
+            pass
+
+
+def schedule_sitemap_rebuild(model_label: str) -> None:
+    """
+    Mark the affected sections dirty and queue one debounced rebuild.
+
+    Once the transaction commits, the first change schedules a Celery task
+    DEBOUNCE_SECONDS out; further changes inside that window only flag their
+    sections, which the pending task picks up.  A rolled-back change neither
+    flags sections nor holds the debounce window open.
+    """
+    if not mark_sections_dirty(model_label):
+        return
+    transaction.on_commit(_queue_rebuild)
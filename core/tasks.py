@@ -0,0 +1,85 @@
+"""
+core/tasks.py
+-------------
+Celery tasks for the core app.
+
+    rebuild_sitemaps        — re-render dirty sitemap sections to storage
+                              (queued, debounced, by core/signals.py)
+    drain_analytics_events  — write queued /api/analytics/ events in batches
+                              (every few seconds via beat, or when the queue
+                              fills a batch)
+    build_analytics_rollups — roll closed hours/days of events up for the
+                              visitor-stats dashboard (every 15 minutes)
+"""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+from celery.schedules import crontab
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on batches per run so one task cannot monopolise a worker
+DRAIN_MAX_BATCHES = 20
+
+BEAT_SCHEDULE = {
+    "core-drain-analytics-events": {
+        "task": "core.tasks.drain_analytics_events",
+        "schedule": 10.0,
+    },
+    "core-build-analytics-rollups": {
+        "task": "core.tasks.build_analytics_rollups",
+        "schedule": crontab(minute="*/15"),
+    },
+}
+
+
+@shared_task(bind=True, name="core.tasks.rebuild_sitemaps", max_retries=2, default_retry_delay=120)
+def rebuild_sitemaps(self, sections=None, force: bool = False):
+    """Rebuild dirty (or the given) sitemap sections and the sitemap index."""
+    from core.sitemap_files import _DEBOUNCE_KEY, build_sitemaps
+
+    # Open the debounce window again so changes made during the build schedule a new run
+    cache.delete(_DEBOUNCE_KEY)
+    try:
+        result = build_sitemaps(sections=sections, force=force)
+    except Exception as exc:
+        logger.exception("rebuild_sitemaps failed: %s", exc)
+        raise self.retry(exc=exc)
+    return result
+
+
+@shared_task(bind=True, name="core.tasks.drain_analytics_events", max_retries=2, default_retry_delay=30)
+def drain_analytics_events(self):
+    """Persist queued analytics events, one bulk insert per batch."""
+    from core.analytics_ingest import BATCH_SIZE, drain_events
+
+    # Each batch is popped atomically and live session updates are serialised
+    # (core/live_sessions.py), so overlapping runs (beat + producer kick) are safe
+    total = 0
+    try:
+        for _ in range(DRAIN_MAX_BATCHES):
+            popped = drain_events(BATCH_SIZE)
+            total += popped
+            if popped < BATCH_SIZE:
+                break
+    except Exception as exc:
+        logger.exception("drain_analytics_events failed: %s", exc)
+        raise self.retry(exc=exc)
+    return total
+
+
+@shared_task(bind=True, name="core.tasks.build_analytics_rollups", max_retries=2, default_retry_delay=120)
+def build_analytics_rollups(self):
+    """Build any closed hour/day rollup buckets that are missing or dirty."""
+    from core.analytics_rollups import build_pending_rollups
+
+    try:
+        result = build_pending_rollups()
+    except Exception as exc:
+        logger.exception("build_analytics_rollups failed: %s", exc)
+        raise self.retry(exc=exc)
+    return result
@@ -11,6 +11,7 @@ urlpatterns = [
     path('contact/', RedirectView.as_view(pattern_name='core:contact_us', permanent=True)),
     path('_preview/', views.import_preview, name='import_preview'),
     path('api/analytics/', views.analytics_event, name='analytics_event'),
+    path('api/analytics/batch/', views.analytics_batch, name='analytics_batch'),
     path('api/url-removal/', url_removal, name='url_removal'),
     path('blog/', views.post_list, name='post_list'),
     path('blog/feed/', LatestPostsFeed(), name='post_feed'),
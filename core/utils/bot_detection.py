@@ -1,11 +1,14 @@
 """Bot / crawler user-agent detection helpers.
 
-Used in two places:
+Used in three places:
   1. The ``/api/analytics/`` endpoint rejects requests from known bots so they
      never reach the database.
-  2. The stats dashboard querysets exclude any rows that slipped through (e.g.
-     from before this filter was added, or from unsophisticated headless clients
-     that do send a User-Agent but whose JS execution is still bot-like).
+  2. ``UserAgent.resolve()`` stores ``is_bot_ua()`` once per distinct user agent;
+     the ingest worker copies it to ``AnalyticsEvent.is_bot`` so the stats
+     dashboards can filter on ``is_bot=False`` instead of pattern matching
+     every row (``manage.py classify_analytics_events`` backfills old rows).
+  3. ``is_bot_session()`` drops sessions that slipped through but behave like
+     unsophisticated headless clients.
 """
 from __future__ import annotations
 
@@ -83,6 +86,9 @@ def is_bot_ua(user_agent: str) -> bool:
 def bot_ua_exclude_q() -> Q:
     """Return a ``Q`` object suitable for ``.exclude()`` on an ``AnalyticsEvent`` queryset.
 
+    Slow on large tables (one ILIKE per pattern per row); dashboards use the
+    indexed ``is_bot`` column instead.
+
     Usage::
 
         events = AnalyticsEvent.objects.filter(...).exclude(bot_ua_exclude_q())
@@ -108,8 +114,22 @@ def is_bot_session(event_types: list[str], paths: list[str]) -> bool:
     - No human-signal events (no page_view, click, form_submit, heartbeat, hover_intent)
     - At least 2 events recorded (ruling out empty/partial sessions)
     """
-    if len(event_types) < 2:
+    return is_bot_session_summary(
+        len(event_types),
+        len(set(paths)),
+        any(is_human_event(et) for et in event_types),
+    )
+
+
+def is_human_event(event_type: str) -> bool:
+    """Return ``True`` for event types that need genuine user interaction."""
+    return event_type in _HUMAN_EVENT_TYPES
+
+
+def is_bot_session_summary(event_count: int, distinct_paths: int, has_human_event: bool) -> bool:
+    """:func:`is_bot_session` for callers that keep running counts instead of event lists."""
+    if event_count < 2:
         return False
-    if len(set(paths)) > 1:
+    if distinct_paths > 1:
         return False
-    return not any(et in _HUMAN_EVENT_TYPES for et in event_types)
+    return not has_human_event
@@ -0,0 +1,71 @@
+"""Device OS / form-factor / browser classification from a user-agent string.
+
+The OS and form-factor rules are the ``Case``/``When`` rules the stats
+dashboards used in SQL before events were classified at ingest (see
+core.models.UserAgent).  Rules are checked in order and compared
+case-insensitively.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+_OS_RULES: tuple[tuple[str, str], ...] = (
+    ("android", "Android"),
+    ("iphone", "iOS"),
+    ("ipad", "iPadOS"),
+    ("mac os", "macOS"),
+    ("macintosh", "macOS"),
+    ("windows", "Windows"),
+    ("linux", "Linux"),
+    ("cros", "ChromeOS"),
+)
+# Checked in order: Chromium derivatives also carry "chrome" and "safari",
+# and Chrome on iOS carries "safari".
+_BROWSER_RULES: tuple[tuple[str, str], ...] = (
+    ("edg/", "Edge"),
+    ("edge/", "Edge"),
+    ("opr/", "Opera"),
+    ("samsungbrowser", "Samsung Internet"),
+    ("firefox", "Firefox"),
+    ("fxios", "Firefox"),
+    ("crios", "Chrome"),
+    ("chrome", "Chrome"),
+    ("safari", "Safari"),
+)
+_TABLET_MARKERS = ("ipad", "tablet")
+_MOBILE_MARKERS = ("mobile", "iphone", "android")
+
+DEFAULT_OS = "Other"
+DEFAULT_DEVICE_TYPE = "Desktop"
+DEFAULT_BROWSER = "Other"
+
+
+def device_os(user_agent: str) -> str:
+    ua = (user_agent or "").lower()
+    for marker, name in _OS_RULES:
+        if marker in ua:
+            return name
+    return DEFAULT_OS
+
+
+def device_type(user_agent: str) -> str:
+    ua = (user_agent or "").lower()
+    if any(marker in ua for marker in _TABLET_MARKERS):
+        return "Tablet"
+    if any(marker in ua for marker in _MOBILE_MARKERS):
+        return "Mobile"
+    return DEFAULT_DEVICE_TYPE
+
+
+def browser_family(user_agent: str) -> str:
+    ua = (user_agent or "").lower()
+    for marker, name in _BROWSER_RULES:
+        if marker in ua:
+            return name
+    return DEFAULT_BROWSER
+
+
+@lru_cache(maxsize=2048)
+def classify_device(user_agent: str) -> tuple[str, str]:
+    """Return ``(device_os, device_type)`` for *user_agent* (memoised; few distinct UAs)."""
+    return device_os(user_agent), device_type(user_agent)
@@ -0,0 +1,292 @@
+"""IP geolocation with a local MaxMind database and layered caching.
+
+Lookups go through three layers, cheapest first:
+
+  1. a bounded in-process LRU with a TTL,
+  2. Redis (``geo:ip:<ip hash>``), shared by every dyno and worker,
+  3. the MaxMind GeoLite2-City database, opened once per process in
+     memory-mapped mode.
+
+The ipinfo.io API is only consulted when the caller passes ``remote=True``,
+which the analytics ingest worker does; request handlers never wait on it.
+Cache keys are AnalyticsEvent.hash_ip() digests, so raw addresses are never
+written to Redis.
+
+Hit/miss counters are kept per process and flushed to the ``geo:stats``
+Redis hash by flush_stats(); ``manage.py geoip_stats`` prints the totals.
+Cached failures are counted as ``negative_hit``, not as cache hits.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+import requests
+from django.conf import settings
+
+from core.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+EMPTY_GEO = {"country_code": "", "region": "", "city": "", "timezone": ""}
+
+LOCAL_CACHE_SIZE = 4096
+LOCAL_TTL = 60 * 60
+REDIS_TTL = 7 * 24 * 60 * 60
+# Addresses nobody could resolve are retried after this long
+NEGATIVE_TTL = 60 * 60
+REMOTE_TIMEOUT = 1.5
+
+_REDIS_PREFIX = "geo:ip:"
+STATS_KEY = "geo:stats"
+DB_FILENAME = "GeoLite2-City.mmdb"
+
+# negative_hit: a cached failure (EMPTY_GEO) was served; not counted as a hit
+STAT_FIELDS = ("local_hit", "redis_hit", "db_hit", "remote_hit", "negative_hit", "miss")
+
+
+class _LRUCache:
+    """Thread-safe LRU mapping with a per-entry expiry."""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict, ttl: int | None = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_local = _LRUCache(LOCAL_CACHE_SIZE, LOCAL_TTL)
+_stats: Counter = Counter()
+_unflushed: Counter = Counter()
+_stats_lock = threading.Lock()
+
+_reader = None
+_reader_loaded = False
+_reader_lock = threading.Lock()
+
+
+def _record(field: str) -> None:
+    with _stats_lock:
+        _stats[field] += 1
+        _unflushed[field] += 1
+
+
+def _db_path() -> Path | None:
+    configured = getattr(settings, "GEOIP_PATH", "")
+    if not configured:
+        return None
+    path = Path(configured)
+    return path / DB_FILENAME if path.is_dir() else path
+
+
+def _get_reader():
+    """Open the MaxMind database once per process; None if it is unavailable."""
+    global _reader, _reader_loaded
+    if _reader_loaded:
+        return _reader
+    with _reader_lock:
+        if _reader_loaded:
+            return _reader
+        path = _db_path()
+        try:
+            import geoip2.database
+
+            if path is not None and path.exists():
+                _reader = geoip2.database.Reader(str(path), mode=geoip2.database.MODE_MMAP)
+            else:
+                logger.info("GeoIP database not found at %s; using remote fallback only", path)
+        except Exception as exc:  # pragma: no cover - optional dependency / data file
+            logger.warning("GeoIP database could not be opened: %s", exc)
+        _reader_loaded = True
+    return _reader
+
+
+def _lookup_db(ip: str) -> dict | None:
+    reader = _get_reader()
+    if reader is None:
+        return None
+    try:
+        res = reader.city(ip)
+    except Exception:
+        # AddressNotFoundError, or a malformed/private address
+        return None
+    return {
+        "country_code": (res.country.iso_code or "")[:2],
+        "region": (res.subdivisions.most_specific.name or "")[:100],
+        "city": (res.city.name or "")[:100],
+        "timezone": (res.location.time_zone or "")[:64],
+    }
+
+
+def _lookup_remote(ip: str) -> dict | None:
+    token = getattr(settings, "IPINFO_TOKEN", "")
+    if not token or ip.startswith("127."):
+        return None
+    try:
+        resp = requests.get(f"https://ipinfo.io/{ip}/json", params={"token": token}, timeout=REMOTE_TIMEOUT)
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+    except Exception as exc:  # pragma: no cover - network fallback best-effort
+        logger.debug("ipinfo lookup failed", exc_info=exc)
+        return None
+    return {
+        "country_code": (data.get("country") or "")[:2],
+        "region": (data.get("region") or "")[:100],
+        "city": (data.get("city") or "")[:100],
+        "timezone": (data.get("timezone") or "")[:64],
+    }
+
+
+def _redis_get(key: str) -> dict | None:
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(_REDIS_PREFIX + key)
+    except Exception as exc:
+        logger.debug("geo cache read failed: %s", exc)
+        return None
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _store(key: str, geo: dict, ttl: int) -> None:
+    _local.set(key, geo, ttl=min(ttl, LOCAL_TTL))
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.set(_REDIS_PREFIX + key, json.dumps(geo), ex=ttl)
+    except Exception as exc:
+        logger.debug("geo cache write failed: %s", exc)
+
+
+def geolocate(ip: str, *, ip_hash: str = "", remote: bool = False) -> dict[str, str]:
+    """
+    Resolve *ip* to country_code / region / city / timezone (empty strings if unknown).
+
+    ``ip_hash`` may be passed when the caller already has
+    AnalyticsEvent.hash_ip(ip).  ``remote=True`` allows the ipinfo.io
+    fallback; only use it off the request path.
+    """
+    if not ip:
+        return dict(EMPTY_GEO)
+    if not ip_hash:
+        from core.models import AnalyticsEvent
+
+        ip_hash = AnalyticsEvent.hash_ip(ip)
+
+    geo = _local.get(ip_hash)
+    if geo is not None:
+        _record("negative_hit" if geo == EMPTY_GEO else "local_hit")
+        return dict(geo)
+
+    geo = _redis_get(ip_hash)
+    if geo is not None:
+        _record("negative_hit" if geo == EMPTY_GEO else "redis_hit")
+        _local.set(ip_hash, geo)
+        return dict(geo)
+
+    geo = _lookup_db(ip)
+    if geo is not None:
+        _record("db_hit")
+        _store(ip_hash, geo, REDIS_TTL)
+        return dict(geo)
+
+    if remote:
+        geo = _lookup_remote(ip)
+        if geo is not None:
+            _record("remote_hit")
+            _store(ip_hash, geo, REDIS_TTL)
+            return dict(geo)
+        # Remember the failure so every event from this address does not retry it
+        _store(ip_hash, dict(EMPTY_GEO), NEGATIVE_TTL)
+
+    _record("miss")
+    return dict(EMPTY_GEO)
+
+
+def flush_stats() -> None:
+    """Add this process's unflushed counters to the shared Redis hash."""
+    client = get_redis()
+    if client is None:
+        return
+    with _stats_lock:
+        pending = dict(_unflushed)
+        _unflushed.clear()
+    if not pending:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for field, count in pending.items():
+            pipe.hincrby(STATS_KEY, field, count)
+        pipe.execute()
+    except Exception as exc:
+        logger.debug("geo stats flush failed: %s", exc)
+        with _stats_lock:
+            _unflushed.update(pending)
+
+
+def get_stats() -> dict:
+    """Return ``{"process": {...}, "shared": {...}}`` hit/miss counters."""
+    with _stats_lock:
+        process = {field: _stats.get(field, 0) for field in STAT_FIELDS}
+    shared = {}
+    client = get_redis()
+    if client is not None:
+        try:
+            raw = client.hgetall(STATS_KEY)
+            shared = {
+                (k.decode() if isinstance(k, bytes) else k): int(v)
+                for k, v in raw.items()
+            }
+        except Exception as exc:
+            logger.debug("geo stats read failed: %s", exc)
+    return {
+        "process": process,
+        "shared": {field: shared.get(field, 0) for field in STAT_FIELDS},
+    }
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+        _unflushed.clear()
+    client = get_redis()
+    if client is not None:
+        try:
+            client.delete(STATS_KEY)
+        except Exception as exc:
+            logger.debug("geo stats reset failed: %s", exc)
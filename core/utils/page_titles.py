@@ -0,0 +1,80 @@
+"""Cached path -> title lookup for the analytics dashboards.
+
+The map is built from Pages, StaticPageSEO entries, published therapist
+profiles and published blog posts.  It is stored in the shared PAGE_TITLES
+cache namespace (core/cache.py), so every dyno shares one copy, and
+core/signals.py bumps the namespace whenever one of SOURCE_LABELS is saved
+or deleted.
+"""
+from __future__ import annotations
+
+import logging
+
+from core.cache import PAGE_TITLES
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "map"
+CACHE_TTL = 24 * 60 * 60
+SOURCE_LABELS = frozenset({"core.page", "core.staticpageseo", "profiles.therapistprofile", "blog.post"})
+
+
+def build_page_title_map() -> dict[str, str]:
+    """Return a path->title mapping for known pages/posts/profiles (uncached)."""
+    from blog.models import Post
+    from core.models import Page, StaticPageSEO
+    from profiles.models import TherapistProfile
+
+    page_title_map: dict[str, str] = {}
+
+    def _add_title(path_val: str, title_val: str) -> None:
+        norm = (path_val or "").strip("/")
+        if not norm or norm in page_title_map:
+            return
+        page_title_map[norm] = title_val
+
+    for p in Page.objects.all().values("path", "title"):
+        _add_title(p.get("path") or "", p.get("title") or "")
+
+    for entry in StaticPageSEO.objects.all().values("slug", "page_name"):
+        _add_title(entry.get("slug") or "", entry.get("page_name") or "")
+
+    for t in TherapistProfile.objects.filter(is_published=True).values("slug", "salutation", "first_name", "last_name"):
+        slug = t.get("slug") or ""
+        salutation = (t.get("salutation") or "").strip()
+        first = (t.get("first_name") or "").strip()
+        last = (t.get("last_name") or "").strip()
+        name_parts = [p for p in [first, last] if p]
+        name = " ".join(name_parts) or slug or "Therapist"
+        if salutation:
+            name = f"{salutation} {name}".strip()
+        _add_title(f"therapists/{slug}", name)
+
+    for post in Post.objects.filter(status=Post.STATUS_PUBLISHED).values("slug", "title"):
+        _add_title(f"blog/{post.get('slug') or ''}", post.get("title") or "")
+
+    return page_title_map
+
+
+def get_page_title_map() -> dict[str, str]:
+    """Return the cached path->title mapping, building it on a miss."""
+    try:
+        title_map = PAGE_TITLES.get(CACHE_KEY)
+        if title_map is not None:
+            return title_map
+    except Exception as exc:
+        logger.debug("page title cache read failed: %s", exc)
+
+    title_map = build_page_title_map()
+    try:
+        PAGE_TITLES.set(CACHE_KEY, title_map, CACHE_TTL)
+    except Exception as exc:
+        logger.debug("page title cache write failed: %s", exc)
+    return title_map
+
+
+def invalidate_page_title_map() -> None:
+    try:
+        PAGE_TITLES.bump()
+    except Exception as exc:
+        logger.warning("page title cache invalidation failed: %s", exc)
@@ -0,0 +1,35 @@
+"""Shared Redis connection for app-level queues and caches.
+
+Uses the same ``REDIS_URL`` as the Celery broker.  Returns ``None`` when Redis
+is not configured (local development) so callers can fall back to doing the
+work inline.
+"""
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis():
+    """Return a process-wide ``redis.Redis`` client, or ``None`` if REDIS_URL is unset."""
+    global _client
+    if _client is not None:
+        return _client
+
+    url = getattr(settings, "REDIS_URL", "")
+    if not url:
+        return None
+
+    import redis
+
+    kwargs = {"socket_timeout": 2, "socket_connect_timeout": 2, "health_check_interval": 30}
+    if url.startswith("rediss://"):
+        # Heroku Redis uses self-signed certificates
+        kwargs["ssl_cert_reqs"] = None
+    _client = redis.Redis.from_url(url, **kwargs)
+    return _client
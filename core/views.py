@@ -13,11 +13,8 @@ from django.template.loader import select_template
 from django.utils.safestring import mark_safe
 from django.utils.http import urlencode
 import json
-import logging
 import re
 from pathlib import Path
-from urllib.parse import urlparse
-import requests
 from .forms import JoinOurTeamForm
 from .models import (
 	Page,
@@ -26,8 +23,6 @@ from .models import (
 	Service,
 	StaticPageSEO,
 	ContactInfo,
-	AnalyticsEvent,
-	AnalyticsEventType,
 	InsuranceProvider,
 	InsuranceExclusion,
 	HeroSettings,
@@ -39,6 +34,7 @@ from .models import (
 )
 from profiles.models import TherapistProfile
 from core.utils.bot_detection import is_bot_ua
+from core.analytics_ingest import InvalidEvent, enqueue_events, validate_batch, validate_event
 
 
 def _client_ip(request) -> str:
@@ -48,48 +44,14 @@ def _client_ip(request) -> str:
 	return request.META.get("REMOTE_ADDR", "") or ""
 
 
-def _geolocate_ip(ip: str) -> dict[str, str]:
-	"""Best-effort geolocation; returns empty values if GeoIP is unavailable."""
-	if not ip:
-		return {"country_code": "", "region": "", "city": "", "timezone": ""}
-	try:
-		from django.contrib.gis.geoip2 import GeoIP2  # type: ignore
-		geo = GeoIP2()
-		res = geo.city(ip)
-		return {
-			"country_code": (res.get("country_code") or "")[:2],
-			"region": (res.get("region") or res.get("subdivisions", [{}])[0].get("names", {}).get("en") or "")[:100] if isinstance(res.get("subdivisions"), list) else (res.get("region") or "")[:100],
-			"city": (res.get("city") or "")[:100],
-			"timezone": (res.get("time_zone") or res.get("timezone") or "")[:64],
-		}
-	except Exception as exc:  # pragma: no cover - optional dependency / data file
-		logging.getLogger(__name__).debug("GeoIP lookup failed", exc_info=exc)
-
-	token = getattr(settings, "IPINFO_TOKEN", "")
-	if token and ip and not ip.startswith("127."):
-		try:
-			resp = requests.get(f"https://ipinfo.io/{ip}/json", params={"token": token}, timeout=1.5)
-			if resp.status_code == 200:
-				data = resp.json()
-				return {
-					"country_code": (data.get("country") or "")[:2],
-					"region": (data.get("region") or "")[:100],
-					"city": (data.get("city") or "")[:100],
-					"timezone": (data.get("timezone") or "")[:64],
-				}
-		except Exception as exc:  # pragma: no cover - network fallback best-effort
-			logging.getLogger(__name__).debug("ipinfo lookup failed", exc_info=exc)
-
-	return {"country_code": "", "region": "", "city": "", "timezone": ""}
-
-
 @csrf_exempt
 @require_POST
 def analytics_event(request):
 	"""Accept lightweight analytics events from the front-end tracker.
 
 	We skip authenticated users to keep the dataset anonymous, and we guard against
-	oversized payloads or unknown event types.
+	oversized payloads or unknown event types.  Events are queued and written
+	in batches by core.analytics_ingest; the request never waits on the database.
 	"""
 
 	if request.user.is_authenticated:
@@ -100,56 +62,53 @@ def analytics_event(request):
 	except json.JSONDecodeError:
 		return JsonResponse({"error": "invalid json"}, status=400)
 
-	event_type = payload.get("event_type") or ""
-	if event_type not in AnalyticsEventType.values:
-		return JsonResponse({"error": "unknown event type"}, status=400)
-
-	session_id = (payload.get("session_id") or "").strip()[:64]
-	if not session_id:
-		return JsonResponse({"error": "session_id required"}, status=400)
-
-	raw_path = (payload.get("path") or request.path or "").split("?")[0]
-	if "://" in raw_path:
-		raw_path = urlparse(raw_path).path or raw_path
-	path = raw_path[:500]
-	referrer = (payload.get("referrer") or "")[:500]
-	label = (payload.get("label") or "")[:255]
-	duration_ms = int(payload.get("duration_ms") or 0)
-	scroll_percent = max(0, min(int(payload.get("scroll_percent") or 0), 100))
-	metadata = payload.get("metadata")
-	if not isinstance(metadata, dict):
-		metadata = {}
-
-	ip = _client_ip(request)
-	user_agent = (request.META.get("HTTP_USER_AGENT", "") or "")[:1000]
-	geo = _geolocate_ip(ip)
+	user_agent = request.META.get("HTTP_USER_AGENT", "") or ""
+	try:
+		event = validate_event(
+			payload,
+			ip=_client_ip(request),
+			user_agent=user_agent,
+			request_path=request.path,
+		)
+	except InvalidEvent as exc:
+		return JsonResponse({"error": str(exc)}, status=400)
+
+	if event is None or is_bot_ua(user_agent):
+		return HttpResponse(status=204)
+
+	# Geolocation and the INSERT happen in the drain_analytics_events worker
+	enqueue_events([event])
+	return HttpResponse(status=204)
+
+
+@csrf_exempt
+@require_POST
+def analytics_batch(request):
+	"""Accept a buffered batch of tracker events sharing one session envelope.
+
+	Same rules as analytics_event, but the auth/bot checks and client IP are
+	resolved once for the whole batch.  Individual malformed events are dropped
+	rather than failing the batch.
+	"""
 
+	if request.user.is_authenticated:
+		return HttpResponse(status=204)
+
+	user_agent = request.META.get("HTTP_USER_AGENT", "") or ""
 	if is_bot_ua(user_agent):
 		return HttpResponse(status=204)
 
-	blocked_paths = ("/admin", "/accounts/login", "/accounts/logout")
-	if event_type not in {AnalyticsEventType.AUTH_SUCCESS, AnalyticsEventType.AUTH_FAILED}:
-		if any(path.startswith(p) for p in blocked_paths):
-			return HttpResponse(status=204)
-
-	AnalyticsEvent.objects.create(
-		event_type=event_type,
-		session_id=session_id,
-		path=path,
-		referrer=referrer,
-		user_agent=user_agent,
-		ip_hash=AnalyticsEvent.hash_ip(ip),
-		label=label,
-		duration_ms=max(duration_ms, 0),
-		scroll_percent=scroll_percent,
-		metadata=metadata,
-		is_authenticated=False,
-		country_code=geo.get("country_code", ""),
-		region=geo.get("region", ""),
-		city=geo.get("city", ""),
-		timezone=geo.get("timezone", ""),
-	)
+	try:
+		payload = json.loads(request.body or "{}")
+	except json.JSONDecodeError:
+		return JsonResponse({"error": "invalid json"}, status=400)
 
+	try:
+		events = validate_batch(payload, ip=_client_ip(request), user_agent=user_agent)
+	except InvalidEvent as exc:
+		return JsonResponse({"error": str(exc)}, status=400)
+
+	enqueue_events(events)
 	return HttpResponse(status=204)
 
 
@@ -290,6 +249,33 @@ def location_xml(request):
 	return HttpResponse(content, content_type='application/vnd.google-earth.kml+xml')
 
 
+def sitemap_index(request):
+	"""Serve the pre-rendered sitemap index; fall back to the live sitemap before the first build."""
+	from core.sitemap_files import INDEX_FILENAME, SITEMAP_SECTIONS, read_sitemap_file
+
+	content = read_sitemap_file(INDEX_FILENAME)
+	if content is None:
+		from django.contrib.sitemaps.views import sitemap
+		return sitemap(request, sitemaps=SITEMAP_SECTIONS)
+	response = HttpResponse(content, content_type='application/xml')
+	response['Cache-Control'] = 'public, max-age=3600'
+	response['X-Robots-Tag'] = 'noindex, noodp, noarchive'
+	return response
+
+
+def sitemap_file(request, filename: str):
+	"""Serve one gzip-compressed sitemap section file from storage."""
+	from core.sitemap_files import read_sitemap_file
+
+	content = read_sitemap_file(filename) if filename.endswith('.xml.gz') else None
+	if content is None:
+		raise Http404('Sitemap not found')
+	response = HttpResponse(content, content_type='application/gzip')
+	response['Cache-Control'] = 'public, max-age=3600'
+	response['X-Robots-Tag'] = 'noindex, noodp, noarchive'
+	return response
+
+
 def our_team(request):
 	profiles = (
 		TherapistProfile.objects.filter(is_published=True)
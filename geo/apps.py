@@ -5,3 +5,7 @@ class GeoConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "geo"
     verbose_name = "Geographic SEO"
+
+    def ready(self):
+        # Keep GeoAvailability in sync with the M2M tables it is derived from
+        from . import signals  # noqa: F401
@@ -0,0 +1,40 @@
+"""
+Management command to rebuild the GeoAvailability table from scratch.
+
+Usage
+-----
+  python manage.py rebuild_geo_availability             # diff and apply changes
+  python manage.py rebuild_geo_availability --truncate  # wipe the table first
+
+Signals keep the table current during normal editing; run this after bulk
+imports, raw SQL changes, or on deploy (see Procfile release phase).
+"""
+
+from django.core.management.base import BaseCommand
+
+from geo.models import GeoAvailability
+from geo.utils.availability_sync import sync_geo_availability
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized GeoAvailability table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--truncate",
+            action="store_true",
+            help="Delete all existing availability rows before rebuilding.",
+        )
+
+    def handle(self, *args, **options):
+        if options["truncate"]:
+            deleted, _ = GeoAvailability.objects.all().delete()
+            self.stdout.write(self.style.WARNING(f"Deleted {deleted} existing availability rows."))
+
+        result = sync_geo_availability()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Geo availability rebuilt: {result['total']} rows "
+                f"({result['created']} created, {result['deleted']} deleted)."
+            )
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.7 on 2026-10-16 20:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0006_georegion_offices'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeoAvailability',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('area_type', models.CharField(choices=[('state', 'State'), ('location', 'Location'), ('region', 'Region')], max_length=10)),
+                ('area_id', models.PositiveIntegerField()),
+                ('entity_type', models.CharField(choices=[('therapist', 'Therapist'), ('service', 'Service'), ('office', 'Office'), ('modality', 'Modality'), ('condition', 'Condition')], max_length=10)),
+                ('entity_id', models.PositiveIntegerField()),
+            ],
+            options={
+                'verbose_name': 'Availability',
+                'verbose_name_plural': 'Availability',
+                'indexes': [models.Index(fields=['entity_type', 'entity_id'], name='geo_avail_entity_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='geoavailability',
+            constraint=models.UniqueConstraint(fields=('area_type', 'area_id', 'entity_type', 'entity_id'), name='geo_availability_unique'),
+        ),
+    ]
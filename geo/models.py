@@ -258,3 +258,59 @@ class GeoContentBlock(models.Model):
 
     def __str__(self):
         return self.heading
+
+
+class GeoAvailability(models.Model):
+    """
+    Denormalized availability row: *entity* is reachable in *area*.
+
+    Rows are derived from the therapist / office / location M2M tables by
+    geo.utils.availability_sync and kept current by the signal handlers in
+    geo/signals.py.  The get_*_for_area helpers in geo.utils.availability
+    read from this table instead of recomputing reachability per request.
+
+    Run ``python manage.py rebuild_geo_availability`` for a full rebuild.
+    """
+
+    AREA_STATE = "state"
+    AREA_LOCATION = "location"
+    AREA_REGION = "region"
+    AREA_TYPES = [
+        (AREA_STATE, "State"),
+        (AREA_LOCATION, "Location"),
+        (AREA_REGION, "Region"),
+    ]
+
+    ENTITY_THERAPIST = "therapist"
+    ENTITY_SERVICE = "service"
+    ENTITY_OFFICE = "office"
+    ENTITY_MODALITY = "modality"
+    ENTITY_CONDITION = "condition"
+    ENTITY_TYPES = [
+        (ENTITY_THERAPIST, "Therapist"),
+        (ENTITY_SERVICE, "Service"),
+        (ENTITY_OFFICE, "Office"),
+        (ENTITY_MODALITY, "Modality"),
+        (ENTITY_CONDITION, "Condition"),
+    ]
+
+    area_type = models.CharField(max_length=10, choices=AREA_TYPES)
+    area_id = models.PositiveIntegerField()
+    entity_type = models.CharField(max_length=10, choices=ENTITY_TYPES)
+    entity_id = models.PositiveIntegerField()
+
+    class Meta:
+        verbose_name = "Availability"
+        verbose_name_plural = "Availability"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["area_type", "area_id", "entity_type", "entity_id"],
+                name="geo_availability_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["entity_type", "entity_id"], name="geo_avail_entity_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.area_type}:{self.area_id} → {self.entity_type}:{self.entity_id}"
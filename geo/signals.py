@@ -0,0 +1,90 @@
+"""
+Keep the GeoAvailability table in sync with the assignments it is derived from.
+
+Any change to therapist ↔ location/service links, office coverage, office
+staffing/modalities/conditions, region membership, or the is_active /
+is_published flags schedules a (debounced, background) sync after the
+current transaction commits.  Saves that leave those flags as they were
+schedule nothing.
+"""
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.models import OfficeLocation
+from geo.models import GeoLocation, GeoRegion, GeoState
+from geo.utils.availability_sync import schedule_geo_availability_sync
+from profiles.models import TherapistProfile
+
+_M2M_ACTIONS = {"post_add", "post_remove", "post_clear"}
+_FLAG_FIELDS = {"is_active", "is_published"}
+
+
+def _flag_fields(model) -> list[str]:
+    return sorted(_FLAG_FIELDS & {f.name for f in model._meta.concrete_fields})
+
+
+def _saves_flags(update_fields) -> bool:
+    return update_fields is None or bool(_FLAG_FIELDS & set(update_fields))
+
+
+def _on_m2m_changed(sender, action, **kwargs):
+    if action in _M2M_ACTIONS:
+        schedule_geo_availability_sync()
+
+
+for _through in (
+    TherapistProfile.locations.through,
+    TherapistProfile.services.through,
+    OfficeLocation.therapists.through,
+    OfficeLocation.geo_locations.through,
+    OfficeLocation.geo_states.through,
+    OfficeLocation.modalities.through,
+    OfficeLocation.conditions.through,
+    GeoRegion.states.through,
+    GeoRegion.locations.through,
+    GeoRegion.offices.through,
+):
+    m2m_changed.connect(
+        _on_m2m_changed,
+        sender=_through,
+        dispatch_uid=f"geo_availability_{_through._meta.label_lower}",
+    )
+
+
+@receiver(pre_save, sender=GeoLocation)
+@receiver(pre_save, sender=GeoState)
+@receiver(pre_save, sender=OfficeLocation)
+@receiver(pre_save, sender=TherapistProfile)
+def remember_flags(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Note the stored is_active / is_published values so post_save can tell if they changed."""
+    instance._geo_flags_before = None
+    if raw or instance.pk is None or not _saves_flags(update_fields):
+        return
+    fields = _flag_fields(sender)
+    if fields:
+        instance._geo_flags_before = sender._default_manager.filter(pk=instance.pk).values(*fields).first()
+
+
+@receiver(post_save, sender=GeoLocation)
+@receiver(post_save, sender=GeoState)
+@receiver(post_save, sender=OfficeLocation)
+@receiver(post_save, sender=TherapistProfile)
+def sync_on_flag_change(sender, instance, created, update_fields=None, **kwargs):
+    """Re-sync when a row that gates availability changes is_active / is_published."""
+    if created:
+        # New rows have no M2M links yet; the m2m_changed handler covers them.
+        return
+    before = getattr(instance, "_geo_flags_before", None)
+    if before is None:
+        return
+    if any(getattr(instance, name) != value for name, value in before.items()):
+        schedule_geo_availability_sync()
+
+
+@receiver(post_delete, sender=GeoLocation)
+@receiver(post_delete, sender=GeoState)
+@receiver(post_delete, sender=GeoRegion)
+@receiver(post_delete, sender=OfficeLocation)
+@receiver(post_delete, sender=TherapistProfile)
+def sync_on_delete(sender, instance, **kwargs):
+    schedule_geo_availability_sync()
@@ -11,6 +11,11 @@ Three separate sitemap classes let search engines discover all geo pages:
 All data is read live from the GeoState / GeoLocation database tables so that
 adding a location in the admin automatically adds it to the sitemap.
 
+The intersectional sitemaps (area × service / modality / condition) read
+from the precomputed matrix in geo.utils.availability_index instead of
+running one availability query per pair, so generating them costs a
+constant number of queries no matter how many areas exist.
+
 Register all five in lcpsych/urls.py under the 'sitemaps' dict that is
 passed to Django's built-in sitemap view.
 """
@@ -19,7 +24,7 @@ from functools import lru_cache
 
 from django.contrib.sitemaps import Sitemap
 from geo.models import GeoLocation, GeoRegion, GeoState
-from geo.utils.availability import get_therapists_for_area_and_service
+from geo.utils.availability_index import get_availability_index
 
 
 @lru_cache(maxsize=1)
@@ -107,12 +112,13 @@ class GeoStateServiceSitemap(Sitemap):
     def items(self):
         from core.models import Service
 
+        index = get_availability_index()
         pairs = []
         states = GeoState.objects.filter(is_active=True).order_by("slug")
-        services = Service.objects.all().order_by("slug")
+        services = list(Service.objects.all().order_by("slug"))
         for state in states:
             for service in services:
-                if get_therapists_for_area_and_service(state, service).exists():
+                if index.has_service(state, service):
                     pairs.append((state, service))
         return pairs
 
@@ -134,16 +140,17 @@ class GeoLocationServiceSitemap(Sitemap):
     def items(self):
         from core.models import Service
 
+        index = get_availability_index()
         pairs = []
         locations = (
             GeoLocation.objects.filter(is_active=True)
             .select_related("state", "county")
             .order_by("state__slug", "slug")
         )
-        services = Service.objects.all().order_by("slug")
+        services = list(Service.objects.all().order_by("slug"))
         for location in locations:
             for service in services:
-                if get_therapists_for_area_and_service(location, service).exists():
+                if index.has_service(location, service):
                     pairs.append((location, service))
         return pairs
 
@@ -238,18 +245,13 @@ class GeoRegionModalitySitemap(Sitemap):
     def items(self):
         from core.models import Modality
 
+        index = get_availability_index()
         pairs = []
-        regions = GeoRegion.objects.filter(is_active=True).prefetch_related(
-            "offices"
-        ).order_by("slug")
-        modalities = Modality.objects.filter(active=True).order_by("slug")
+        regions = GeoRegion.objects.filter(is_active=True).order_by("slug")
+        modalities = list(Modality.objects.filter(active=True).order_by("slug"))
         for region in regions:
-            offices_in_region = region.offices.filter(
-                is_active=True,
-                therapists__is_published=True,
-            ).distinct()
             for modality in modalities:
-                if offices_in_region.filter(modalities=modality).exists():
+                if index.has_modality(region, modality):
                     pairs.append((region, modality))
         return pairs
 
@@ -271,18 +273,13 @@ class GeoRegionConditionSitemap(Sitemap):
     def items(self):
         from core.models import Condition
 
+        index = get_availability_index()
         pairs = []
-        regions = GeoRegion.objects.filter(is_active=True).prefetch_related(
-            "offices"
-        ).order_by("slug")
-        conditions = Condition.objects.filter(active=True).order_by("slug")
+        regions = GeoRegion.objects.filter(is_active=True).order_by("slug")
+        conditions = list(Condition.objects.filter(active=True).order_by("slug"))
         for region in regions:
-            offices_in_region = region.offices.filter(
-                is_active=True,
-                therapists__is_published=True,
-            ).distinct()
             for condition in conditions:
-                if offices_in_region.filter(conditions=condition).exists():
+                if index.has_condition(region, condition):
                     pairs.append((region, condition))
         return pairs
 
@@ -303,14 +300,14 @@ class GeoStateModalitySitemap(Sitemap):
 
     def items(self):
         from core.models import Modality
-        from geo.utils.availability import get_therapists_for_area_and_modality
 
+        index = get_availability_index()
         pairs = []
         states = GeoState.objects.filter(is_active=True).order_by("slug")
-        modalities = Modality.objects.filter(active=True).order_by("slug")
+        modalities = list(Modality.objects.filter(active=True).order_by("slug"))
         for state in states:
             for modality in modalities:
-                if get_therapists_for_area_and_modality(state, modality).exists():
+                if index.has_modality(state, modality):
                     pairs.append((state, modality))
         return pairs
 
@@ -331,14 +328,14 @@ class GeoStateConditionSitemap(Sitemap):
 
     def items(self):
         from core.models import Condition
-        from geo.utils.availability import get_therapists_for_area_and_condition
 
+        index = get_availability_index()
         pairs = []
         states = GeoState.objects.filter(is_active=True).order_by("slug")
-        conditions = Condition.objects.filter(active=True).order_by("slug")
+        conditions = list(Condition.objects.filter(active=True).order_by("slug"))
         for state in states:
             for condition in conditions:
-                if get_therapists_for_area_and_condition(state, condition).exists():
+                if index.has_condition(state, condition):
                     pairs.append((state, condition))
         return pairs
 
@@ -359,18 +356,18 @@ class GeoLocationModalitySitemap(Sitemap):
 
     def items(self):
         from core.models import Modality
-        from geo.utils.availability import get_therapists_for_area_and_modality
 
+        index = get_availability_index()
         pairs = []
         locations = (
             GeoLocation.objects.filter(is_active=True)
             .select_related("state", "county")
             .order_by("state__slug", "slug")
         )
-        modalities = Modality.objects.filter(active=True).order_by("slug")
+        modalities = list(Modality.objects.filter(active=True).order_by("slug"))
         for location in locations:
             for modality in modalities:
-                if get_therapists_for_area_and_modality(location, modality).exists():
+                if index.has_modality(location, modality):
                     pairs.append((location, modality))
         return pairs
 
@@ -391,18 +388,18 @@ class GeoLocationConditionSitemap(Sitemap):
 
     def items(self):
         from core.models import Condition
-        from geo.utils.availability import get_therapists_for_area_and_condition
 
+        index = get_availability_index()
         pairs = []
         locations = (
             GeoLocation.objects.filter(is_active=True)
             .select_related("state", "county")
             .order_by("state__slug", "slug")
         )
-        conditions = Condition.objects.filter(active=True).order_by("slug")
+        conditions = list(Condition.objects.filter(active=True).order_by("slug"))
         for location in locations:
             for condition in conditions:
-                if get_therapists_for_area_and_condition(location, condition).exists():
+                if index.has_condition(location, condition):
                     pairs.append((location, condition))
         return pairs
 
@@ -0,0 +1,32 @@
+"""
+geo/tasks.py
+------------
+Celery tasks for the geo app.
+
+    sync_geo_availability — bring GeoAvailability in line with the current
+                            assignments (queued, debounced, by geo/signals.py)
+"""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="geo.tasks.sync_geo_availability", max_retries=2, default_retry_delay=60)
+def sync_geo_availability(self):
+    """Diff GeoAvailability against the current assignments and apply the changes."""
+    from core.cache import LOCKS
+    from geo.utils.availability_sync import _DEBOUNCE_KEY, sync_geo_availability as sync
+
+    # Open the debounce window again so changes made during the sync queue a new run
+    LOCKS.delete(_DEBOUNCE_KEY)
+    try:
+        result = sync()
+    except Exception as exc:
+        logger.exception("sync_geo_availability failed: %s", exc)
+        raise self.retry(exc=exc)
+    return result
@@ -19,12 +19,48 @@ Public API
 
 Each function accepts either a model instance or a slug string (or state_slug +
 optional location_slug pair) for convenience.
+
+Area-level lookups (get_*_for_area, get_*_for_region, is_*_available_in_area)
+read from the denormalized GeoAvailability table, which is maintained by
+geo/signals.py and `manage.py rebuild_geo_availability`.  Each call is a
+single query against its unique (area_type, area_id, entity_type, entity_id)
+index.
 """
 
 from __future__ import annotations
 from typing import Union
 
 
+def _available_ids(area, entity_type: str):
+    """
+    Return a ``values_list`` queryset of entity ids available in *area*.
+
+    Used as a subquery so callers still issue a single SQL statement.
+    """
+    from geo.models import GeoAvailability, GeoLocation, GeoRegion, GeoState
+
+    if isinstance(area, GeoState):
+        area_type = GeoAvailability.AREA_STATE
+    elif isinstance(area, GeoLocation):
+        area_type = GeoAvailability.AREA_LOCATION
+    elif isinstance(area, GeoRegion):
+        area_type = GeoAvailability.AREA_REGION
+    else:
+        raise TypeError(f"Expected GeoState, GeoLocation or GeoRegion, got {type(area)}")
+
+    return GeoAvailability.objects.filter(
+        area_type=area_type,
+        area_id=area.pk,
+        entity_type=entity_type,
+    ).values_list("entity_id", flat=True)
+
+
+def _is_available(area, entity_type: str, entity) -> bool:
+    return _available_ids(area, entity_type).filter(
+        entity_id=entity if isinstance(entity, int) else entity.pk
+    ).exists()
+
+
 def get_therapists_for_location(location):
     """
     Return all published therapists associated with *location*, either via:
@@ -134,41 +170,18 @@ def get_locations_serving_area(area):
 def get_services_for_area(area):
     """
     Return all Services available in the given area, derived from therapists
-    at locations that serve it.
+    (direct or via an office) at locations that serve it.
 
     Parameters
     ----------
     area : GeoState or GeoLocation instance
     """
     from core.models import Service
-    from geo.models import GeoState, GeoLocation
-
-    if isinstance(area, GeoState):
-        return Service.objects.filter(
-            therapists__locations__state=area,
-            therapists__locations__is_active=True,
-            therapists__is_published=True,
-        ).distinct()
+    from geo.models import GeoAvailability
 
-    if isinstance(area, GeoLocation):
-        if area.location_type == GeoLocation.COUNTY:
-            from django.db.models import Q
-            location_filter = Q(therapists__locations__pk=area.pk) | Q(
-                therapists__locations__county=area
-            )
-            return Service.objects.filter(
-                location_filter,
-                therapists__locations__is_active=True,
-                therapists__is_published=True,
-            ).distinct()
-        # city
-        return Service.objects.filter(
-            therapists__locations=area,
-            therapists__locations__is_active=True,
-            therapists__is_published=True,
-        ).distinct()
-
-    raise TypeError(f"Expected GeoState or GeoLocation, got {type(area)}")
+    return Service.objects.filter(
+        id__in=_available_ids(area, GeoAvailability.ENTITY_SERVICE),
+    )
 
 
 def is_service_available_in_area(area, service) -> bool:
@@ -180,9 +193,9 @@ def is_service_available_in_area(area, service) -> bool:
     area    : GeoState or GeoLocation instance
     service : Service instance or int (pk)
     """
-    return get_services_for_area(area).filter(
-        pk=service if isinstance(service, int) else service.pk
-    ).exists()
+    from geo.models import GeoAvailability
+
+    return _is_available(area, GeoAvailability.ENTITY_SERVICE, service)
 
 
 def get_therapists_for_area(area):
@@ -195,55 +208,12 @@ def get_therapists_for_area(area):
     area : GeoState or GeoLocation instance
     """
     from profiles.models import TherapistProfile
-    from geo.models import GeoState, GeoLocation
+    from geo.models import GeoAvailability
 
-    if isinstance(area, GeoState):
-        direct_ids = TherapistProfile.objects.filter(
-            locations__state=area,
-            locations__is_active=True,
-            is_published=True,
-        ).values_list("id", flat=True)
-        office_loc_ids = TherapistProfile.objects.filter(
-            offices__geo_locations__state=area,
-            offices__geo_locations__is_active=True,
-            is_published=True,
-        ).values_list("id", flat=True)
-        office_state_ids = TherapistProfile.objects.filter(
-            offices__geo_states=area,
-            is_published=True,
-        ).values_list("id", flat=True)
-        all_ids = set(direct_ids) | set(office_loc_ids) | set(office_state_ids)
-        return TherapistProfile.objects.filter(id__in=all_ids, is_published=True).distinct()
-
-    if isinstance(area, GeoLocation):
-        if area.location_type == GeoLocation.COUNTY:
-            from django.db.models import Q
-            direct_ids = TherapistProfile.objects.filter(
-                Q(locations__pk=area.pk) | Q(locations__county=area),
-                locations__is_active=True,
-                is_published=True,
-            ).values_list("id", flat=True)
-            office_ids = TherapistProfile.objects.filter(
-                Q(offices__geo_locations__pk=area.pk) | Q(offices__geo_locations__county=area),
-                offices__geo_locations__is_active=True,
-                is_published=True,
-            ).values_list("id", flat=True)
-            all_ids = set(direct_ids) | set(office_ids)
-            return TherapistProfile.objects.filter(id__in=all_ids, is_published=True).distinct()
-        # city
-        direct_ids = TherapistProfile.objects.filter(
-            locations=area,
-            locations__is_active=True,
-            is_published=True,
-        ).values_list("id", flat=True)
-        office_ids = TherapistProfile.objects.filter(
-            offices__geo_locations=area,
-            is_published=True,
-        ).values_list("id", flat=True)
-        all_ids = set(direct_ids) | set(office_ids)
-        return TherapistProfile.objects.filter(id__in=all_ids, is_published=True).distinct()
-
-    raise TypeError(f"Expected GeoState or GeoLocation, got {type(area)}")
+    return TherapistProfile.objects.filter(
+        id__in=_available_ids(area, GeoAvailability.ENTITY_THERAPIST),
+        is_published=True,
+    )
 
 
 def get_therapists_for_area_and_service(area, service):
@@ -274,16 +244,12 @@ def get_therapists_for_region(region):
     region : GeoRegion instance
     """
     from profiles.models import TherapistProfile
+    from geo.models import GeoAvailability
 
-    ids: set[int] = set()
-
-    for state in region.states.filter(is_active=True):
-        ids |= set(get_therapists_for_area(state).values_list("id", flat=True))
-
-    for location in region.locations.filter(is_active=True):
-        ids |= set(get_therapists_for_location(location).values_list("id", flat=True))
-
-    return TherapistProfile.objects.filter(id__in=ids, is_published=True).distinct()
+    return TherapistProfile.objects.filter(
+        id__in=_available_ids(region, GeoAvailability.ENTITY_THERAPIST),
+        is_published=True,
+    )
 
 
 def get_services_for_region(region):
@@ -297,9 +263,11 @@ def get_services_for_region(region):
     region : GeoRegion instance
     """
     from core.models import Service
+    from geo.models import GeoAvailability
 
-    therapist_ids = get_therapists_for_region(region).values_list("id", flat=True)
-    return Service.objects.filter(therapists__id__in=therapist_ids).distinct()
+    return Service.objects.filter(
+        id__in=_available_ids(region, GeoAvailability.ENTITY_SERVICE),
+    )
 
 
 def get_therapists_for_region_and_service(region, service):
@@ -331,66 +299,48 @@ def _get_offices_for_area(area):
     area : GeoState or GeoLocation instance
     """
     from core.models import OfficeLocation
-    from geo.models import GeoState, GeoLocation
-    from django.db.models import Q
-
-    if isinstance(area, GeoState):
-        return OfficeLocation.objects.filter(
-            is_active=True,
-        ).filter(
-            Q(geo_states=area) | Q(geo_locations__state=area)
-        ).distinct()
-
-    if isinstance(area, GeoLocation):
-        if area.location_type == GeoLocation.COUNTY:
-            return OfficeLocation.objects.filter(
-                is_active=True,
-            ).filter(
-                Q(geo_locations__pk=area.pk) | Q(geo_locations__county=area)
-            ).distinct()
-        # city
-        return OfficeLocation.objects.filter(
-            is_active=True,
-            geo_locations=area,
-        ).distinct()
+    from geo.models import GeoAvailability
 
-    raise TypeError(f"Expected GeoState or GeoLocation, got {type(area)}")
+    return OfficeLocation.objects.filter(
+        id__in=_available_ids(area, GeoAvailability.ENTITY_OFFICE),
+        is_active=True,
+    )
 
 
 def get_modalities_for_area(area):
     """
     Return all active Modalities available in the given area (via offices
-    that serve the area).
+    that serve the area and have at least one published therapist).
 
     Parameters
     ----------
     area : GeoState or GeoLocation instance
     """
     from core.models import Modality
+    from geo.models import GeoAvailability
 
-    office_ids = _get_offices_for_area(area).values_list("id", flat=True)
     return Modality.objects.filter(
         active=True,
-        offices__id__in=office_ids,
-    ).distinct()
+        id__in=_available_ids(area, GeoAvailability.ENTITY_MODALITY),
+    )
 
 
 def get_conditions_for_area(area):
     """
     Return all active Conditions available in the given area (via offices
-    that serve the area).
+    that serve the area and have at least one published therapist).
 
     Parameters
     ----------
     area : GeoState or GeoLocation instance
     """
     from core.models import Condition
+    from geo.models import GeoAvailability
 
-    office_ids = _get_offices_for_area(area).values_list("id", flat=True)
     return Condition.objects.filter(
         active=True,
-        offices__id__in=office_ids,
-    ).distinct()
+        id__in=_available_ids(area, GeoAvailability.ENTITY_CONDITION),
+    )
 
 
 def is_modality_available_in_area(area, modality) -> bool:
@@ -402,9 +352,9 @@ def is_modality_available_in_area(area, modality) -> bool:
     area     : GeoState or GeoLocation instance
     modality : Modality instance or int (pk)
     """
-    return get_modalities_for_area(area).filter(
-        pk=modality if isinstance(modality, int) else modality.pk
-    ).exists()
+    from geo.models import GeoAvailability
+
+    return _is_available(area, GeoAvailability.ENTITY_MODALITY, modality)
 
 
 def is_condition_available_in_area(area, condition) -> bool:
@@ -416,9 +366,9 @@ def is_condition_available_in_area(area, condition) -> bool:
     area      : GeoState or GeoLocation instance
     condition : Condition instance or int (pk)
     """
-    return get_conditions_for_area(area).filter(
-        pk=condition if isinstance(condition, int) else condition.pk
-    ).exists()
+    from geo.models import GeoAvailability
+
+    return _is_available(area, GeoAvailability.ENTITY_CONDITION, condition)
 
 
 def get_therapists_for_area_and_modality(area, modality):
@@ -432,13 +382,12 @@ def get_therapists_for_area_and_modality(area, modality):
     modality : Modality instance
     """
     from profiles.models import TherapistProfile
+    from geo.models import GeoAvailability
 
-    office_ids = _get_offices_for_area(area).filter(
-        modalities=modality,
-    ).values_list("id", flat=True)
-
+    # Both office conditions sit in one filter() so they apply to the same office
     return TherapistProfile.objects.filter(
-        offices__id__in=office_ids,
+        offices__id__in=_available_ids(area, GeoAvailability.ENTITY_OFFICE),
+        offices__modalities=modality,
         is_published=True,
     ).distinct()
 
@@ -454,12 +403,11 @@ def get_therapists_for_area_and_condition(area, condition):
     condition : Condition instance
     """
     from profiles.models import TherapistProfile
+    from geo.models import GeoAvailability
 
-    office_ids = _get_offices_for_area(area).filter(
-        conditions=condition,
-    ).values_list("id", flat=True)
-
+    # Both office conditions sit in one filter() so they apply to the same office
     return TherapistProfile.objects.filter(
-        offices__id__in=office_ids,
+        offices__id__in=_available_ids(area, GeoAvailability.ENTITY_OFFICE),
+        offices__conditions=condition,
         is_published=True,
     ).distinct()
@@ -0,0 +1,280 @@
+"""
+Precomputed availability matrix for sitemap generation.
+
+The helpers in geo.utils.availability answer one (area, entity) question per
+call, which is fine for a single page view but explodes when a sitemap walks
+every (area × service/modality/condition) pair.  This module reads the
+therapist ↔ location ↔ office ↔ service M2M tables once, in bulk, and builds
+an in-memory matrix that answers the same questions with set lookups.
+
+The rules mirror geo.utils.availability exactly:
+
+  Therapists / services
+    - state  : published therapists linked directly to an active location in
+               the state, or at an office whose geo_locations include an
+               active location in the state, or whose geo_states include it
+    - county : same, for the county itself and its active cities
+    - city   : same, for the city itself
+    Services are the union of those therapists' services.
+
+  Offices
+    - *active* offices covering the area (geo_states or geo_locations, with
+      county roll-up); regions use GeoRegion.offices directly
+
+  Modalities / conditions
+    - derived from the covering offices that have at least one published
+      therapist
+
+  Regions
+    - therapists are the union of the region's active states (as above) and
+      its active locations (direct or office assignment, no roll-up)
+    - services are the union of those therapists' services
+
+Public API
+----------
+  build_availability_index()  -> AvailabilityIndex
+  get_availability_index()    -> AvailabilityIndex   (cached)
+  invalidate_availability_index() -> None
+
+The number of queries is constant regardless of how many areas, services,
+modalities or conditions exist.  The same matrix is materialised into the
+GeoAvailability table by geo.utils.availability_sync.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "geo:availability_index"
+CACHE_TTL = 60 * 10  # 10 minutes
+
+STATE = "state"
+LOCATION = "location"
+REGION = "region"
+
+AreaKey = tuple[str, int]
+
+
+def area_key(area) -> AreaKey:
+    """Return the ``(area_type, pk)`` key used by the index for *area*."""
+    from geo.models import GeoLocation, GeoRegion, GeoState
+
+    if isinstance(area, GeoState):
+        return (STATE, area.pk)
+    if isinstance(area, GeoLocation):
+        return (LOCATION, area.pk)
+    if isinstance(area, GeoRegion):
+        return (REGION, area.pk)
+    raise TypeError(f"Expected GeoState, GeoLocation or GeoRegion, got {type(area)}")
+
+
+def _pk(obj) -> int:
+    return obj if isinstance(obj, int) else obj.pk
+
+
+@dataclass
+class AvailabilityIndex:
+    """Area → entity-id sets, built by :func:`build_availability_index`."""
+
+    therapists: dict[AreaKey, set[int]] = field(default_factory=dict)
+    services: dict[AreaKey, set[int]] = field(default_factory=dict)
+    offices: dict[AreaKey, set[int]] = field(default_factory=dict)
+    modalities: dict[AreaKey, set[int]] = field(default_factory=dict)
+    conditions: dict[AreaKey, set[int]] = field(default_factory=dict)
+    # therapist id → active GeoLocation ids (direct or via an office)
+    therapist_locations: dict[int, set[int]] = field(default_factory=dict)
+
+    def therapist_ids_for(self, area) -> set[int]:
+        return self.therapists.get(area_key(area), set())
+
+    def service_ids_for(self, area) -> set[int]:
+        return self.services.get(area_key(area), set())
+
+    def modality_ids_for(self, area) -> set[int]:
+        return self.modalities.get(area_key(area), set())
+
+    def condition_ids_for(self, area) -> set[int]:
+        return self.conditions.get(area_key(area), set())
+
+    def has_service(self, area, service) -> bool:
+        return _pk(service) in self.service_ids_for(area)
+
+    def has_modality(self, area, modality) -> bool:
+        return _pk(modality) in self.modality_ids_for(area)
+
+    def has_condition(self, area, condition) -> bool:
+        return _pk(condition) in self.condition_ids_for(area)
+
+    def location_ids_for_therapist(self, therapist) -> set[int]:
+        return self.therapist_locations.get(_pk(therapist), set())
+
+
+def build_availability_index() -> AvailabilityIndex:
+    """Read every availability M2M table once and return a fresh index."""
+    from core.models import OfficeLocation
+    from geo.models import GeoLocation, GeoRegion, GeoState
+    from profiles.models import TherapistProfile
+
+    published = set(
+        TherapistProfile.objects.filter(is_published=True).values_list("id", flat=True)
+    )
+
+    # location id → (state id, county id, is_active)
+    locations = {
+        loc_id: (state_id, county_id, is_active)
+        for loc_id, state_id, county_id, is_active in GeoLocation.objects.values_list(
+            "id", "state_id", "county_id", "is_active"
+        )
+    }
+
+    def _area_keys_for_location(loc_id: int) -> list[AreaKey]:
+        """Every area a location rolls up into: itself, its county, its state."""
+        state_id, county_id, _active = locations[loc_id]
+        keys = [(LOCATION, loc_id), (STATE, state_id)]
+        if county_id:
+            keys.append((LOCATION, county_id))
+        return keys
+
+    active_offices = set(
+        OfficeLocation.objects.filter(is_active=True).values_list("id", flat=True)
+    )
+
+    office_therapists: dict[int, set[int]] = defaultdict(set)
+    for office_id, therapist_id in OfficeLocation.therapists.through.objects.values_list(
+        "officelocation_id", "therapistprofile_id"
+    ):
+        if therapist_id in published:
+            office_therapists[office_id].add(therapist_id)
+
+    office_locations: dict[int, set[int]] = defaultdict(set)
+    for office_id, loc_id in OfficeLocation.geo_locations.through.objects.values_list(
+        "officelocation_id", "geolocation_id"
+    ):
+        office_locations[office_id].add(loc_id)
+
+    office_states: dict[int, set[int]] = defaultdict(set)
+    for office_id, state_id in OfficeLocation.geo_states.through.objects.values_list(
+        "officelocation_id", "geostate_id"
+    ):
+        office_states[office_id].add(state_id)
+
+    therapist_services: dict[int, set[int]] = defaultdict(set)
+    for therapist_id, service_id in TherapistProfile.services.through.objects.values_list(
+        "therapistprofile_id", "service_id"
+    ):
+        if therapist_id in published:
+            therapist_services[therapist_id].add(service_id)
+
+    office_modalities: dict[int, set[int]] = defaultdict(set)
+    for office_id, modality_id in OfficeLocation.modalities.through.objects.values_list(
+        "officelocation_id", "modality_id"
+    ):
+        office_modalities[office_id].add(modality_id)
+
+    office_conditions: dict[int, set[int]] = defaultdict(set)
+    for office_id, condition_id in OfficeLocation.conditions.through.objects.values_list(
+        "officelocation_id", "condition_id"
+    ):
+        office_conditions[office_id].add(condition_id)
+
+    index = AvailabilityIndex()
+    therapists: dict[AreaKey, set[int]] = defaultdict(set)
+    therapist_locations: dict[int, set[int]] = defaultdict(set)
+    # location id → therapists assigned to exactly that location (no roll-up)
+    location_therapists: dict[int, set[int]] = defaultdict(set)
+
+    # Direct therapist → location assignments
+    for therapist_id, loc_id in TherapistProfile.locations.through.objects.values_list(
+        "therapistprofile_id", "geolocation_id"
+    ):
+        if therapist_id not in published:
+            continue
+        location_therapists[loc_id].add(therapist_id)
+        if not locations[loc_id][2]:
+            continue
+        therapist_locations[therapist_id].add(loc_id)
+        for key in _area_keys_for_location(loc_id):
+            therapists[key].add(therapist_id)
+
+    # Therapists reached through the offices they work at
+    for office_id, staff in office_therapists.items():
+        for loc_id in office_locations.get(office_id, ()):
+            location_therapists[loc_id] |= staff
+            if not locations[loc_id][2]:
+                continue
+            for therapist_id in staff:
+                therapist_locations[therapist_id].add(loc_id)
+            for key in _area_keys_for_location(loc_id):
+                therapists[key] |= staff
+        for state_id in office_states.get(office_id, ()):
+            therapists[(STATE, state_id)] |= staff
+
+    # Regions: union of their active states and active locations
+    active_states = set(GeoState.objects.filter(is_active=True).values_list("id", flat=True))
+    for region_id, state_id in GeoRegion.states.through.objects.values_list(
+        "georegion_id", "geostate_id"
+    ):
+        if state_id in active_states:
+            therapists[(REGION, region_id)] |= therapists.get((STATE, state_id), set())
+    for region_id, loc_id in GeoRegion.locations.through.objects.values_list(
+        "georegion_id", "geolocation_id"
+    ):
+        if locations[loc_id][2]:
+            therapists[(REGION, region_id)] |= location_therapists.get(loc_id, set())
+
+    index.therapists = {key: ids for key, ids in therapists.items() if ids}
+    index.therapist_locations = dict(therapist_locations)
+    index.services = {
+        key: set().union(*(therapist_services.get(t, set()) for t in ids))
+        for key, ids in index.therapists.items()
+    }
+
+    # Offices covering each area; modalities / conditions only count staffed ones
+    offices: dict[AreaKey, set[int]] = defaultdict(set)
+    modalities: dict[AreaKey, set[int]] = defaultdict(set)
+    conditions: dict[AreaKey, set[int]] = defaultdict(set)
+
+    def _add_office(key: AreaKey, office_id: int) -> None:
+        offices[key].add(office_id)
+        if office_therapists.get(office_id):
+            modalities[key] |= office_modalities.get(office_id, set())
+            conditions[key] |= office_conditions.get(office_id, set())
+
+    for office_id in active_offices:
+        for loc_id in office_locations.get(office_id, ()):
+            for key in _area_keys_for_location(loc_id):
+                _add_office(key, office_id)
+        for state_id in office_states.get(office_id, ()):
+            _add_office((STATE, state_id), office_id)
+
+    for region_id, office_id in GeoRegion.offices.through.objects.values_list(
+        "georegion_id", "officelocation_id"
+    ):
+        if office_id in active_offices:
+            _add_office((REGION, region_id), office_id)
+
+    index.offices = dict(offices)
+    index.modalities = {key: ids for key, ids in modalities.items() if ids}
+    index.conditions = {key: ids for key, ids in conditions.items() if ids}
+    return index
+
+
+def get_availability_index() -> AvailabilityIndex:
+    """Return the cached availability index, building it on a miss."""
+    index = cache.get(CACHE_KEY)
+    if index is None:
+        index = build_availability_index()
+        cache.set(CACHE_KEY, index, CACHE_TTL)
+        logger.debug("geo availability index rebuilt (%d areas)", len(index.therapists))
+    return index
+
+
+def invalidate_availability_index() -> None:
+    """Drop the cached index so the next sitemap request rebuilds it."""
+    cache.delete(CACHE_KEY)
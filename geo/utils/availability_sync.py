@@ -0,0 +1,129 @@
+"""
+Materialisation of the availability matrix into the GeoAvailability table.
+
+The desired rows are computed with build_availability_index() (a constant
+number of bulk queries), then diffed against the rows already stored: only
+stale rows are deleted and only missing rows are inserted, so a typical
+edit touches a handful of rows.
+
+Edits don't sync in the request that makes them: schedule_geo_availability_sync()
+queues one debounced Celery task (geo.tasks.sync_geo_availability) after the
+transaction commits, and every change inside the DEBOUNCE_SECONDS window is
+picked up by that one sync.
+
+Public API
+----------
+  sync_geo_availability()           -> dict   (counts of created / deleted rows)
+  schedule_geo_availability_sync()  -> None   (debounced Celery task, on commit)
+  availability_changed              Signal sent after a sync that changed rows
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from core.cache import LOCKS
+
+logger = logging.getLogger(__name__)
+
+# Sent with ``created`` / ``deleted`` counts whenever a sync changes the table
+availability_changed = Signal()
+
+BATCH_SIZE = 1000
+DEBOUNCE_SECONDS = 30
+# Set while a sync task is queued; the task clears it when it starts
+_DEBOUNCE_KEY = "geo_availability_sync"
+
+
+def _desired_rows(index) -> set[tuple[str, int, str, int]]:
+    from geo.models import GeoAvailability
+
+    rows: set[tuple[str, int, str, int]] = set()
+    for entity_type, matrix in (
+        (GeoAvailability.ENTITY_THERAPIST, index.therapists),
+        (GeoAvailability.ENTITY_SERVICE, index.services),
+        (GeoAvailability.ENTITY_OFFICE, index.offices),
+        (GeoAvailability.ENTITY_MODALITY, index.modalities),
+        (GeoAvailability.ENTITY_CONDITION, index.conditions),
+    ):
+        for (area_type, area_id), entity_ids in matrix.items():
+            for entity_id in entity_ids:
+                rows.add((area_type, area_id, entity_type, entity_id))
+    return rows
+
+
+def sync_geo_availability() -> dict:
+    """
+    Bring GeoAvailability in line with the current M2M assignments.
+
+    Returns a dict with ``created``, ``deleted`` and ``total`` row counts.
+    """
+    from geo.models import GeoAvailability
+    from geo.utils.availability_index import build_availability_index, invalidate_availability_index
+
+    index = build_availability_index()
+    desired = _desired_rows(index)
+
+    with transaction.atomic():
+        existing = {
+            (area_type, area_id, entity_type, entity_id): pk
+            for pk, area_type, area_id, entity_type, entity_id in GeoAvailability.objects.values_list(
+                "pk", "area_type", "area_id", "entity_type", "entity_id"
+            )
+        }
+
+        stale_ids = [pk for key, pk in existing.items() if key not in desired]
+        for start in range(0, len(stale_ids), BATCH_SIZE):
+            GeoAvailability.objects.filter(pk__in=stale_ids[start:start + BATCH_SIZE]).delete()
+
+        missing = [
+            GeoAvailability(
+                area_type=area_type,
+                area_id=area_id,
+                entity_type=entity_type,
+                entity_id=entity_id,
+            )
+            for area_type, area_id, entity_type, entity_id in desired
+            if (area_type, area_id, entity_type, entity_id) not in existing
+        ]
+        GeoAvailability.objects.bulk_create(missing, batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+    invalidate_availability_index()
+
+    result = {"created": len(missing), "deleted": len(stale_ids), "total": len(desired)}
+    if missing or stale_ids:
+        logger.info("geo availability synced: %s", result)
+        availability_changed.send(sender=GeoAvailability, **result)
+    return result
+
+
+def _queue_sync() -> None:
+    try:
+        if not LOCKS.add(_DEBOUNCE_KEY, True, DEBOUNCE_SECONDS):
+            return
+        from geo.tasks import sync_geo_availability as sync_task
+
+        sync_task.apply_async(countdown=DEBOUNCE_SECONDS)
+    except Exception as exc:
+        # Never let a sync failure break the save that triggered it; the next
+        # change (or the release-phase rebuild) queues it again
+        logger.exception("geo availability sync could not be queued: %s", exc)
+        try:
+            LOCKS.delete(_DEBOUNCE_KEY)
+        except Exception:
+            pass
+
+
+def schedule_geo_availability_sync() -> None:
+    """
+    Queue one debounced sync after the current transaction commits.
+
+    A single admin save fires several m2m_changed / post_save signals; the
+    first to commit queues the task DEBOUNCE_SECONDS out and the rest, like
+    any other change in that window, are covered by it.  Nothing is queued
+    if the transaction rolls back.
+    """
+    transaction.on_commit(_queue_sync)
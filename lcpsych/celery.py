@@ -25,6 +25,8 @@ app.autodiscover_tasks()
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     """Register the beat schedule after all apps are loaded."""
+    from core.tasks import BEAT_SCHEDULE as CORE_BEAT_SCHEDULE  # noqa: PLC0415
     from seo_intel.tasks import BEAT_SCHEDULE  # noqa: PLC0415
 
+    sender.conf.beat_schedule.update(CORE_BEAT_SCHEDULE)
     sender.conf.beat_schedule.update(BEAT_SCHEDULE)
@@ -61,6 +61,9 @@ ROBOTS_ALLOW = env.bool('ROBOTS_ALLOW', default=not DEBUG)
 GOOGLE_SITE_VERIFICATION = env('GOOGLE_SITE_VERIFICATION', default='')
 # Optional IP info token for geolocating analytics events
 IPINFO_TOKEN = env('IPINFO_TOKEN', default='')
+# MaxMind GeoLite2-City database (a directory containing GeoLite2-City.mmdb, or
+# the file itself). Used before falling back to ipinfo; see core/utils/geolocation.py
+GEOIP_PATH = env('GEOIP_PATH', default=str(BASE_DIR / 'geoip'))
 
 TINYMCE_DEFAULT_CONFIG = {
     'height': 500,
@@ -343,5 +346,49 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+# Shared Redis cache on the Celery Redis instance, so gunicorn and Celery
+# workers on every dyno see the same entries and they survive restarts.
+# Large values are stored zlib-compressed; features cache under versioned key
+# namespaces (core/cache.py).  Per-process LocMemCache without REDIS_URL.
+if REDIS_URL:
+    _redis_cache_options = {
+        'serializer': 'core.cache.CompressedPickleSerializer',
+        'socket_timeout': 2,
+        'socket_connect_timeout': 2,
+        'health_check_interval': 30,
+    }
+    if REDIS_URL.startswith('rediss://'):
+        # Heroku Redis uses self-signed certificates
+        _redis_cache_options['ssl_cert_reqs'] = None
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': env('CACHE_KEY_PREFIX', default='lcpsych'),
+            'OPTIONS': _redis_cache_options,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # SEO Intel admin email recipient (override via SEO_INTEL_ADMIN_EMAIL env var)
 SEO_INTEL_ADMIN_EMAIL = env('SEO_INTEL_ADMIN_EMAIL', default=DEFAULT_FROM_EMAIL)
+
+# SerpApi throughput: sustained searches per hour allowed by the plan (capped
+# at the account's own limit when the Account API reports one) and searches
+# kept in flight at once by run_serpapi_for_seeds / run_serpapi_for_discovered
+SERPAPI_RATE_PER_HOUR = env.int('SERPAPI_RATE_PER_HOUR', default=1000)
+SERPAPI_CONCURRENCY = env.int('SERPAPI_CONCURRENCY', default=4)
+
+# Competitor crawl politeness per host: requests in flight and requests per
+# second.  Defaults are one at a time at 2/s; raise only for sites known to
+# tolerate it.
+COMPETITOR_CRAWL_HOST_CONCURRENCY = env.int('COMPETITOR_CRAWL_HOST_CONCURRENCY', default=1)
+COMPETITOR_CRAWL_HOST_RATE = env.float('COMPETITOR_CRAWL_HOST_RATE', default=2.0)
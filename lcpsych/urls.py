@@ -17,11 +17,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include, re_path
 from django.views.generic import TemplateView
-from django.contrib.sitemaps.views import sitemap
 from django.views.static import serve
-from core.sitemaps import StaticViewSitemap, PageSitemap, PostSitemap, ConditionSitemap, ModalitySitemap
-from geo.sitemaps import GeoStateSitemap, GeoCitySitemap, GeoCountySitemap, GeoStateServiceSitemap, GeoLocationServiceSitemap, GeoRegionSitemap, GeoRegionServiceSitemap, GeoRegionTherapistSitemap, GeoRegionModalitySitemap, GeoRegionConditionSitemap, GeoStateModalitySitemap, GeoStateConditionSitemap, GeoLocationModalitySitemap, GeoLocationConditionSitemap
-from profiles.sitemaps import TherapistSitemap, TherapistStateSitemap, TherapistAreaSitemap
 from core import views as core_views
 from accounts.views import ManageTherapistsView
 from django.conf import settings
@@ -35,32 +31,9 @@ urlpatterns = [
     path('blog/', include('blog.urls')),
     path('settings/', ManageTherapistsView.as_view(), name='settings'),
     path('seo/', include('seo_settings.portal_urls', namespace='seo_intel')),
-    path('sitemap.xml', sitemap, {
-        'sitemaps': {
-            'static': StaticViewSitemap,
-            'pages': PageSitemap,
-            'posts': PostSitemap,
-            'conditions': ConditionSitemap,
-            'modalities': ModalitySitemap,
-            'geo_states': GeoStateSitemap,
-            'geo_cities': GeoCitySitemap,
-            'geo_counties': GeoCountySitemap,
-            'geo_state_services': GeoStateServiceSitemap,
-            'geo_location_services': GeoLocationServiceSitemap,
-            'geo_regions': GeoRegionSitemap,
-            'geo_region_services': GeoRegionServiceSitemap,
-            'geo_region_therapists': GeoRegionTherapistSitemap,
-            'geo_region_modalities': GeoRegionModalitySitemap,
-            'geo_region_conditions': GeoRegionConditionSitemap,
-            'geo_state_modalities': GeoStateModalitySitemap,
-            'geo_state_conditions': GeoStateConditionSitemap,
-            'geo_location_modalities': GeoLocationModalitySitemap,
-            'geo_location_conditions': GeoLocationConditionSitemap,
-            'therapists': TherapistSitemap,
-            'therapist_states': TherapistStateSitemap,
-            'therapist_areas': TherapistAreaSitemap,
-        }
-    }, name='django.contrib.sitemaps.views.sitemap'),
+    # Pre-rendered sitemap index + gzip section files (see core/sitemap_files.py)
+    path('sitemap.xml', core_views.sitemap_index, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemaps/<str:filename>', core_views.sitemap_file, name='sitemap_file'),
     path('location.xml', core_views.location_xml, name='location_xml'),
     path('robots.txt', TemplateView.as_view(
         template_name='robots.txt',
@@ -10,7 +10,30 @@ Sitemaps for therapist profile pages.
 
 from django.contrib.sitemaps import Sitemap
 from profiles.models import TherapistProfile
-from geo.utils.availability import get_locations_for_therapist
+from geo.models import GeoLocation
+from geo.utils.availability_index import get_availability_index
+
+
+def _therapist_locations():
+    """Yield (therapist, [GeoLocation, ...]) for every published therapist.
+
+    Uses the precomputed availability index plus one bulk location query
+    instead of calling get_locations_for_therapist() per therapist.
+    """
+    index = get_availability_index()
+    locations = {
+        loc.pk: loc
+        for loc in GeoLocation.objects.filter(is_active=True).select_related("state", "county")
+    }
+    therapists = TherapistProfile.objects.filter(is_published=True).order_by("slug")
+    for therapist in therapists:
+        locs = [
+            locations[loc_id]
+            for loc_id in index.location_ids_for_therapist(therapist)
+            if loc_id in locations
+        ]
+        locs.sort(key=lambda loc: loc.name)
+        yield therapist, locs
 
 
 class TherapistSitemap(Sitemap):
@@ -57,9 +80,7 @@ class TherapistStateSitemap(Sitemap):
 
     def items(self):
         pairs = []
-        therapists = TherapistProfile.objects.filter(is_published=True).order_by("slug")
-        for therapist in therapists:
-            locations = get_locations_for_therapist(therapist).select_related("state")
+        for therapist, locations in _therapist_locations():
             seen_states = set()
             for loc in locations:
                 if loc.state.slug not in seen_states:
@@ -85,9 +106,7 @@ class TherapistAreaSitemap(Sitemap):
 
     def items(self):
         pairs = []
-        therapists = TherapistProfile.objects.filter(is_published=True).order_by("slug")
-        for therapist in therapists:
-            locations = get_locations_for_therapist(therapist).select_related("state", "county")
+        for therapist, locations in _therapist_locations():
             for loc in locations:
                 pairs.append((therapist, loc))
         return pairs
@@ -0,0 +1,84 @@
+"""
+Management command: benchmark_keyword_matcher
+-----------------------------------------------
+Times the compiled taxonomy matcher against the old per-keyword substring
+loop on a saved HTML page and lists the keywords on which they disagree
+(substring-only hits such as "act" inside "contact").
+
+Usage
+-----
+    python manage.py benchmark_keyword_matcher
+    python manage.py benchmark_keyword_matcher --file page.html --repeat 50
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Benchmark the competitor keyword matcher against per-keyword substring checks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=str(Path(settings.BASE_DIR) / "profile_sample.txt"),
+            help="HTML file to scan (default: profile_sample.txt in the project root).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Timed runs per implementation (default: 20).",
+        )
+
+    def handle(self, *args, **options):
+        from seo_intel.services.competitor_crawler import (
+            CONDITIONS_KW, LOCATION_KW, MODALITIES_KW, SERVICES_KW, TESTING_KW,
+            _extract_keyword_hits,
+        )
+        from seo_intel.services.page_extractor import extract_page_signals
+
+        path = Path(options["file"])
+        if not path.exists():
+            raise CommandError(f"File not found: {path}")
+        repeat = max(options["repeat"], 1)
+
+        html = path.read_text(encoding="utf-8", errors="replace")
+        samples = {
+            "page text": extract_page_signals(html).text.lower(),
+            "raw html": html.lower(),
+        }
+        taxonomy = {
+            "services": SERVICES_KW,
+            "modalities": MODALITIES_KW,
+            "testing": TESTING_KW,
+            "conditions": CONDITIONS_KW,
+            "locations": LOCATION_KW,
+        }
+
+        def _substring_hits(text: str) -> dict[str, list[str]]:
+            return {category: [kw for kw in kws if kw in text] for category, kws in taxonomy.items()}
+
+        for label, text in samples.items():
+            self.stdout.write(f"{label}: {len(text):,} chars")
+            timings = {}
+            for name, fn in (("substring loop", _substring_hits), ("matcher", _extract_keyword_hits)):
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    fn(text)
+                timings[name] = (time.perf_counter() - started) / repeat
+                self.stdout.write(f"  {name:<15} {timings[name] * 1000:8.2f} ms/page")
+            self.stdout.write(
+                self.style.SUCCESS(f"  speed-up        {timings['substring loop'] / timings['matcher']:8.1f}x")
+            )
+
+            old, new = _substring_hits(text), _extract_keyword_hits(text)
+            for category in taxonomy:
+                dropped = sorted(set(old[category]) - set(new[category]))
+                added = sorted(set(new[category]) - set(old[category]))
+                if dropped or added:
+                    self.stdout.write(f"  {category}: substring only {dropped}, matcher only {added}")
@@ -0,0 +1,59 @@
+"""
+Management command: benchmark_keyword_trends
+----------------------------------------------
+Times the keyword seeds intelligence batch engine (uncached) on growing
+subsets of the keyword seeds and checks that the number of database queries
+stays the same however many seeds are analysed.  Exits with an error if the
+query count grows with the seed count.
+
+Usage
+-----
+    python manage.py benchmark_keyword_trends
+    python manage.py benchmark_keyword_trends --repeat 5
+"""
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class Command(BaseCommand):
+    help = "Benchmark keyword_trends_analyzer and assert its query count is independent of the seed count."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Timed runs per subset size (default: 3).",
+        )
+
+    def handle(self, *args, **options):
+        from seo_intel.services.keyword_trends_analyzer import build_reports
+        from seo_settings.models import KeywordSeed
+
+        seeds = list(KeywordSeed.objects.order_by("category", "keyword"))
+        if not seeds:
+            raise CommandError("No keyword seeds to analyse.")
+        repeat = max(options["repeat"], 1)
+
+        sizes = sorted({1, max(len(seeds) // 4, 1), max(len(seeds) // 2, 1), len(seeds)})
+        query_counts = {}
+        for size in sizes:
+            subset = seeds[:size]
+            with CaptureQueriesContext(connection) as ctx:
+                build_reports(subset)
+            query_counts[size] = len(ctx.captured_queries)
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                build_reports(subset)
+            elapsed_ms = (time.perf_counter() - started) / repeat * 1000
+            self.stdout.write(f"  {size:>5} seed(s)  {query_counts[size]:>3} queries  {elapsed_ms:9.1f} ms")
+
+        if len(set(query_counts.values())) != 1:
+            raise CommandError(f"Query count grows with the number of seeds: {query_counts}")
+        self.stdout.write(self.style.SUCCESS(f"OK: {query_counts[sizes[0]]} queries for any number of seeds."))
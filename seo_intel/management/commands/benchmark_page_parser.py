@@ -0,0 +1,111 @@
+"""
+Management command: benchmark_page_parser
+-------------------------------------------
+Times the single-pass page signal extractor against the BeautifulSoup tree
+walk the competitor crawler used before, on a saved HTML page, and checks
+that every implementation extracts the same title, headings, schema types,
+links and word count.
+
+Usage
+-----
+    python manage.py benchmark_page_parser
+    python manage.py benchmark_page_parser --file page.html --repeat 20
+"""
+from __future__ import annotations
+
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _soup_signals(html: str, builder: str) -> dict:
+    """The crawler's former BeautifulSoup extraction, for comparison."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, builder)
+    title_tag = soup.find("title")
+    types = [el["itemtype"].rsplit("/", 1)[-1] for el in soup.find_all(attrs={"itemtype": True}) if el["itemtype"]]
+    for script in soup.find_all("script", type="application/ld+json"):
+        types.extend(re.findall(r'"@type"\s*:\s*"([^"]+)"', script.get_text()))
+    links = [a["href"] for a in soup.find_all("a", href=True)]
+    h1 = [el.get_text(strip=True) for el in soup.find_all("h1")]
+    h2 = [el.get_text(strip=True) for el in soup.find_all("h2")]
+    for tag in soup(["script", "style", "nav", "header", "footer", "aside"]):
+        tag.decompose()
+    return {
+        "title": title_tag.get_text(strip=True) if title_tag else "",
+        "h1": h1,
+        "h2": h2,
+        "schema_types": sorted(set(types)),
+        "links": sorted({href.strip() for href in links if href.strip()}),
+        "word_count": len(soup.get_text(" ", strip=True).split()),
+    }
+
+
+def _extractor_signals(html: str, backend: str) -> dict:
+    from seo_intel.services.page_extractor import extract_page_signals
+
+    signals = extract_page_signals(html, backend=backend)
+    return {
+        "title": signals.title,
+        "h1": signals.h1,
+        "h2": signals.h2,
+        "schema_types": sorted(set(signals.schema_types)),
+        "links": sorted({href.strip() for href in signals.links if href.strip()}),
+        "word_count": signals.word_count,
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmark the single-pass page extractor against BeautifulSoup tree parsing."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=str(Path(settings.BASE_DIR) / "profile_sample.txt"),
+            help="HTML file to parse (default: profile_sample.txt in the project root).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10,
+            help="Timed runs per implementation (default: 10).",
+        )
+
+    def handle(self, *args, **options):
+        from seo_intel.services.page_extractor import BACKEND
+
+        path = Path(options["file"])
+        if not path.exists():
+            raise CommandError(f"File not found: {path}")
+        repeat = max(options["repeat"], 1)
+        html = path.read_text(encoding="utf-8", errors="replace")
+        self.stdout.write(f"{path.name}: {len(html):,} chars, extractor backend {BACKEND}")
+
+        candidates = [
+            ("bs4 html.parser", lambda: _soup_signals(html, "html.parser")),
+            ("extractor html.parser", lambda: _extractor_signals(html, "html.parser")),
+        ]
+        if BACKEND == "lxml":
+            candidates += [
+                ("bs4 lxml", lambda: _soup_signals(html, "lxml")),
+                ("extractor lxml", lambda: _extractor_signals(html, "lxml")),
+            ]
+
+        baseline_ms = None
+        reference = None
+        for name, run in candidates:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                result = run()
+            elapsed_ms = (time.perf_counter() - started) / repeat * 1000
+            baseline_ms = baseline_ms or elapsed_ms
+            self.stdout.write(f"  {name:<22} {elapsed_ms:8.2f} ms/page  {baseline_ms / elapsed_ms:5.1f}x")
+
+            reference = reference or result
+            mismatched = [key for key in reference if result[key] != reference[key]]
+            if mismatched:
+                self.stdout.write(self.style.WARNING(f"    differs from bs4 html.parser on: {', '.join(mismatched)}"))
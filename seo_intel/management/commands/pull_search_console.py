@@ -4,11 +4,20 @@ Management command: pull_search_console
 Fetches Search Console Search Analytics data for the last N days (default 7)
 and stores the results in SearchConsoleQuery, deduplicating on (query, page, date).
 
+The range is split into per-day shards (--shard-days 7 for weekly) that are
+fetched concurrently, every page of each (startRow pagination), and written
+with bulk upserts.  Completed days are checkpointed: a rerun skips days
+already final and fetches only missing ones and the last few days GSC may
+still revise.  See seo_intel.services.search_console.
+
 Usage
 -----
     python manage.py pull_search_console
     python manage.py pull_search_console --days 28
-    python manage.py pull_search_console --days 7 --row-limit 1000
+    python manage.py pull_search_console --days 90 --workers 8
+    python manage.py pull_search_console --days 480 --shard-days 7
+    python manage.py pull_search_console --days 28 --refetch
+    python manage.py pull_search_console --days 7 --row-limit 5000
 
 Auth
 ----
@@ -51,122 +60,14 @@ cron (non-Heroku / local):
 
 from __future__ import annotations
 
-import json
 import logging
 import os
-import urllib.error
-import urllib.parse
-import urllib.request
 from datetime import date, timedelta
 
 from django.core.management.base import BaseCommand, CommandError
 
 logger = logging.getLogger(__name__)
 
-_SCOPE = "https://www.googleapis.com/auth/webmasters.readonly"
-_SEARCH_ANALYTICS_URL = (
-    "https://searchconsole.googleapis.com/webmasters/v3/sites/{site}/searchAnalytics/query"
-)
-
-
-def _get_access_token() -> str:
-    """Return a short-lived access token; prefers OAuth2, falls back to service account."""
-    client_id = os.environ.get("GSC_OAUTH_CLIENT_ID", "")
-    client_secret = os.environ.get("GSC_OAUTH_CLIENT_SECRET", "")
-    refresh_token = os.environ.get("GSC_OAUTH_REFRESH_TOKEN", "")
-
-    if client_id and client_secret and refresh_token:
-        body = urllib.parse.urlencode(
-            {
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "refresh_token": refresh_token,
-                "grant_type": "refresh_token",
-            }
-        ).encode()
-        req = urllib.request.Request(
-            "https://oauth2.googleapis.com/token",
-            data=body,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read())
-        token = data.get("access_token")
-        if not token:
-            raise RuntimeError(f"OAuth2 token exchange failed: {data}")
-        return token
-
-    # Service account fallback
-    from google.oauth2 import service_account  # type: ignore
-    import google.auth.transport.requests as google_requests  # type: ignore
-
-    private_key = os.environ.get("GOOGLE_PRIVATE_KEY", "").replace("\\n", "\n")
-    client_email = os.environ.get("GOOGLE_CLIENT_EMAIL", "")
-    if not private_key or not client_email:
-        raise RuntimeError(
-            "No GSC credentials found. Set GSC_OAUTH_CLIENT_ID / "
-            "GSC_OAUTH_CLIENT_SECRET / GSC_OAUTH_REFRESH_TOKEN  or  "
-            "GOOGLE_CLIENT_EMAIL / GOOGLE_PRIVATE_KEY."
-        )
-    credentials = service_account.Credentials.from_service_account_info(
-        {
-            "type": "service_account",
-            "private_key": private_key,
-            "client_email": client_email,
-            "token_uri": "https://oauth2.googleapis.com/token",
-        },
-        scopes=[_SCOPE],
-    )
-    credentials.refresh(google_requests.Request())
-    return credentials.token  # type: ignore[return-value]
-
-
-def _fetch_rows(
-    access_token: str,
-    site_url: str,
-    start: date,
-    end: date,
-    row_limit: int,
-) -> list[dict]:
-    """
-    Call the Search Analytics API with dimensions=[query, page] and return
-    the raw rows list.  Raises on HTTP errors.
-    """
-    encoded_site = urllib.parse.quote(site_url, safe="")
-    endpoint = _SEARCH_ANALYTICS_URL.format(site=encoded_site)
-
-    payload = json.dumps(
-        {
-            "startDate": start.isoformat(),
-            "endDate": end.isoformat(),
-            "dimensions": ["date", "query", "page"],
-            "rowLimit": row_limit,
-            "orderBy": [{"fieldName": "clicks", "sortOrder": "DESCENDING"}],
-        }
-    ).encode("utf-8")
-
-    req = urllib.request.Request(
-        endpoint,
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
-
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(
-            f"GSC API returned HTTP {exc.code}: {detail}"
-        ) from exc
-
-    return data.get("rows") or []
-
 
 class Command(BaseCommand):
     help = "Pull Search Console search analytics and store in SearchConsoleQuery."
@@ -182,19 +83,39 @@ class Command(BaseCommand):
         parser.add_argument(
             "--row-limit",
             type=int,
-            default=1000,
-            help="Maximum rows to request from GSC per call (default: 1000, max: 25000).",
+            default=25000,
+            help="Rows to request from GSC per API page (default and max: 25000). "
+                 "All pages are fetched.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Shards fetched concurrently (default: 4).",
+        )
+        parser.add_argument(
+            "--shard-days",
+            type=int,
+            default=1,
+            dest="shard_days",
+            help="Days per shard (default: 1; use 7 for weekly shards).",
+        )
+        parser.add_argument(
+            "--refetch",
+            action="store_true",
+            default=False,
+            help="Fetch every day in the range, including days already checkpointed as final.",
         )
 
     def handle(self, *args, **options):
-        from seo_intel.models import SearchConsoleQuery
+        from seo_intel.services.search_console import MAX_PAGE_SIZE, get_access_token, pull_sharded
 
         site_url = os.environ.get("GSC_SITE_URL", "")
         if not site_url:
             raise CommandError("GSC_SITE_URL environment variable is not set.")
 
         days: int = options["days"]
-        row_limit: int = min(options["row_limit"], 25000)
+        row_limit: int = min(options["row_limit"], MAX_PAGE_SIZE)
 
         # GSC lags ~2 days; end yesterday to avoid incomplete data.
         end_date = date.today() - timedelta(days=2)
@@ -202,56 +123,45 @@ class Command(BaseCommand):
 
         self.stdout.write(
             f"Fetching GSC data for {site_url}  "
-            f"{start_date} → {end_date}  (row_limit={row_limit}) …"
+            f"{start_date} → {end_date}  (row_limit={row_limit}, "
+            f"{options['shard_days']}-day shards, {options['workers']} workers) …"
         )
 
         try:
-            access_token = _get_access_token()
+            access_token = get_access_token()
         except Exception as exc:
             raise CommandError(f"Auth failed: {exc}") from exc
 
-        try:
-            rows = _fetch_rows(access_token, site_url, start_date, end_date, row_limit)
-        except Exception as exc:
-            raise CommandError(str(exc)) from exc
-
-        self.stdout.write(f"  Received {len(rows)} rows from API.")
-
-        created = 0
-        updated = 0
-
-        for row in rows:
-            keys = row.get("keys", [])
-            if len(keys) < 3:
-                continue
-
-            # dimensions order: date, query, page
-            try:
-                row_date = date.fromisoformat(keys[0])
-            except ValueError:
-                continue
-            query_str = keys[1]
-            page_url = keys[2]
-
-            _, was_created = SearchConsoleQuery.objects.update_or_create(
-                query=query_str,
-                page=page_url,
-                date=row_date,
-                defaults={
-                    "clicks": int(row.get("clicks") or 0),
-                    "impressions": int(row.get("impressions") or 0),
-                    "ctr": float(row.get("ctr") or 0.0),
-                    "position": float(row.get("position") or 0.0),
-                },
-            )
-            if was_created:
-                created += 1
+        def _report(shard, result, error):
+            label = f"{shard[0]}" if shard[0] == shard[1] else f"{shard[0]} → {shard[1]}"
+            if error is not None:
+                self.stdout.write(self.style.ERROR(f"  ERR {label}: {error}"))
             else:
-                updated += 1
+                self.stdout.write(f"  OK  {label}: {result['rows']} rows in {result['pages']} page(s)")
+
+        summary = pull_sharded(
+            site_url,
+            start_date,
+            end_date,
+            workers=options["workers"],
+            shard_days=options["shard_days"],
+            resume=not options["refetch"],
+            access_token=access_token,
+            page_size=row_limit,
+            on_shard=_report,
+        )
 
         self.stdout.write(
-            self.style.SUCCESS(
-                f"Done. Created: {created}  Updated: {updated}  "
-                f"Total stored: {created + updated}"
+            f"  Shards: {summary['shards']}  fetched: {summary['done']}  "
+            f"skipped (already final): {summary['skipped']}  failed: {len(summary['failed'])}"
+        )
+        self.stdout.write(f"  Received {summary['rows']} rows from API in {summary['pages']} page(s).")
+        if summary["failed"]:
+            # Failed shards are not checkpointed; a rerun (or task retry) fetches only those
+            raise CommandError(
+                f"{len(summary['failed'])} shard(s) failed after retries; "
+                f"stored {summary['stored']} rows from the rest."
             )
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. Total stored: {summary['stored']}")
         )
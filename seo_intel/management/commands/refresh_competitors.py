@@ -0,0 +1,65 @@
+"""
+Management command: refresh_competitors
+-----------------------------------------
+Crawls, directory-scans and social-scans every active competitor domain in
+parallel, recording progress so an interrupted run resumes where it stopped.
+
+Usage
+-----
+    python manage.py refresh_competitors
+    python manage.py refresh_competitors --workers 8 --max-pages 300
+    python manage.py refresh_competitors --no-resume
+"""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Refresh crawl, directory and social data for all active competitor domains in parallel."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Worker threads, and competitor sites crawled at once (default: 4).",
+        )
+        parser.add_argument(
+            "--max-pages",
+            type=int,
+            default=200,
+            dest="max_pages",
+            help="Maximum HTML pages to crawl per domain (default: 200).",
+        )
+        parser.add_argument(
+            "--no-resume",
+            action="store_false",
+            dest="resume",
+            default=True,
+            help="Start a new run even if the previous one did not finish.",
+        )
+
+    def handle(self, *args, **options):
+        from seo_intel.services.competitor_refresh import run_competitor_refresh
+
+        summary = run_competitor_refresh(
+            workers=options["workers"],
+            max_pages=options["max_pages"],
+            resume=options["resume"],
+        )
+        if summary["status"] == "busy":
+            self.stdout.write(self.style.WARNING("Another competitor refresh is already running."))
+            return
+
+        action = "Resumed" if summary["resumed"] else "Ran"
+        self.stdout.write(f"{action} refresh {summary['run_id']} in {summary['elapsed_s']}s")
+        self.stdout.write(
+            self.style.SUCCESS(f"  done:   {summary['done']}")
+        )
+        if summary["failed"]:
+            self.stdout.write(self.style.ERROR(f"  failed: {summary['failed']}"))
+        if summary["pending"] or summary["running"]:
+            self.stdout.write(
+                self.style.WARNING(f"  unfinished: {summary['pending'] + summary['running']}")
+            )
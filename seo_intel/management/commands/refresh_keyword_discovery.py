@@ -0,0 +1,41 @@
+"""
+Management command: refresh_keyword_discovery
+-----------------------------------------------
+Brings the keyword discovery candidate store (DiscoveredKeyword) up to date.
+Each source reads only the rows added since its last refresh; ``--full``
+rebuilds every source from scratch.
+
+Usage
+-----
+    python manage.py refresh_keyword_discovery
+    python manage.py refresh_keyword_discovery --full
+"""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Incrementally refresh the keyword discovery candidate store."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Reset the source watermarks and rebuild every source.",
+        )
+
+    def handle(self, *args, **options):
+        from seo_intel.services.keyword_discovery import refresh_discovery
+
+        summary = refresh_discovery(full=options["full"])
+        if summary["status"] == "busy":
+            self.stdout.write(self.style.WARNING("Another keyword discovery refresh is already running."))
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Refreshed in {summary['elapsed_s']}s — created: {summary['created']}, "
+                f"updated: {summary['updated']}, deleted: {summary['deleted']}"
+            )
+        )
@@ -10,6 +10,7 @@ Usage
     python manage.py run_gap_analysis --show-gaps          # print only true gaps
     python manage.py run_gap_analysis --show-all           # print every keyword
     python manage.py run_gap_analysis --top 50             # limit printed rows
+    python manage.py run_gap_analysis --keep-stale         # don't delete retired keywords
 """
 
 from __future__ import annotations
@@ -51,6 +52,13 @@ class Command(BaseCommand):
             help="Maximum number of rows to print when --show-gaps or --show-all "
                  "is used (default: 30).",
         )
+        parser.add_argument(
+            "--keep-stale",
+            action="store_false",
+            dest="prune",
+            help="Keep records for keywords that are no longer in the keyword "
+                 "universe (by default they are deleted unless resolved or ignored).",
+        )
 
     def handle(self, *args, **options):
         from seo_intel.services.content_gap_engine import run_gap_analysis
@@ -61,14 +69,15 @@ class Command(BaseCommand):
         if min_impressions:
             self.stdout.write(f"  (excluding GSC keywords with < {min_impressions} impressions)")
 
-        summary = run_gap_analysis(min_impressions=min_impressions)
+        summary = run_gap_analysis(min_impressions=min_impressions, prune=options["prune"])
 
         # ---- Summary table -----------------------------------------------
         self.stdout.write("")
         self.stdout.write(
             self.style.SUCCESS(
                 f"Done.  Keywords analysed: {summary.total}  "
-                f"(created: {summary.created}, updated: {summary.updated})"
+                f"(created: {summary.created}, updated: {summary.updated}, "
+                f"unchanged: {summary.unchanged}, pruned: {summary.pruned})"
             )
         )
         self.stdout.write("")
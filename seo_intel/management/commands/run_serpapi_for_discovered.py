@@ -10,8 +10,8 @@ Populates the same tables as run_serpapi_for_seeds:
     • LCPsychHit        — LC Psych's own positions in organic results
     • KeywordSuggestion — PAA and related search phrases
 
-After completion the discovery cache is invalidated so the Keyword Discovery
-page reflects the fresh rank data on the next page load.
+After completion the keyword discovery store is refreshed so the Keyword
+Discovery page reflects the fresh rank data on the next page load.
 
 Usage
 -----
@@ -33,15 +33,17 @@ Flags
                      (default: 7 — skip keywords fetched within the last week).
 --dry-run            Print keywords that would be processed without calling
                      the API.
---delay SECS         Seconds to pause between API calls (default: 1.5).
+--concurrency N      Searches in flight at once (default: SERPAPI_CONCURRENCY).
+--rate N             Sustained searches per hour; the SerpApi account's own
+                     hourly limit caps it (default: SERPAPI_RATE_PER_HOUR).
 """
 
 from __future__ import annotations
 
 import logging
-import time
 from datetime import timedelta
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
@@ -91,34 +93,32 @@ class Command(BaseCommand):
             help="Print keywords without calling the API.",
         )
         parser.add_argument(
-            "--delay",
+            "--concurrency",
+            type=int,
+            default=None,
+            metavar="N",
+            help="Searches in flight at once (default: SERPAPI_CONCURRENCY).",
+        )
+        parser.add_argument(
+            "--rate",
             type=float,
-            default=1.5,
-            metavar="SECS",
-            help="Seconds to pause between API calls (default: 1.5).",
+            default=None,
+            metavar="PER_HOUR",
+            help="Sustained searches per hour (default: SERPAPI_RATE_PER_HOUR).",
         )
 
     def handle(self, *args, **options):
-        from seo_intel.models import (
-            CompetitorHit,
-            KeywordSuggestion,
-            LCPsychHit,
-            SerpRawResult,
-        )
-        from seo_intel.services.keyword_discovery import invalidate_cache, run_discovery
-        from seo_intel.services.serpapi_client import (
-            detect_competitor_hits,
-            detect_lcpsych_hits,
-            fetch_serp,
-            parse_serp,
-        )
+        from seo_intel.models import SerpRawResult
+        from seo_intel.services.keyword_discovery import refresh_discovery, run_discovery
+        from seo_intel.services.serp_pipeline import fetch_serps
 
         limit: int        = options["limit"]
         min_priority: int = options["min_priority"]
         source_filter: str | None = options["source"]
         stale_days: int   = options["stale_days"]
         dry_run: bool     = options["dry_run"]
-        delay: float      = options["delay"]
+        concurrency: int | None = options["concurrency"]
+        rate: float | None      = options["rate"]
 
         # ── 1. Get discovery results ─────────────────────────────────────────
         self.stdout.write("Running keyword discovery …")
@@ -172,107 +172,58 @@ class Command(BaseCommand):
                 )
             return
 
-        self.stdout.write(f"Processing {total} discovered keyword(s) …\n")
-
-        ok_count  = 0
-        err_count = 0
-        errors: list[tuple[str, str]] = []
-
-        for idx, entry in enumerate(discovered, start=1):
-            kw = entry["keyword"]
-            self.stdout.write(f"[{idx}/{total}] Fetching: '{kw}' … ", ending="")
-            self.stdout.flush()
-
-            try:
-                raw    = fetch_serp(kw)
-                parsed = parse_serp(kw, raw)
-                now    = timezone.now()
-
-                # Raw result
-                SerpRawResult.objects.create(
-                    keyword=kw,
-                    payload={"raw": raw, "parsed": parsed},
-                )
-
-                # Competitor hits
-                comp_hits = detect_competitor_hits(kw, parsed["organic"])
-                for hit in comp_hits:
-                    CompetitorHit.objects.create(
-                        keyword=hit["keyword"],
-                        competitor_domain=hit["competitor_domain"],
-                        url=hit["url"],
-                        title=hit["title"],
-                        rank=hit["rank"],
-                        timestamp=now,
-                    )
-
-                # LC Psych own hits
-                own_hits = detect_lcpsych_hits(kw, parsed["organic"])
-                for hit in own_hits:
-                    LCPsychHit.objects.create(
-                        keyword=hit["keyword"],
-                        url=hit["url"],
-                        title=hit["title"],
-                        rank=hit["rank"],
-                        timestamp=now,
-                    )
-
-                # PAA + related suggestions
-                new_suggestions = 0
-                for question in parsed["people_also_ask"]:
-                    phrase = question.strip().lower()
-                    if phrase:
-                        _, created = KeywordSuggestion.objects.get_or_create(
-                            suggestion=phrase,
-                            defaults={
-                                "source_keyword": kw,
-                                "source_type": KeywordSuggestion.PAA,
-                            },
-                        )
-                        if created:
-                            new_suggestions += 1
+        self.stdout.write(
+            f"Processing {total} discovered keyword(s) "
+            f"({concurrency or settings.SERPAPI_CONCURRENCY} at a time) …\n"
+        )
 
-                for query in parsed["related_searches"]:
-                    phrase = query.strip().lower()
-                    if phrase:
-                        _, created = KeywordSuggestion.objects.get_or_create(
-                            suggestion=phrase,
-                            defaults={
-                                "source_keyword": kw,
-                                "source_type": KeywordSuggestion.RELATED,
-                            },
-                        )
-                        if created:
-                            new_suggestions += 1
+        done = 0
 
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"OK  ({len(parsed['organic'])} organic, "
-                        f"{len(comp_hits)} competitor hit(s), "
-                        f"{len(own_hits)} own hit(s), "
-                        f"{new_suggestions} new suggestion(s))"
-                    )
+        def _report(outcome):
+            nonlocal done
+            done += 1
+            prefix = f"[{done}/{total}] '{outcome.keyword}' … "
+            if outcome.error:
+                self.stdout.write(prefix + self.style.ERROR(f"ERROR — {outcome.error}"))
+                return
+            self.stdout.write(
+                prefix
+                + self.style.SUCCESS(
+                    f"OK  ({len(outcome.parsed['organic'])} organic, "
+                    f"{outcome.competitor_hits} competitor hit(s), "
+                    f"{outcome.own_hits} own hit(s))"
                 )
-                ok_count += 1
-
-            except Exception as exc:
-                msg = str(exc)
-                self.stdout.write(self.style.ERROR(f"ERROR — {msg}"))
-                errors.append((kw, msg))
-                err_count += 1
+            )
 
-            if idx < total:
-                time.sleep(delay)
+        report = fetch_serps(
+            [d["keyword"] for d in discovered],
+            concurrency=concurrency,
+            rate_per_hour=rate,
+            on_result=_report,
+        )
+        ok_count  = report.ok
+        err_count = len(report.errors)
+        errors    = report.errors
 
-        # ── 4. Invalidate discovery cache so fresh rank data appears ────────
-        invalidate_cache()
-        self.stdout.write("\nDiscovery cache invalidated.")
+        # ── 4. Refresh discovery so fresh rank data appears ─────────────────
+        refresh_discovery()
+        self.stdout.write("\nKeyword discovery refreshed.")
 
         # ── 5. Summary ───────────────────────────────────────────────────────
         self.stdout.write("\n" + "─" * 60)
         self.stdout.write(
-            self.style.SUCCESS(f"Done.  Processed: {ok_count}  Errors: {err_count}")
+            self.style.SUCCESS(
+                f"Done.  Processed: {ok_count}  Errors: {err_count}  "
+                f"New suggestions: {report.new_suggestions}"
+            )
         )
+        if report.skipped_for_quota:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Skipped {len(report.skipped_for_quota)} keyword(s): "
+                    "no SerpApi searches left this month."
+                )
+            )
         if errors:
             self.stdout.write(self.style.ERROR("\nFailed keywords:"))
             for kw, msg in errors:
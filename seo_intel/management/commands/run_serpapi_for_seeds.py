@@ -10,6 +10,7 @@ Usage
     python manage.py run_serpapi_for_seeds --limit 10
     python manage.py run_serpapi_for_seeds --category service
     python manage.py run_serpapi_for_seeds --dry-run
+    python manage.py run_serpapi_for_seeds --concurrency 8 --rate 3000
 
 Flags
 -----
@@ -19,16 +20,17 @@ Flags
                  (service | testing | modality | location).
 --dry-run        Print keywords that would be processed without calling
                  the API.
---delay SECS     Seconds to wait between API calls (default: 1.5).
+--concurrency N  Searches in flight at once (default: SERPAPI_CONCURRENCY).
+--rate N         Sustained searches per hour; the SerpApi account's own
+                 hourly limit caps it (default: SERPAPI_RATE_PER_HOUR).
 """
 
 from __future__ import annotations
 
 import logging
-import time
 
-from django.core.management.base import BaseCommand, CommandError
-from django.utils import timezone
+from django.conf import settings
+from django.core.management.base import BaseCommand
 
 logger = logging.getLogger(__name__)
 
@@ -56,28 +58,29 @@ class Command(BaseCommand):
             help="Print keywords without calling the API.",
         )
         parser.add_argument(
-            "--delay",
+            "--concurrency",
+            type=int,
+            default=None,
+            metavar="N",
+            help="Searches in flight at once (default: SERPAPI_CONCURRENCY).",
+        )
+        parser.add_argument(
+            "--rate",
             type=float,
-            default=1.5,
-            metavar="SECS",
-            help="Seconds to pause between API calls (default: 1.5).",
+            default=None,
+            metavar="PER_HOUR",
+            help="Sustained searches per hour (default: SERPAPI_RATE_PER_HOUR).",
         )
 
     def handle(self, *args, **options):
-        from django.utils import timezone
-        from seo_intel.models import CompetitorHit, KeywordSuggestion, LCPsychHit, SerpRawResult
-        from seo_intel.services.serpapi_client import (
-            detect_competitor_hits,
-            detect_lcpsych_hits,
-            fetch_serp,
-            parse_serp,
-        )
+        from seo_intel.services.serp_pipeline import fetch_serps
         from seo_settings.models import KeywordSeed
 
         dry_run: bool = options["dry_run"]
         limit: int | None = options["limit"]
         category: str | None = options["category"]
-        delay: float = options["delay"]
+        concurrency: int | None = options["concurrency"]
+        rate: float | None = options["rate"]
 
         # --- Load seeds ---
         qs = KeywordSeed.objects.filter(active=True).order_by("category", "keyword")
@@ -101,111 +104,57 @@ class Command(BaseCommand):
                 self.stdout.write(f"  [{seed.category}] {seed.keyword}")
             return
 
-        self.stdout.write(f"Processing {total} keyword seed(s) …\n")
-
-        ok_count = 0
-        err_count = 0
-        errors: list[tuple[str, str]] = []
-
-        for idx, seed in enumerate(seeds, start=1):
-            kw = seed.keyword
-            self.stdout.write(f"[{idx}/{total}] Fetching: '{kw}' … ", ending="")
-            self.stdout.flush()
-
-            try:
-                raw = fetch_serp(kw)
-                parsed = parse_serp(kw, raw)
-
-                now = timezone.now()
+        self.stdout.write(
+            f"Processing {total} keyword seed(s) "
+            f"({concurrency or settings.SERPAPI_CONCURRENCY} at a time) …\n"
+        )
 
-                SerpRawResult.objects.create(
-                    keyword=kw,
-                    payload={
-                        "raw": raw,
-                        "parsed": parsed,
-                    },
-                )
+        done = 0
 
-                # Detect and persist competitor hits
-                comp_hits = detect_competitor_hits(kw, parsed["organic"])
-                for hit in comp_hits:
-                    CompetitorHit.objects.create(
-                        keyword=hit["keyword"],
-                        competitor_domain=hit["competitor_domain"],
-                        url=hit["url"],
-                        title=hit["title"],
-                        rank=hit["rank"],
-                        timestamp=now,
-                    )
-
-                # Detect and persist LC Psych own hits
-                own_hits = detect_lcpsych_hits(kw, parsed["organic"])
-                for hit in own_hits:
-                    LCPsychHit.objects.create(
-                        keyword=hit["keyword"],
-                        url=hit["url"],
-                        title=hit["title"],
-                        rank=hit["rank"],
-                        timestamp=now,
-                    )
-
-                organic_count = len(parsed["organic"])
-                paa_count = len(parsed["people_also_ask"])
-                rs_count = len(parsed["related_searches"])
-
-                # Save PAA and related search phrases as keyword suggestions
-                new_suggestions = 0
-                for question in parsed["people_also_ask"]:
-                    phrase = question.strip().lower()
-                    if phrase:
-                        _, created = KeywordSuggestion.objects.get_or_create(
-                            suggestion=phrase,
-                            defaults={
-                                "source_keyword": kw,
-                                "source_type": KeywordSuggestion.PAA,
-                            },
-                        )
-                        if created:
-                            new_suggestions += 1
-
-                for query in parsed["related_searches"]:
-                    phrase = query.strip().lower()
-                    if phrase:
-                        _, created = KeywordSuggestion.objects.get_or_create(
-                            suggestion=phrase,
-                            defaults={
-                                "source_keyword": kw,
-                                "source_type": KeywordSuggestion.RELATED,
-                            },
-                        )
-                        if created:
-                            new_suggestions += 1
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"OK  ({organic_count} organic, {paa_count} PAA, "
-                        f"{rs_count} related, "
-                        f"{len(comp_hits)} competitor hit(s), "
-                        f"{len(own_hits)} own hit(s), "
-                        f"{new_suggestions} new suggestion(s))"
-                    )
+        def _report(outcome):
+            nonlocal done
+            done += 1
+            prefix = f"[{done}/{total}] '{outcome.keyword}' … "
+            if outcome.error:
+                self.stdout.write(prefix + self.style.ERROR(f"ERROR — {outcome.error}"))
+                return
+            parsed = outcome.parsed
+            self.stdout.write(
+                prefix
+                + self.style.SUCCESS(
+                    f"OK  ({len(parsed['organic'])} organic, "
+                    f"{len(parsed['people_also_ask'])} PAA, "
+                    f"{len(parsed['related_searches'])} related, "
+                    f"{outcome.competitor_hits} competitor hit(s), "
+                    f"{outcome.own_hits} own hit(s))"
                 )
-                ok_count += 1
-
-            except Exception as exc:
-                msg = str(exc)
-                self.stdout.write(self.style.ERROR(f"ERROR — {msg}"))
-                errors.append((kw, msg))
-                err_count += 1
+            )
 
-            if idx < total:
-                time.sleep(delay)
+        report = fetch_serps(
+            [seed.keyword for seed in seeds],
+            concurrency=concurrency,
+            rate_per_hour=rate,
+            on_result=_report,
+        )
+        ok_count = report.ok
+        err_count = len(report.errors)
+        errors = report.errors
 
         # --- Summary ---
         self.stdout.write("\n" + "─" * 60)
         self.stdout.write(
-            self.style.SUCCESS(f"Done.  Processed: {ok_count}  Errors: {err_count}")
+            self.style.SUCCESS(
+                f"Done.  Processed: {ok_count}  Errors: {err_count}  "
+                f"New suggestions: {report.new_suggestions}"
+            )
         )
+        if report.skipped_for_quota:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Skipped {len(report.skipped_for_quota)} keyword(s): "
+                    "no SerpApi searches left this month."
+                )
+            )
         if errors:
             self.stdout.write(self.style.ERROR("\nFailed keywords:"))
             for kw, msg in errors:
@@ -4,14 +4,16 @@ seo_intel/management/commands/score_keywords.py
 Compute and persist keyword priority scores for every known keyword.
 
 The command aggregates data from five sources in a single DB pass, scores each
-keyword via the ``keyword_scoring`` service, then upserts ``KeywordScore``
-records.  At the end it prints the top-20 highest-priority keywords.
+keyword via the ``keyword_scoring`` service, then writes ``KeywordScore``
+records in bulk (``save_scores``).  With ``--prune``, scores for keywords no
+longer found in any source are deleted.  At the end it prints the top-20 highest-priority keywords.
 
 Usage
 -----
     python manage.py score_keywords
     python manage.py score_keywords --top 30
     python manage.py score_keywords --dry-run
+    python manage.py score_keywords --prune
 """
 
 from __future__ import annotations
@@ -38,16 +40,21 @@ class Command(BaseCommand):
             action="store_true",
             help="Compute scores but do not save to the database.",
         )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete KeywordScore records for keywords not found in any source "
+                 "(including scores saved from the portal's keyword suggestions).",
+        )
 
     def handle(self, *args, **options):
         from seo_intel.models import (
             CompetitorHit,
-            KeywordScore,
             KeywordSuggestion,
             LCPsychHit,
             SearchConsoleQuery,
         )
-        from seo_intel.services.keyword_scoring import load_geo_terms, score_keyword
+        from seo_intel.services.keyword_scoring import load_geo_terms, save_scores, score_keyword
         from seo_settings.models import KeywordSeed
 
         top_n: int = options["top"]
@@ -104,32 +111,18 @@ class Command(BaseCommand):
         geo_terms = load_geo_terms()
 
         # ── 6. Score and persist ──────────────────────────────────────────────
-        results: list[dict] = []
-        saved = 0
-
-        for keyword in keywords:
-            scored = score_keyword(
+        results: list[dict] = [
+            score_keyword(
                 keyword,
                 gsc_stats=gsc_stats,
                 competitor_ranks=competitor_ranks,
                 lcpsych_ranks=lcpsych_ranks,
                 geo_terms=geo_terms,
             )
-            results.append(scored)
-
-            if not dry_run:
-                KeywordScore.objects.update_or_create(
-                    keyword=keyword,
-                    defaults={
-                        "search_demand_score": scored["search_demand_score"],
-                        "competitor_pressure_score": scored["competitor_pressure_score"],
-                        "lcpsych_presence_score": scored["lcpsych_presence_score"],
-                        "local_intent_score": scored["local_intent_score"],
-                        "commercial_intent_score": scored["commercial_intent_score"],
-                        "priority_score": scored["priority_score"],
-                    },
-                )
-                saved += 1
+            for keyword in keywords
+        ]
+        if not dry_run:
+            written = save_scores(results, prune=options["prune"])
 
         # ── 7. Print top-N ────────────────────────────────────────────────────
         results.sort(key=lambda r: r["priority_score"], reverse=True)
@@ -174,6 +167,8 @@ class Command(BaseCommand):
         else:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"\nDone. {saved} KeywordScore record(s) saved/updated."
+                    f"\nDone. KeywordScore records — created: {written['created']}, "
+                    f"updated: {written['updated']}, unchanged: {written['unchanged']}, "
+                    f"pruned: {written['pruned']}."
                 )
             )
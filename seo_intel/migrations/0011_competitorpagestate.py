@@ -0,0 +1,32 @@
+# Generated by Django 5.0.7 on 2026-10-16 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0010_directoryprofile_socialprofile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompetitorPageState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('domain', models.CharField(db_index=True, max_length=253)),
+                ('url', models.URLField(max_length=2000)),
+                ('url_hash', models.CharField(help_text='SHA-1 of the canonical URL.', max_length=40, unique=True)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, help_text='Last-Modified header, verbatim.', max_length=64)),
+                ('content_hash', models.CharField(blank=True, help_text='SHA-1 of the response body.', max_length=40)),
+                ('page', models.JSONField(default=dict)),
+                ('last_seen', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Competitor page state',
+                'verbose_name_plural': 'Competitor page states',
+                'ordering': ['domain', 'url'],
+            },
+        ),
+    ]
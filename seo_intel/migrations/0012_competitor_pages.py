@@ -0,0 +1,143 @@
+# Generated by Django 5.0.7 on 2026-10-16 23:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def classify_page(page):
+    """Frozen copy of competitor_crawler.classify_page() as of this migration."""
+    hits = page.get('keyword_hits', {})
+    title = page.get('title', '').lower()
+    url = page.get('url', '').lower()
+
+    if hits.get('testing') or any(
+        w in title for w in ('testing', 'evaluation', 'assessment', 'neuropsych')
+    ):
+        return 'testing'
+    if hits.get('modalities') or any(
+        w in title for w in ('cbt', 'dbt', 'emdr', 'approach', 'technique')
+    ):
+        return 'modality'
+    if hits.get('locations') or any(
+        seg in url for seg in ('/location', '/area', '/serving', '/near')
+    ):
+        return 'location'
+    if hits.get('conditions') or any(
+        w in title for w in ('anxiety', 'depression', 'adhd', 'ptsd', 'ocd', 'trauma')
+    ):
+        return 'condition'
+    if hits.get('services'):
+        return 'service'
+    return 'general'
+
+
+def copy_crawl_pages(apps, schema_editor):
+    """Move each CompetitorCrawl.pages blob into CompetitorPage / CompetitorPageKeyword rows."""
+    CompetitorCrawl = apps.get_model('seo_intel', 'CompetitorCrawl')
+    CompetitorPage = apps.get_model('seo_intel', 'CompetitorPage')
+    CompetitorPageKeyword = apps.get_model('seo_intel', 'CompetitorPageKeyword')
+
+    for crawl in CompetitorCrawl.objects.all().iterator():
+        pages = [p for p in (crawl.pages or []) if isinstance(p, dict)]
+        rows = CompetitorPage.objects.bulk_create(
+            [
+                CompetitorPage(
+                    crawl=crawl,
+                    url=p.get('url', '')[:2000],
+                    title=(p.get('title') or '')[:500],
+                    h1=p.get('h1') or [],
+                    h2=p.get('h2') or [],
+                    h2_count=len(p.get('h2') or []),
+                    word_count=p.get('word_count', 0),
+                    schema_types=p.get('schema_types') or [],
+                    schema_type_count=len(p.get('schema_types') or []),
+                    internal_links=p.get('internal_links') or [],
+                    internal_link_count=len(p.get('internal_links') or []),
+                    keyword_hit_count=sum(len(v) for v in (p.get('keyword_hits') or {}).values()),
+                    page_class=classify_page(p),
+                )
+                for p in pages
+            ],
+            batch_size=500,
+        )
+        CompetitorPageKeyword.objects.bulk_create(
+            [
+                CompetitorPageKeyword(crawl=crawl, page=row, category=category, keyword=keyword[:100])
+                for row, p in zip(rows, pages)
+                for category, keywords in (p.get('keyword_hits') or {}).items()
+                for keyword in set(keywords)
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0011_competitorpagestate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompetitorPage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=2000)),
+                ('title', models.CharField(blank=True, max_length=500)),
+                ('h1', models.JSONField(default=list, help_text='First 3 H1 texts.')),
+                ('h2', models.JSONField(default=list, help_text='First 10 H2 texts.')),
+                ('h2_count', models.PositiveSmallIntegerField(default=0)),
+                ('word_count', models.PositiveIntegerField(default=0)),
+                ('schema_types', models.JSONField(default=list)),
+                ('schema_type_count', models.PositiveSmallIntegerField(default=0)),
+                ('internal_links', models.JSONField(default=list)),
+                ('internal_link_count', models.PositiveIntegerField(default=0)),
+                ('keyword_hit_count', models.PositiveIntegerField(default=0)),
+                ('page_class', models.CharField(choices=[('testing', 'Testing'), ('modality', 'Modality'), ('location', 'Location'), ('condition', 'Condition'), ('service', 'Service'), ('general', 'General')], default='general', max_length=16)),
+                ('crawl', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='crawl_pages', to='seo_intel.competitorcrawl')),
+            ],
+            options={
+                'verbose_name': 'Competitor page',
+                'verbose_name_plural': 'Competitor pages',
+                'ordering': ['crawl', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CompetitorPageKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(help_text='services / modalities / testing / conditions / locations', max_length=16)),
+                ('keyword', models.CharField(max_length=100)),
+                ('crawl', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='page_keywords', to='seo_intel.competitorcrawl')),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keywords', to='seo_intel.competitorpage')),
+            ],
+            options={
+                'ordering': ['page', 'category', 'keyword'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='competitorpage',
+            index=models.Index(fields=['crawl', 'page_class', '-word_count'], name='seo_intel_c_crawl_i_ce46f2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitorpage',
+            index=models.Index(fields=['crawl', '-word_count'], name='seo_intel_c_crawl_i_a9015a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitorpage',
+            index=models.Index(fields=['crawl', 'schema_type_count'], name='seo_intel_c_crawl_i_60ad59_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitorpagekeyword',
+            index=models.Index(fields=['crawl', 'category', 'keyword'], name='seo_intel_c_crawl_i_cf3c1f_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='competitorpagekeyword',
+            unique_together={('page', 'category', 'keyword')},
+        ),
+        migrations.RunPython(copy_crawl_pages, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='competitorcrawl',
+            name='pages',
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.7 on 2026-10-16 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0012_competitor_pages'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompetitorRefreshTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('run_id', models.CharField(db_index=True, max_length=32)),
+                ('domain', models.CharField(max_length=253)),
+                ('kind', models.CharField(choices=[('crawl', 'Site crawl'), ('directory', 'Directory scan'), ('social', 'Social scan')], max_length=16)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=16)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('detail', models.CharField(blank=True, help_text='Result summary or error message.', max_length=500)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Competitor refresh task',
+                'verbose_name_plural': 'Competitor refresh tasks',
+                'ordering': ['-created_at', 'domain', 'kind'],
+                'unique_together': {('run_id', 'domain', 'kind')},
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.7 on 2026-10-16 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0013_competitorrefreshtask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SerpCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=64, unique=True)),
+                ('engine', models.CharField(max_length=32)),
+                ('query', models.CharField(blank=True, max_length=500)),
+                ('params', models.JSONField(default=dict, help_text='Normalised request parameters.')),
+                ('body', models.BinaryField()),
+                ('fetched_at', models.DateTimeField()),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('last_hit_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'SERP cache entry',
+                'verbose_name_plural': 'SERP cache entries',
+                'ordering': ['-fetched_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SerpCacheStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('caller', models.CharField(max_length=32)),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('misses', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'SERP cache stat',
+                'verbose_name_plural': 'SERP cache stats',
+                'ordering': ['-day', 'caller'],
+                'unique_together': {('day', 'caller')},
+            },
+        ),
+    ]
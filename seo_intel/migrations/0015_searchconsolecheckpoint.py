@@ -0,0 +1,30 @@
+# Generated by Django 5.0.7 on 2026-10-17 00:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0014_serp_cache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchConsoleCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('site_url', models.CharField(max_length=500)),
+                ('date', models.DateField()),
+                ('rows', models.PositiveIntegerField(default=0)),
+                ('final', models.BooleanField(default=False)),
+                ('completed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Search Console checkpoint',
+                'verbose_name_plural': 'Search Console checkpoints',
+                'ordering': ['-date'],
+                'unique_together': {('site_url', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.7 on 2026-10-17 00:25
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0015_searchconsolecheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='competitorhit',
+            name='keyword_norm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('keyword'), output_field=models.CharField(max_length=500)),
+        ),
+        migrations.AddField(
+            model_name='competitorserpresult',
+            name='keyword_norm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('keyword'), output_field=models.CharField(max_length=500)),
+        ),
+        migrations.AddField(
+            model_name='keywordscore',
+            name='keyword_norm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('keyword'), output_field=models.CharField(max_length=500)),
+        ),
+        migrations.AddField(
+            model_name='keywordsuggestion',
+            name='keyword_norm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('source_keyword'), output_field=models.CharField(max_length=500)),
+        ),
+        migrations.AddField(
+            model_name='lcpsychhit',
+            name='keyword_norm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('keyword'), output_field=models.CharField(max_length=500)),
+        ),
+        migrations.AddField(
+            model_name='searchconsolequery',
+            name='keyword_norm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('query'), output_field=models.CharField(max_length=500)),
+        ),
+        migrations.AddIndex(
+            model_name='competitorhit',
+            index=models.Index(fields=['keyword_norm', '-timestamp'], name='seo_intel_c_keyword_d0a369_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitorserpresult',
+            index=models.Index(fields=['keyword_norm', '-timestamp'], name='seo_intel_c_keyword_cc9531_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keywordscore',
+            index=models.Index(fields=['keyword_norm'], name='seo_intel_k_keyword_94517d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='keywordsuggestion',
+            index=models.Index(fields=['keyword_norm'], name='seo_intel_k_keyword_8be33f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lcpsychhit',
+            index=models.Index(fields=['keyword_norm', '-timestamp'], name='seo_intel_l_keyword_2d4cef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchconsolequery',
+            index=models.Index(fields=['keyword_norm', 'date'], name='seo_intel_s_keyword_cc4494_idx'),
+        ),
+    ]
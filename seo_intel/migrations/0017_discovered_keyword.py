@@ -0,0 +1,46 @@
+# Generated by Django 5.0.7 on 2026-10-17 00:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0016_keyword_norm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscoveryWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=32, unique=True)),
+                ('cursor', models.JSONField(default=dict)),
+                ('window_day', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Discovery watermark',
+                'verbose_name_plural': 'Discovery watermarks',
+                'ordering': ['source'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscoveredKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword', models.CharField(max_length=500)),
+                ('keyword_norm', models.CharField(max_length=500, unique=True)),
+                ('signals', models.JSONField(default=dict)),
+                ('entry', models.JSONField(default=dict)),
+                ('priority_score', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Discovered keyword',
+                'verbose_name_plural': 'Discovered keywords',
+                'ordering': ['-priority_score', 'keyword_norm'],
+                'indexes': [models.Index(fields=['-priority_score', 'keyword_norm'], name='seo_intel_d_priorit_1973ac_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_intel', '0017_discovered_keyword'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='competitorpagestate',
+            name='parser_version',
+            field=models.PositiveSmallIntegerField(default=0, help_text='PARSER_VERSION that produced page.'),
+        ),
+    ]
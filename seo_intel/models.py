@@ -1,4 +1,19 @@
 from django.db import models
+from django.db.models.functions import Lower
+
+
+def _keyword_norm(source: str) -> models.GeneratedField:
+    """
+    Lower-cased copy of the *source* column, computed and stored by the
+    database on every write (bulk_create and update() included).  Case-
+    insensitive keyword lookups filter on it, through a plain index, instead of
+    ``__iexact`` or ``Lower(...)``, which can't use one.
+    """
+    return models.GeneratedField(
+        expression=Lower(source),
+        output_field=models.CharField(max_length=500),
+        db_persist=True,
+    )
 
 
 class SearchConsoleQuery(models.Model):
@@ -11,6 +26,7 @@ class SearchConsoleQuery(models.Model):
     impressions = models.IntegerField(default=0)
     ctr = models.FloatField(default=0.0)
     position = models.FloatField(default=0.0)
+    keyword_norm = _keyword_norm('query')
 
     class Meta:
         ordering = ['-date', '-clicks']
@@ -19,6 +35,7 @@ class SearchConsoleQuery(models.Model):
             models.Index(fields=['query']),
             models.Index(fields=['page']),
             models.Index(fields=['-clicks']),
+            models.Index(fields=['keyword_norm', 'date']),
         ]
         unique_together = [('query', 'page', 'date')]
         verbose_name = 'Search Console query'
@@ -79,6 +96,7 @@ class CompetitorSERPResult(models.Model):
     description = models.TextField(blank=True)
     rank = models.IntegerField()
     timestamp = models.DateTimeField()
+    keyword_norm = _keyword_norm('keyword')
 
     class Meta:
         ordering = ['-timestamp', 'rank']
@@ -86,6 +104,7 @@ class CompetitorSERPResult(models.Model):
             models.Index(fields=['keyword']),
             models.Index(fields=['-timestamp']),
             models.Index(fields=['rank']),
+            models.Index(fields=['keyword_norm', '-timestamp']),
         ]
         verbose_name = 'Competitor SERP result'
         verbose_name_plural = 'Competitor SERP results'
@@ -103,6 +122,7 @@ class CompetitorHit(models.Model):
     title = models.CharField(max_length=500, blank=True)
     rank = models.IntegerField()
     timestamp = models.DateTimeField()
+    keyword_norm = _keyword_norm('keyword')
 
     class Meta:
         ordering = ['-timestamp', 'rank']
@@ -110,6 +130,7 @@ class CompetitorHit(models.Model):
             models.Index(fields=['keyword']),
             models.Index(fields=['competitor_domain']),
             models.Index(fields=['-timestamp']),
+            models.Index(fields=['keyword_norm', '-timestamp']),
         ]
         verbose_name = 'Competitor hit'
         verbose_name_plural = 'Competitor hits'
@@ -181,6 +202,7 @@ class LCPsychHit(models.Model):
     title = models.CharField(max_length=500, blank=True)
     rank = models.IntegerField()
     timestamp = models.DateTimeField()
+    keyword_norm = _keyword_norm('keyword')
 
     class Meta:
         ordering = ['-timestamp', 'rank']
@@ -188,6 +210,7 @@ class LCPsychHit(models.Model):
             models.Index(fields=['keyword']),
             models.Index(fields=['-timestamp']),
             models.Index(fields=['rank']),
+            models.Index(fields=['keyword_norm', '-timestamp']),
         ]
         verbose_name = 'LC Psych SERP hit'
         verbose_name_plural = 'LC Psych SERP hits'
@@ -210,6 +233,7 @@ class KeywordSuggestion(models.Model):
     ]
 
     source_keyword = models.CharField(max_length=500)
+    keyword_norm = _keyword_norm('source_keyword')
     suggestion = models.CharField(max_length=500, unique=True)
     source_type = models.CharField(
         max_length=10,
@@ -227,6 +251,7 @@ class KeywordSuggestion(models.Model):
             models.Index(fields=['source_type']),
             models.Index(fields=['used_as_seed']),
             models.Index(fields=['-timestamp']),
+            models.Index(fields=['keyword_norm']),
         ]
         verbose_name = 'Keyword suggestion'
         verbose_name_plural = 'Keyword suggestions'
@@ -242,6 +267,7 @@ class KeywordScore(models.Model):
     """
 
     keyword = models.CharField(max_length=500, unique=True)
+    keyword_norm = _keyword_norm('keyword')
     search_demand_score = models.IntegerField(default=0)
     competitor_pressure_score = models.IntegerField(default=0)
     lcpsych_presence_score = models.IntegerField(default=0)
@@ -255,6 +281,7 @@ class KeywordScore(models.Model):
         indexes = [
             models.Index(fields=['-priority_score']),
             models.Index(fields=['keyword']),
+            models.Index(fields=['keyword_norm']),
         ]
         verbose_name = 'Keyword score'
         verbose_name_plural = 'Keyword scores'
@@ -273,7 +300,6 @@ class CompetitorCrawl(models.Model):
     domain = models.CharField(max_length=253, unique=True, db_index=True)
     crawled_at = models.DateTimeField()
     page_count = models.IntegerField(default=0)
-    pages = models.JSONField(default=list)
 
     class Meta:
         ordering = ['domain']
@@ -284,6 +310,110 @@ class CompetitorCrawl(models.Model):
         return f'{self.domain} — {self.page_count} pages @ {self.crawled_at:%Y-%m-%d %H:%M}'
 
 
+class CompetitorPage(models.Model):
+    """One page of a competitor's most recent crawl.
+
+    Rows are replaced wholesale whenever the domain is re-crawled.  Counts and
+    the page class are stored as indexed columns so the analysis engines can
+    filter and aggregate in SQL; keyword hits live in CompetitorPageKeyword.
+    """
+
+    CLASS_TESTING = 'testing'
+    CLASS_MODALITY = 'modality'
+    CLASS_LOCATION = 'location'
+    CLASS_CONDITION = 'condition'
+    CLASS_SERVICE = 'service'
+    CLASS_GENERAL = 'general'
+
+    CLASS_CHOICES = [
+        (CLASS_TESTING, 'Testing'),
+        (CLASS_MODALITY, 'Modality'),
+        (CLASS_LOCATION, 'Location'),
+        (CLASS_CONDITION, 'Condition'),
+        (CLASS_SERVICE, 'Service'),
+        (CLASS_GENERAL, 'General'),
+    ]
+
+    crawl = models.ForeignKey(CompetitorCrawl, on_delete=models.CASCADE, related_name='crawl_pages')
+    url = models.URLField(max_length=2000)
+    title = models.CharField(max_length=500, blank=True)
+    h1 = models.JSONField(default=list, help_text='First 3 H1 texts.')
+    h2 = models.JSONField(default=list, help_text='First 10 H2 texts.')
+    h2_count = models.PositiveSmallIntegerField(default=0)
+    word_count = models.PositiveIntegerField(default=0)
+    schema_types = models.JSONField(default=list)
+    schema_type_count = models.PositiveSmallIntegerField(default=0)
+    internal_links = models.JSONField(default=list)
+    internal_link_count = models.PositiveIntegerField(default=0)
+    keyword_hit_count = models.PositiveIntegerField(default=0)
+    page_class = models.CharField(max_length=16, choices=CLASS_CHOICES, default=CLASS_GENERAL)
+
+    class Meta:
+        ordering = ['crawl', 'id']
+        verbose_name = 'Competitor page'
+        verbose_name_plural = 'Competitor pages'
+        indexes = [
+            models.Index(fields=['crawl', 'page_class', '-word_count']),
+            models.Index(fields=['crawl', '-word_count']),
+            models.Index(fields=['crawl', 'schema_type_count']),
+        ]
+
+    def __str__(self):
+        return self.url
+
+
+class CompetitorPageKeyword(models.Model):
+    """A taxonomy keyword found on a CompetitorPage.
+
+    ``crawl`` is denormalised from the page so per-domain keyword counts need
+    no join.
+    """
+
+    crawl = models.ForeignKey(CompetitorCrawl, on_delete=models.CASCADE, related_name='page_keywords')
+    page = models.ForeignKey(CompetitorPage, on_delete=models.CASCADE, related_name='keywords')
+    category = models.CharField(max_length=16, help_text='services / modalities / testing / conditions / locations')
+    keyword = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ['page', 'category', 'keyword']
+        unique_together = [('page', 'category', 'keyword')]
+        indexes = [
+            models.Index(fields=['crawl', 'category', 'keyword']),
+        ]
+
+    def __str__(self):
+        return f'{self.category}: {self.keyword}'
+
+
+class CompetitorPageState(models.Model):
+    """Per-URL crawl state used for conditional recrawls of competitor sites.
+
+    Holds the HTTP validators and body hash from the last fetch together with
+    the parsed page signals, so a recrawl can send ``If-None-Match`` /
+    ``If-Modified-Since`` and reuse ``page`` on a 304 or an identical body.
+    ``page`` is only reused while ``parser_version`` matches the crawler's
+    PARSER_VERSION.
+    """
+
+    domain = models.CharField(max_length=253, db_index=True)
+    url = models.URLField(max_length=2000)
+    url_hash = models.CharField(max_length=40, unique=True, help_text='SHA-1 of the canonical URL.')
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True, help_text='Last-Modified header, verbatim.')
+    content_hash = models.CharField(max_length=40, blank=True, help_text='SHA-1 of the response body.')
+    page = models.JSONField(default=dict)
+    parser_version = models.PositiveSmallIntegerField(default=0, help_text='PARSER_VERSION that produced page.')
+    last_seen = models.DateTimeField()
+
+    class Meta:
+        ordering = ['domain', 'url']
+        verbose_name = 'Competitor page state'
+        verbose_name_plural = 'Competitor page states'
+
+    def __str__(self):
+        return self.url
+
+
 class DirectoryProfile(models.Model):
     """Scraped directory listing for one (domain, platform) pair.
 
@@ -352,3 +482,175 @@ class SocialProfile(models.Model):
 
     def __str__(self):
         return f'{self.competitor_domain} — {self.get_platform_display()}'
+
+
+class CompetitorRefreshTask(models.Model):
+    """One unit of work in a competitor refresh run.
+
+    A run (``run_id``) has one crawl, one directory scan and one social scan
+    task per active competitor domain.  Status is written as each task starts
+    and finishes, so a run interrupted by a worker restart resumes with only
+    the tasks that had not finished.
+    """
+
+    KIND_CRAWL = 'crawl'
+    KIND_DIRECTORY = 'directory'
+    KIND_SOCIAL = 'social'
+
+    KIND_CHOICES = [
+        (KIND_CRAWL, 'Site crawl'),
+        (KIND_DIRECTORY, 'Directory scan'),
+        (KIND_SOCIAL, 'Social scan'),
+    ]
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    run_id = models.CharField(max_length=32, db_index=True)
+    domain = models.CharField(max_length=253)
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    detail = models.CharField(max_length=500, blank=True, help_text='Result summary or error message.')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = [('run_id', 'domain', 'kind')]
+        ordering = ['-created_at', 'domain', 'kind']
+        verbose_name = 'Competitor refresh task'
+        verbose_name_plural = 'Competitor refresh tasks'
+
+    def __str__(self):
+        return f'{self.run_id} {self.domain} {self.kind} — {self.status}'
+
+
+class SerpCacheEntry(models.Model):
+    """A cached SerpApi response, addressed by a fingerprint of its request.
+
+    ``fingerprint`` is the SHA-256 of the normalised request parameters (see
+    seo_intel.services.serp_cache); ``body`` is the zlib-compressed JSON
+    response.  Refetching a search replaces the entry in place.
+    """
+
+    fingerprint = models.CharField(max_length=64, unique=True)
+    engine = models.CharField(max_length=32)
+    query = models.CharField(max_length=500, blank=True)
+    params = models.JSONField(default=dict, help_text='Normalised request parameters.')
+    body = models.BinaryField()
+    fetched_at = models.DateTimeField()
+    hit_count = models.PositiveIntegerField(default=0)
+    last_hit_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-fetched_at']
+        verbose_name = 'SERP cache entry'
+        verbose_name_plural = 'SERP cache entries'
+
+    def __str__(self):
+        return f'[{self.engine}] "{self.query}" at {self.fetched_at:%Y-%m-%d %H:%M}'
+
+
+class SerpCacheStat(models.Model):
+    """Daily SERP cache hit / miss counts for one caller.
+
+    Every hit is a SerpApi search credit that was not spent.
+    """
+
+    day = models.DateField()
+    caller = models.CharField(max_length=32)
+    hits = models.PositiveIntegerField(default=0)
+    misses = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = [('day', 'caller')]
+        ordering = ['-day', 'caller']
+        verbose_name = 'SERP cache stat'
+        verbose_name_plural = 'SERP cache stats'
+
+    def __str__(self):
+        return f'{self.day} {self.caller}: {self.hits} hit(s), {self.misses} miss(es)'
+
+
+class SearchConsoleCheckpoint(models.Model):
+    """A Search Console day whose rows have been pulled into SearchConsoleQuery.
+
+    ``final`` is set once the day is old enough that GSC no longer revises
+    its data; final days are skipped by later pulls, provisional ones are
+    fetched again.
+    """
+
+    site_url = models.CharField(max_length=500)
+    date = models.DateField()
+    rows = models.PositiveIntegerField(default=0)
+    final = models.BooleanField(default=False)
+    completed_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = [('site_url', 'date')]
+        ordering = ['-date']
+        verbose_name = 'Search Console checkpoint'
+        verbose_name_plural = 'Search Console checkpoints'
+
+    def __str__(self):
+        return f'{self.site_url} {self.date} ({self.rows} rows{", final" if self.final else ""})'
+
+
+class DiscoveredKeyword(models.Model):
+    """A keyword opportunity maintained by seo_intel.services.keyword_discovery.
+
+    ``signals`` holds what each discovery source found for the keyword (one
+    entry per source); ``entry`` is the merged, scored opportunity rendered by
+    the Keyword Discovery page.  Sources update their signals incrementally
+    and only the keywords they touched are re-scored.
+    """
+
+    keyword = models.CharField(max_length=500)
+    keyword_norm = models.CharField(max_length=500, unique=True)
+    signals = models.JSONField(default=dict)
+    entry = models.JSONField(default=dict)
+    priority_score = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-priority_score', 'keyword_norm']
+        indexes = [
+            models.Index(fields=['-priority_score', 'keyword_norm']),
+        ]
+        verbose_name = 'Discovered keyword'
+        verbose_name_plural = 'Discovered keywords'
+
+    def __str__(self):
+        return f'"{self.keyword}" — priority {self.priority_score}'
+
+
+class DiscoveryWatermark(models.Model):
+    """How far a keyword discovery source has read its input tables.
+
+    ``cursor`` is source-specific (typically the highest primary key
+    processed per table); ``window_day`` is the day the source's time window
+    was last rebuilt in full.
+    """
+
+    source = models.CharField(max_length=32, unique=True)
+    cursor = models.JSONField(default=dict)
+    window_day = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['source']
+        verbose_name = 'Discovery watermark'
+        verbose_name_plural = 'Discovery watermarks'
+
+    def __str__(self):
+        return f'{self.source} @ {self.cursor}'
@@ -5,10 +5,12 @@ Competitor Analysis Engine.
 
 Compares crawled competitor pages against LC Psych's own page structure
 to identify content, keyword, location, modality, and testing gaps.
+Competitor coverage, page classes and word counts are aggregated in SQL
+over CompetitorPage / CompetitorPageKeyword.
 
 Public API
 ----------
-    analyze_competitor(domain, pages=None) -> dict
+    analyze_competitor(domain) -> dict
 
 Return dict keys:
     domain          str
@@ -19,13 +21,15 @@ Return dict keys:
     comp_coverage   dict   — {category: sorted_list_of_keywords}
     gaps            dict   — {category: sorted list of gap keywords}
     gap_scores      dict   — {score_name: 0-100 int}
-    top_pages       dict   — {category: [page_dict, ...]}
+    top_pages       dict   — {category: [{url, title, word_count}, ...]}
     recommendations list   — [{action, description, category, priority, priority_css}, ...]
 """
 from __future__ import annotations
 
 import logging
-from collections import Counter, defaultdict
+from collections import Counter
+
+from django.db.models import Avg, Count
 
 logger = logging.getLogger(__name__)
 
@@ -83,13 +87,12 @@ def _lc_psych_coverage() -> dict[str, set[str]]:
     return coverage
 
 
-def _competitor_coverage(pages: list[dict]) -> dict[str, set[str]]:
+def _competitor_coverage(crawl) -> dict[str, set[str]]:
     """Union of all keyword hits across all competitor pages."""
     coverage: dict[str, set[str]] = {cat: set() for cat in _CATEGORIES}
-    for page in pages:
-        for cat, kws in page.get("keyword_hits", {}).items():
-            if cat in coverage:
-                coverage[cat].update(kws)
+    for cat, kw in crawl.page_keywords.values_list("category", "keyword").distinct():
+        if cat in coverage:
+            coverage[cat].add(kw)
     return coverage
 
 
@@ -101,37 +104,6 @@ def _gap_score(lc: set, comp: set) -> int:
     return round(100 * len(missing) / len(comp))
 
 
-# ---------------------------------------------------------------------------
-# Page classification
-# ---------------------------------------------------------------------------
-
-def _classify_page(page: dict) -> str:
-    """Assign a primary category to a competitor page."""
-    hits = page.get("keyword_hits", {})
-    title = page.get("title", "").lower()
-    url = page.get("url", "").lower()
-
-    if hits.get("testing") or any(
-        w in title for w in ("testing", "evaluation", "assessment", "neuropsych")
-    ):
-        return "testing"
-    if hits.get("modalities") or any(
-        w in title for w in ("cbt", "dbt", "emdr", "approach", "technique")
-    ):
-        return "modality"
-    if hits.get("locations") or any(
-        seg in url for seg in ("/location", "/area", "/serving", "/near")
-    ):
-        return "location"
-    if hits.get("conditions") or any(
-        w in title for w in ("anxiety", "depression", "adhd", "ptsd", "ocd", "trauma")
-    ):
-        return "condition"
-    if hits.get("services"):
-        return "service"
-    return "general"
-
-
 # ---------------------------------------------------------------------------
 # Recommendations
 # ---------------------------------------------------------------------------
@@ -213,22 +185,19 @@ def _build_recommendations(
 # Public API
 # ---------------------------------------------------------------------------
 
-def analyze_competitor(domain: str, pages: list[dict] | None = None) -> dict:
+def analyze_competitor(domain: str) -> dict:
     """Run full competitor gap analysis and return a structured report.
 
     Args:
         domain: Competitor domain (e.g. ``"psychologytoday.com"``).
-        pages:  Pre-crawled page list. If None, loads from cache automatically.
 
     Returns a dict with keys: domain, page_count, crawled, overview,
     lc_coverage, comp_coverage, gaps, gap_scores, top_pages, recommendations.
     """
-    from seo_intel.services.competitor_crawler import get_cached_crawl
-
-    if pages is None:
-        pages = get_cached_crawl(domain) or []
+    from seo_intel.services.competitor_crawler import latest_crawl
 
-    if not pages:
+    crawl = latest_crawl(domain)
+    if crawl is None or not crawl.page_count:
         return {
             "domain": domain,
             "page_count": 0,
@@ -243,7 +212,7 @@ def analyze_competitor(domain: str, pages: list[dict] | None = None) -> dict:
         }
 
     lc_cov = _lc_psych_coverage()
-    comp_cov = _competitor_coverage(pages)
+    comp_cov = _competitor_coverage(crawl)
 
     # ── Gaps ──────────────────────────────────────────────────────────────
     gaps: dict[str, list[str]] = {}
@@ -273,22 +242,27 @@ def analyze_competitor(domain: str, pages: list[dict] | None = None) -> dict:
         ),
     }
 
+    # ── Page classes and word counts ──────────────────────────────────────
+    pages = crawl.crawl_pages.all()
+    pages_by_cat = Counter(dict(
+        pages.order_by().values_list("page_class").annotate(n=Count("id"))
+    ))
+    totals = pages.aggregate(n=Count("id"), avg_words=Avg("word_count"))
+    page_count = totals["n"]
+    avg_word_count = totals["avg_words"] or 0
+
     # ── Top pages per category (by word count) ────────────────────────────
-    top_pages: dict[str, list[dict]] = defaultdict(list)
-    for page in pages:
-        cat = _classify_page(page)
-        top_pages[cat].append(page)
-    for cat in top_pages:
-        top_pages[cat] = sorted(
-            top_pages[cat], key=lambda p: p.get("word_count", 0), reverse=True
-        )[:5]
-
-    # ── Overview ──────────────────────────────────────────────────────────
-    pages_by_cat = Counter(_classify_page(p) for p in pages)
-    avg_word_count = sum(p.get("word_count", 0) for p in pages) / len(pages) if pages else 0
+    top_pages: dict[str, list[dict]] = {
+        cat: list(
+            pages.filter(page_class=cat)
+            .order_by("-word_count")
+            .values("url", "title", "word_count")[:5]
+        )
+        for cat in pages_by_cat
+    }
 
     overview = {
-        "page_count": len(pages),
+        "page_count": page_count,
         "avg_word_count": round(avg_word_count),
         "service_pages": pages_by_cat.get("service", 0),
         "testing_pages": pages_by_cat.get("testing", 0),
@@ -306,13 +280,13 @@ def analyze_competitor(domain: str, pages: list[dict] | None = None) -> dict:
 
     return {
         "domain": domain,
-        "page_count": len(pages),
+        "page_count": page_count,
         "crawled": True,
         "overview": overview,
         "lc_coverage": {k: sorted(v) for k, v in lc_cov.items()},
         "comp_coverage": {k: sorted(v) for k, v in comp_cov.items()},
         "gaps": gaps,
         "gap_scores": gap_scores,
-        "top_pages": dict(top_pages),
+        "top_pages": top_pages,
         "recommendations": recommendations,
     }
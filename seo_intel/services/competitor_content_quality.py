@@ -5,7 +5,8 @@ Content Quality Engine.
 
 Scores each competitor page across multiple quality dimensions,
 computes an aggregate quality_score (0-100), and identifies the
-strongest and weakest competitor pages.
+strongest and weakest competitor pages.  Scores are computed from the
+count columns of CompetitorPage, so no page JSON is loaded.
 
 Public API
 ----------
@@ -36,23 +37,19 @@ def _word_count_score(wc: int) -> int:
     return 10
 
 
-def _heading_score(page: dict) -> int:
-    h1s = page.get("h1", [])
-    h2s = page.get("h2", [])
-    if h1s and len(h2s) >= 5:
+def _heading_score(has_h1: bool, h2_count: int) -> int:
+    if has_h1 and h2_count >= 5:
         return 100
-    if h1s and len(h2s) >= 3:
+    if has_h1 and h2_count >= 3:
         return 80
-    if h1s and len(h2s) >= 1:
+    if has_h1 and h2_count >= 1:
         return 60
-    if h1s:
+    if has_h1:
         return 40
     return 15
 
 
-def _schema_score(page: dict) -> int:
-    types = page.get("schema_types", [])
-    n = len(types)
+def _schema_score(n: int) -> int:
     if n >= 3:
         return 100
     if n == 2:
@@ -62,8 +59,7 @@ def _schema_score(page: dict) -> int:
     return 0
 
 
-def _link_score(page: dict) -> int:
-    n = len(page.get("internal_links", []))
+def _link_score(n: int) -> int:
     if n >= 8:
         return 100
     if n >= 5:
@@ -75,9 +71,7 @@ def _link_score(page: dict) -> int:
     return 0
 
 
-def _keyword_richness_score(page: dict) -> int:
-    hits = page.get("keyword_hits", {})
-    total = sum(len(v) for v in hits.values())
+def _keyword_richness_score(total: int) -> int:
     if total >= 10:
         return 100
     if total >= 6:
@@ -89,14 +83,14 @@ def _keyword_richness_score(page: dict) -> int:
     return 0
 
 
-def _page_quality_score(page: dict) -> int:
-    """Compute an aggregate 0-100 quality score for a single page."""
+def _page_quality_score(row: dict) -> int:
+    """Compute an aggregate 0-100 quality score for a single CompetitorPage row."""
     return round(
-        0.35 * _word_count_score(page.get("word_count", 0))
-        + 0.25 * _heading_score(page)
-        + 0.15 * _schema_score(page)
-        + 0.15 * _link_score(page)
-        + 0.10 * _keyword_richness_score(page)
+        0.35 * _word_count_score(row["word_count"])
+        + 0.25 * _heading_score(bool(row["h1"]), row["h2_count"])
+        + 0.15 * _schema_score(row["schema_type_count"])
+        + 0.15 * _link_score(row["internal_link_count"])
+        + 0.10 * _keyword_richness_score(row["keyword_hit_count"])
     )
 
 
@@ -119,10 +113,10 @@ def get_content_quality(domain: str) -> dict:
         strong_pages    list[dict]  – top 15 scoring pages (threats)
         weak_pages      list[dict]  – bottom 15 scoring pages (opportunities)
     """
-    from seo_intel.services.competitor_crawler import get_cached_crawl
+    from seo_intel.services.competitor_crawler import latest_crawl
 
-    pages_raw = get_cached_crawl(domain) or []
-    if not pages_raw:
+    crawl = latest_crawl(domain)
+    if crawl is None or not crawl.page_count:
         return {
             "domain": domain,
             "has_data": False,
@@ -132,31 +126,35 @@ def get_content_quality(domain: str) -> dict:
             "weak_pages": [],
         }
 
+    rows = crawl.crawl_pages.values(
+        "url", "title", "word_count", "h1", "h2_count", "schema_types",
+        "schema_type_count", "internal_link_count", "keyword_hit_count",
+    )
     scored: list[dict] = []
-    for p in pages_raw:
-        wc = p.get("word_count", 0)
-        qs = _page_quality_score(p)
+    for row in rows:
+        wc = row["word_count"]
+        qs = _page_quality_score(row)
         scored.append({
-            "url": p.get("url", ""),
-            "title": p.get("title", "") or p.get("url", ""),
+            "url": row["url"],
+            "title": row["title"] or row["url"],
             "word_count": wc,
-            "h1": (p.get("h1") or [])[:1],
-            "h2_count": len(p.get("h2") or []),
-            "schema_types": p.get("schema_types") or [],
-            "internal_link_count": len(p.get("internal_links") or []),
-            "keyword_hit_count": sum(len(v) for v in (p.get("keyword_hits") or {}).values()),
+            "h1": (row["h1"] or [])[:1],
+            "h2_count": row["h2_count"],
+            "schema_types": row["schema_types"] or [],
+            "internal_link_count": row["internal_link_count"],
+            "keyword_hit_count": row["keyword_hit_count"],
             "quality_score": qs,
             "word_count_score": _word_count_score(wc),
-            "heading_score": _heading_score(p),
-            "schema_score": _schema_score(p),
-            "link_score": _link_score(p),
-            "keyword_score": _keyword_richness_score(p),
+            "heading_score": _heading_score(bool(row["h1"]), row["h2_count"]),
+            "schema_score": _schema_score(row["schema_type_count"]),
+            "link_score": _link_score(row["internal_link_count"]),
+            "keyword_score": _keyword_richness_score(row["keyword_hit_count"]),
             "quality_css": _quality_css(qs),
         })
 
     scored.sort(key=lambda p: p["quality_score"], reverse=True)
 
-    n = len(scored)
+    n = len(scored) or 1
     avg_quality = round(sum(p["quality_score"] for p in scored) / n)
     avg_words = round(sum(p["word_count"] for p in scored) / n)
     strong_count = sum(1 for p in scored if p["quality_score"] >= 70)
@@ -167,7 +165,7 @@ def get_content_quality(domain: str) -> dict:
         "has_data": True,
         "pages": scored,
         "summary": {
-            "page_count": n,
+            "page_count": len(scored),
             "avg_quality_score": avg_quality,
             "avg_word_count": avg_words,
             "strong_page_count": strong_count,
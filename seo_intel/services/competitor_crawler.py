@@ -3,15 +3,22 @@ seo_intel/services/competitor_crawler.py
 ------------------------------------------
 Competitor site crawler for the Competitor Analysis Engine.
 
-Crawls up to *max_pages* HTML pages of a competitor domain using
-requests + BeautifulSoup, extracting structured signals from each page.
-Results are cached for 24 hours (CACHE_TTL seconds).
+Crawls up to *max_pages* HTML pages of a competitor domain with the
+concurrent crawl engine (crawl_engine.py) and extracts structured signals
+from each page in a single parser pass (page_extractor.py).  Each crawl
+replaces the domain's rows in CompetitorCrawl, CompetitorPage (one row per
+page, counts and page class in indexed columns) and CompetitorPageKeyword
+(one row per keyword hit); the analysis engines query those tables directly.
+A crawl is considered fresh for 24 hours (CACHE_TTL seconds).
 
 Public API
 ----------
     crawl_competitor(domain, max_pages=200, force=False) -> list[dict]
+    crawl_competitors(domains, max_pages=500, parallel=4, on_done=None) -> dict[str, int]
+    latest_crawl(domain) -> CompetitorCrawl | None
     get_cached_crawl(domain) -> list[dict] | None
     invalidate_crawl(domain) -> None
+    classify_page(page) -> str
 
 Each page dict contains:
     url          str       — canonical URL fetched
@@ -22,30 +29,38 @@ Each page dict contains:
     schema_types list[str] — Schema.org @type values found
     internal_links list[str]
     keyword_hits dict[str, list[str]]  — keys: services/modalities/testing/conditions/locations
+                                         (whole-word matches, see keyword_matcher.py)
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import re
-import time
-from collections import deque
-
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from typing import Callable
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from django.conf import settings
 
-from django.core.cache import cache
+from core.cache import CRAWL
+from seo_intel.services.crawl_engine import (
+    PARSE_WORKERS, CrawlState, HostLimiter, PageRecord, crawl_site, new_client, run_crawl,
+)
+from seo_intel.services.keyword_matcher import KeywordMatcher
+from seo_intel.services.page_extractor import extract_page_signals
 
 logger = logging.getLogger(__name__)
 
 CACHE_TTL = 60 * 60 * 24  # 24 hours
 
-_REQUEST_TIMEOUT = 10
-_CRAWL_DELAY = 0.5
-_USER_AGENT = (
-    "Mozilla/5.0 (compatible; LCPsych-SEO-Bot/1.0; +https://lcpsych.com)"
-)
+# Version of the parsed page format (_parse_page, page_extractor, the keyword
+# taxonomy and matcher).  Bump it whenever their output changes: stored pages
+# from another version are not reused, so every page is fetched and parsed
+# again on the next crawl.
+PARSER_VERSION = 2
 
 # ---------------------------------------------------------------------------
 # Keyword taxonomy — broad coverage for mental-health / psychology practices
@@ -56,7 +71,8 @@ SERVICES_KW: frozenset[str] = frozenset({
     "psychiatry", "psychiatrist", "mental health", "behavioral health",
     "psychologist", "assessment", "evaluation", "treatment",
     "telehealth", "teletherapy", "online therapy", "medication management",
-    "medication", "prescriber", "clinical social work", "social worker",
+    "medication", "prescriber", "clinical social work", "clinical social worker",
+    "social worker",
     "life coaching", "coaching", "support group",
 })
 
@@ -139,41 +155,65 @@ LOCATION_KW: frozenset[str] = frozenset({
     "online", "virtual",
 })
 
+# Whole taxonomy compiled once; one pass over a page's text finds every hit
+TAXONOMY_MATCHER = KeywordMatcher({
+    "services": SERVICES_KW,
+    "modalities": MODALITIES_KW,
+    "testing": TESTING_KW,
+    "conditions": CONDITIONS_KW,
+    "locations": LOCATION_KW,
+})
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def _cache_key(domain: str) -> str:
-    clean = re.sub(r"^www\.", "", domain.lower()).strip("/")
-    return f"comp_crawl_v1_{clean}"
+    return re.sub(r"^www\.", "", domain.lower()).strip("/")
+
+
+def latest_crawl(domain: str):
+    """The domain's CompetitorCrawl row (pages in ``crawl_pages``), or None."""
+    from seo_intel.models import CompetitorCrawl
+    return CompetitorCrawl.objects.filter(domain=_normalise_domain(domain)).first()
 
 
 def get_cached_crawl(domain: str) -> list[dict] | None:
-    """Return crawl results for *domain* — cache first, then DB."""
-    cached = cache.get(_cache_key(domain))
-    if cached is not None:
-        return cached
-    # Fall back to the database snapshot
+    """Return the latest persisted crawl of *domain* as page dicts, or None."""
     try:
-        from seo_intel.models import CompetitorCrawl
-        snap = CompetitorCrawl.objects.filter(domain=_normalise_domain(domain)).first()
-        if snap is not None:
-            logger.info(
-                "competitor_crawler: DB hit for %s (%d pages, crawled %s)",
-                domain, snap.page_count, snap.crawled_at,
-            )
-            # Warm the cache so subsequent reads are fast
-            cache.set(_cache_key(domain), snap.pages, CACHE_TTL)
-            return snap.pages
+        from seo_intel.models import CompetitorPageKeyword
+        crawl = latest_crawl(domain)
+        if crawl is None:
+            return None
+        hits: dict[int, dict[str, list[str]]] = {}
+        for page_id, category, keyword in (
+            CompetitorPageKeyword.objects.filter(crawl=crawl)
+            .order_by("page_id", "keyword")
+            .values_list("page_id", "category", "keyword")
+        ):
+            hits.setdefault(page_id, {c: [] for c in TAXONOMY_MATCHER.categories})[category].append(keyword)
+        return [
+            {
+                "url": page.url,
+                "title": page.title,
+                "h1": page.h1,
+                "h2": page.h2,
+                "word_count": page.word_count,
+                "schema_types": page.schema_types,
+                "internal_links": page.internal_links,
+                "keyword_hits": hits.get(page.pk) or {c: [] for c in TAXONOMY_MATCHER.categories},
+            }
+            for page in crawl.crawl_pages.order_by("id")
+        ]
     except Exception as exc:
-        logger.warning("competitor_crawler: DB fallback failed for %s: %s", domain, exc)
-    return None
+        logger.warning("competitor_crawler: failed to load crawl for %s: %s", domain, exc)
+        return None
 
 
 def invalidate_crawl(domain: str) -> None:
-    """Delete cached crawl results for *domain*."""
-    cache.delete(_cache_key(domain))
+    """Mark the stored crawl of *domain* stale so the next crawl_competitor() re-crawls."""
+    CRAWL.delete(_cache_key(domain))
 
 
 def _normalise_domain(domain: str) -> str:
@@ -186,6 +226,14 @@ def _base_url(domain: str) -> str:
     return f"https://{domain}/"
 
 
+def _host_limiter() -> HostLimiter:
+    """Per-host politeness limits; HostLimiter's defaults unless raised in settings."""
+    return HostLimiter(
+        concurrency=max(getattr(settings, "COMPETITOR_CRAWL_HOST_CONCURRENCY", 1), 1),
+        rate=getattr(settings, "COMPETITOR_CRAWL_HOST_RATE", 2.0),
+    )
+
+
 def _same_domain(url: str, domain: str) -> bool:
     parsed = urlparse(url)
     if not parsed.netloc:
@@ -210,48 +258,14 @@ def _skip_url(url: str) -> bool:
     return False
 
 
-def _extract_schema_types(soup: BeautifulSoup) -> list[str]:
-    types: list[str] = []
-    for el in soup.find_all(attrs={"itemtype": True}):
-        val = el.get("itemtype", "")
-        if val:
-            types.append(val.rsplit("/", 1)[-1])
-    for script in soup.find_all("script", type="application/ld+json"):
-        found = re.findall(r'"@type"\s*:\s*"([^"]+)"', script.get_text())
-        types.extend(found)
-    return list(set(types))
+def _extract_keyword_hits(text_lower: str) -> dict[str, list[str]]:
+    return TAXONOMY_MATCHER.hits(text_lower)
 
 
-def _extract_keyword_hits(text_lower: str) -> dict[str, list[str]]:
-    hits: dict[str, list[str]] = {
-        "services": [],
-        "modalities": [],
-        "testing": [],
-        "conditions": [],
-        "locations": [],
-    }
-    for kw in SERVICES_KW:
-        if kw in text_lower:
-            hits["services"].append(kw)
-    for kw in MODALITIES_KW:
-        if kw in text_lower:
-            hits["modalities"].append(kw)
-    for kw in TESTING_KW:
-        if kw in text_lower:
-            hits["testing"].append(kw)
-    for kw in CONDITIONS_KW:
-        if kw in text_lower:
-            hits["conditions"].append(kw)
-    for kw in LOCATION_KW:
-        if kw in text_lower:
-            hits["locations"].append(kw)
-    return hits
-
-
-def _extract_internal_links(soup: BeautifulSoup, base: str, domain: str) -> list[str]:
+def _extract_internal_links(hrefs: list[str], base: str, domain: str) -> list[str]:
     links: list[str] = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
+    for href in hrefs:
+        href = href.strip()
         if not href or href.startswith("mailto:") or href.startswith("tel:"):
             continue
         absolute = urljoin(base, href).split("#")[0].rstrip("/")
@@ -261,38 +275,46 @@ def _extract_internal_links(soup: BeautifulSoup, base: str, domain: str) -> list
 
 
 def _parse_page(url: str, html: str, domain: str) -> dict:
-    soup = BeautifulSoup(html, "html.parser")
-
-    title_tag = soup.find("title")
-    title = title_tag.get_text(strip=True) if title_tag else ""
-
-    h1s = [el.get_text(strip=True) for el in soup.find_all("h1")]
-    h2s = [el.get_text(strip=True) for el in soup.find_all("h2")]
-
-    schema_types = _extract_schema_types(soup)
-    internal_links = _extract_internal_links(soup, url, domain)
-
-    # Strip nav/chrome before word count
-    for tag in soup(["script", "style", "nav", "header", "footer", "aside"]):
-        tag.decompose()
-    body_text = soup.get_text(" ", strip=True)
-    word_count = len(body_text.split())
-    text_lower = body_text.lower()
-
-    keyword_hits = _extract_keyword_hits(text_lower)
-
+    signals = extract_page_signals(html)
     return {
         "url": url,
-        "title": title,
-        "h1": h1s[:3],
-        "h2": h2s[:10],
-        "word_count": word_count,
-        "schema_types": schema_types,
-        "internal_links": internal_links,
-        "keyword_hits": keyword_hits,
+        "title": signals.title,
+        "h1": signals.h1[:3],
+        "h2": signals.h2[:10],
+        "word_count": signals.word_count,
+        "schema_types": signals.schema_types,
+        "internal_links": _extract_internal_links(signals.links, url, domain),
+        "keyword_hits": _extract_keyword_hits(signals.text.lower()),
     }
 
 
+def classify_page(page: dict) -> str:
+    """Assign a primary category (CompetitorPage.page_class) to a crawled page."""
+    hits = page.get("keyword_hits", {})
+    title = page.get("title", "").lower()
+    url = page.get("url", "").lower()
+
+    if hits.get("testing") or any(
+        w in title for w in ("testing", "evaluation", "assessment", "neuropsych")
+    ):
+        return "testing"
+    if hits.get("modalities") or any(
+        w in title for w in ("cbt", "dbt", "emdr", "approach", "technique")
+    ):
+        return "modality"
+    if hits.get("locations") or any(
+        seg in url for seg in ("/location", "/area", "/serving", "/near")
+    ):
+        return "location"
+    if hits.get("conditions") or any(
+        w in title for w in ("anxiety", "depression", "adhd", "ptsd", "ocd", "trauma")
+    ):
+        return "condition"
+    if hits.get("services"):
+        return "service"
+    return "general"
+
+
 # URL path segments that indicate high-value clinical pages — crawl these first
 _HIGH_PRIORITY_SEGMENTS: frozenset[str] = frozenset({
     "services", "service", "therapy", "therapist", "therapists",
@@ -313,103 +335,239 @@ def _url_is_high_priority(url: str) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# Public API
+# Per-URL crawl state (conditional recrawls)
 # ---------------------------------------------------------------------------
 
-def crawl_competitor(domain: str, max_pages: int = 500, force: bool = False) -> list[dict]:
-    """Crawl a competitor domain and return a list of page dicts.
+# States for URLs not seen by any crawl in this long are dropped
+_PAGE_STATE_RETENTION = timedelta(days=60)
 
-    High-priority pages (services, therapists, locations, conditions, etc.) are
-    visited before general pages so the most valuable content is captured first
-    when the crawl is capped.
 
-    Results are stored in the Django cache for CACHE_TTL seconds.
-    Pass ``force=True`` to bypass the cache and re-crawl.
+def _url_hash(canonical: str) -> str:
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def _load_page_states(domain: str) -> dict[str, PageRecord]:
     """
-    domain = _normalise_domain(domain)
-    cache_key = _cache_key(domain)
+    Previous crawl's validators and parsed pages for *domain*, by canonical URL.
 
-    if not force:
-        cached = cache.get(cache_key)
-        if cached is not None:
-            logger.info(
-                "competitor_crawler: cache hit for %s (%d pages)", domain, len(cached)
+    Pages parsed under another PARSER_VERSION are left out, so they are
+    refetched unconditionally and parsed again.
+    """
+    try:
+        from seo_intel.models import CompetitorPageState
+        return {
+            row.url: PageRecord(
+                page=row.page,
+                etag=row.etag,
+                last_modified=row.last_modified,
+                content_hash=row.content_hash,
             )
-            return cached
+            for row in CompetitorPageState.objects.filter(domain=domain, parser_version=PARSER_VERSION)
+        }
+    except Exception as exc:
+        logger.warning("competitor_crawler: failed to load page states for %s: %s", domain, exc)
+        return {}
 
-    logger.info(
-        "competitor_crawler: starting crawl of %s (max_pages=%d)", domain, max_pages
+
+def _save_page_states(domain: str, state: CrawlState) -> None:
+    """Upsert the records of every page returned by this crawl and prune stale ones."""
+    try:
+        from django.utils import timezone as _tz
+        from seo_intel.models import CompetitorPageState
+
+        now = _tz.now()
+        rows = [
+            CompetitorPageState(
+                domain=domain,
+                url=canonical,
+                url_hash=_url_hash(canonical),
+                etag=record.etag[:255],
+                last_modified=record.last_modified[:64],
+                content_hash=record.content_hash,
+                page=record.page,
+                parser_version=PARSER_VERSION,
+                last_seen=now,
+            )
+            for canonical, record in state.fetched.items()
+        ]
+        CompetitorPageState.objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["url_hash"],
+            update_fields=["etag", "last_modified", "content_hash", "page", "parser_version", "last_seen"],
+        )
+        CompetitorPageState.objects.filter(domain=domain, last_seen__lt=now - _PAGE_STATE_RETENTION).delete()
+    except Exception as exc:
+        logger.warning("competitor_crawler: failed to save page states for %s: %s", domain, exc)
+
+
+# ---------------------------------------------------------------------------
+# Crawl snapshot (CompetitorCrawl + CompetitorPage + CompetitorPageKeyword)
+# ---------------------------------------------------------------------------
+
+def _page_row(crawl, page: dict):
+    from seo_intel.models import CompetitorPage
+
+    hits = page.get("keyword_hits") or {}
+    return CompetitorPage(
+        crawl=crawl,
+        url=page.get("url", "")[:2000],
+        title=(page.get("title") or "")[:500],
+        h1=page.get("h1") or [],
+        h2=page.get("h2") or [],
+        h2_count=len(page.get("h2") or []),
+        word_count=page.get("word_count", 0),
+        schema_types=page.get("schema_types") or [],
+        schema_type_count=len(page.get("schema_types") or []),
+        internal_links=page.get("internal_links") or [],
+        internal_link_count=len(page.get("internal_links") or []),
+        keyword_hit_count=sum(len(v) for v in hits.values()),
+        page_class=classify_page(page),
     )
 
-    base = _base_url(domain)
-    session = requests.Session()
-    session.headers.update({"User-Agent": _USER_AGENT})
 
-    visited: set[str] = set()
-    queue: deque[str] = deque([base])
-    pages: list[dict] = []
-    errors = 0
+def _save_crawl(domain: str, pages: list[dict]) -> None:
+    """Replace the stored snapshot of *domain* with *pages*."""
+    from django.db import transaction
+    from django.utils import timezone as _tz
+    from seo_intel.models import CompetitorCrawl, CompetitorPage, CompetitorPageKeyword
 
-    while queue and len(pages) < max_pages:
-        url = queue.popleft()
-        canonical = url.rstrip("/")
-        if canonical in visited:
-            continue
-        visited.add(canonical)
+    with transaction.atomic():
+        crawl, _ = CompetitorCrawl.objects.update_or_create(
+            domain=domain,
+            defaults={"crawled_at": _tz.now(), "page_count": len(pages)},
+        )
+        CompetitorPageKeyword.objects.filter(crawl=crawl).delete()
+        CompetitorPage.objects.filter(crawl=crawl).delete()
+        rows = CompetitorPage.objects.bulk_create(
+            [_page_row(crawl, page) for page in pages], batch_size=500
+        )
+        CompetitorPageKeyword.objects.bulk_create(
+            [
+                CompetitorPageKeyword(crawl=crawl, page=row, category=category, keyword=keyword[:100])
+                for row, page in zip(rows, pages)
+                for category, keywords in (page.get("keyword_hits") or {}).items()
+                for keyword in set(keywords)
+            ],
+            batch_size=1000,
+        )
 
-        try:
-            resp = session.get(url, timeout=_REQUEST_TIMEOUT, allow_redirects=True)
-            if resp.status_code != 200:
-                continue
-            if "text/html" not in resp.headers.get("Content-Type", ""):
-                continue
-
-            page = _parse_page(url, resp.text, domain)
-            pages.append(page)
-
-            for link in page["internal_links"]:
-                if link.rstrip("/") not in visited:
-                    # Push high-priority URLs to front so they're crawled within budget
-                    if _url_is_high_priority(link):
-                        queue.appendleft(link)
-                    else:
-                        queue.append(link)
-
-            if len(pages) % 10 == 0:
-                logger.info(
-                    "competitor_crawler: %s — %d pages crawled so far", domain, len(pages)
-                )
-
-        except requests.RequestException as exc:
-            errors += 1
-            logger.warning("competitor_crawler: error fetching %s: %s", url, exc)
-            if errors > 20:
-                logger.error(
-                    "competitor_crawler: too many consecutive errors, stopping crawl of %s",
-                    domain,
-                )
-                break
-
-        time.sleep(_CRAWL_DELAY)
 
+def _finish_crawl(domain: str, pages: list[dict], state: CrawlState) -> None:
     logger.info(
-        "competitor_crawler: finished %s — %d pages, %d errors", domain, len(pages), errors
+        "competitor_crawler: finished %s — %d pages (%d parsed, %d not modified, %d unchanged)",
+        domain, len(pages), state.stats["parsed"], state.stats["not_modified"], state.stats["unchanged"],
     )
-    cache.set(cache_key, pages, CACHE_TTL)
+    _save_page_states(domain, state)
 
     # Persist to database so data survives dyno restarts / cache expiry
     try:
-        from django.utils import timezone as _tz
-        from seo_intel.models import CompetitorCrawl
-        CompetitorCrawl.objects.update_or_create(
-            domain=domain,
-            defaults={
-                "crawled_at": _tz.now(),
-                "page_count": len(pages),
-                "pages":      pages,
-            },
-        )
+        _save_crawl(domain, pages)
+        CRAWL.set(_cache_key(domain), True, CACHE_TTL)
     except Exception as exc:
         logger.warning("competitor_crawler: failed to persist crawl for %s: %s", domain, exc)
 
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def crawl_competitor(domain: str, max_pages: int = 500, force: bool = False) -> list[dict]:
+    """Crawl a competitor domain and return a list of page dicts.
+
+    High-priority pages (services, therapists, locations, conditions, etc.) are
+    visited before general pages so the most valuable content is captured first
+    when the crawl is capped.  Pages are fetched concurrently with per-host
+    rate limiting (see crawl_engine.py).  Each fetch is conditional on the
+    URL's CompetitorPageState, so unchanged pages are neither downloaded
+    again (304) nor re-parsed (same body hash).
+
+    Results are stored in CompetitorCrawl / CompetitorPage /
+    CompetitorPageKeyword; for CACHE_TTL seconds afterwards the stored pages
+    are returned instead of crawling again.  Pass ``force=True`` to re-crawl.
+    """
+    domain = _normalise_domain(domain)
+    if not force and CRAWL.get(_cache_key(domain)):
+        stored = get_cached_crawl(domain)
+        if stored is not None:
+            logger.info(
+                "competitor_crawler: fresh crawl on record for %s (%d pages)", domain, len(stored)
+            )
+            return stored
+
+    logger.info(
+        "competitor_crawler: starting crawl of %s (max_pages=%d)", domain, max_pages
+    )
+
+    state = CrawlState(known=_load_page_states(domain))
+    pages = run_crawl(
+        _base_url(domain),
+        partial(_parse_page, domain=domain),
+        max_pages,
+        is_high_priority=_url_is_high_priority,
+        limiter=_host_limiter(),
+        state=state,
+    )
+
+    _finish_crawl(domain, pages, state)
     return pages
+
+
+def crawl_competitors(
+    domains: list[str],
+    max_pages: int = 500,
+    parallel: int = 4,
+    on_done: Callable[[str, list[dict] | None, Exception | None], None] | None = None,
+) -> dict[str, int]:
+    """Crawl several competitor domains at once and return {domain: pages crawled}.
+
+    Up to *parallel* sites are crawled concurrently in one event loop that
+    shares a single HTTP connection pool, per-host limiter and parse thread
+    pool, so politeness stays per host while the sites overlap.  Every crawl
+    is forced (no freshness check) and persisted like crawl_competitor().
+
+    *on_done(domain, pages, error)* is called from a worker thread (ORM calls
+    are safe there) as each domain finishes; a failed crawl passes
+    ``pages=None`` and the exception instead of raising.
+    """
+    domains = list(dict.fromkeys(_normalise_domain(d) for d in domains))
+
+    async def _crawl_all() -> dict[str, int]:
+        limiter = _host_limiter()
+        gate = asyncio.Semaphore(max(parallel, 1))
+        executor = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="crawl-parse")
+        counts: dict[str, int] = {}
+
+        async def _one(client, domain: str) -> None:
+            async with gate:
+                pages, error = None, None
+                try:
+                    state = CrawlState(known=await asyncio.to_thread(_load_page_states, domain))
+                    logger.info("competitor_crawler: starting crawl of %s (max_pages=%d)", domain, max_pages)
+                    pages = await crawl_site(
+                        _base_url(domain),
+                        partial(_parse_page, domain=domain),
+                        max_pages,
+                        is_high_priority=_url_is_high_priority,
+                        client=client,
+                        limiter=limiter,
+                        executor=executor,
+                        state=state,
+                    )
+                    await asyncio.to_thread(_finish_crawl, domain, pages, state)
+                    counts[domain] = len(pages)
+                except Exception as exc:
+                    logger.exception("competitor_crawler: crawl of %s failed: %s", domain, exc)
+                    error = exc
+                if on_done is not None:
+                    await asyncio.to_thread(on_done, domain, pages, error)
+
+        try:
+            async with new_client() as client:
+                await asyncio.gather(*(_one(client, d) for d in domains))
+        finally:
+            executor.shutdown(wait=False)
+        return counts
+
+    return asyncio.run(_crawl_all())
@@ -49,18 +49,18 @@ def get_keyword_gaps(domain: str) -> dict:
     # ── Best LC Psych rank for the same keywords ──────────────────────────
     lc_hits: dict[str, dict] = {}
     for hit in LCPsychHit.objects.filter(
-        keyword__in=list(comp_hits.keys())
-    ).values("keyword", "rank", "url"):
-        kw = hit["keyword"].lower()
+        keyword_norm__in=list(comp_hits.keys())
+    ).values("keyword_norm", "rank", "url"):
+        kw = hit["keyword_norm"]
         if kw not in lc_hits or hit["rank"] < lc_hits[kw]["rank"]:
             lc_hits[kw] = {"rank": hit["rank"], "url": hit["url"]}
 
     # ── Priority scores ───────────────────────────────────────────────────
     score_map: dict[str, int] = {
-        row["keyword"].lower(): row["priority_score"]
+        row["keyword_norm"]: row["priority_score"]
         for row in KeywordScore.objects.filter(
-            keyword__in=list(comp_hits.keys())
-        ).values("keyword", "priority_score")
+            keyword_norm__in=list(comp_hits.keys())
+        ).values("keyword_norm", "priority_score")
     }
 
     # ── Existing seeds (for "Add to Seeds" UI state) ─────────────────────
@@ -48,10 +48,10 @@ def get_location_coverage(domain: str) -> dict:
         summary               dict
         location_rows         list[dict]  – full comparison table
     """
-    from seo_intel.services.competitor_crawler import get_cached_crawl, LOCATION_KW
+    from seo_intel.services.competitor_crawler import latest_crawl, LOCATION_KW
 
-    pages = get_cached_crawl(domain) or []
-    if not pages:
+    crawl = latest_crawl(domain)
+    if crawl is None or not crawl.page_count:
         return {
             "domain": domain,
             "has_data": False,
@@ -93,11 +93,14 @@ def get_location_coverage(domain: str) -> dict:
     loc_taxonomy = LOCATION_KW | lc_locs
 
     # ── Competitor locations (from keyword_hits + URL path matching) ──────
-    comp_locs: set[str] = set()
-    for page in pages:
-        kw_locs = page.get("keyword_hits", {}).get("locations", [])
-        comp_locs.update(kw.lower() for kw in kw_locs)
-        comp_locs.update(_extract_url_locations(page.get("url", ""), loc_taxonomy))
+    comp_locs: set[str] = {
+        kw.lower()
+        for kw in crawl.page_keywords.filter(category="locations")
+        .values_list("keyword", flat=True)
+        .distinct()
+    }
+    for url in crawl.crawl_pages.values_list("url", flat=True):
+        comp_locs.update(_extract_url_locations(url, loc_taxonomy))
 
     # Filter competitor locations to expanded taxonomy; LC Psych locations are
     # authoritative (from DB) so use them directly.
@@ -15,6 +15,8 @@ from __future__ import annotations
 
 import logging
 
+from django.db.models import Count
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,14 +97,14 @@ _TESTING_ITEMS: list[tuple[str, str, str]] = [
 ]
 
 
-def _comp_kw_counts(pages: list[dict], category: str) -> dict[str, int]:
+def _comp_kw_counts(crawl, category: str) -> dict[str, int]:
     """Return {keyword: page_count} for *category* keyword hits across pages."""
-    counts: dict[str, int] = {}
-    for page in pages:
-        for kw in page.get("keyword_hits", {}).get(category, []):
-            kl = kw.lower()
-            counts[kl] = counts.get(kl, 0) + 1
-    return counts
+    return dict(
+        crawl.page_keywords.filter(category=category)
+        .order_by()
+        .values_list("keyword")
+        .annotate(pages=Count("page_id"))
+    )
 
 
 def _lc_seed_kws(seed_category: str) -> set[str]:
@@ -194,10 +196,10 @@ def get_modality_testing(domain: str) -> dict:
         testing_summary     dict
         recommendations     list[dict]
     """
-    from seo_intel.services.competitor_crawler import get_cached_crawl
+    from seo_intel.services.competitor_crawler import latest_crawl
 
-    pages = get_cached_crawl(domain) or []
-    if not pages:
+    crawl = latest_crawl(domain)
+    if crawl is None or not crawl.page_count:
         return {
             "domain": domain,
             "has_data": False,
@@ -208,8 +210,8 @@ def get_modality_testing(domain: str) -> dict:
             "recommendations": [],
         }
 
-    comp_mod = _comp_kw_counts(pages, "modalities")
-    comp_test = _comp_kw_counts(pages, "testing")
+    comp_mod = _comp_kw_counts(crawl, "modalities")
+    comp_test = _comp_kw_counts(crawl, "testing")
     lc_mod = _lc_seed_kws("modality")
     lc_test = _lc_seed_kws("testing")
 
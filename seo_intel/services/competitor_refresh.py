@@ -0,0 +1,215 @@
+"""
+seo_intel/services/competitor_refresh.py
+-----------------------------------------
+Weekly competitive refresh: site crawl, directory scan and social scan of
+every active CompetitorDomain, fanned out over a bounded worker pool.
+
+  * directory and social scans of different competitors run side by side in
+    a pool of *workers* threads; requests to any one host stay spaced by
+    politeness.HOST_THROTTLE, so the pool never makes a site busier;
+  * all site crawls share one event loop, HTTP connection pool and per-host
+    limiter (competitor_crawler.crawl_competitors) and take one pool slot;
+  * every unit of work is a CompetitorRefreshTask row whose status is written
+    when it starts and when it finishes.
+
+Calling run_competitor_refresh() while a run still has unfinished tasks
+resumes that run: finished tasks are skipped and tasks left "running" by a
+worker that died are retried, up to MAX_ATTEMPTS starts each.  Only runs
+started within RESUME_WINDOW are resumed; the unfinished tasks of older runs
+are failed as abandoned and a fresh run starts.
+
+Public API
+----------
+    run_competitor_refresh(workers=4, max_pages=200, resume=True) -> dict
+"""
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.db import connections
+from django.db.models import Count, F
+from django.utils import timezone
+
+from core.cache import LOCKS
+
+logger = logging.getLogger(__name__)
+
+# Held while a run is in progress so two workers never process the same run;
+# expires on its own if the worker holding it dies.
+LOCK_KEY = "competitor_refresh"
+LOCK_TTL = 60 * 60 * 3
+
+# A task that has been started this many times without finishing is failed
+MAX_ATTEMPTS = 3
+
+# Unfinished runs older than this are abandoned rather than resumed, so a
+# worker lost mid-run doesn't leave the next scheduled refresh finishing a
+# stale run (and missing competitors added since) instead of starting afresh.
+RESUME_WINDOW = timedelta(days=1)
+
+
+def _task_model():
+    from seo_intel.models import CompetitorRefreshTask
+    return CompetitorRefreshTask
+
+
+def _open_run(resume: bool) -> tuple[str, bool]:
+    """Return (run_id, resumed) — the unfinished run within RESUME_WINDOW if any, else a new one."""
+    Task = _task_model()
+    unfinished = [Task.STATUS_PENDING, Task.STATUS_RUNNING]
+    now = timezone.now()
+    abandoned = Task.objects.filter(status__in=unfinished, created_at__lt=now - RESUME_WINDOW).update(
+        status=Task.STATUS_FAILED,
+        detail="Abandoned: run was not resumed in time",
+        finished_at=now,
+    )
+    if abandoned:
+        logger.warning("competitor_refresh: abandoned %d unfinished task(s) of stale runs", abandoned)
+
+    if resume:
+        run_id = (
+            Task.objects.filter(status__in=unfinished)
+            .order_by("-created_at")
+            .values_list("run_id", flat=True)
+            .first()
+        )
+        if run_id:
+            Task.objects.filter(
+                run_id=run_id, status=Task.STATUS_RUNNING, attempts__gte=MAX_ATTEMPTS
+            ).update(
+                status=Task.STATUS_FAILED,
+                detail=f"Gave up after {MAX_ATTEMPTS} interrupted attempts",
+                finished_at=timezone.now(),
+            )
+            Task.objects.filter(run_id=run_id, status=Task.STATUS_RUNNING).update(status=Task.STATUS_PENDING)
+            return run_id, True
+
+    from seo_settings.models import CompetitorDomain
+
+    run_id = timezone.now().strftime("%Y%m%d-%H%M%S")
+    domains = list(
+        CompetitorDomain.objects.filter(active=True).order_by("domain").values_list("domain", flat=True)
+    )
+    Task.objects.bulk_create(
+        [
+            Task(run_id=run_id, domain=domain, kind=kind)
+            for domain in domains
+            for kind, _ in Task.KIND_CHOICES
+        ],
+        ignore_conflicts=True,
+    )
+    return run_id, False
+
+
+def _mark_running(task_ids) -> None:
+    Task = _task_model()
+    Task.objects.filter(pk__in=list(task_ids)).update(
+        status=Task.STATUS_RUNNING, started_at=timezone.now(), attempts=F("attempts") + 1
+    )
+
+
+def _mark_finished(task_id: int, ok: bool, detail: str) -> None:
+    Task = _task_model()
+    Task.objects.filter(pk=task_id).update(
+        status=Task.STATUS_DONE if ok else Task.STATUS_FAILED,
+        detail=detail[:500],
+        finished_at=timezone.now(),
+    )
+
+
+def _run_scan(task_id: int, domain: str, kind: str) -> None:
+    """Directory or social scan of one domain (runs in a pool thread)."""
+    from seo_intel.services.directory_scraper import run_directory_scan
+    from seo_intel.services.social_scraper import run_social_scan
+
+    Task = _task_model()
+    try:
+        _mark_running([task_id])
+        scan = run_directory_scan if kind == Task.KIND_DIRECTORY else run_social_scan
+        results = scan(domain, force=True)
+        found = sum(1 for data in results.values() if data.get("found"))
+        _mark_finished(task_id, True, f"{found}/{len(results)} profiles found")
+    except Exception as exc:
+        logger.exception("competitor_refresh: %s scan of %s failed: %s", kind, domain, exc)
+        _mark_finished(task_id, False, str(exc))
+    finally:
+        connections.close_all()
+
+
+def _run_crawls(tasks: list[tuple[int, str]], max_pages: int, parallel: int) -> None:
+    """Site crawls of every domain in *tasks*, sharing one fetch pool (runs in a pool thread)."""
+    from seo_intel.services.competitor_crawler import _normalise_domain, crawl_competitors
+
+    task_ids = {_normalise_domain(domain): task_id for task_id, domain in tasks}
+
+    def _on_done(domain: str, pages: list[dict] | None, error: Exception | None) -> None:
+        if error is None:
+            _mark_finished(task_ids[domain], True, f"{len(pages)} pages crawled")
+        else:
+            _mark_finished(task_ids[domain], False, str(error))
+        connections.close_all()
+
+    try:
+        _mark_running(task_ids.values())
+        crawl_competitors(list(task_ids), max_pages=max_pages, parallel=parallel, on_done=_on_done)
+    except Exception as exc:
+        logger.exception("competitor_refresh: crawl batch failed: %s", exc)
+        Task = _task_model()
+        Task.objects.filter(pk__in=list(task_ids.values()), status=Task.STATUS_RUNNING).update(
+            status=Task.STATUS_FAILED, detail=str(exc)[:500], finished_at=timezone.now()
+        )
+    finally:
+        connections.close_all()
+
+
+def run_competitor_refresh(workers: int = 4, max_pages: int = 200, resume: bool = True) -> dict:
+    """Refresh crawl, directory and social data for all active competitors.
+
+    *workers* bounds the thread pool (and the number of sites crawled at
+    once).  Returns a summary dict: run_id, resumed, elapsed_s and task
+    counts by status; ``{"status": "busy"}`` if another run holds the lock.
+    """
+    if not LOCKS.add(LOCK_KEY, timezone.now().isoformat(), LOCK_TTL):
+        logger.warning("competitor_refresh: another refresh is already running")
+        return {"status": "busy"}
+
+    started = time.monotonic()
+    try:
+        Task = _task_model()
+        run_id, resumed = _open_run(resume)
+        pending = list(
+            Task.objects.filter(run_id=run_id, status=Task.STATUS_PENDING).values_list("pk", "domain", "kind")
+        )
+        logger.info(
+            "competitor_refresh: %s run %s — %d task(s) to do",
+            "resuming" if resumed else "starting", run_id, len(pending),
+        )
+
+        crawl_tasks = [(pk, domain) for pk, domain, kind in pending if kind == Task.KIND_CRAWL]
+        scan_tasks = [(pk, domain, kind) for pk, domain, kind in pending if kind != Task.KIND_CRAWL]
+        workers = max(workers, 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="competitor-refresh") as pool:
+            futures = []
+            if crawl_tasks:
+                futures.append(pool.submit(_run_crawls, crawl_tasks, max_pages, workers))
+            futures += [pool.submit(_run_scan, *task) for task in scan_tasks]
+            wait(futures)
+
+        counts = dict(
+            Task.objects.filter(run_id=run_id).order_by().values_list("status").annotate(n=Count("id"))
+        )
+    finally:
+        LOCKS.delete(LOCK_KEY)
+
+    summary = {
+        "status": "ok",
+        "run_id": run_id,
+        "resumed": resumed,
+        "elapsed_s": round(time.monotonic() - started, 1),
+        **{status: counts.get(status, 0) for status, _ in Task.STATUS_CHOICES},
+    }
+    logger.info("competitor_refresh: run %s finished — %s", run_id, summary)
+    return summary
@@ -9,11 +9,13 @@ LC Psych ranks for (SearchConsoleQuery) and what the site already has
 
 Public API
 ----------
-    run_gap_analysis()  -> GapSummary
+    run_gap_analysis(min_impressions=0, prune=True)  -> GapSummary
 
     GapSummary.created  — new ContentGapRecord rows written
-    GapSummary.updated  — existing rows refreshed
-    GapSummary.total    — total rows in this run
+    GapSummary.updated  — existing rows whose analysis changed
+    GapSummary.unchanged — existing rows only re-stamped with this run's time
+    GapSummary.pruned   — rows deleted because their keyword left the universe
+    GapSummary.total    — keywords analysed in this run
     GapSummary.by_action — dict mapping action label → count
     GapSummary.keywords — list of GapKeyword dataclass instances
 
@@ -30,6 +32,10 @@ Internal pipeline
    b. competitor_presence = keyword in CompetitorSERPResult
    c. search_volume      = total impressions from GSC (0 if not in GSC)
    d. recommended_action = classify() — see rules below
+6. Diff the results against the existing ContentGapRecord rows in memory and
+   write them with chunked bulk_create / bulk_update calls; rows whose keyword
+   is no longer in the universe are deleted unless marked resolved or
+   ignored.  resolved / ignored are never overwritten.
 
 Recommended action classification (first match wins)
 ------------------------------------------------------
@@ -48,9 +54,19 @@ import re
 from dataclasses import dataclass, field
 from typing import DefaultDict
 
+from django.db import transaction
 from django.db.models import Sum
 from django.utils import timezone
 
+from seo_intel.services.keyword_matcher import matcher_for
+
+
+# Rows per bulk INSERT / UPDATE / DELETE statement
+BATCH_SIZE = 500
+
+# Fields the analysis owns; resolved / ignored belong to the reviewer
+_ANALYSIS_FIELDS = ("search_volume", "lcpsych_presence", "competitor_presence", "recommended_action")
+
 
 # ---------------------------------------------------------------------------
 # Domain vocabulary — keyword signal dictionaries
@@ -105,6 +121,8 @@ class GapKeyword:
 class GapSummary:
     created: int = 0
     updated: int = 0
+    unchanged: int = 0
+    pruned: int = 0
     by_action: DefaultDict[str, int] = field(
         default_factory=lambda: DefaultDict(int)
     )
@@ -112,7 +130,7 @@ class GapSummary:
 
     @property
     def total(self) -> int:
-        return self.created + self.updated
+        return self.created + self.updated + self.unchanged
 
 
 # ---------------------------------------------------------------------------
@@ -175,10 +193,7 @@ def _normalise(text: str) -> str:
 
 
 def _contains_any(text: str, signals: frozenset[str]) -> bool:
-    for signal in signals:
-        if signal in text:
-            return True
-    return False
+    return matcher_for(signals).contains_any(text)
 
 
 def _keyword_touches_catalog(keyword: str, catalog_terms: set[str]) -> bool:
@@ -244,7 +259,73 @@ def classify_keyword(
 # Main engine
 # ---------------------------------------------------------------------------
 
-def run_gap_analysis(min_impressions: int = 0) -> GapSummary:
+def _write_records(keywords: list[GapKeyword], now, *, prune: bool, summary: GapSummary) -> None:
+    """
+    Bring ContentGapRecord in line with *keywords* using bulk statements.
+
+    Existing rows are loaded once and compared in memory: new keywords are
+    bulk-created, rows whose analysis changed are bulk-updated, and the rest
+    only get their timestamp moved to *now*.  With *prune*, rows for keywords
+    outside *keywords* (and duplicate rows for one keyword) are deleted unless
+    a reviewer marked them resolved or ignored.
+    """
+    from seo_intel.models import ContentGapRecord
+
+    existing: dict[str, ContentGapRecord] = {}
+    stale_pks: list[int] = []
+    for record in ContentGapRecord.objects.only(
+        "pk", "keyword", "resolved", "ignored", *_ANALYSIS_FIELDS
+    ).order_by("pk"):
+        if record.keyword not in existing:
+            existing[record.keyword] = record
+        elif not (record.resolved or record.ignored):
+            stale_pks.append(record.pk)
+
+    to_create: list[ContentGapRecord] = []
+    to_update: list[ContentGapRecord] = []
+    unchanged_pks: list[int] = []
+    for kw in keywords:
+        values = {
+            "search_volume": kw.search_volume,
+            "lcpsych_presence": kw.lcpsych_presence,
+            "competitor_presence": kw.competitor_presence,
+            "recommended_action": kw.recommended_action,
+        }
+        record = existing.pop(kw.keyword, None)
+        if record is None:
+            to_create.append(ContentGapRecord(keyword=kw.keyword, timestamp=now, **values))
+        elif any(getattr(record, name) != value for name, value in values.items()):
+            for name, value in values.items():
+                setattr(record, name, value)
+            record.timestamp = now
+            to_update.append(record)
+        else:
+            unchanged_pks.append(record.pk)
+
+    # Whatever is left in existing has dropped out of the universe
+    stale_pks += [r.pk for r in existing.values() if not (r.resolved or r.ignored)]
+
+    with transaction.atomic():
+        ContentGapRecord.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        ContentGapRecord.objects.bulk_update(
+            to_update, [*_ANALYSIS_FIELDS, "timestamp"], batch_size=BATCH_SIZE
+        )
+        for start in range(0, len(unchanged_pks), BATCH_SIZE):
+            ContentGapRecord.objects.filter(
+                pk__in=unchanged_pks[start:start + BATCH_SIZE]
+            ).update(timestamp=now)
+        if prune:
+            for start in range(0, len(stale_pks), BATCH_SIZE):
+                summary.pruned += ContentGapRecord.objects.filter(
+                    pk__in=stale_pks[start:start + BATCH_SIZE]
+                ).delete()[0]
+
+    summary.created += len(to_create)
+    summary.updated += len(to_update)
+    summary.unchanged += len(unchanged_pks)
+
+
+def run_gap_analysis(min_impressions: int = 0, prune: bool = True) -> GapSummary:
     """
     Run the full content gap analysis pipeline.
 
@@ -254,16 +335,15 @@ def run_gap_analysis(min_impressions: int = 0) -> GapSummary:
         Exclude keywords with total impressions below this threshold when
         sourced from GSC.  Competitor-sourced keywords always pass through
         (they have 0 impressions in our GSC data by definition).
+    prune:
+        Delete records for keywords no longer in the universe, except those
+        marked resolved or ignored.
 
     Returns
     -------
     GapSummary with counts and full keyword list.
     """
-    from seo_intel.models import (
-        CompetitorSERPResult,
-        ContentGapRecord,
-        SearchConsoleQuery,
-    )
+    from seo_intel.models import CompetitorSERPResult, SearchConsoleQuery
 
     now = timezone.now()
     catalog = _build_site_catalog()
@@ -318,20 +398,7 @@ def run_gap_analysis(min_impressions: int = 0) -> GapSummary:
         summary.keywords.append(gap_kw)
         summary.by_action[recommended_action] += 1
 
-        # Upsert: one record per keyword (latest run wins)
-        obj, created = ContentGapRecord.objects.update_or_create(
-            keyword=keyword,
-            defaults={
-                "search_volume": impressions,
-                "lcpsych_presence": lcpsych_presence,
-                "competitor_presence": competitor_presence,
-                "recommended_action": recommended_action,
-                "timestamp": now,
-            },
-        )
-        if created:
-            summary.created += 1
-        else:
-            summary.updated += 1
+    # ---- Step 5: write (one record per keyword, latest run wins) ----------
+    _write_records(summary.keywords, now, prune=prune, summary=summary)
 
     return summary
@@ -33,13 +33,15 @@ from __future__ import annotations
 import logging
 import os
 import re
-import time
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
-from django.core.cache import cache
+
+from core.cache import DIRECTORY
+from seo_intel.services.politeness import HOST_THROTTLE
+from seo_intel.services.serp_cache import cached_search
 
 logger = logging.getLogger(__name__)
 
@@ -85,24 +87,29 @@ def _get_serpapi_key() -> str:
     return key
 
 
-def _serpapi_request(params: dict) -> dict:
-    """Make a SerpAPI request. Returns parsed JSON or raises RuntimeError."""
+def _serpapi_request(params: dict, caller: str = "profile_lookup") -> dict:
+    """Make a SerpAPI request (through the SERP cache). Returns parsed JSON or raises RuntimeError."""
     key = _get_serpapi_key()
     if not key:
         raise RuntimeError("SERPAPI_KEY not configured")
     params = {**params, "api_key": key, "no_cache": "false"}
-    resp = requests.get(
-        "https://serpapi.com/search.json",
-        params=params,
-        timeout=_REQUEST_TIMEOUT,
-    )
-    resp.raise_for_status()
-    return resp.json()
+
+    def _fetch() -> dict:
+        resp = requests.get(
+            "https://serpapi.com/search.json",
+            params=params,
+            timeout=_REQUEST_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    return cached_search(caller, params, _fetch)
 
 
 def _fetch_html(url: str, timeout: int = _REQUEST_TIMEOUT) -> BeautifulSoup | None:
     """Fetch a page and return a BeautifulSoup tree, or None on error."""
     try:
+        HOST_THROTTLE.wait(url)
         resp = requests.get(url, headers=_HEADERS, timeout=timeout, allow_redirects=True)
         resp.raise_for_status()
         return BeautifulSoup(resp.text, "html.parser")
@@ -224,7 +231,7 @@ def _scrape_gbp(domain: str, business_name: str) -> dict:
             "type": "search",
             "gl": "us",
             "hl": "en",
-        })
+        }, caller="business_profile")
     except Exception as exc:
         return {"error": str(exc), "found": False}
 
@@ -492,8 +499,6 @@ def _scrape_platform(domain: str, platform: str, business_name: str) -> dict:
     if not profile_url:
         return {"found": False, "error": "Profile URL not found via SerpAPI"}
 
-    time.sleep(0.5)  # polite delay between pages
-
     scrapers = {
         "psychology_today": _scrape_psychology_today,
         "therapyden": _scrape_therapyden,
@@ -512,8 +517,7 @@ def _scrape_platform(domain: str, platform: str, business_name: str) -> dict:
 
 
 def _cache_key(domain: str) -> str:
-    safe = re.sub(r"[^a-z0-9]", "_", domain.lower())
-    return f"dir_profiles:{safe}"
+    return re.sub(r"[^a-z0-9]", "_", domain.lower())
 
 
 def _upsert_db(domain: str, platform: str, data: dict) -> None:
@@ -538,7 +542,7 @@ def run_directory_scan(domain: str, force: bool = False) -> dict[str, dict]:
     """
     ck = _cache_key(domain)
     if not force:
-        cached = cache.get(ck)
+        cached = DIRECTORY.get(ck)
         if cached is not None:
             return cached
 
@@ -558,7 +562,7 @@ def run_directory_scan(domain: str, force: bool = False) -> dict[str, dict]:
         results[platform] = data
         _upsert_db(domain, platform, data)
 
-    cache.set(ck, results, DIRECTORY_CACHE_TTL)
+    DIRECTORY.set(ck, results, DIRECTORY_CACHE_TTL)
     return results
 
 
@@ -569,7 +573,7 @@ def get_cached_directory_data(domain: str) -> dict[str, dict]:
     an empty dict as value.
     """
     ck = _cache_key(domain)
-    cached = cache.get(ck)
+    cached = DIRECTORY.get(ck)
     if cached is not None:
         return cached
 
@@ -583,10 +587,10 @@ def get_cached_directory_data(domain: str) -> dict[str, dict]:
     for row in rows:
         result[row.platform] = row.data or {}
 
-    cache.set(ck, result, DIRECTORY_CACHE_TTL)
+    DIRECTORY.set(ck, result, DIRECTORY_CACHE_TTL)
     return result
 
 
 def invalidate_directory_cache(domain: str) -> None:
     """Remove the directory cache for *domain*."""
-    cache.delete(_cache_key(domain))
+    DIRECTORY.delete(_cache_key(domain))
@@ -14,28 +14,37 @@ C. CompetitorHit       — keywords competitors rank for that LC Psych doesn't
 D. InternalSearchQuery — site search terms not in the seed list
 E. DeadURLHit          — 404 URL paths that imply missing service/location pages
 
-Results are cached for 15 minutes (configurable via _CACHE_TTL).
+Opportunities are persisted in DiscoveredKeyword and maintained
+incrementally by refresh_discovery(): each source reads only the rows added
+since its DiscoveryWatermark, rebuilds its time window in full at most once
+a day, and records what it found as a per-source signal on the keyword's
+row; only the keywords whose signals changed are re-merged and re-scored.
+run_discovery() just reads the store, so every process (and dyno) sees the
+same results.  The store is refreshed every 15 minutes by the
+refresh_keyword_discovery task and after SERP runs.
 
 Public API
 ----------
-    run_discovery() -> list[dict]
+    run_discovery(*, force=False) -> list[dict]
+    refresh_discovery(*, full=False) -> dict
 """
 from __future__ import annotations
 
 import hashlib
 import logging
 import re
+import time
 from datetime import date, timedelta
 from urllib.parse import urlparse
 
-from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Count, Sum
 from django.utils import timezone
 
-logger = logging.getLogger(__name__)
+from core.cache import LOCKS
+from seo_intel.services.keyword_matcher import matcher_for
 
-_CACHE_KEY = "kw_discovery_v1"
-_CACHE_TTL  = 60 * 15   # 15 minutes
+logger = logging.getLogger(__name__)
 
 # ── Source identifiers ────────────────────────────────────────────────────
 SRC_SC         = "search_console"
@@ -108,13 +117,11 @@ _KW_MAX_WORDS = 8
 # ---------------------------------------------------------------------------
 
 def _has_local(kw: str) -> bool:
-    kw_l = kw.lower()
-    return any(t in kw_l for t in _LOCAL_TERMS)
+    return matcher_for(_LOCAL_TERMS).contains_any(kw)
 
 
 def _has_commercial(kw: str) -> bool:
-    kw_l = kw.lower()
-    return any(t in kw_l for t in _COMMERCIAL_TERMS)
+    return matcher_for(_COMMERCIAL_TERMS).contains_any(kw)
 
 
 def _word_count(kw: str) -> int:
@@ -355,68 +362,152 @@ def _merge(pool: dict[str, dict], entry: dict) -> None:
         existing["lc_rank"] = entry["lc_rank"]
 
 
+# ---------------------------------------------------------------------------
+# Candidate store
+# ---------------------------------------------------------------------------
+#
+# Each source records what it found for a keyword as a *signal* on that
+# keyword's DiscoveredKeyword row: {"args": _build_entry kwargs, "meta": {...}}.
+# A source reads only rows newer than its DiscoveryWatermark and rebuilds its
+# time window in full once a day (when the window has moved); the keywords
+# whose signals changed are then re-merged and re-scored, nothing else.
+
+# Signal keys, in the order their entries are merged
+SIG_SC          = "search_console"
+SIG_SUGGESTION  = "suggestion"
+SIG_SERP_TITLE  = "serp_title"
+SIG_COMPETITOR  = "competitor"
+SIG_INTERNAL    = "internal"
+SIG_DEAD_URL    = "dead_url"
+
+_SIGNAL_ORDER = (SIG_SC, SIG_SUGGESTION, SIG_SERP_TITLE, SIG_COMPETITOR, SIG_INTERNAL, SIG_DEAD_URL)
+
+_LOCK_KEY = "keyword_discovery"
+_LOCK_TTL = 60 * 30
+
+# Keys per ``__in`` lookup / rows per bulk statement
+_CHUNK = 500
+
+# Organic results tokenised for title phrases: the top 5 of the latest 100 SERPs
+_SERP_WINDOW = 100
+_SERP_TOP_RESULTS = 5
+
+_WINDOW_DAYS = 90
+
+
+def _norm(keyword: str) -> str:
+    return keyword.strip().lower()
+
+
+def _chunks(items, size: int = _CHUNK):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# _build_entry keyword arguments a signal stores under "args"
+_ENTRY_ARGS = frozenset({
+    "source_detail", "impressions_7d", "impressions_prev_7d", "competitor_domains",
+    "competitor_hits", "top_competitor_rank", "lc_rank", "category",
+})
+
+
+def _signal(keyword: str, source: str, **meta) -> dict:
+    """A signal value; *meta* kwargs that _build_entry accepts go to args."""
+    args = {"keyword": keyword.strip(), "source": source}
+    extra = {}
+    for name, value in meta.items():
+        if name in _ENTRY_ARGS:
+            args[name] = value
+        else:
+            extra[name] = value
+    return {"args": args, "meta": extra}
+
+
+class _Changes:
+    """Signal updates collected from the sources, written by _apply()."""
+
+    def __init__(self):
+        self.updates: dict[str, dict[str, dict | None]] = {}
+
+    def set(self, key: str, signal: str, value: dict) -> None:
+        self.updates.setdefault(key, {})[signal] = value
+
+    def drop(self, key: str, signal: str) -> None:
+        self.updates.setdefault(key, {})[signal] = None
+
+    def replace(self, signal: str, found: dict[str, dict], stale) -> None:
+        """Set *found* signals and drop *signal* from the *stale* keys not in it."""
+        for key, value in found.items():
+            self.set(key, signal, value)
+        for key in stale:
+            if key not in found:
+                self.drop(key, signal)
+
+
+def _holders(signal: str) -> dict[str, dict]:
+    """keyword_norm -> stored *signal* value, for every candidate that has one."""
+    from seo_intel.models import DiscoveredKeyword
+
+    return {
+        key: signals[signal]
+        for key, signals in DiscoveredKeyword.objects.filter(signals__has_key=signal)
+        .values_list("keyword_norm", "signals")
+    }
+
+
+def _max_pk(model) -> int:
+    return model.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+
+
 # ---------------------------------------------------------------------------
 # Source A: Search Console
 # ---------------------------------------------------------------------------
 
-def _from_search_console(existing_seeds: set[str]) -> list[dict]:
+def _search_console_signals(keys: list[str] | None, today: date) -> dict[str, dict]:
     """
-    Yield keyword opportunities from SearchConsoleQuery:
-      1. Rising queries (last 7d vs prior 7d, delta > 10%)
-      2. High-impression queries not in seeds
-      3. Zero-click queries (impressions > 5, clicks == 0)
+    Rising and breakout queries (last 7d vs prior 7d) among *keys*, or among
+    all queries when *keys* is None.
     """
+    from django.db.models import Min
+
     from seo_intel.models import SearchConsoleQuery
 
-    today    = date.today()
-    wk_end   = today - timedelta(days=1)
-    wk_start = today - timedelta(days=7)
-    prev_end = today - timedelta(days=8)
+    wk_end     = today - timedelta(days=1)
+    wk_start   = today - timedelta(days=7)
+    prev_end   = today - timedelta(days=8)
     prev_start = today - timedelta(days=14)
 
-    # Aggregate last-7d
-    recent = (
-        SearchConsoleQuery.objects
-        .filter(date__gte=wk_start, date__lte=wk_end)
-        .values("query")
-        .annotate(
-            impressions=Sum("impressions"),
-            clicks=Sum("clicks"),
-        )
-    )
-    recent_map: dict[str, dict] = {
-        r["query"].lower(): r for r in recent
-    }
-
-    # Aggregate prior-7d
-    prior = (
-        SearchConsoleQuery.objects
-        .filter(date__gte=prev_start, date__lte=prev_end)
-        .values("query")
-        .annotate(impressions=Sum("impressions"))
-    )
-    prior_map: dict[str, int] = {
-        p["query"].lower(): p["impressions"] for p in prior
-    }
-
-    results: list[dict] = []
-    seen: set[str] = set()
-
+    recent_map: dict[str, dict] = {}
+    prior_map: dict[str, int] = {}
+    for chunk in (_chunks(keys) if keys is not None else [None]):
+        base = SearchConsoleQuery.objects.all()
+        if chunk is not None:
+            base = base.filter(keyword_norm__in=chunk)
+        for r in (
+            base.filter(date__gte=wk_start, date__lte=wk_end)
+            .values("keyword_norm")
+            .annotate(query=Min("query"), impressions=Sum("impressions"), clicks=Sum("clicks"))
+            .order_by()
+        ):
+            recent_map[r["keyword_norm"]] = r
+        for p in (
+            base.filter(date__gte=prev_start, date__lte=prev_end)
+            .values("keyword_norm")
+            .annotate(impressions=Sum("impressions"))
+            .order_by()
+        ):
+            prior_map[p["keyword_norm"]] = p["impressions"]
+
+    found: dict[str, dict] = {}
     for kw_lower, r in recent_map.items():
-        kw       = r["query"]
-        impr     = r["impressions"] or 0
-        clicks   = r["clicks"] or 0
-        prev_i   = prior_map.get(kw_lower, 0)
+        kw     = r["query"].strip()
+        impr   = r["impressions"] or 0
+        prev_i = prior_map.get(kw_lower, 0) or 0
 
-        # Skip if already a seed
-        if kw_lower in existing_seeds:
-            continue
         # Skip very short / single-word queries
         if not _is_plausible_keyword(kw):
             continue
-        if kw_lower in seen:
-            continue
-        seen.add(kw_lower)
 
         # Classify signal — only include trending/rising queries
         if prev_i == 0 and impr > 0:
@@ -429,178 +520,223 @@ def _from_search_console(existing_seeds: set[str]) -> list[dict]:
         else:
             continue
 
-        entry = _build_entry(
+        found[_norm(kw)] = _signal(
             kw,
             SRC_SC,
             source_detail=detail,
             impressions_7d=impr,
             impressions_prev_7d=prev_i,
         )
-        results.append(entry)
+    return found
 
-    return results
+
+def _refresh_search_console(mark, changes: _Changes, today: date) -> None:
+    """
+    Rebuilt in full when the day changes (the 7-day windows move); otherwise
+    only the queries on days whose Search Console pull completed since the
+    last refresh are re-evaluated.
+    """
+    from datetime import datetime
+
+    from django.db.models import Max
+
+    from seo_intel.models import SearchConsoleCheckpoint, SearchConsoleQuery
+
+    latest = SearchConsoleCheckpoint.objects.aggregate(latest=Max("completed_at"))["latest"]
+
+    if mark.window_day != today:
+        changes.replace(SIG_SC, _search_console_signals(None, today), _holders(SIG_SC))
+    else:
+        since = mark.cursor.get("checkpoint")
+        if latest is None or (since and latest <= datetime.fromisoformat(since)):
+            return
+        days = SearchConsoleCheckpoint.objects.filter(date__gte=today - timedelta(days=14))
+        if since:
+            days = days.filter(completed_at__gt=datetime.fromisoformat(since))
+        keys = set(
+            SearchConsoleQuery.objects.filter(date__in=list(days.values_list("date", flat=True)))
+            .values_list("keyword_norm", flat=True)
+            .distinct()
+        )
+        changes.replace(SIG_SC, _search_console_signals(sorted(keys), today), keys)
+
+    mark.cursor = {"checkpoint": latest.isoformat()} if latest else {}
+    mark.window_day = today
 
 
 # ---------------------------------------------------------------------------
 # Source B: SerpAPI Expansions (PAA + Related + Organic title phrases)
 # ---------------------------------------------------------------------------
 
-def _from_serpapi_expansions(existing_seeds: set[str]) -> list[dict]:
+def _refresh_suggestions(mark, changes: _Changes, today: date) -> None:
     """
-    Yield keyword opportunities from stored KeywordSuggestion records
-    (PAA and related searches captured during previous SERP runs).
-    Also extracts phrase candidates from SerpRawResult organic titles.
+    PAA and related searches captured during SERP runs.  New suggestions are
+    added as they arrive; the full set is re-read once a day so promoted
+    (used_as_seed) suggestions drop out.
     """
-    from seo_intel.models import KeywordSuggestion, SerpRawResult
-
-    results: list[dict] = []
-    seen: set[str] = set()
-
-    # ── PAA and Related ──────────────────────────────────────────────────
-    for s in KeywordSuggestion.objects.filter(used_as_seed=False):
-        kw      = s.suggestion.strip()
-        kw_lower = kw.lower()
-        if kw_lower in existing_seeds or kw_lower in seen:
+    from seo_intel.models import KeywordSuggestion
+
+    high = _max_pk(KeywordSuggestion)
+    full = mark.window_day != today
+    qs = KeywordSuggestion.objects.filter(used_as_seed=False)
+    if not full:
+        if high <= mark.cursor.get("id", 0):
+            return
+        qs = qs.filter(pk__gt=mark.cursor.get("id", 0), pk__lte=high)
+
+    found: dict[str, dict] = {}
+    for s in qs.only("suggestion", "source_keyword", "source_type"):
+        kw = s.suggestion.strip()
+        key = _norm(kw)
+        if key in found or not _is_plausible_keyword(kw):
             continue
-        if not _is_plausible_keyword(kw):
-            continue
-        seen.add(kw_lower)
         source = SRC_PAA if s.source_type == KeywordSuggestion.PAA else SRC_RELATED
-        entry  = _build_entry(
-            kw,
-            source,
-            source_detail=f"from seed: {s.source_keyword}",
-        )
-        results.append(entry)
+        found[key] = _signal(kw, source, source_detail=f"from seed: {s.source_keyword}")
 
-    # ── Organic title phrase extraction ─────────────────────────────────
-    _STOPWORDS = frozenset(
-        "a an the and or but in on at to for of with is are was were be been being "
-        "have has had do does did will would could should may might shall can "
-        "our we you your it its this that these those i me my".split()
-    )
+    changes.replace(SIG_SUGGESTION, found, _holders(SIG_SUGGESTION) if full else ())
+    mark.cursor = {"id": high}
+    mark.window_day = today
 
-    def _phrases_from_title(title: str) -> list[str]:
-        """Extract 2-4 word meaningful sub-phrases from an organic title."""
-        # Clean separators
-        clean = re.sub(r"[|•–—/]", " ", title)
-        clean = re.sub(r"\s+", " ", clean).strip()
-        words = [w.strip(",:;.\"'()[]") for w in clean.split()]
-        phrases = []
-        for size in (4, 3, 2):
-            for i in range(len(words) - size + 1):
-                chunk = words[i : i + size]
-                # Skip if starts or ends with stopword
-                if chunk[0].lower() in _STOPWORDS or chunk[-1].lower() in _STOPWORDS:
-                    continue
-                phrase = " ".join(chunk)
-                if _is_plausible_keyword(phrase):
-                    phrases.append(phrase)
-        return phrases
 
-    recent_serps = SerpRawResult.objects.order_by("-timestamp")[:100]
-    for serp_rec in recent_serps:
+_STOPWORDS = frozenset(
+    "a an the and or but in on at to for of with is are was were be been being "
+    "have has had do does did will would could should may might shall can "
+    "our we you your it its this that these those i me my".split()
+)
+
+
+def _phrases_from_title(title: str) -> list[str]:
+    """Extract 2-4 word meaningful sub-phrases from an organic title."""
+    # Clean separators
+    clean = re.sub(r"[|•–—/]", " ", title)
+    clean = re.sub(r"\s+", " ", clean).strip()
+    words = [w.strip(",:;.\"'()[]") for w in clean.split()]
+    phrases = []
+    for size in (4, 3, 2):
+        for i in range(len(words) - size + 1):
+            chunk = words[i : i + size]
+            # Skip if starts or ends with stopword
+            if chunk[0].lower() in _STOPWORDS or chunk[-1].lower() in _STOPWORDS:
+                continue
+            phrase = " ".join(chunk)
+            if _is_plausible_keyword(phrase):
+                phrases.append(phrase)
+    return phrases
+
+
+def _refresh_serp_titles(mark, changes: _Changes, today: date) -> None:
+    """
+    Phrases from the organic titles of the latest SERPs.  Each phrase
+    remembers the SERPs it came from (meta.serp_ids): SERPs entering the
+    window are tokenised once, and a phrase is dropped when the last SERP it
+    came from leaves the window.
+    """
+    from seo_intel.models import SerpRawResult
+
+    window = list(
+        SerpRawResult.objects.order_by("-timestamp").values_list("pk", flat=True)[:_SERP_WINDOW]
+    )
+    if mark.cursor.get("window") == window:
+        return
+    current = set(window)
+    holders = _holders(SIG_SERP_TITLE)
+    touched: dict[str, dict] = {}
+
+    # Phrases whose SERPs have all left the window
+    for key, value in holders.items():
+        ids = [pk for pk in value["meta"].get("serp_ids", []) if pk in current]
+        if len(ids) != len(value["meta"].get("serp_ids", [])):
+            touched[key] = {**value, "meta": {**value["meta"], "serp_ids": ids}}
+
+    previous = set(mark.cursor.get("window", []))
+    added = [pk for pk in window if pk not in previous]
+    for serp_rec in SerpRawResult.objects.filter(pk__in=added).order_by("-timestamp").only("payload"):
         parsed = serp_rec.payload.get("parsed", {}) if isinstance(serp_rec.payload, dict) else {}
-        organic = parsed.get("organic", [])
-        for result in organic[:5]:  # top 5 results only
+        for result in parsed.get("organic", [])[:_SERP_TOP_RESULTS]:
             title = result.get("title", "")
             if not title:
                 continue
             for phrase in _phrases_from_title(title):
-                kw_lower = phrase.lower()
-                if kw_lower in existing_seeds or kw_lower in seen:
-                    continue
                 if not (_has_local(phrase) or _has_commercial(phrase)):
                     continue
-                seen.add(kw_lower)
-                entry = _build_entry(
-                    phrase,
-                    SRC_RELATED,
-                    source_detail=f"organic title: {title[:50]}",
-                )
-                results.append(entry)
-
-    return results
+                key = _norm(phrase)
+                value = touched.get(key) or holders.get(key)
+                if value is None:
+                    value = _signal(phrase, SRC_RELATED, source_detail=f"organic title: {title[:50]}", serp_ids=[])
+                ids = value["meta"].get("serp_ids", [])
+                if serp_rec.pk not in ids:
+                    touched[key] = {**value, "meta": {**value["meta"], "serp_ids": [*ids, serp_rec.pk]}}
+
+    for key, value in touched.items():
+        if value["meta"]["serp_ids"]:
+            changes.set(key, SIG_SERP_TITLE, value)
+        else:
+            changes.drop(key, SIG_SERP_TITLE)
+    mark.cursor = {"window": window}
+    mark.window_day = today
 
 
 # ---------------------------------------------------------------------------
 # Source C: Competitor gaps
 # ---------------------------------------------------------------------------
 
-def _from_competitors(existing_seeds: set[str]) -> list[dict]:
+def _competitor_signals(keys: list[str] | None) -> dict[str, dict]:
     """
-    Keywords where competitors appear in SERP but LC Psych does not.
-    Also flags keywords where competitors dominate the top 3.
+    Keywords among *keys* (all when None) where competitors appear in SERP,
+    with LC Psych's best rank.  Also flags keywords where competitors
+    dominate the top 3.
     """
     from seo_intel.models import CompetitorHit, LCPsychHit
+    from seo_settings.models import CompetitorDomain
 
-    cutoff = timezone.now() - timedelta(days=90)
-
-    # All keywords with competitor hits (recent)
-    competitor_keywords = set(
-        CompetitorHit.objects
-        .filter(timestamp__gte=cutoff)
-        .values_list("keyword", flat=True)
-        .distinct()
-    )
+    cutoff = timezone.now() - timedelta(days=_WINDOW_DAYS)
 
-    # LC Psych ranks by keyword
-    lc_ranks: dict[str, int] = {}
-    for hit in LCPsychHit.objects.filter(timestamp__gte=cutoff).order_by("rank"):
-        kl = hit.keyword.lower()
-        if kl not in lc_ranks:
-            lc_ranks[kl] = hit.rank
-
-    # Pre-fetch CompetitorDomain labels — used as the authoritative display name
-    # when set, falling back to title-derived names.
-    from seo_settings.models import CompetitorDomain as _CD
-    _domain_labels: dict[str, str] = {
+    # CompetitorDomain labels are the authoritative display name when set,
+    # falling back to title-derived names.
+    domain_labels: dict[str, str] = {
         cd["domain"].lower().removeprefix("www."): cd["label"]
-        for cd in _CD.objects.values("domain", "label")
+        for cd in CompetitorDomain.objects.values("domain", "label")
         if cd["label"]
     }
 
-    results: list[dict] = []
-    seen: set[str] = set()
-
-    for kw in competitor_keywords:
-        kw_lower = kw.lower()
-        if kw_lower in existing_seeds or kw_lower in seen:
-            continue
+    hits_by_kw: dict[str, list[dict]] = {}
+    lc_ranks: dict[str, int] = {}
+    for chunk in (_chunks(keys) if keys is not None else [None]):
+        comp_qs = CompetitorHit.objects.filter(timestamp__gte=cutoff)
+        lc_qs = LCPsychHit.objects.filter(timestamp__gte=cutoff)
+        if chunk is not None:
+            comp_qs = comp_qs.filter(keyword_norm__in=chunk)
+            lc_qs = lc_qs.filter(keyword_norm__in=chunk)
+        for h in comp_qs.order_by("rank").values("keyword", "keyword_norm", "competitor_domain", "rank", "title"):
+            hits_by_kw.setdefault(h["keyword_norm"], []).append(h)
+        for kl, rank in lc_qs.order_by("rank").values_list("keyword_norm", "rank"):
+            lc_ranks.setdefault(kl, rank)
+
+    found: dict[str, dict] = {}
+    for kw_lower, comp_hits in hits_by_kw.items():
+        kw = comp_hits[0]["keyword"].strip()
         if not _is_plausible_keyword(kw):
             continue
-        seen.add(kw_lower)
-
-        # Gather competitor domains + best rank per domain
-        comp_hits = (
-            CompetitorHit.objects
-            .filter(keyword__iexact=kw, timestamp__gte=cutoff)
-            .order_by("rank")
-            .values("competitor_domain", "rank", "title")
-        )
-        domains_seen: set[str] = set()
+
+        # Competitor domains + best rank per domain
         domains: list[str] = []
         hits: list[dict] = []   # [{domain, rank, name}] — best rank per domain
-        top_rank: int | None = None
         top3_count = 0
         for h in comp_hits:
             d, r = h["competitor_domain"], h["rank"]
-            if d not in domains_seen:
-                domains_seen.add(d)
-                domains.append(d)
-                _clean_d = d.lower().removeprefix("www.")
-                hits.append({
-                    "domain": d,
-                    "rank": r,
-                    "name": (
-                        _domain_labels.get(_clean_d)
-                        or _site_name_from_title(h.get("title", ""), d)
-                    ),
-                })
-                if top_rank is None:
-                    top_rank = r
-                if r <= 3:
-                    top3_count += 1
+            if d in domains:
+                continue
+            domains.append(d)
+            hits.append({
+                "domain": d,
+                "rank": r,
+                "name": (
+                    domain_labels.get(d.lower().removeprefix("www."))
+                    or _site_name_from_title(h.get("title", ""), d)
+                ),
+            })
+            if r <= 3:
+                top3_count += 1
 
         lc_rank = lc_ranks.get(kw_lower)
 
@@ -610,56 +746,96 @@ def _from_competitors(existing_seeds: set[str]) -> list[dict]:
         if top3_count >= 2:
             detail.append(f"{top3_count} competitors in top 3")
 
-        entry = _build_entry(
+        found[_norm(kw)] = _signal(
             kw,
             SRC_COMPETITOR,
             source_detail=", ".join(detail) if detail else f"{len(domains)} competitors",
             competitor_domains=domains,
             competitor_hits=hits,
-            top_competitor_rank=top_rank,
+            top_competitor_rank=hits[0]["rank"],
             lc_rank=lc_rank,
         )
-        results.append(entry)
+    return found
 
-    return results
+
+def _refresh_competitors(mark, changes: _Changes, today: date) -> None:
+    """
+    Re-evaluates the keywords with competitor or LC Psych hits recorded since
+    the last refresh; rebuilt in full once a day as the 90-day window moves.
+    """
+    from seo_intel.models import CompetitorHit, LCPsychHit
+
+    comp_high, lc_high = _max_pk(CompetitorHit), _max_pk(LCPsychHit)
+    comp_low, lc_low = mark.cursor.get("competitor_hit", 0), mark.cursor.get("lcpsych_hit", 0)
+
+    if mark.window_day != today:
+        changes.replace(SIG_COMPETITOR, _competitor_signals(None), _holders(SIG_COMPETITOR))
+    elif comp_high > comp_low or lc_high > lc_low:
+        keys = set(
+            CompetitorHit.objects.filter(pk__gt=comp_low, pk__lte=comp_high)
+            .values_list("keyword_norm", flat=True)
+        ) | set(
+            LCPsychHit.objects.filter(pk__gt=lc_low, pk__lte=lc_high)
+            .values_list("keyword_norm", flat=True)
+        )
+        changes.replace(SIG_COMPETITOR, _competitor_signals(sorted(keys)), keys)
+    else:
+        return
+
+    mark.cursor = {"competitor_hit": comp_high, "lcpsych_hit": lc_high}
+    mark.window_day = today
 
 
 # ---------------------------------------------------------------------------
 # Source D: Internal search
 # ---------------------------------------------------------------------------
 
-def _from_internal_search(existing_seeds: set[str]) -> list[dict]:
-    """Terms typed into the site's own search that are not in the seed list."""
+def _refresh_internal_search(mark, changes: _Changes, today: date) -> None:
+    """
+    Terms typed into the site's own search by at least two users in the last
+    90 days.  New searches re-count only their own terms; the window is
+    rebuilt in full once a day.
+    """
+    from django.db.models import Min
+    from django.db.models.functions import Lower, Trim
+
     from seo_intel.models import InternalSearchQuery
 
-    cutoff = timezone.now() - timedelta(days=90)
-    terms  = (
+    high = _max_pk(InternalSearchQuery)
+    full = mark.window_day != today
+    if not full and high <= mark.cursor.get("id", 0):
+        return
+
+    qs = (
         InternalSearchQuery.objects
-        .filter(timestamp__gte=cutoff)
-        .values("term")
-        .annotate(count=Count("id"))
-        .filter(count__gte=2)   # at least 2 users searched for it
-        .order_by("-count")
+        .filter(timestamp__gte=timezone.now() - timedelta(days=_WINDOW_DAYS))
+        .annotate(term_norm=Lower(Trim("term")))
     )
+    keys: set[str] = set()
+    if not full:
+        keys = {
+            _norm(term) for term in
+            InternalSearchQuery.objects.filter(pk__gt=mark.cursor.get("id", 0), pk__lte=high)
+            .values_list("term", flat=True)
+        }
+
+    found: dict[str, dict] = {}
+    for chunk in (_chunks(keys) if not full else [None]):
+        rows = qs if chunk is None else qs.filter(term_norm__in=chunk)
+        for row in (
+            rows.values("term_norm")
+            .annotate(count=Count("id"), term=Min("term"))
+            .filter(count__gte=2)   # at least 2 users searched for it
+            .order_by("-count")
+        ):
+            kw = row["term"].strip()
+            if not _is_plausible_keyword(kw) or _norm(kw) in found:
+                continue
+            found[_norm(kw)] = _signal(kw, SRC_INTERNAL, source_detail=f"searched {row['count']}× on site")
 
-    results: list[dict] = []
-    seen: set[str] = set()
-    for row in terms:
-        kw      = row["term"].strip()
-        kw_lower = kw.lower()
-        if kw_lower in existing_seeds or kw_lower in seen:
-            continue
-        if not _is_plausible_keyword(kw):
-            continue
-        seen.add(kw_lower)
-        entry = _build_entry(
-            kw,
-            SRC_INTERNAL,
-            source_detail=f"searched {row['count']}× on site",
-        )
-        results.append(entry)
-
-    return results
+    changes.replace(SIG_INTERNAL, found, _holders(SIG_INTERNAL) if full else keys)
+    mark.cursor = {"id": high}
+    mark.window_day = today
 
 
 # ---------------------------------------------------------------------------
@@ -687,89 +863,210 @@ def _extract_keyword_from_path(path: str) -> str | None:
     return None
 
 
-def _from_dead_urls(existing_seeds: set[str]) -> list[dict]:
-    """Extract keyword candidates from 404 URL paths."""
+def _refresh_dead_urls(mark, changes: _Changes, today: date) -> None:
+    """
+    Keyword candidates from URLs that returned 404 at least twice in the last
+    90 days.  Several URLs can suggest one keyword; the most-hit URL is
+    kept.  New hits re-count only their own URLs (a count can only grow
+    between the daily full rebuilds, so nothing is dropped).
+    """
     from seo_intel.models import DeadURLHit
 
-    cutoff = timezone.now() - timedelta(days=90)
-    hits   = (
-        DeadURLHit.objects
-        .filter(timestamp__gte=cutoff)
-        .values("url")
-        .annotate(count=Count("id"))
-        .filter(count__gte=2)
-        .order_by("-count")
-    )
+    high = _max_pk(DeadURLHit)
+    full = mark.window_day != today
+    if not full and high <= mark.cursor.get("id", 0):
+        return
 
-    results: list[dict] = []
-    seen: set[str] = set()
-    for row in hits:
-        url  = row["url"]
-        path = urlparse(url).path
-        kw   = _extract_keyword_from_path(path)
-        if not kw:
-            continue
-        kw_lower = kw.lower()
-        if kw_lower in existing_seeds or kw_lower in seen:
-            continue
-        seen.add(kw_lower)
-        entry = _build_entry(
-            kw,
-            SRC_DEAD_URL,
-            source_detail=f"404 hit {row['count']}× — {url[:60]}",
+    hits = DeadURLHit.objects.filter(timestamp__gte=timezone.now() - timedelta(days=_WINDOW_DAYS))
+    urls: list[str] | None = None
+    if not full:
+        urls = list(set(
+            DeadURLHit.objects.filter(pk__gt=mark.cursor.get("id", 0), pk__lte=high)
+            .values_list("url", flat=True)
+        ))
+
+    found: dict[str, dict] = {}
+    for chunk in (_chunks(urls) if urls is not None else [None]):
+        rows = hits if chunk is None else hits.filter(url__in=chunk)
+        for row in (
+            rows.values("url")
+            .annotate(count=Count("id"))
+            .filter(count__gte=2)
+            .order_by("-count")
+        ):
+            kw = _extract_keyword_from_path(urlparse(row["url"]).path)
+            if not kw:
+                continue
+            key = _norm(kw)
+            if key in found and found[key]["meta"]["count"] >= row["count"]:
+                continue
+            found[key] = _signal(
+                kw,
+                SRC_DEAD_URL,
+                source_detail=f"404 hit {row['count']}× — {row['url'][:60]}",
+                url=row["url"],
+                count=row["count"],
+            )
+
+    holders = _holders(SIG_DEAD_URL)
+    if full:
+        changes.replace(SIG_DEAD_URL, found, holders)
+    else:
+        for key, value in found.items():
+            held = holders.get(key)
+            if held and held["meta"]["url"] != value["meta"]["url"] and held["meta"]["count"] > value["meta"]["count"]:
+                continue
+            changes.set(key, SIG_DEAD_URL, value)
+    mark.cursor = {"id": high}
+    mark.window_day = today
+
+
+# ---------------------------------------------------------------------------
+# Scoring and persistence
+# ---------------------------------------------------------------------------
+
+_SOURCES = (
+    (SIG_SC, _refresh_search_console),
+    (SIG_SUGGESTION, _refresh_suggestions),
+    (SIG_SERP_TITLE, _refresh_serp_titles),
+    (SIG_COMPETITOR, _refresh_competitors),
+    (SIG_INTERNAL, _refresh_internal_search),
+    (SIG_DEAD_URL, _refresh_dead_urls),
+)
+
+
+def _entry_from_signals(signals: dict[str, dict]) -> dict:
+    """Merge a keyword's signals into one scored opportunity."""
+    pool: dict[str, dict] = {}
+    for signal in _SIGNAL_ORDER:
+        if signal in signals:
+            _merge(pool, _build_entry(**signals[signal]["args"]))
+    return next(iter(pool.values()))
+
+
+def _apply(changes: _Changes) -> dict[str, int]:
+    """Write signal changes and re-score only the candidates they touch."""
+    from seo_intel.models import DiscoveredKeyword
+
+    existing: dict[str, DiscoveredKeyword] = {}
+    for chunk in _chunks(changes.updates):
+        existing.update(
+            (dk.keyword_norm, dk) for dk in DiscoveredKeyword.objects.filter(keyword_norm__in=chunk)
         )
-        results.append(entry)
 
-    return results
+    to_create: list[DiscoveredKeyword] = []
+    to_update: list[DiscoveredKeyword] = []
+    to_delete: list[int] = []
+    now = timezone.now()
+    for key, updates in changes.updates.items():
+        dk = existing.get(key)
+        signals = dict(dk.signals) if dk else {}
+        for signal, value in updates.items():
+            if value is None:
+                signals.pop(signal, None)
+            else:
+                signals[signal] = value
+        if not signals:
+            if dk is not None:
+                to_delete.append(dk.pk)
+            continue
+        if dk is not None and signals == dk.signals:
+            continue
+        entry = _entry_from_signals(signals)
+        fields = {
+            "keyword": entry["keyword"],
+            "signals": signals,
+            "entry": entry,
+            "priority_score": entry["priority_score"],
+        }
+        if dk is None:
+            to_create.append(DiscoveredKeyword(keyword_norm=key, **fields))
+        else:
+            for name, value in fields.items():
+                setattr(dk, name, value)
+            # bulk_update doesn't apply auto_now
+            dk.updated_at = now
+            to_update.append(dk)
+
+    DiscoveredKeyword.objects.bulk_create(to_create, batch_size=_CHUNK)
+    DiscoveredKeyword.objects.bulk_update(
+        to_update, ["keyword", "signals", "entry", "priority_score", "updated_at"], batch_size=_CHUNK
+    )
+    for chunk in _chunks(to_delete):
+        DiscoveredKeyword.objects.filter(pk__in=chunk).delete()
+    return {"created": len(to_create), "updated": len(to_update), "deleted": len(to_delete)}
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def run_discovery(*, force: bool = False) -> list[dict]:
+def refresh_discovery(*, full: bool = False) -> dict:
     """
-    Run the full discovery pipeline and return a scored, deduplicated list
-    of keyword opportunities not already in the KeywordSeed list.
+    Bring the DiscoveredKeyword store up to date with the source tables.
 
-    Results are cached for 15 minutes.  Pass ``force=True`` to bypass cache.
-    """
-    if not force:
-        cached = cache.get(_CACHE_KEY)
-        if cached is not None:
-            logger.debug("keyword_discovery: cache hit (%d items)", len(cached))
-            return cached
+    Each source reads only the rows added since its watermark (rebuilding its
+    time window once a day) and only the candidates whose signals changed are
+    re-scored.  ``full=True`` resets the watermarks and rebuilds every source.
 
-    from seo_settings.models import KeywordSeed
+    Returns ``{"status": "ok", "created", "updated", "deleted", "elapsed_s"}``,
+    or ``{"status": "busy"}`` if another refresh holds the lock.
+    """
+    from seo_intel.models import DiscoveryWatermark
+
+    if not LOCKS.add(_LOCK_KEY, timezone.now().isoformat(), _LOCK_TTL):
+        logger.info("keyword_discovery: another refresh is already running")
+        return {"status": "busy"}
+
+    started = time.monotonic()
+    try:
+        today = timezone.localdate()
+        changes = _Changes()
+        marks = []
+        for source, refresh in _SOURCES:
+            mark, _ = DiscoveryWatermark.objects.get_or_create(source=source)
+            if full:
+                mark.cursor, mark.window_day = {}, None
+            refresh(mark, changes, today)
+            marks.append(mark)
+
+        with transaction.atomic():
+            counts = _apply(changes)
+            for mark in marks:
+                mark.save()
+    finally:
+        LOCKS.delete(_LOCK_KEY)
+
+    summary = {"status": "ok", **counts, "elapsed_s": round(time.monotonic() - started, 2)}
+    logger.info(
+        "keyword_discovery: refreshed — %(created)d new, %(updated)d re-scored, "
+        "%(deleted)d retired in %(elapsed_s)ss", summary,
+    )
+    return summary
 
-    existing_seeds: set[str] = {
-        kw.lower()
-        for kw in KeywordSeed.objects.values_list("keyword", flat=True)
-    }
 
-    pool: dict[str, dict] = {}
-
-    for entry in _from_search_console(existing_seeds):
-        _merge(pool, entry)
-    for entry in _from_serpapi_expansions(existing_seeds):
-        _merge(pool, entry)
-    for entry in _from_competitors(existing_seeds):
-        _merge(pool, entry)
-    for entry in _from_internal_search(existing_seeds):
-        _merge(pool, entry)
-    for entry in _from_dead_urls(existing_seeds):
-        _merge(pool, entry)
+def run_discovery(*, force: bool = False) -> list[dict]:
+    """
+    Return the scored, deduplicated keyword opportunities that are not
+    already in the KeywordSeed list, highest priority first.
 
-    results = list(pool.values())
+    Reads the DiscoveredKeyword store.  Pass ``force=True`` to bring the store
+    up to date first (incrementally); the store is also built on first use.
+    """
+    from seo_intel.models import DiscoveredKeyword, DiscoveryWatermark
+    from seo_settings.models import KeywordSeed
 
-    # Final sort: priority_score desc, then keyword alpha
-    results.sort(key=lambda r: (-r["priority_score"], r["keyword"].lower()))
+    if force or not DiscoveryWatermark.objects.exists():
+        refresh_discovery()
 
-    cache.set(_CACHE_KEY, results, _CACHE_TTL)
-    logger.info("keyword_discovery: found %d opportunities", len(results))
+    existing_seeds: set[str] = {
+        _norm(kw) for kw in KeywordSeed.objects.values_list("keyword", flat=True)
+    }
+    results = [
+        entry
+        for key, entry in DiscoveredKeyword.objects.order_by("-priority_score", "keyword_norm")
+        .values_list("keyword_norm", "entry")
+        if key not in existing_seeds
+    ]
+    logger.debug("keyword_discovery: %d opportunities", len(results))
     return results
-
-
-def invalidate_cache() -> None:
-    """Delete the discovery cache (call after adding/removing seeds)."""
-    cache.delete(_CACHE_KEY)
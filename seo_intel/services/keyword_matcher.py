@@ -0,0 +1,104 @@
+"""
+seo_intel/services/keyword_matcher.py
+--------------------------------------
+Compiled multi-keyword matcher shared by the crawler, discovery, trends and
+content-gap services.
+
+Checking a taxonomy one ``kw in text`` at a time scans the text once per
+keyword and matches inside words ("act" in "contact", "ky" in "sky").  A
+KeywordMatcher compiles every keyword into a single character trie, turned
+into one regular expression, and finds all of them in one left-to-right
+pass:
+
+  * a match must start and end on a word boundary; a trailing plural
+    ``s`` / ``es`` is allowed, so "therapist" still matches "therapists";
+  * matches may overlap — "cognitive behavioral therapy" also reports
+    "cognitive behavioral" and "therapy" when those are keywords, and a
+    keyword that is the agent noun of another ("clinical social worker")
+    also reports that one ("clinical social work");
+  * matching is case-insensitive (text is lower-cased before the scan).
+
+Public API
+----------
+    KeywordMatcher(taxonomy)           taxonomy: {category: iterable of keywords}
+    KeywordMatcher.hits(text)       -> dict[str, list[str]]   (every category, sorted)
+    KeywordMatcher.matches(text)    -> set[str]
+    KeywordMatcher.contains_any(text) -> bool
+    matcher_for(terms)              -> KeywordMatcher          (cached, one category)
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, Mapping
+
+_PLURAL = r"(?:e?s)?"
+# How a longer keyword may extend a shorter one it implies: a plural, or an
+# agent noun ("clinical social worker" implies "clinical social work").
+_DERIVED = r"(?:e?s|ers?)?"
+_END = r"(?!\w)"
+
+
+def _trie_regex(node: dict) -> str:
+    """Regex for the keywords below *node*; longer keywords are tried first."""
+    branches = [re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+class KeywordMatcher:
+    """All keywords of a taxonomy compiled into one word-boundary-aware pattern."""
+
+    def __init__(self, taxonomy: Mapping[str, Iterable[str]]):
+        self.categories = tuple(taxonomy)
+        self._categories_of: dict[str, set[str]] = {}
+        for category, keywords in taxonomy.items():
+            for kw in keywords:
+                kw = kw.strip().lower()
+                if kw:
+                    self._categories_of.setdefault(kw, set()).add(category)
+
+        trie: dict = {}
+        for kw in self._categories_of:
+            node = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        # Zero-width so overlapping keywords that start later are still found
+        self._pattern = re.compile(rf"(?<!\w)(?=({_trie_regex(trie)}){_PLURAL}{_END})")
+
+        # The scan reports the longest keyword at each position; shorter
+        # keywords that are whole-word prefixes of it are implied.
+        self._implied: dict[str, frozenset[str]] = {}
+        for kw in self._categories_of:
+            self._implied[kw] = frozenset(
+                other for other in self._categories_of
+                if kw.startswith(other)
+                and re.fullmatch(rf"{re.escape(other)}{_DERIVED}(?:\W.*)?", kw, re.S)
+            )
+
+    def matches(self, text: str) -> set[str]:
+        """Every keyword that occurs in *text*."""
+        found: set[str] = set()
+        for longest in {m.group(1) for m in self._pattern.finditer(text.lower())}:
+            found |= self._implied[longest]
+        return found
+
+    def contains_any(self, text: str) -> bool:
+        return self._pattern.search(text.lower()) is not None
+
+    def hits(self, text: str) -> dict[str, list[str]]:
+        """Matched keywords grouped by category; every category is present."""
+        grouped: dict[str, list[str]] = {category: [] for category in self.categories}
+        for kw in sorted(self.matches(text)):
+            for category in self._categories_of[kw]:
+                grouped[category].append(kw)
+        return grouped
+
+
+@lru_cache(maxsize=64)
+def matcher_for(terms: frozenset[str]) -> KeywordMatcher:
+    """Compiled matcher for a flat keyword set (compiled once per set)."""
+    return KeywordMatcher({"terms": terms})
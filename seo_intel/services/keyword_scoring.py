@@ -18,15 +18,32 @@ Public API
     load_geo_terms() -> frozenset[str]
     score_keyword(keyword, *, gsc_stats, competitor_ranks, lcpsych_ranks,
                   geo_terms) -> dict
+    save_scores(scores, *, prune=False) -> dict
 """
 
 from __future__ import annotations
 
 import logging
 import math
+from typing import Iterable
+
+from django.db import transaction
+from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+# Rows per bulk INSERT / UPDATE / DELETE statement
+BATCH_SIZE = 500
+
+SCORE_FIELDS = (
+    "search_demand_score",
+    "competitor_pressure_score",
+    "lcpsych_presence_score",
+    "local_intent_score",
+    "commercial_intent_score",
+    "priority_score",
+)
+
 # ---------------------------------------------------------------------------
 # Commercial-intent vocabulary
 # ---------------------------------------------------------------------------
@@ -259,3 +276,63 @@ def score_keyword(
         "commercial_intent_score": ci,
         "priority_score": priority,
     }
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+def save_scores(scores: Iterable[dict], *, prune: bool = False) -> dict:
+    """
+    Write :func:`score_keyword` results to ``KeywordScore`` in bulk.
+
+    Existing rows are loaded once and compared in memory: new keywords are
+    bulk-created, rows whose scores changed are bulk-updated, and unchanged
+    rows only have their timestamp refreshed.  With *prune*, rows for keywords
+    not in *scores* are deleted.
+
+    Returns ``{"created", "updated", "unchanged", "pruned"}`` counts.
+    """
+    from seo_intel.models import KeywordScore
+
+    now = timezone.now()
+    incoming = {row["keyword"]: row for row in scores}
+    existing = {
+        ks.keyword: ks
+        for ks in KeywordScore.objects.only("pk", "keyword", *SCORE_FIELDS)
+    }
+
+    to_create: list[KeywordScore] = []
+    to_update: list[KeywordScore] = []
+    unchanged_pks: list[int] = []
+    for keyword, row in incoming.items():
+        ks = existing.pop(keyword, None)
+        if ks is None:
+            to_create.append(KeywordScore(keyword=keyword, **{f: row[f] for f in SCORE_FIELDS}))
+        elif any(getattr(ks, f) != row[f] for f in SCORE_FIELDS):
+            for f in SCORE_FIELDS:
+                setattr(ks, f, row[f])
+            # bulk_update doesn't apply auto_now
+            ks.timestamp = now
+            to_update.append(ks)
+        else:
+            unchanged_pks.append(ks.pk)
+
+    pruned = 0
+    with transaction.atomic():
+        KeywordScore.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        KeywordScore.objects.bulk_update(to_update, [*SCORE_FIELDS, "timestamp"], batch_size=BATCH_SIZE)
+        for start in range(0, len(unchanged_pks), BATCH_SIZE):
+            KeywordScore.objects.filter(pk__in=unchanged_pks[start:start + BATCH_SIZE]).update(timestamp=now)
+        if prune:
+            stale_pks = [ks.pk for ks in existing.values()]
+            for start in range(0, len(stale_pks), BATCH_SIZE):
+                pruned += KeywordScore.objects.filter(pk__in=stale_pks[start:start + BATCH_SIZE]).delete()[0]
+
+    return {
+        "created": len(to_create),
+        "updated": len(to_update),
+        "unchanged": len(unchanged_pks),
+        "pruned": pruned,
+    }
@@ -8,22 +8,30 @@ CompetitorHit, LCPsychHit, KeywordSuggestion, KeywordScore) into a single
 intelligence report per keyword seed.
 
 No live SerpAPI calls are made here — all source data comes from the local DB.
+Each source is read once for the whole seed set (matched and grouped on the
+indexed keyword_norm column, GSC windows as conditional sums), so the number
+of queries does not grow with the number of seeds; reports are then assembled
+in memory.
 Results are cached for 15 minutes to keep page loads fast.
 
 Public API
 ----------
     analyze_seeds(seeds) -> list[dict]
+    build_reports(seeds, *, today=None, window=30) -> list[dict]   (uncached)
 """
 from __future__ import annotations
 
 import hashlib
 import logging
+from collections import defaultdict
 from datetime import date, timedelta
 
-from django.core.cache import cache
-from django.db.models import Avg, Count, Min, Sum
+from django.db.models import Q, Sum
 from django.utils import timezone
 
+from core.cache import KEYWORD_TRENDS
+from seo_intel.services.keyword_matcher import matcher_for
+
 logger = logging.getLogger(__name__)
 
 _CACHE_TTL = 60 * 15  # 15 minutes
@@ -61,13 +69,11 @@ _COMMERCIAL_TERMS: frozenset[str] = frozenset(
 # ---------------------------------------------------------------------------
 
 def _has_local_intent(kw: str) -> bool:
-    kw_lower = kw.lower()
-    return any(term in kw_lower for term in _LOCAL_TERMS)
+    return matcher_for(_LOCAL_TERMS).contains_any(kw)
 
 
 def _has_commercial_intent(kw: str) -> bool:
-    kw_lower = kw.lower()
-    return any(term in kw_lower for term in _COMMERCIAL_TERMS)
+    return matcher_for(_COMMERCIAL_TERMS).contains_any(kw)
 
 
 def _trend_score(impressions_recent: int, impressions_prior: int) -> int:
@@ -123,11 +129,20 @@ def _action_css(action: str) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Core analyzer
+# Batch loading
 # ---------------------------------------------------------------------------
 
-def _analyze_one(keyword: str, *, today: date, window: int = 30) -> dict:
-    """Build the intelligence report for a single keyword string."""
+def _load_sources(keywords: set[str], *, today: date, window: int) -> dict[str, dict]:
+    """
+    Fetch every source once for the whole lower-cased *keywords* set.
+
+    Five queries regardless of how many keywords there are; each result is
+    grouped by lower-cased keyword:
+
+        {"gsc": {kw: {recent, prior, impressions_90d, clicks_90d}},
+         "suggestions": {kw: [row, ...]}, "competitors": {kw: [row, ...]},
+         "lc_hits": {kw: row}, "scores": {kw: KeywordScore}}
+    """
     from seo_intel.models import (
         CompetitorHit,
         KeywordScore,
@@ -136,33 +151,87 @@ def _analyze_one(keyword: str, *, today: date, window: int = 30) -> dict:
         SearchConsoleQuery,
     )
 
-    kw_lower = keyword.lower()
+    kw_list = sorted(keywords)
 
-    # ── Search Console impressions ─────────────────────────────────────────
+    # ── Search Console: conditional sums per date window ──────────────────
     recent_start = today - timedelta(days=window)
     prior_start  = today - timedelta(days=window * 2)
     prior_end    = today - timedelta(days=window + 1)
-
-    def _impressions(start: date, end: date) -> int:
-        return (
-            SearchConsoleQuery.objects.filter(
-                query__iexact=keyword,
-                date__gte=start,
-                date__lte=end,
-            ).aggregate(total=Sum("impressions"))["total"]
-            or 0
+    start_90     = today - timedelta(days=90)
+
+    gsc_rows = (
+        SearchConsoleQuery.objects
+        .filter(keyword_norm__in=kw_list, date__gte=min(prior_start, start_90))
+        .values("keyword_norm")
+        .annotate(
+            recent=Sum("impressions", filter=Q(date__gte=recent_start, date__lte=today)),
+            prior=Sum("impressions", filter=Q(date__gte=prior_start, date__lte=prior_end)),
+            impressions_90d=Sum("impressions", filter=Q(date__gte=start_90, date__lte=today)),
+            clicks_90d=Sum("clicks", filter=Q(date__gte=start_90)),
         )
-
-    impressions_recent = _impressions(recent_start, today)
-    impressions_prior  = _impressions(prior_start, prior_end)
-    impressions_90d    = _impressions(today - timedelta(days=90), today)
-    clicks_90d = (
-        SearchConsoleQuery.objects.filter(
-            query__iexact=keyword,
-            date__gte=today - timedelta(days=90),
-        ).aggregate(total=Sum("clicks"))["total"]
-        or 0
+        .order_by()
     )
+    gsc = {row["keyword_norm"]: row for row in gsc_rows}
+
+    # ── PAA / related suggestions ──────────────────────────────────────────
+    suggestions: dict[str, list[dict]] = defaultdict(list)
+    for row in (
+        KeywordSuggestion.objects
+        .filter(keyword_norm__in=kw_list)
+        .values("keyword_norm", "suggestion", "source_type", "used_as_seed")
+    ):
+        suggestions[row["keyword_norm"]].append(row)
+
+    # ── Competitor and LC Psych hits (last 90 days), best rank first ───────
+    cutoff_90 = timezone.now() - timedelta(days=90)
+    competitors: dict[str, list[dict]] = defaultdict(list)
+    for row in (
+        CompetitorHit.objects
+        .filter(keyword_norm__in=kw_list, timestamp__gte=cutoff_90)
+        .values("keyword_norm", "competitor_domain", "rank")
+        .order_by("rank")
+    ):
+        competitors[row["keyword_norm"]].append(row)
+
+    lc_hits: dict[str, dict] = {}
+    for row in (
+        LCPsychHit.objects
+        .filter(keyword_norm__in=kw_list, timestamp__gte=cutoff_90)
+        .values("keyword_norm", "url", "title", "rank")
+        .order_by("rank")
+    ):
+        lc_hits.setdefault(row["keyword_norm"], row)
+
+    # ── Stored priority scores ─────────────────────────────────────────────
+    scores: dict[str, KeywordScore] = {}
+    for ks in KeywordScore.objects.filter(keyword_norm__in=kw_list):
+        scores.setdefault(ks.keyword_norm, ks)
+
+    return {
+        "gsc": gsc,
+        "suggestions": suggestions,
+        "competitors": competitors,
+        "lc_hits": lc_hits,
+        "scores": scores,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Report assembly (in memory)
+# ---------------------------------------------------------------------------
+
+def _build_report(keyword: str, sources: dict[str, dict], *, window: int = 30) -> dict:
+    """Build the intelligence report for a single keyword from preloaded *sources*."""
+    from seo_intel.models import KeywordSuggestion
+
+    kw_lower = keyword.lower()
+
+    # ── Search Console impressions ─────────────────────────────────────────
+    gsc = sources["gsc"].get(kw_lower, {})
+    impressions_recent = gsc.get("recent") or 0
+    impressions_prior  = gsc.get("prior") or 0
+    impressions_90d    = gsc.get("impressions_90d") or 0
+    clicks_90d         = gsc.get("clicks_90d") or 0
 
     trend = _trend_score(impressions_recent, impressions_prior)
 
@@ -177,13 +246,9 @@ def _analyze_one(keyword: str, *, today: date, window: int = 30) -> dict:
         delta_direction = "up" if pct > 5 else ("down" if pct < -5 else "neutral")
 
     # ── PAA / Related searches ─────────────────────────────────────────────
-    suggestions_qs = KeywordSuggestion.objects.filter(
-        source_keyword__iexact=keyword
-    ).values("suggestion", "source_type", "used_as_seed")
-
     paa = []
     related = []
-    for s in suggestions_qs:
+    for s in sources["suggestions"].get(kw_lower, ()):
         entry = {
             "text": s["suggestion"],
             "used_as_seed": s["used_as_seed"],
@@ -194,20 +259,11 @@ def _analyze_one(keyword: str, *, today: date, window: int = 30) -> dict:
             related.append(entry)
 
     # ── Competitor hits ────────────────────────────────────────────────────
-    cutoff_90 = timezone.now() - timedelta(days=90)
-    competitor_qs = (
-        CompetitorHit.objects.filter(
-            keyword__iexact=keyword,
-            timestamp__gte=cutoff_90,
-        )
-        .values("competitor_domain", "rank")
-        .order_by("rank")
-    )
     competitors: list[dict] = []
     seen_domains: set[str] = set()
     top_competitor_rank: int | None = None
     top3_domains: list[str] = []
-    for hit in competitor_qs:
+    for hit in sources["competitors"].get(kw_lower, ()):
         domain = hit["competitor_domain"]
         rank   = hit["rank"]
         if domain not in seen_domains:
@@ -223,29 +279,21 @@ def _analyze_one(keyword: str, *, today: date, window: int = 30) -> dict:
     competitors_dominate_top3 = len(top3_domains) >= 2
 
     # ── LC Psych hits ──────────────────────────────────────────────────────
-    lc_qs = (
-        LCPsychHit.objects.filter(
-            keyword__iexact=keyword,
-            timestamp__gte=cutoff_90,
-        )
-        .order_by("rank")
-        .values("url", "title", "rank")
-        .first()
-    )
-    lc_rank: int | None = lc_qs["rank"] if lc_qs else None
-    lc_url:  str | None = lc_qs["url"]  if lc_qs else None
-    lc_title: str | None = lc_qs["title"] if lc_qs else None
+    lc_hit = sources["lc_hits"].get(kw_lower)
+    lc_rank: int | None = lc_hit["rank"] if lc_hit else None
+    lc_url:  str | None = lc_hit["url"]  if lc_hit else None
+    lc_title: str | None = lc_hit["title"] if lc_hit else None
 
     # ── Priority score ─────────────────────────────────────────────────────
-    try:
-        ks = KeywordScore.objects.get(keyword__iexact=keyword)
+    ks = sources["scores"].get(kw_lower)
+    if ks is not None:
         priority_score            = ks.priority_score
         search_demand_score       = ks.search_demand_score
         competitor_pressure_score = ks.competitor_pressure_score
         lcpsych_presence_score    = ks.lcpsych_presence_score
         local_intent_score        = ks.local_intent_score
         commercial_intent_score   = ks.commercial_intent_score
-    except KeywordScore.DoesNotExist:
+    else:
         # Derive lightweight scores from available data
         local_intent_score      = 15 if _has_local_intent(keyword)      else 0
         commercial_intent_score = 10 if _has_commercial_intent(keyword) else 0
@@ -332,6 +380,32 @@ def _analyze_one(keyword: str, *, today: date, window: int = 30) -> dict:
     }
 
 
+def build_reports(seed_list: list, *, today: date | None = None, window: int = 30) -> list[dict]:
+    """
+    Uncached batch engine behind analyze_seeds(): load every source once for
+    all seeds, then assemble the reports in memory.
+    """
+    if not seed_list:
+        return []
+    today = today or date.today()
+    sources = _load_sources({s.keyword.lower() for s in seed_list}, today=today, window=window)
+
+    results = []
+    for seed in seed_list:
+        try:
+            report = _build_report(seed.keyword, sources, window=window)
+            report["category"] = seed.category
+            report["seed_id"] = seed.pk
+            report["active"] = seed.active
+            results.append(report)
+        except Exception:
+            logger.exception("keyword_trends_analyzer: error analyzing %r", seed.keyword)
+
+    # Sort by priority_score desc, then keyword alpha
+    results.sort(key=lambda r: (-r["priority_score"], r["keyword"].lower()))
+    return results
+
+
 def analyze_seeds(seeds) -> list[dict]:
     """
     Return an intelligence report for each seed.
@@ -352,28 +426,15 @@ def analyze_seeds(seeds) -> list[dict]:
 
     # Build a stable cache key from the sorted keyword set
     kw_key = ",".join(sorted(s.keyword for s in seed_list))
-    cache_key = "kw_intel_" + hashlib.md5(kw_key.encode()).hexdigest()
+    cache_key = hashlib.md5(kw_key.encode()).hexdigest()
 
-    cached = cache.get(cache_key)
+    cached = KEYWORD_TRENDS.get(cache_key)
     if cached is not None:
         logger.debug("keyword_trends_analyzer: cache hit (%d seeds)", len(seed_list))
         return cached
 
-    today = date.today()
-    results = []
-    for seed in seed_list:
-        try:
-            report = _analyze_one(seed.keyword, today=today)
-            report["category"] = seed.category
-            report["seed_id"] = seed.pk
-            report["active"] = seed.active
-            results.append(report)
-        except Exception:
-            logger.exception("keyword_trends_analyzer: error analyzing %r", seed.keyword)
-
-    # Sort by priority_score desc, then keyword alpha
-    results.sort(key=lambda r: (-r["priority_score"], r["keyword"].lower()))
+    results = build_reports(seed_list)
 
-    cache.set(cache_key, results, _CACHE_TTL)
+    KEYWORD_TRENDS.set(cache_key, results, _CACHE_TTL)
     logger.debug("keyword_trends_analyzer: computed + cached %d seeds", len(results))
     return results
@@ -0,0 +1,198 @@
+"""
+seo_intel/services/page_extractor.py
+-------------------------------------
+Single-pass page signal extractor for crawled HTML.
+
+Building a BeautifulSoup tree, walking it with several ``find_all`` calls
+and then ``decompose()``-ing the page chrome to count words costs far more
+than reading the page once.  extract_page_signals() never builds a tree: the
+parser emits start/end/data events and a collector keeps only what the
+crawler needs:
+
+  * the <title> text and every <h1> / <h2> text;
+  * Schema.org types from ``itemtype`` attributes and JSON-LD ``@type`` values;
+  * every ``<a href>`` value, in document order;
+  * the visible text (everything outside script/style/nav/header/footer/aside)
+    and its word count.
+
+Backends: lxml's parser-target interface (libxml2, C speed) when lxml is
+installed, otherwise the standard library's html.parser driving the same
+collector.  Both produce the same signals.
+
+Public API
+----------
+    PageSignals(title, h1, h2, schema_types, links, text, word_count)
+    extract_page_signals(html, backend=None) -> PageSignals
+    BACKEND        "lxml" | "html.parser"
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - depends on the environment
+    etree = None
+
+BACKEND = "lxml" if etree is not None else "html.parser"
+
+# Text inside these elements is page chrome, not content
+_CHROME_TAGS = frozenset({"script", "style", "nav", "header", "footer", "aside"})
+_CAPTURE_TAGS = frozenset({"title", "h1", "h2"})
+_LD_TYPE_RE = re.compile(r'"@type"\s*:\s*"([^"]+)"')
+
+
+@dataclass
+class PageSignals:
+    title: str = ""
+    h1: list[str] = field(default_factory=list)
+    h2: list[str] = field(default_factory=list)
+    schema_types: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)
+    text: str = ""
+    word_count: int = 0
+
+
+class _SignalCollector:
+    """
+    Parser target: receives start/end/data events and accumulates signals.
+
+    Text between two tags is one string, stripped and joined with a space
+    (headings: joined with nothing), the same as BeautifulSoup's
+    ``get_text(" ", strip=True)`` / ``get_text(strip=True)``.
+    """
+
+    def __init__(self):
+        self.signals = PageSignals()
+        self._buf: list[str] = []
+        self._text: list[str] = []
+        self._open: list[str] = []              # tracked elements only
+        self._chrome_depth = 0
+        self._captures: list[tuple[str, list[str]]] = []
+        self._ld_json: list[str] | None = None
+        self._types: dict[str, None] = {}
+
+    def _flush(self) -> None:
+        if not self._buf:
+            return
+        chunk = "".join(self._buf)
+        self._buf = []
+        if self._ld_json is not None:
+            self._ld_json.append(chunk)
+        stripped = chunk.strip()
+        if not stripped:
+            return
+        if not self._chrome_depth:
+            self._text.append(stripped)
+        for _, parts in self._captures:
+            parts.append(stripped)
+
+    def start(self, tag: str, attrib) -> None:
+        self._flush()
+        tag = tag.lower()
+        itemtype = attrib.get("itemtype")
+        if itemtype:
+            self._types.setdefault(itemtype.rsplit("/", 1)[-1], None)
+        if tag == "a":
+            href = attrib.get("href")
+            if href:
+                self.signals.links.append(href)
+            return
+        if tag in _CHROME_TAGS:
+            self._chrome_depth += 1
+            self._open.append(tag)
+            if tag == "script" and (attrib.get("type") or "").lower() == "application/ld+json":
+                self._ld_json = []
+        elif tag in _CAPTURE_TAGS:
+            self._captures.append((tag, []))
+            self._open.append(tag)
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        tag = tag.lower()
+        if tag not in self._open:
+            return
+        # Close anything left open inside it (unclosed tags in sloppy markup)
+        while self._open:
+            current = self._open.pop()
+            if current in _CHROME_TAGS:
+                self._chrome_depth -= 1
+                if current == "script" and self._ld_json is not None:
+                    for found in _LD_TYPE_RE.findall("".join(self._ld_json)):
+                        self._types.setdefault(found, None)
+                    self._ld_json = None
+            else:
+                self._close_capture(current)
+            if current == tag:
+                break
+
+    def _close_capture(self, tag: str) -> None:
+        for i in range(len(self._captures) - 1, -1, -1):
+            if self._captures[i][0] == tag:
+                _, parts = self._captures.pop(i)
+                text = "".join(parts)
+                if tag == "title":
+                    if not self.signals.title:
+                        self.signals.title = text
+                else:
+                    getattr(self.signals, tag).append(text)
+                return
+
+    def data(self, data: str) -> None:
+        self._buf.append(data)
+
+    def close(self) -> PageSignals:
+        self._flush()
+        while self._open:
+            self.end(self._open[-1])
+        signals = self.signals
+        signals.schema_types = list(self._types)
+        signals.text = " ".join(self._text)
+        signals.word_count = len(signals.text.split())
+        return signals
+
+
+class _StdlibDriver(HTMLParser):
+    """Feeds html.parser events into a _SignalCollector."""
+
+    def __init__(self, target: _SignalCollector):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag, {name: value or "" for name, value in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.target.end(tag)
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+def extract_page_signals(html: str, backend: str | None = None) -> PageSignals:
+    """
+    Title, headings, schema types, links and visible text of *html* in one pass.
+
+    *backend* forces "lxml" or "html.parser" (benchmarks); default BACKEND.
+    """
+    collector = _SignalCollector()
+    if not html:
+        return collector.close()
+    if (backend or BACKEND) == "lxml":
+        parser = etree.HTMLParser(target=collector, recover=True)
+        try:
+            parser.feed(html)
+            return parser.close()
+        except etree.LxmlError:
+            # libxml2 gave up on the document; html.parser is more forgiving
+            collector = _SignalCollector()
+    driver = _StdlibDriver(collector)
+    driver.feed(html)
+    driver.close()
+    return collector.close()
@@ -0,0 +1,82 @@
+"""
+seo_intel/services/politeness.py
+---------------------------------
+Request pacing for the synchronous (requests-based) fetchers.
+
+The directory and social scrapers used to ``time.sleep(0.5)`` between
+every page, which serialises a scan even when consecutive requests go to
+different hosts.  HostThrottle instead spaces requests *to the same host*
+by at least ``min_interval`` seconds, across every thread of the process,
+so scans of several competitors can run side by side without hitting any
+one site faster than before.
+
+TokenBucket paces calls to a metered API (SerpApi) at a sustained rate with
+a bounded burst, shared by every thread that acquires from it.
+
+Public API
+----------
+    HostThrottle(min_interval=0.5)
+    HostThrottle.wait(url) -> float    (seconds slept)
+    HOST_THROTTLE                      process-wide instance used by the scrapers
+    TokenBucket(rate, capacity=1)      *rate* tokens per second
+    TokenBucket.acquire() -> float     (seconds slept)
+"""
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlparse
+
+DEFAULT_MIN_INTERVAL = 0.5
+
+
+class HostThrottle:
+    """Thread-safe minimum interval between requests to the same host."""
+
+    def __init__(self, min_interval: float = DEFAULT_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    def wait(self, url: str) -> float:
+        """Block until a request to *url*'s host is allowed; return the delay."""
+        host = urlparse(url).netloc.lower().removeprefix("www.")
+        with self._lock:
+            # Reserve the next free slot for this host, then sleep outside the lock
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return max(delay, 0.0)
+
+
+HOST_THROTTLE = HostThrottle()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: *rate* tokens per second, at most *capacity* banked."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._lock = threading.Lock()
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    def acquire(self) -> float:
+        """Block until a token is available and take it; return the delay."""
+        with self._lock:
+            # Refill, then take a token — possibly one not yet earned, in which
+            # case the caller sleeps (outside the lock) until it is.
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,399 @@
+"""
+seo_intel/services/search_console.py
+-------------------------------------
+Search Console Search Analytics ingestion into SearchConsoleQuery.
+
+A date range is read with dimensions [date, query, page] one page of up to
+25,000 rows at a time, advancing ``startRow`` until a short page comes back,
+so long backfills are complete rather than cut off at the first page.  Each
+page is written with chunked bulk upserts
+(``bulk_create(update_conflicts=True)`` on the (query, page, date) unique
+constraint) instead of an update_or_create round trip per row.
+
+pull_sharded() splits a long range into per-day (or per-week) shards and
+fetches them concurrently on a bounded thread pool, retrying each shard with
+exponential backoff.  Completed days are recorded in SearchConsoleCheckpoint.
+A day older than FINAL_AFTER_DAYS is final and later pulls skip it, so a
+rerun picks up where a failed run stopped and a nightly pull fetches only
+the days GSC may still be revising plus any that are missing.
+
+Auth
+----
+Uses the same credential chain as core.utils.gsc_utils:
+  1. OAuth2 refresh token (GSC_OAUTH_CLIENT_ID / GSC_OAUTH_CLIENT_SECRET / GSC_OAUTH_REFRESH_TOKEN)
+  2. Service account (GOOGLE_CLIENT_EMAIL / GOOGLE_PRIVATE_KEY)
+
+Public API
+----------
+    get_access_token() -> str
+    iter_row_pages(access_token, site_url, start, end, page_size=25000) -> Iterator[list[dict]]
+    upsert_rows(rows, batch_size=2000) -> int
+    pull_date_range(site_url, start, end, *, access_token=None,
+                    page_size=25000, batch_size=2000) -> dict
+    pull_sharded(site_url, start, end, *, workers=4, shard_days=1, resume=True,
+                 access_token=None, page_size=25000, on_shard=None) -> dict
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Callable, Iterable, Iterator
+
+from django.db import connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_SCOPE = "https://www.googleapis.com/auth/webmasters.readonly"
+_SEARCH_ANALYTICS_URL = (
+    "https://searchconsole.googleapis.com/webmasters/v3/sites/{site}/searchAnalytics/query"
+)
+
+# The Search Analytics API returns at most this many rows per request
+MAX_PAGE_SIZE = 25000
+
+# GSC keeps revising a day's figures for a few days; after this many it is final
+FINAL_AFTER_DAYS = 4
+
+DEFAULT_WORKERS = 4
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 2.0  # seconds; doubled on each retry of a shard
+
+
+def get_access_token() -> str:
+    """Return a short-lived access token; prefers OAuth2, falls back to service account."""
+    client_id = os.environ.get("GSC_OAUTH_CLIENT_ID", "")
+    client_secret = os.environ.get("GSC_OAUTH_CLIENT_SECRET", "")
+    refresh_token = os.environ.get("GSC_OAUTH_REFRESH_TOKEN", "")
+
+    if client_id and client_secret and refresh_token:
+        body = urllib.parse.urlencode(
+            {
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "refresh_token": refresh_token,
+                "grant_type": "refresh_token",
+            }
+        ).encode()
+        req = urllib.request.Request(
+            "https://oauth2.googleapis.com/token",
+            data=body,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=15) as resp:
+            data = json.loads(resp.read())
+        token = data.get("access_token")
+        if not token:
+            raise RuntimeError(f"OAuth2 token exchange failed: {data}")
+        return token
+
+    # Service account fallback
+    from google.oauth2 import service_account  # type: ignore
+    import google.auth.transport.requests as google_requests  # type: ignore
+
+    private_key = os.environ.get("GOOGLE_PRIVATE_KEY", "").replace("\\n", "\n")
+    client_email = os.environ.get("GOOGLE_CLIENT_EMAIL", "")
+    if not private_key or not client_email:
+        raise RuntimeError(
+            "No GSC credentials found. Set GSC_OAUTH_CLIENT_ID / "
+            "GSC_OAUTH_CLIENT_SECRET / GSC_OAUTH_REFRESH_TOKEN  or  "
+            "GOOGLE_CLIENT_EMAIL / GOOGLE_PRIVATE_KEY."
+        )
+    credentials = service_account.Credentials.from_service_account_info(
+        {
+            "type": "service_account",
+            "private_key": private_key,
+            "client_email": client_email,
+            "token_uri": "https://oauth2.googleapis.com/token",
+        },
+        scopes=[_SCOPE],
+    )
+    credentials.refresh(google_requests.Request())
+    return credentials.token  # type: ignore[return-value]
+
+
+def _query(access_token: str, site_url: str, body: dict) -> list[dict]:
+    """POST one Search Analytics query and return its rows.  Raises on HTTP errors."""
+    encoded_site = urllib.parse.quote(site_url, safe="")
+    req = urllib.request.Request(
+        _SEARCH_ANALYTICS_URL.format(site=encoded_site),
+        data=json.dumps(body).encode("utf-8"),
+        headers={
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        },
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            data = json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        detail = exc.read().decode("utf-8", errors="replace")
+        raise RuntimeError(f"GSC API returned HTTP {exc.code}: {detail}") from exc
+    return data.get("rows") or []
+
+
+def iter_row_pages(
+    access_token: str,
+    site_url: str,
+    start: date,
+    end: date,
+    page_size: int = MAX_PAGE_SIZE,
+) -> Iterator[list[dict]]:
+    """
+    Yield every [date, query, page] row for *start*..*end*, one API page at a time.
+
+    Pages are requested with increasing ``startRow`` until one comes back
+    shorter than *page_size*.
+    """
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    start_row = 0
+    while True:
+        rows = _query(
+            access_token,
+            site_url,
+            {
+                "startDate": start.isoformat(),
+                "endDate": end.isoformat(),
+                "dimensions": ["date", "query", "page"],
+                "rowLimit": page_size,
+                "startRow": start_row,
+                # A stable sort keeps pages from overlapping or skipping rows
+                "orderBy": [{"fieldName": "clicks", "sortOrder": "DESCENDING"}],
+            },
+        )
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        start_row += len(rows)
+
+
+def upsert_rows(rows: Iterable[dict], batch_size: int = 2000) -> int:
+    """
+    Insert or update SearchConsoleQuery rows from raw API *rows*; return the count written.
+
+    Rows whose keys are incomplete or whose date does not parse are skipped.
+    """
+    from seo_intel.models import SearchConsoleQuery
+
+    # One object per (query, page, date): an upsert statement may not touch
+    # the same row twice
+    objects: dict[tuple, SearchConsoleQuery] = {}
+    for row in rows:
+        keys = row.get("keys", [])
+        if len(keys) < 3:
+            continue
+        # dimensions order: date, query, page
+        try:
+            row_date = date.fromisoformat(keys[0])
+        except ValueError:
+            continue
+        objects[(keys[1], keys[2], row_date)] = SearchConsoleQuery(
+            query=keys[1],
+            page=keys[2],
+            date=row_date,
+            clicks=int(row.get("clicks") or 0),
+            impressions=int(row.get("impressions") or 0),
+            ctr=float(row.get("ctr") or 0.0),
+            position=float(row.get("position") or 0.0),
+        )
+
+    SearchConsoleQuery.objects.bulk_create(
+        list(objects.values()),
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["query", "page", "date"],
+        update_fields=["clicks", "impressions", "ctr", "position"],
+    )
+    return len(objects)
+
+
+def pull_date_range(
+    site_url: str,
+    start: date,
+    end: date,
+    *,
+    access_token: str | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    batch_size: int = 2000,
+) -> dict:
+    """
+    Fetch and store all Search Analytics rows for *start*..*end*.
+
+    Returns ``{"pages": int, "rows": int, "stored": int, "by_date": {date: int}}``
+    — API pages read, rows received, rows upserted and rows received per day.
+    """
+    access_token = access_token or get_access_token()
+    pages = received = stored = 0
+    by_date: Counter = Counter()
+    for rows in iter_row_pages(access_token, site_url, start, end, page_size):
+        pages += 1
+        received += len(rows)
+        by_date.update(row["keys"][0] for row in rows if len(row.get("keys", [])) >= 3)
+        stored += upsert_rows(rows, batch_size=batch_size)
+        logger.debug("search_console: %s → %s page %d, %d rows", start, end, pages, len(rows))
+    return {
+        "pages": pages,
+        "rows": received,
+        "stored": stored,
+        "by_date": {day: count for day, count in ((_parse_day(key), n) for key, n in by_date.items()) if day},
+    }
+
+
+def _parse_day(value: str) -> date | None:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Sharded, checkpointed pulls
+# ---------------------------------------------------------------------------
+
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _shards(start: date, end: date, shard_days: int) -> list[tuple[date, date]]:
+    days = _days(start, end)
+    return [(chunk[0], chunk[-1]) for chunk in (days[i:i + shard_days] for i in range(0, len(days), shard_days))]
+
+
+def _final_days(site_url: str, start: date, end: date) -> set[date]:
+    from seo_intel.models import SearchConsoleCheckpoint
+
+    return set(
+        SearchConsoleCheckpoint.objects.filter(
+            site_url=site_url, date__range=(start, end), final=True
+        ).values_list("date", flat=True)
+    )
+
+
+def _checkpoint(site_url: str, start: date, end: date, by_date: dict[date, int]) -> None:
+    from seo_intel.models import SearchConsoleCheckpoint
+
+    now = timezone.now()
+    final_before = date.today() - timedelta(days=FINAL_AFTER_DAYS)
+    SearchConsoleCheckpoint.objects.bulk_create(
+        [
+            SearchConsoleCheckpoint(
+                site_url=site_url,
+                date=day,
+                rows=by_date.get(day, 0),
+                final=day <= final_before,
+                completed_at=now,
+            )
+            for day in _days(start, end)
+        ],
+        update_conflicts=True,
+        unique_fields=["site_url", "date"],
+        update_fields=["rows", "final", "completed_at"],
+    )
+
+
+def _pull_shard(
+    site_url: str,
+    start: date,
+    end: date,
+    access_token: str,
+    page_size: int,
+    max_attempts: int,
+) -> dict:
+    """Pull one shard, retrying with exponential backoff, then checkpoint its days."""
+    try:
+        for attempt in range(1, max_attempts + 1):
+            try:
+                result = pull_date_range(site_url, start, end, access_token=access_token, page_size=page_size)
+                break
+            except Exception as exc:
+                if attempt == max_attempts:
+                    raise
+                delay = BACKOFF_BASE * 2 ** (attempt - 1) * (1 + random.random() / 2)
+                logger.warning(
+                    "search_console: shard %s → %s failed (attempt %d/%d): %s; retrying in %.1fs",
+                    start, end, attempt, max_attempts, exc, delay,
+                )
+                time.sleep(delay)
+        _checkpoint(site_url, start, end, result["by_date"])
+        return result
+    finally:
+        connections.close_all()
+
+
+def pull_sharded(
+    site_url: str,
+    start: date,
+    end: date,
+    *,
+    workers: int = DEFAULT_WORKERS,
+    shard_days: int = 1,
+    resume: bool = True,
+    access_token: str | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    max_attempts: int = MAX_ATTEMPTS,
+    on_shard: Callable[[tuple[date, date], dict | None, Exception | None], None] | None = None,
+) -> dict:
+    """
+    Pull *start*..*end* as shards of *shard_days* days on *workers* threads.
+
+    With *resume*, shards whose days are all final in SearchConsoleCheckpoint
+    are skipped.  A shard that still fails after *max_attempts* is reported
+    and left unrecorded, so the next run fetches it again.  *on_shard(shard,
+    result, error)* is called on the calling thread as each shard finishes.
+
+    Returns ``{"shards", "skipped", "done", "pages", "rows", "stored",
+    "failed": [((start, end), message), ...]}``.
+    """
+    shards = _shards(start, end, max(shard_days, 1))
+    final_days = _final_days(site_url, start, end) if resume else set()
+    todo = [shard for shard in shards if not set(_days(*shard)) <= final_days]
+
+    summary = {
+        "shards": len(shards),
+        "skipped": len(shards) - len(todo),
+        "done": 0,
+        "pages": 0,
+        "rows": 0,
+        "stored": 0,
+        "failed": [],
+    }
+    if not todo:
+        return summary
+
+    access_token = access_token or get_access_token()
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="gsc") as pool:
+        futures = {
+            pool.submit(_pull_shard, site_url, shard_start, shard_end, access_token, page_size, max_attempts): (
+                shard_start,
+                shard_end,
+            )
+            for shard_start, shard_end in todo
+        }
+        for future in as_completed(futures):
+            shard = futures[future]
+            result = error = None
+            try:
+                result = future.result()
+            except Exception as exc:
+                error = exc
+                summary["failed"].append((shard, str(exc)))
+                logger.error("search_console: shard %s → %s failed: %s", shard[0], shard[1], exc)
+            else:
+                summary["done"] += 1
+                for key in ("pages", "rows", "stored"):
+                    summary[key] += result[key]
+            if on_shard is not None:
+                on_shard(shard, result, error)
+    return summary
@@ -0,0 +1,191 @@
+"""
+seo_intel/services/serp_cache.py
+---------------------------------
+Content-addressed cache for SerpApi responses.
+
+Every SerpApi call site goes through cached_search():
+serpapi_client.fetch_serp, serp_scraper.scrape_keyword, and the profile and
+Google Business Profile lookups in directory_scraper and social_scraper.  A
+request is identified by a fingerprint: the SHA-256 of its parameters with
+keys sorted, values lower-cased and whitespace-collapsed, and the API key and
+transport flags (no_cache, output, async) dropped.  The same search issued
+by different commands or admin actions is therefore bought once.
+
+Responses are stored zlib-compressed in SerpCacheEntry.  Each caller has a
+freshness window (FRESHNESS; override per caller with the
+SERP_CACHE_MAX_AGE_HOURS setting, a dict of caller -> hours).  An entry older
+than the caller's window is refetched and replaced.  Error responses are
+never cached.
+
+Hits and misses are counted per caller per day in SerpCacheStat; each hit is
+one SerpApi credit not spent.
+
+Public API
+----------
+    FRESHNESS                                        caller -> timedelta
+    fingerprint(params) -> str
+    cached_search(caller, params, fetch, *, max_age=None) -> dict
+    cache_stats(days=30) -> dict
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import zlib
+from datetime import timedelta
+from typing import Callable
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Callers and how old a cached response each will accept
+FRESHNESS: dict[str, timedelta] = {
+    # Rankings: reuse within the day, refetch on every weekly run
+    "rank_tracking": timedelta(hours=24),
+    "competitor_serp": timedelta(hours=24),
+    # Where a practice's directory / social profile lives rarely changes
+    "profile_lookup": timedelta(days=30),
+    # GBP rating and review counts: under a week so the weekly refresh is current
+    "business_profile": timedelta(days=6),
+}
+DEFAULT_MAX_AGE = timedelta(hours=24)
+
+# Parameters that don't change the search results
+_IGNORED_PARAMS = frozenset({"api_key", "no_cache", "output", "async"})
+
+
+def _normalise(params: dict) -> dict:
+    return {
+        key: " ".join(str(value).split()).lower()
+        for key, value in sorted(params.items())
+        if key not in _IGNORED_PARAMS and value is not None
+    }
+
+
+def fingerprint(params: dict) -> str:
+    """SHA-256 hex digest identifying the search *params* describe."""
+    canonical = json.dumps(_normalise(params), separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _max_age(caller: str) -> timedelta:
+    overrides = getattr(settings, "SERP_CACHE_MAX_AGE_HOURS", {}) or {}
+    if caller in overrides:
+        return timedelta(hours=overrides[caller])
+    return FRESHNESS.get(caller, DEFAULT_MAX_AGE)
+
+
+def _count(caller: str, field: str) -> None:
+    from seo_intel.models import SerpCacheStat
+
+    today = timezone.localdate()
+    if SerpCacheStat.objects.filter(day=today, caller=caller).update(**{field: F(field) + 1}):
+        return
+    try:
+        # Savepoint, so a lost race doesn't break an enclosing transaction
+        with transaction.atomic():
+            SerpCacheStat.objects.create(day=today, caller=caller, **{field: 1})
+    except IntegrityError:
+        # Another thread created today's row first
+        SerpCacheStat.objects.filter(day=today, caller=caller).update(**{field: F(field) + 1})
+
+
+def cached_search(
+    caller: str,
+    params: dict,
+    fetch: Callable[[], dict],
+    *,
+    max_age: timedelta | None = None,
+) -> dict:
+    """
+    Return the SerpApi response for *params*, calling *fetch* only on a miss.
+
+    *caller* selects the freshness window (see FRESHNESS) and the stats row;
+    *max_age* overrides the window for this call (``timedelta(0)`` forces a
+    refetch).  Exceptions from *fetch* propagate and nothing is cached.
+    """
+    from seo_intel.models import SerpCacheEntry
+
+    key = fingerprint(params)
+    max_age = _max_age(caller) if max_age is None else max_age
+    now = timezone.now()
+
+    if max_age > timedelta(0):
+        entry = (
+            SerpCacheEntry.objects.filter(fingerprint=key, fetched_at__gte=now - max_age)
+            .only("body")
+            .first()
+        )
+        if entry is not None:
+            SerpCacheEntry.objects.filter(pk=entry.pk).update(hit_count=F("hit_count") + 1, last_hit_at=now)
+            _count(caller, "hits")
+            logger.debug("serp_cache: hit %s (%s)", key[:12], caller)
+            return json.loads(zlib.decompress(bytes(entry.body)))
+
+    _count(caller, "misses")
+    result = fetch()
+    if isinstance(result, dict) and "error" not in result:
+        normalised = _normalise(params)
+        SerpCacheEntry.objects.update_or_create(
+            fingerprint=key,
+            defaults={
+                "engine": normalised.get("engine", "")[:32],
+                "query": normalised.get("q", "")[:500],
+                "params": normalised,
+                "body": zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8")),
+                "fetched_at": timezone.now(),
+                "hit_count": 0,
+                "last_hit_at": None,
+            },
+        )
+    return result
+
+
+def cache_stats(days: int = 30) -> dict:
+    """
+    Hit / miss totals for the last *days* days, overall and per caller.
+
+    ::
+
+        {"days": int, "hits": int, "misses": int, "hit_rate": float (0–100),
+         "credits_saved": int, "entries": int,
+         "by_caller": [{"caller", "hits", "misses", "hit_rate"}, ...]}
+    """
+    from seo_intel.models import SerpCacheEntry, SerpCacheStat
+
+    since = timezone.localdate() - timedelta(days=days - 1)
+    rows = (
+        SerpCacheStat.objects.filter(day__gte=since)
+        .values("caller")
+        .annotate(hits=Sum("hits"), misses=Sum("misses"))
+        .order_by("caller")
+    )
+
+    def _rate(hits: int, misses: int) -> float:
+        return round(100 * hits / (hits + misses), 1) if hits + misses else 0.0
+
+    by_caller = [
+        {
+            "caller": row["caller"],
+            "hits": row["hits"],
+            "misses": row["misses"],
+            "hit_rate": _rate(row["hits"], row["misses"]),
+        }
+        for row in rows
+    ]
+    hits = sum(row["hits"] for row in by_caller)
+    misses = sum(row["misses"] for row in by_caller)
+    return {
+        "days": days,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": _rate(hits, misses),
+        "credits_saved": hits,
+        "entries": SerpCacheEntry.objects.count(),
+        "by_caller": by_caller,
+    }
@@ -0,0 +1,250 @@
+"""
+seo_intel/services/serp_pipeline.py
+------------------------------------
+Concurrent SerpApi fetch pipeline for keyword lists.
+
+fetch_serps() keeps up to *concurrency* SerpApi searches in flight, paced by
+a token bucket at the plan's hourly rate, and persists what the searches
+yield — SerpRawResult, CompetitorHit, LCPsychHit and KeywordSuggestion rows —
+in batches with ``bulk_create(ignore_conflicts=True)`` rather than one INSERT
+(or get_or_create round trip) per row.
+
+Quota awareness: before the first search the Account API (which costs no
+credit) reports the searches left this month and the account's hourly rate
+limit.  The keyword list is cut to the searches left, and the bucket runs at
+the lower of SERPAPI_RATE_PER_HOUR and the account limit.  When the Account
+API is unreachable the configured rate is used and nothing is cut.
+
+Worker threads only run searches (fetch_serp, which consults the SERP
+cache); results are stored on the calling thread.
+
+Settings
+--------
+    SERPAPI_RATE_PER_HOUR   sustained searches per hour (default: 1000)
+    SERPAPI_CONCURRENCY     searches in flight (default: 4)
+
+Public API
+----------
+    SerpOutcome(keyword, parsed, error, competitor_hits, own_hits)
+    SerpRunReport(ok, errors, new_suggestions, skipped_for_quota, rate_per_hour, concurrency)
+    fetch_serps(keywords, *, concurrency=None, rate_per_hour=None,
+                batch_size=25, on_result=None) -> SerpRunReport
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from seo_intel.services.politeness import TokenBucket
+from seo_intel.services.serpapi_client import (
+    detect_competitor_hits,
+    detect_lcpsych_hits,
+    fetch_account,
+    fetch_serp,
+    parse_serp,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_PER_HOUR = 1000
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class SerpOutcome:
+    """Result of one keyword's search, passed to the *on_result* callback."""
+
+    keyword: str
+    parsed: dict | None = None
+    error: str = ""
+    competitor_hits: int = 0
+    own_hits: int = 0
+
+
+@dataclass
+class SerpRunReport:
+    ok: int = 0
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    new_suggestions: int = 0
+    skipped_for_quota: list[str] = field(default_factory=list)
+    rate_per_hour: float = 0.0
+    concurrency: int = 0
+
+
+class _WriteBuffer:
+    """Rows from completed searches, written together by flush()."""
+
+    def __init__(self):
+        from seo_intel.models import CompetitorHit, KeywordSuggestion, LCPsychHit, SerpRawResult
+
+        self._models = (SerpRawResult, CompetitorHit, LCPsychHit, KeywordSuggestion)
+        self._reset()
+
+    def _reset(self) -> None:
+        self.raw: list = []
+        self.competitor_hits: list = []
+        self.own_hits: list = []
+        self.suggestions: dict[str, object] = {}
+        self.keywords = 0
+
+    def add(self, keyword: str, raw: dict, parsed: dict, comp_hits: list, own_hits: list) -> None:
+        SerpRawResult, CompetitorHit, LCPsychHit, KeywordSuggestion = self._models
+        now = timezone.now()
+        self.keywords += 1
+        self.raw.append(SerpRawResult(keyword=keyword, payload={"raw": raw, "parsed": parsed}))
+        self.competitor_hits += [
+            CompetitorHit(
+                keyword=hit["keyword"],
+                competitor_domain=hit["competitor_domain"],
+                url=hit["url"],
+                title=hit["title"],
+                rank=hit["rank"],
+                timestamp=now,
+            )
+            for hit in comp_hits
+        ]
+        self.own_hits += [
+            LCPsychHit(
+                keyword=hit["keyword"],
+                url=hit["url"],
+                title=hit["title"],
+                rank=hit["rank"],
+                timestamp=now,
+            )
+            for hit in own_hits
+        ]
+        # First keyword to surface a phrase is recorded as its source, as
+        # get_or_create did when searches ran one at a time
+        for phrases, source_type in (
+            (parsed["people_also_ask"], KeywordSuggestion.PAA),
+            (parsed["related_searches"], KeywordSuggestion.RELATED),
+        ):
+            for phrase in phrases:
+                phrase = phrase.strip().lower()
+                if phrase and phrase not in self.suggestions:
+                    self.suggestions[phrase] = KeywordSuggestion(
+                        suggestion=phrase,
+                        source_keyword=keyword,
+                        source_type=source_type,
+                    )
+
+    def flush(self) -> int:
+        """Write buffered rows in one transaction; return the number of new suggestions."""
+        if not self.keywords:
+            return 0
+        SerpRawResult, CompetitorHit, LCPsychHit, KeywordSuggestion = self._models
+        existing = set(
+            KeywordSuggestion.objects.filter(suggestion__in=list(self.suggestions))
+            .values_list("suggestion", flat=True)
+        )
+        new_suggestions = [obj for phrase, obj in self.suggestions.items() if phrase not in existing]
+        with transaction.atomic():
+            SerpRawResult.objects.bulk_create(self.raw, ignore_conflicts=True)
+            CompetitorHit.objects.bulk_create(self.competitor_hits, ignore_conflicts=True)
+            LCPsychHit.objects.bulk_create(self.own_hits, ignore_conflicts=True)
+            KeywordSuggestion.objects.bulk_create(new_suggestions, ignore_conflicts=True)
+        logger.debug(
+            "serp_pipeline: wrote %d SERP(s), %d competitor hit(s), %d own hit(s), %d suggestion(s)",
+            len(self.raw), len(self.competitor_hits), len(self.own_hits), len(new_suggestions),
+        )
+        self._reset()
+        return len(new_suggestions)
+
+
+def _plan_limits(rate_per_hour: float) -> tuple[int | None, float]:
+    """(searches left this month or None, hourly rate capped by the account's limit)."""
+    try:
+        account = fetch_account()
+    except Exception as exc:
+        logger.warning("serp_pipeline: SerpApi account lookup failed (%s); assuming %s/hour", exc, rate_per_hour)
+        return None, rate_per_hour
+    searches_left = account.get("total_searches_left")
+    account_rate = account.get("account_rate_limit_per_hour")
+    if account_rate:
+        rate_per_hour = min(rate_per_hour, float(account_rate))
+    return (int(searches_left) if searches_left is not None else None), rate_per_hour
+
+
+def _search(keyword: str, bucket: TokenBucket) -> tuple[dict, dict]:
+    try:
+        bucket.acquire()
+        raw = fetch_serp(keyword)
+        return raw, parse_serp(keyword, raw)
+    finally:
+        # fetch_serp reads and writes the SERP cache from this worker thread
+        connections.close_all()
+
+
+def fetch_serps(
+    keywords: Iterable[str],
+    *,
+    concurrency: int | None = None,
+    rate_per_hour: float | None = None,
+    batch_size: int = 25,
+    on_result: Callable[[SerpOutcome], None] | None = None,
+) -> SerpRunReport:
+    """
+    Search SerpApi for every keyword and store the results.
+
+    *on_result* is called on the calling thread as each search completes
+    (in completion order, not input order).  A failed search is reported
+    and skipped; it does not stop the run.
+    """
+    from seo_settings.models import CompetitorDomain
+
+    concurrency = max(concurrency or getattr(settings, "SERPAPI_CONCURRENCY", DEFAULT_CONCURRENCY), 1)
+    rate_per_hour = rate_per_hour or getattr(settings, "SERPAPI_RATE_PER_HOUR", DEFAULT_RATE_PER_HOUR)
+    keywords = list(dict.fromkeys(keywords))
+
+    report = SerpRunReport(concurrency=concurrency)
+    searches_left, report.rate_per_hour = _plan_limits(rate_per_hour)
+    if searches_left is not None and searches_left < len(keywords):
+        logger.warning(
+            "serp_pipeline: %d search(es) left on the SerpApi plan; skipping %d keyword(s)",
+            searches_left, len(keywords) - max(searches_left, 0),
+        )
+        report.skipped_for_quota = keywords[max(searches_left, 0):]
+        keywords = keywords[:max(searches_left, 0)]
+    if not keywords:
+        return report
+
+    bucket = TokenBucket(report.rate_per_hour / 3600, capacity=concurrency)
+    active_domains = list(CompetitorDomain.objects.filter(active=True).values_list("domain", flat=True))
+    buffer = _WriteBuffer()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="serpapi") as pool:
+        futures = {pool.submit(_search, keyword, bucket): keyword for keyword in keywords}
+        try:
+            for future in as_completed(futures):
+                outcome = SerpOutcome(keyword=futures[future])
+                try:
+                    raw, parsed = future.result()
+                except Exception as exc:
+                    outcome.error = str(exc)
+                    report.errors.append((outcome.keyword, outcome.error))
+                else:
+                    comp_hits = detect_competitor_hits(outcome.keyword, parsed["organic"], active_domains)
+                    own_hits = detect_lcpsych_hits(outcome.keyword, parsed["organic"])
+                    buffer.add(outcome.keyword, raw, parsed, comp_hits, own_hits)
+                    outcome.parsed = parsed
+                    outcome.competitor_hits = len(comp_hits)
+                    outcome.own_hits = len(own_hits)
+                    report.ok += 1
+                    if buffer.keywords >= batch_size:
+                        report.new_suggestions += buffer.flush()
+                if on_result is not None:
+                    on_result(outcome)
+        except BaseException:
+            # Don't spend credits on searches whose results can't be stored
+            for future in futures:
+                future.cancel()
+            raise
+
+    report.new_suggestions += buffer.flush()
+    return report
@@ -35,6 +35,8 @@ import time
 
 import requests
 
+from seo_intel.services.serp_cache import cached_search
+
 logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------
@@ -87,6 +89,7 @@ def scrape_keyword(
 ) -> list[SerpRow]:
     """
     Fetch up to `num_results` organic results for `keyword` via SerpApi.
+    Repeat searches within a day are served from the SERP cache.
 
     Parameters
     ----------
@@ -117,9 +120,13 @@ def scrape_keyword(
         "safe": "active",
         "output": "json",
     }
-    resp = requests.get(_SERPAPI_ENDPOINT, params=params, timeout=request_timeout)
-    resp.raise_for_status()
-    data = resp.json()
+
+    def _fetch() -> dict:
+        resp = requests.get(_SERPAPI_ENDPOINT, params=params, timeout=request_timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    data = cached_search("competitor_serp", params, _fetch)
 
     rows: list[SerpRow] = []
     for item in data.get("organic_results", []):
@@ -18,12 +18,17 @@ Public API
 ----------
     fetch_serp(keyword)         -> dict          raw SerpApi JSON response
     parse_serp(keyword, serp)   -> dict          normalised result dict
+    fetch_account()             -> dict          SerpApi Account API response
+                                                 (searches left, hourly rate limit)
 """
 
 from __future__ import annotations
 
 import logging
 import os
+from datetime import timedelta
+
+from seo_intel.services.serp_cache import cached_search
 
 logger = logging.getLogger(__name__)
 
@@ -51,16 +56,23 @@ def _get_api_key() -> str:
 # Public API
 # ---------------------------------------------------------------------------
 
-def fetch_serp(keyword: str, *, timeout: int = 20) -> dict:
+def fetch_serp(keyword: str, *, timeout: int = 20, max_age: timedelta | None = None) -> dict:
     """
     Query SerpApi for *keyword* and return the raw parsed JSON dict.
 
+    Responses are served from the SERP cache (serp_cache, caller
+    ``"rank_tracking"``) while fresh, so repeating a search the same day
+    costs no credit.
+
     Parameters
     ----------
     keyword:
         The search query to run.
     timeout:
         HTTP timeout in seconds (passed through to the underlying request).
+    max_age:
+        Accept a cached response up to this old instead of the caller's
+        default window; ``timedelta(0)`` always fetches.
 
     Returns
     -------
@@ -85,10 +97,14 @@ def fetch_serp(keyword: str, *, timeout: int = 20) -> dict:
         "api_key": api_key,
     }
 
-    logger.debug("SerpApi fetch: %r (location=%s)", keyword, _LOCATION)
-    try:
+    def _fetch() -> dict:
+        logger.debug("SerpApi fetch: %r (location=%s)", keyword, _LOCATION)
         search = GoogleSearch(params)
-        result = search.get_dict()
+        search.timeout = timeout
+        return search.get_dict()
+
+    try:
+        result = cached_search("rank_tracking", params, _fetch, max_age=max_age)
     except Exception as exc:
         logger.error("SerpApi error for %r: %s", keyword, exc)
         raise
@@ -106,6 +122,28 @@ def fetch_serp(keyword: str, *, timeout: int = 20) -> dict:
     return result
 
 
+def fetch_account(*, timeout: int = 20) -> dict:
+    """
+    Return the SerpApi Account API response for the configured key.
+
+    Does not use a search credit.  Keys of interest: ``total_searches_left``,
+    ``plan_searches_left`` and ``account_rate_limit_per_hour``.
+
+    Raises
+    ------
+    RuntimeError   — SERPAPI_KEY not set, or the API returned an error
+    Exception      — any network error
+    """
+    from serpapi import GoogleSearch
+
+    search = GoogleSearch({"api_key": _get_api_key()})
+    search.timeout = timeout
+    account = search.get_account()
+    if "error" in account:
+        raise RuntimeError(f"SerpApi error: {account['error']}")
+    return account
+
+
 def parse_serp(keyword: str, serp: dict) -> dict:
     """
     Normalise a raw SerpApi response into a structured dict.
@@ -162,7 +200,11 @@ def parse_serp(keyword: str, serp: dict) -> dict:
     }
 
 
-def detect_competitor_hits(keyword: str, organic_results: list) -> list:
+def detect_competitor_hits(
+    keyword: str,
+    organic_results: list,
+    active_domains: list[str] | None = None,
+) -> list:
     """
     Cross-reference organic SERP results against active CompetitorDomain records.
 
@@ -173,6 +215,9 @@ def detect_competitor_hits(keyword: str, organic_results: list) -> list:
     organic_results:
         The ``organic`` list from :func:`parse_serp` — each item must have
         ``link``, ``title``, and ``position`` keys.
+    active_domains:
+        Competitor domains to match; loaded from active CompetitorDomain
+        records when omitted.  Pass a preloaded list when checking many SERPs.
 
     Returns
     -------
@@ -189,11 +234,12 @@ def detect_competitor_hits(keyword: str, organic_results: list) -> list:
             ...
         ]
     """
-    from seo_settings.models import CompetitorDomain
+    if active_domains is None:
+        from seo_settings.models import CompetitorDomain
 
-    active_domains = list(
-        CompetitorDomain.objects.filter(active=True).values_list("domain", flat=True)
-    )
+        active_domains = list(
+            CompetitorDomain.objects.filter(active=True).values_list("domain", flat=True)
+        )
 
     if not active_domains:
         logger.debug("detect_competitor_hits: no active competitor domains configured.")
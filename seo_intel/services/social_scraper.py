@@ -39,13 +39,15 @@ import json
 import logging
 import os
 import re
-import time
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
-from django.core.cache import cache
+
+from core.cache import SOCIAL
+from seo_intel.services.politeness import HOST_THROTTLE
+from seo_intel.services.serp_cache import cached_search
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +90,7 @@ _SOCIAL_SEARCH_SITE: dict[str, str] = {
 def _fetch_html(url: str, extra_headers: dict | None = None, timeout: int = _REQUEST_TIMEOUT) -> BeautifulSoup | None:
     try:
         headers = {**_HEADERS, **(extra_headers or {})}
+        HOST_THROTTLE.wait(url)
         resp = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
         resp.raise_for_status()
         return BeautifulSoup(resp.text, "html.parser")
@@ -126,9 +129,13 @@ def _serpapi_request(params: dict) -> dict:
     if not key:
         raise RuntimeError("SERPAPI_KEY not configured")
     params = {**params, "api_key": key}
-    resp = requests.get("https://serpapi.com/search.json", params=params, timeout=_REQUEST_TIMEOUT)
-    resp.raise_for_status()
-    return resp.json()
+
+    def _fetch() -> dict:
+        resp = requests.get("https://serpapi.com/search.json", params=params, timeout=_REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        return resp.json()
+
+    return cached_search("profile_lookup", params, _fetch)
 
 
 def _find_social_url(business_name: str, platform: str) -> str | None:
@@ -435,8 +442,6 @@ def _scrape_platform(domain: str, platform: str, business_name: str) -> dict:
     if not profile_url:
         return {"found": False, "error": "Profile not found via SerpAPI"}
 
-    time.sleep(0.5)
-
     try:
         if platform == "facebook":
             return _scrape_facebook(profile_url)
@@ -454,8 +459,7 @@ def _scrape_platform(domain: str, platform: str, business_name: str) -> dict:
 
 
 def _cache_key(domain: str) -> str:
-    safe = re.sub(r"[^a-z0-9]", "_", domain.lower())
-    return f"social_profiles:{safe}"
+    return re.sub(r"[^a-z0-9]", "_", domain.lower())
 
 
 def _upsert_db(domain: str, platform: str, data: dict) -> None:
@@ -479,7 +483,7 @@ def run_social_scan(domain: str, force: bool = False) -> dict[str, dict]:
     """
     ck = _cache_key(domain)
     if not force:
-        cached = cache.get(ck)
+        cached = SOCIAL.get(ck)
         if cached is not None:
             return cached
 
@@ -499,14 +503,14 @@ def run_social_scan(domain: str, force: bool = False) -> dict[str, dict]:
         results[platform] = data
         _upsert_db(domain, platform, data)
 
-    cache.set(ck, results, SOCIAL_CACHE_TTL)
+    SOCIAL.set(ck, results, SOCIAL_CACHE_TTL)
     return results
 
 
 def get_cached_social_data(domain: str) -> dict[str, dict]:
     """Load social profiles from cache, falling back to DB rows."""
     ck = _cache_key(domain)
-    cached = cache.get(ck)
+    cached = SOCIAL.get(ck)
     if cached is not None:
         return cached
 
@@ -519,10 +523,10 @@ def get_cached_social_data(domain: str) -> dict[str, dict]:
     for row in rows:
         result[row.platform] = row.data or {}
 
-    cache.set(ck, result, SOCIAL_CACHE_TTL)
+    SOCIAL.set(ck, result, SOCIAL_CACHE_TTL)
     return result
 
 
 def invalidate_social_cache(domain: str) -> None:
     """Remove the social cache for *domain*."""
-    cache.delete(_cache_key(domain))
+    SOCIAL.delete(_cache_key(domain))
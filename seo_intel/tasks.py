@@ -4,10 +4,14 @@ seo_intel/tasks.py
 Celery tasks for the weekly SEO intelligence automation pipeline.
 
 Pipeline (run in sequence, each task independent):
+    0. refresh_competitors    — refresh_competitors management command
     1. pull_gsc_data          — pull_search_console management command
     2. scrape_competitor_serp — scrape_competitors management command
     3. analyse_content_gaps   — run_gap_analysis management command
 
+Also:
+    refresh_keyword_discovery — incremental keyword discovery refresh (no email)
+
 Each task:
   - Captures stdout/stderr from the management command
   - Logs the output via Python logging
@@ -20,9 +24,13 @@ the database via django-celery-beat. Tasks are chained: gap analysis only runs
 after both data-collection tasks have completed.
 
 Schedule:
-  Monday 06:00 UTC — pull_gsc_data     (GSC data ready ~2–3 days after weekend)
+  Monday 04:00 UTC — refresh_competitors (crawl + directory + social scans;
+                     resumes an interrupted run when retried)
+  Daily  06:00 UTC — pull_gsc_data     (checkpointed: fetches only missing days
+                                        and the days GSC may still revise)
   Monday 06:10 UTC — scrape_competitor_serp  (10-minute offset to spread load)
   Monday 06:30 UTC — analyse_content_gaps    (30-minute offset, runs after both)
+  Every 15 minutes — refresh_keyword_discovery (reads only new source rows)
 
 Env vars
 --------
@@ -51,10 +59,17 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 BEAT_SCHEDULE = {
-    # Step 1: Pull fresh GSC data (Monday 06:00 UTC)
+    # Step 0: Refresh competitor crawl/directory/social data (Monday 04:00 UTC)
+    "seo-intel-refresh-competitors-weekly": {
+        "task": "seo_intel.tasks.refresh_competitors",
+        "schedule": crontab(hour=4, minute=0, day_of_week=1),
+    },
+    # Step 1: Pull fresh GSC data (nightly 06:00 UTC; only lagging days are fetched).
+    # The key predates the nightly schedule; it is kept so the DatabaseScheduler
+    # updates its existing PeriodicTask instead of adding a second one.
     "seo-intel-pull-gsc-weekly": {
         "task": "seo_intel.tasks.pull_gsc_data",
-        "schedule": crontab(hour=6, minute=0, day_of_week=1),
+        "schedule": crontab(hour=6, minute=0),
     },
     # Step 2: Scrape competitor SERPs (Monday 06:10 UTC)
     "seo-intel-scrape-serp-weekly": {
@@ -66,6 +81,11 @@ BEAT_SCHEDULE = {
         "task": "seo_intel.tasks.analyse_content_gaps",
         "schedule": crontab(hour=6, minute=30, day_of_week=1),
     },
+    # Keyword discovery candidate store (every 15 minutes; incremental)
+    "seo-intel-refresh-keyword-discovery": {
+        "task": "seo_intel.tasks.refresh_keyword_discovery",
+        "schedule": crontab(minute="*/15"),
+    },
 }
 
 
@@ -108,11 +128,43 @@ def _send_summary_email(subject: str, body: str) -> None:
 # Tasks
 # ---------------------------------------------------------------------------
 
+@shared_task(bind=True, name="seo_intel.tasks.refresh_competitors", max_retries=2, default_retry_delay=300)
+def refresh_competitors(self, workers: int = 4, max_pages: int = 200):
+    """
+    Crawl, directory-scan and social-scan all active competitor domains.
+    Wraps the refresh_competitors management command; a retry resumes the
+    interrupted run instead of starting over.
+    """
+    logger.info("SEO Intel: starting refresh_competitors (workers=%d, max_pages=%d)", workers, max_pages)
+    try:
+        stdout, stderr = _capture_command(
+            "refresh_competitors",
+            workers=workers,
+            max_pages=max_pages,
+        )
+    except Exception as exc:
+        logger.exception("refresh_competitors failed: %s", exc)
+        _send_summary_email(
+            subject="[SEO Intel] Competitor refresh FAILED",
+            body=f"Task failed with exception:\n{exc}\n",
+        )
+        raise self.retry(exc=exc)
+
+    output = stdout + (f"\nSTDERR:\n{stderr}" if stderr.strip() else "")
+    logger.info("refresh_competitors output:\n%s", output)
+    _send_summary_email(
+        subject="[SEO Intel] Competitor refresh complete",
+        body=output or "(no output)",
+    )
+    return output
+
+
 @shared_task(bind=True, name="seo_intel.tasks.pull_gsc_data", max_retries=2, default_retry_delay=300)
-def pull_gsc_data(self, days: int = 7, row_limit: int = 1000):
+def pull_gsc_data(self, days: int = 7, row_limit: int = 25000, workers: int = 4, shard_days: int = 1):
     """
     Pull Search Console search analytics for the last `days` days.
-    Wraps the pull_search_console management command.
+    Wraps the pull_search_console management command; days already
+    checkpointed as final are skipped, so a retry only fetches what failed.
     """
     logger.info("SEO Intel: starting pull_gsc_data (days=%d, row_limit=%d)", days, row_limit)
     try:
@@ -120,6 +172,8 @@ def pull_gsc_data(self, days: int = 7, row_limit: int = 1000):
             "pull_search_console",
             days=days,
             row_limit=row_limit,
+            workers=workers,
+            shard_days=shard_days,
         )
     except Exception as exc:
         logger.exception("pull_gsc_data failed: %s", exc)
@@ -219,3 +273,17 @@ def analyse_content_gaps(self, min_impressions: int = 0):
         body=output or "(no output)",
     )
     return output
+
+
+@shared_task(name="seo_intel.tasks.refresh_keyword_discovery")
+def refresh_keyword_discovery(full: bool = False):
+    """
+    Bring the keyword discovery candidate store up to date.  Runs every 15
+    minutes and only logs; a refresh that finds nothing new costs one
+    watermark check per source.
+    """
+    from seo_intel.services.keyword_discovery import refresh_discovery
+
+    summary = refresh_discovery(full=full)
+    logger.info("refresh_keyword_discovery: %s", summary)
+    return summary
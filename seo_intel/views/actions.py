@@ -260,7 +260,7 @@ def _bg_run_serpapi_selected(job_id: str, keywords: list[str]) -> None:
         from django.utils import timezone
 
         from seo_intel.models import CompetitorHit, LCPsychHit, SerpRawResult
-        from seo_intel.services.keyword_discovery import invalidate_cache
+        from seo_intel.services.keyword_discovery import refresh_discovery
         from seo_intel.services.serpapi_client import (
             detect_competitor_hits,
             detect_lcpsych_hits,
@@ -323,7 +323,7 @@ def _bg_run_serpapi_selected(job_id: str, keywords: list[str]) -> None:
             if i < len(keywords) - 1:
                 _time.sleep(1.5)
 
-        invalidate_cache()
+        refresh_discovery()
         _jobs[job_id] = {
             "status":    "done",
             "processed": ok_count,
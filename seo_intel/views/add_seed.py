@@ -3,8 +3,8 @@ seo_intel/views/add_seed.py
 -----------------------------
 POST-only endpoint: promote a discovered keyword to a KeywordSeed record.
 
-On success returns JSON {status, keyword, created} and invalidates the
-discovery cache so the next page load shows fresh results.
+On success returns JSON {status, keyword, created}.  The keyword drops out of
+Keyword Discovery on the next page load, which leaves out seeded keywords.
 """
 from __future__ import annotations
 
@@ -58,12 +58,8 @@ def add_seed(request):
         defaults={"category": category, "active": True},
     )
 
-    # Invalidate discovery cache so the next load reflects the new seed
-    try:
-        from seo_intel.services.keyword_discovery import invalidate_cache
-        invalidate_cache()
-    except Exception:
-        logger.warning("add_seed: could not invalidate discovery cache")
+    # No discovery refresh needed: run_discovery() leaves out seeded keywords
+    # when it reads the candidate store
 
     logger.info("add_seed: %r (created=%s)", keyword, created)
     return JsonResponse({
@@ -0,0 +1,80 @@
+"""
+seo_intel/views/cache_stats.py
+--------------------------------
+Cache view.
+
+Lists the shared cache's namespaces (core/cache.py) with their current
+version, key count and memory, and lets staff bump a namespace to
+invalidate everything cached in it.
+"""
+from __future__ import annotations
+
+import logging
+from functools import wraps
+
+from django.contrib import messages
+from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, JsonResponse
+from django.shortcuts import redirect, render
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+
+def _staff_required(view_func):
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            from django.conf import settings as django_settings
+            login_url = getattr(django_settings, "LOGIN_URL", "/accounts/login/")
+            return redirect(f"{login_url}?{REDIRECT_FIELD_NAME}={request.path}")
+        if not (request.user.is_staff or request.user.is_superuser):
+            raise PermissionDenied
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+@_staff_required
+def cache_stats(request):
+    from django.conf import settings as django_settings
+
+    from core.cache import namespace_stats
+
+    try:
+        namespaces = namespace_stats()
+        error = ""
+    except Exception as exc:
+        logger.warning("cache_stats: could not read cache stats: %s", exc)
+        namespaces, error = [], str(exc)
+
+    backend = django_settings.CACHES["default"]["BACKEND"].rsplit(".", 1)[-1]
+    ctx = {
+        "seo_title":   "Cache",
+        "active_page": "cache_stats",
+        "namespaces":  namespaces,
+        "backend":     backend,
+        "inspectable": any(ns["keys"] is not None for ns in namespaces),
+        "total_keys":  sum(ns["keys"] or 0 for ns in namespaces),
+        "total_bytes": sum(ns["bytes"] or 0 for ns in namespaces),
+        "error":       error,
+    }
+    return render(request, "seo_intel/cache_stats.html", ctx)
+
+
+@_staff_required
+def bump_cache_namespace(request, name: str):
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+
+    from core.cache import NAMESPACES
+
+    ns = NAMESPACES.get(name)
+    if ns is None:
+        raise Http404(f"Unknown cache namespace {name!r}")
+    if not ns.bumpable:
+        messages.error(request, f"{ns.label} can't be invalidated.")
+    else:
+        version = ns.bump()
+        messages.success(request, f"{ns.label} invalidated (now v{version}).")
+    return redirect(reverse("seo_intel:cache_stats"))
@@ -146,7 +146,7 @@ def serp_settings(request):
         {
             'command': 'run_serpapi_for_seeds',
             'description': 'Fetch SERPs for all active keyword seeds; records competitor hits, LC Psych hits, and new keyword suggestions.',
-            'flags': '--limit N  --category CAT  --delay SECS  --dry-run',
+            'flags': '--limit N  --category CAT  --concurrency N  --rate PER_HOUR  --dry-run',
         },
         {
             'command': 'promote_suggestions_to_seeds',
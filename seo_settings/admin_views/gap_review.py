@@ -172,13 +172,13 @@ def render_gap_detail(request, pk, admin_site):
 
     competitor_results = list(
         CompetitorSERPResult.objects
-        .filter(keyword__iexact=record.keyword)
+        .filter(keyword_norm=record.keyword.lower())
         .order_by('rank')[:20]
     )
 
     lcpsych_pages = list(
         SearchConsoleQuery.objects
-        .filter(query__iexact=record.keyword)
+        .filter(keyword_norm=record.keyword.lower())
         .values('page')
         .annotate(
             total_clicks=Sum('clicks'),
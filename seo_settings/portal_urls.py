@@ -17,6 +17,7 @@ from seo_intel.views.actions import (
 )
 from seo_intel.views.add_seed import add_seed
 from seo_intel.views.analytics_hub import analytics_hub
+from seo_intel.views.cache_stats import bump_cache_namespace, cache_stats
 from seo_intel.views.content_gaps import content_gaps
 from seo_intel.views.keyword_discovery import keyword_discovery
 from seo_intel.views.keyword_seeds_intel import keyword_seeds_intel
@@ -44,6 +45,10 @@ urlpatterns = [
     path('', portal.control_panel, name='control_panel'),
     path('settings/', portal.global_settings, name='settings'),
 
+    # Shared cache: per-namespace stats and invalidation
+    path('cache/', cache_stats, name='cache_stats'),
+    path('cache/<str:name>/bump/', bump_cache_namespace, name='cache_bump'),
+
     # Competitor domains
     path('competitors/', portal.competitors, name='competitors'),
     path('competitors/<int:pk>/toggle/', portal.toggle_competitor, name='competitor_toggle'),
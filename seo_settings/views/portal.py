@@ -55,6 +55,7 @@ def control_panel(request):
         InternalSearchQuery,
         SearchConsoleQuery,
     )
+    from seo_intel.services.serp_cache import cache_stats
     from seo_settings.models import CompetitorDomain, KeywordSeed, SEOGlobalSettings
 
     gs = SEOGlobalSettings.get()
@@ -108,6 +109,7 @@ def control_panel(request):
         'global_settings': gs,
         'stats': stats,
         'modules': modules,
+        'serp_cache': cache_stats(days=30),
         'creds_configured': bool(
             os.environ.get('GSC_OAUTH_CLIENT_ID') and os.environ.get('GSC_OAUTH_REFRESH_TOKEN')
         ),
@@ -178,7 +180,7 @@ def global_settings(request):
         {
             'command': 'run_serpapi_for_seeds',
             'description': 'Fetch SERPs for all active keyword seeds; records competitor hits, LC Psych hits, and new keyword suggestions.',
-            'flags': '--limit N  --category CAT  --delay SECS  --dry-run',
+            'flags': '--limit N  --category CAT  --concurrency N  --rate PER_HOUR  --dry-run',
         },
         {
             'command': 'promote_suggestions_to_seeds',
@@ -534,8 +536,8 @@ def ai_suggest_keywords(request):
     # Score each suggestion live using the keyword scoring engine
     from collections import defaultdict
     from django.db.models import Sum
-    from seo_intel.models import CompetitorHit, KeywordScore, LCPsychHit, SearchConsoleQuery
-    from seo_intel.services.keyword_scoring import load_geo_terms, score_keyword
+    from seo_intel.models import CompetitorHit, LCPsychHit, SearchConsoleQuery
+    from seo_intel.services.keyword_scoring import load_geo_terms, save_scores, score_keyword
 
     kw_list = [f['keyword'] for f in filtered]
 
@@ -581,18 +583,7 @@ def ai_suggest_keywords(request):
         score_updates.append(result)
 
     # Persist scores so the Keyword Universe table reflects them immediately
-    for result in score_updates:
-        KeywordScore.objects.update_or_create(
-            keyword=result['keyword'],
-            defaults={
-                'search_demand_score': result['search_demand_score'],
-                'competitor_pressure_score': result['competitor_pressure_score'],
-                'lcpsych_presence_score': result['lcpsych_presence_score'],
-                'local_intent_score': result['local_intent_score'],
-                'commercial_intent_score': result['commercial_intent_score'],
-                'priority_score': result['priority_score'],
-            },
-        )
+    save_scores(score_updates)
 
     # Sort highest score first
     filtered.sort(key=lambda x: -x['score'])
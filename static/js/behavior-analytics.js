@@ -1,7 +1,11 @@
 (function () {
   'use strict';
 
-  var ENDPOINT = '/api/analytics/';
+  var ENDPOINT = '/api/analytics/batch/';
+  var QUEUE_NAME = 'lcpsAnalyticsQueue';
+  var FLUSH_INTERVAL_MS = 5000;
+  var FLUSH_SIZE = 20;
+  var MAX_BATCH = 50;
   var SESSION_KEY = 'lcpsid';
   var LEGACY_SESSION_KEY = 'lcpsych_session_id';
   var CLICK_PATH_LIMIT = 5;
@@ -12,6 +16,8 @@
   var navigationStarted = false;
   var clickPath = [];
   var rageMap = new Map();
+  var buffer = [];
+  var flushTimer = null;
 
   function now() {
     return Date.now();
@@ -59,27 +65,68 @@
     return [tag, id, cls ? '.' + cls : ''].join('');
   }
 
+  // Events are buffered and posted to the batch endpoint in one request:
+  // every FLUSH_INTERVAL_MS, once FLUSH_SIZE events are waiting, and via
+  // sendBeacon when the page is hidden.
   function send(payload) {
     try {
-      payload.session_id = sessionId();
       payload.path = (payload.path || location.pathname || '').split('?')[0].slice(0, 500);
       payload.referrer = (payload.referrer || document.referrer || '').slice(0, 500);
       payload.metadata = payload.metadata || {};
-      var body = JSON.stringify(payload);
-      if (navigator.sendBeacon) {
-        var blob = new Blob([body], { type: 'application/json' });
-        navigator.sendBeacon(ENDPOINT, blob);
-        return;
+      payload.t = payload.t || now();
+      buffer.push(payload);
+      if (buffer.length >= FLUSH_SIZE) {
+        flush(false);
+      } else if (!flushTimer) {
+        flushTimer = setTimeout(function () { flush(false); }, FLUSH_INTERVAL_MS);
       }
-      fetch(ENDPOINT, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: body,
-        keepalive: true,
-      }).catch(function () {});
     } catch (_) {}
   }
 
+  function post(events, useBeacon) {
+    var body = JSON.stringify({ session_id: sessionId(), sent_at: now(), events: events });
+    if (useBeacon && navigator.sendBeacon) {
+      var blob = new Blob([body], { type: 'application/json' });
+      if (navigator.sendBeacon(ENDPOINT, blob)) return;
+    }
+    fetch(ENDPOINT, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: body,
+      credentials: 'same-origin',
+      keepalive: true,
+    }).catch(function () {});
+  }
+
+  function flush(useBeacon) {
+    if (flushTimer) {
+      clearTimeout(flushTimer);
+      flushTimer = null;
+    }
+    try {
+      while (buffer.length) {
+        post(buffer.splice(0, MAX_BATCH), useBeacon);
+      }
+    } catch (_) {}
+  }
+
+  // Inline page scripts push events onto window.lcpsAnalyticsQueue before this
+  // deferred file loads, and may hold on to that array.  Keep the same array:
+  // drain what is there and patch its push() so later pushes go to send().
+  function adoptQueue() {
+    var queue = window[QUEUE_NAME];
+    if (!Array.isArray(queue)) queue = window[QUEUE_NAME] = [];
+    var pending = queue.splice(0, queue.length);
+    queue.push = function () {
+      for (var i = 0; i < arguments.length; i++) {
+        var evt = arguments[i];
+        if (evt && evt.event_type) send(evt);
+      }
+      return 0;
+    };
+    for (var j = 0; j < pending.length; j++) queue.push(pending[j]);
+  }
+
   function loadPagePathSeq() {
     try {
       var raw = localStorage.getItem('lcps_click_path_' + sessionId());
@@ -220,14 +267,21 @@
   }
 
   function bindExit() {
-    window.addEventListener('pagehide', sendExitEvent, { passive: true });
+    window.addEventListener('pagehide', function () {
+      sendExitEvent();
+      flush(true);
+    }, { passive: true });
     document.addEventListener('visibilitychange', function () {
-      if (document.visibilityState === 'hidden') sendExitEvent();
+      if (document.visibilityState === 'hidden') {
+        sendExitEvent();
+        flush(true);
+      }
     });
     window.addEventListener('beforeunload', function () { navigationStarted = true; });
   }
 
   if (typeof window === 'undefined' || !window.addEventListener) return;
+  adoptQueue();
   clickPath = loadPagePathSeq();
   recordPagePath();
   bindClicks();